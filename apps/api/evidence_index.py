@@ -0,0 +1,371 @@
+"""
+LawyerFactory Evidence Index
+In-memory evidence store with secondary indexes for the canonical API server.
+
+Replaces the plain ``evidence_store`` dict so that listing, filtering, search
+and statistics no longer rescan every entry on every request.
+
+Key Features:
+- Per-field hash indexes for equality filters (source, type, relevance, phase)
+- Token index with prefix lookup for free-text search
+- Incrementally maintained aggregate counters for /api/evidence/stats
+- Cursor-based pagination in insertion order with field projection; requests
+  without paging parameters still get every matching entry
+
+The index behaves like a ``dict`` of ``evidence_id -> entry`` for reads, so
+existing callers keep working. Mutations must go through ``__setitem__``,
+``patch`` or ``__delitem__`` so the indexes stay consistent.
+"""
+
+import base64
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableMapping
+from itertools import islice
+import math
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Fields with exact-match filters on GET /api/evidence
+INDEXED_FIELDS = ("evidence_source", "evidence_type", "relevance_level", "phase")
+
+# Fields that contribute to free-text search
+SEARCH_FIELDS = (
+    "evidence_id",
+    "object_id",
+    "source_document",
+    "page_section",
+    "content",
+    "evidence_type",
+    "evidence_source",
+    "relevance_level",
+    "bluebook_citation",
+    "witness_name",
+    "key_terms",
+    "notes",
+)
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _search_text(entry: Dict[str, Any]) -> str:
+    """Lowercased text searched by the ``search`` filter."""
+    parts = []
+    for field_name in SEARCH_FIELDS:
+        value = entry.get(field_name)
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            parts.extend(str(item) for item in value)
+        else:
+            parts.append(str(value))
+    return "\n".join(parts).lower()
+
+
+def parse_relevance_score(value: Any) -> float:
+    """Validate a client-supplied relevance score; raises ValueError if not a finite number"""
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid relevance_score: {value!r}")
+    try:
+        score = float(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid relevance_score: {value!r}") from e
+    if not math.isfinite(score):
+        raise ValueError(f"Invalid relevance_score: {value!r}")
+    return score
+
+
+def _relevance(entry: Dict[str, Any]) -> float:
+    """Relevance counted in the stats; unparseable values count as 0"""
+    try:
+        return parse_relevance_score(entry.get("relevance_score") or 0)
+    except ValueError:
+        return 0.0
+
+
+def encode_cursor(seq: int) -> str:
+    return base64.urlsafe_b64encode(str(seq).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        return int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+class EvidenceIndex(MutableMapping):
+    """Indexed evidence store keyed by evidence_id"""
+
+    def __init__(self, entries: Optional[Iterable[Dict[str, Any]]] = None):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 0
+
+        # Insertion order for pagination; deleted seqs are skipped lazily
+        self._order: List[int] = []
+        self._by_seq: Dict[int, str] = {}
+
+        self._field_index: Dict[str, Dict[Any, Set[str]]] = {f: {} for f in INDEXED_FIELDS}
+        self._token_index: Dict[str, Set[str]] = {}
+        self._vocabulary: List[str] = []
+        self._text: Dict[str, str] = {}
+
+        self._by_source: Dict[str, int] = {}
+        self._by_type: Dict[str, int] = {}
+        self._relevance_total = 0.0
+
+        for entry in entries or ():
+            self[entry["evidence_id"]] = entry
+
+    # ------------------------------------------------------------------
+    # Mapping protocol
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, evidence_id: str) -> Dict[str, Any]:
+        return self._entries[evidence_id]
+
+    def __setitem__(self, evidence_id: str, entry: Dict[str, Any]) -> None:
+        if evidence_id in self._entries:
+            self._unindex(evidence_id)
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._seq[evidence_id] = seq
+            self._order.append(seq)
+            self._by_seq[seq] = evidence_id
+        self._entries[evidence_id] = entry
+        self._index(evidence_id)
+
+    def __delitem__(self, evidence_id: str) -> None:
+        self._unindex(evidence_id)
+        del self._entries[evidence_id]
+        seq = self._seq.pop(evidence_id)
+        del self._by_seq[seq]
+        if len(self._order) > 2 * len(self._by_seq) + 64:
+            self._order = [s for s in self._order if s in self._by_seq]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def patch(self, evidence_id: str, changes: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply a partial update to an entry and refresh its index postings"""
+        self._unindex(evidence_id)
+        entry = self._entries[evidence_id]
+        entry.update(changes)
+        self._index(evidence_id)
+        return entry
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _index(self, evidence_id: str) -> None:
+        entry = self._entries[evidence_id]
+
+        for field_name, postings in self._field_index.items():
+            value = entry.get(field_name)
+            if value is not None:
+                postings.setdefault(value, set()).add(evidence_id)
+
+        text = _search_text(entry)
+        self._text[evidence_id] = text
+        for token in set(_tokenize(text)):
+            ids = self._token_index.get(token)
+            if ids is None:
+                ids = self._token_index[token] = set()
+                insort(self._vocabulary, token)
+            ids.add(evidence_id)
+
+        source = entry.get("evidence_source", "unknown")
+        etype = entry.get("evidence_type", "unknown")
+        self._by_source[source] = self._by_source.get(source, 0) + 1
+        self._by_type[etype] = self._by_type.get(etype, 0) + 1
+        self._relevance_total += _relevance(entry)
+
+    def _unindex(self, evidence_id: str) -> None:
+        entry = self._entries[evidence_id]
+
+        for field_name, postings in self._field_index.items():
+            value = entry.get(field_name)
+            ids = postings.get(value)
+            if ids is not None:
+                ids.discard(evidence_id)
+                if not ids:
+                    del postings[value]
+
+        text = self._text.pop(evidence_id, "")
+        for token in set(_tokenize(text)):
+            ids = self._token_index.get(token)
+            if ids is None:
+                continue
+            ids.discard(evidence_id)
+            if not ids:
+                del self._token_index[token]
+                pos = bisect_left(self._vocabulary, token)
+                if pos < len(self._vocabulary) and self._vocabulary[pos] == token:
+                    del self._vocabulary[pos]
+
+        source = entry.get("evidence_source", "unknown")
+        etype = entry.get("evidence_type", "unknown")
+        self._decrement(self._by_source, source)
+        self._decrement(self._by_type, etype)
+        self._relevance_total -= _relevance(entry)
+
+    @staticmethod
+    def _decrement(counter: Dict[str, int], key: str) -> None:
+        remaining = counter.get(key, 0) - 1
+        if remaining > 0:
+            counter[key] = remaining
+        else:
+            counter.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _prefix_matches(self, prefix: str) -> Set[str]:
+        """Ids containing any token that starts with ``prefix``"""
+        matches: Set[str] = set()
+        start = bisect_left(self._vocabulary, prefix)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            matches |= self._token_index[token]
+        return matches
+
+    def _search(self, term: str) -> Set[str]:
+        """
+        Ids whose searchable text contains ``term``.
+
+        Candidates come from the token index: every query token must match an
+        indexed token exactly, except the last, which may be a partial word.
+        The phrase itself is then confirmed against the cached search text.
+        """
+        term = term.lower().strip()
+        tokens = _tokenize(term)
+        if not tokens:
+            # Punctuation-only searches cannot use the token index
+            return {eid for eid, text in self._text.items() if term in text}
+
+        candidates = self._prefix_matches(tokens[-1])
+        for token in tokens[:-1]:
+            if not candidates:
+                break
+            candidates = candidates & self._token_index.get(token, set())
+
+        return {eid for eid in candidates if term in self._text[eid]}
+
+    def query(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Return one page of entries matching ``filters``.
+
+        Args:
+            filters: Exact-match filters on INDEXED_FIELDS plus optional ``search``
+            limit: Page size, clamped to MAX_PAGE_SIZE; ``None`` returns every match
+            cursor: Opaque cursor from a previous page's ``next_cursor``
+            fields: Optional projection; ``evidence_id`` is always included
+
+        Returns:
+            Dict with ``evidence``, ``count``, ``total`` and ``next_cursor``
+        """
+        filters = filters or {}
+        if limit is not None:
+            limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        after = decode_cursor(cursor) if cursor else -1
+        wanted = None if limit is None else limit + 1
+
+        candidates: Optional[Set[str]] = None
+        for field_name in INDEXED_FIELDS:
+            value = filters.get(field_name)
+            if value is None:
+                continue
+            ids = self._field_index[field_name].get(value, set())
+            candidates = set(ids) if candidates is None else candidates & ids
+        if filters.get("search"):
+            ids = self._search(filters["search"])
+            candidates = ids if candidates is None else candidates & ids
+
+        if candidates is None:
+            total = len(self._entries)
+            start = bisect_right(self._order, after)
+            page_seqs = self._walk(self._order, start, wanted)
+        else:
+            total = len(candidates)
+            ordered = sorted(self._seq[eid] for eid in candidates)
+            start = bisect_right(ordered, after)
+            page_seqs = list(islice(ordered, start, None if wanted is None else start + wanted))
+
+        has_more = limit is not None and len(page_seqs) > limit
+        page_seqs = page_seqs[:limit]
+        evidence = [self._project(self._entries[self._by_seq[s]], fields) for s in page_seqs]
+
+        return {
+            "evidence": evidence,
+            "count": len(evidence),
+            "total": total,
+            "next_cursor": encode_cursor(page_seqs[-1]) if has_more else None,
+        }
+
+    def _walk(self, order: List[int], start: int, count: Optional[int]) -> List[int]:
+        """Up to ``count`` live seqs from ``order[start:]``, without copying the tail"""
+        live = (seq for seq in islice(order, start, None) if seq in self._by_seq)
+        return list(islice(live, count))
+
+    @staticmethod
+    def _project(entry: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+        if not fields:
+            return entry
+        projected = {"evidence_id": entry.get("evidence_id")}
+        for field_name in fields:
+            if field_name in entry:
+                projected[field_name] = entry[field_name]
+        return projected
+
+    def stats(self) -> Dict[str, Any]:
+        """Aggregate counters maintained on every write"""
+        total = len(self._entries)
+        return {
+            "total_count": total,
+            "by_source": dict(self._by_source),
+            "by_type": dict(self._by_type),
+            "average_relevance_score": self._relevance_total / max(total, 1),
+        }
+
+
+def parse_page_args(
+    args: Dict[str, Any],
+) -> Tuple[Optional[int], Optional[str], Optional[List[str]]]:
+    """
+    Parse ``limit``, ``cursor`` and ``fields`` query parameters
+
+    Without ``limit`` or ``cursor`` the listing is unpaged (limit ``None``), so
+    callers that never paged keep getting every entry.
+    """
+    cursor = args.get("cursor") or None
+    if args.get("limit"):
+        limit = int(args["limit"])
+    else:
+        limit = DEFAULT_PAGE_SIZE if cursor else None
+    fields_arg = args.get("fields")
+    fields = [f.strip() for f in fields_arg.split(",") if f.strip()] if fields_arg else None
+    return limit, cursor, fields
@@ -0,0 +1,327 @@
+"""
+LawyerFactory Background Job Executor
+Bounded execution engine for long-running phase work started from the API.
+
+Phase routes used to record a status dict and return without running
+anything. The executor runs phase pipelines on a worker pool so request
+threads return immediately, and keeps job state in a local SQLite database
+so status survives restarts.
+
+Key Features:
+- Fixed-size worker pool with a per-case concurrency limit (excess jobs queue)
+- Durable job state (queued/running/completed/failed/cancelled/interrupted)
+- Accepted jobs for phases with no server-side pipeline, tracked but never run
+- Cooperative cancellation checked at pipeline progress checkpoints
+- Progress callbacks for Socket.IO broadcasting
+"""
+
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional
+import uuid
+
+logger = logging.getLogger(__name__)
+
+ACCEPTED = "accepted"
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+INTERRUPTED = "interrupted"
+
+FINAL_STATUSES = {COMPLETED, FAILED, CANCELLED, INTERRUPTED}
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested"""
+
+
+class JobStore:
+    """SQLite-backed job state"""
+
+    _COLUMNS = (
+        "job_id",
+        "case_id",
+        "phase_id",
+        "status",
+        "progress",
+        "message",
+        "payload",
+        "result",
+        "error",
+        "cancel_requested",
+        "created_at",
+        "started_at",
+        "finished_at",
+    )
+
+    def __init__(self, db_path: str = ":memory:"):
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            if db_path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    case_id TEXT NOT NULL,
+                    phase_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    progress INTEGER NOT NULL DEFAULT 0,
+                    message TEXT,
+                    payload TEXT,
+                    result TEXT,
+                    error TEXT,
+                    cancel_requested INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_case_id ON jobs (case_id)")
+
+    def create(
+        self,
+        job_id: str,
+        case_id: str,
+        phase_id: str,
+        payload: Dict[str, Any],
+        status: str = QUEUED,
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, case_id, phase_id, status, payload, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, case_id, phase_id, status, json.dumps(payload, default=str), time.time()),
+            )
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        if "result" in fields:
+            fields["result"] = json.dumps(fields["result"], default=str)
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE job_id = ?", (*fields.values(), job_id)
+            )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list_for_case(self, case_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE case_id = ? ORDER BY created_at", (case_id,)
+            ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def mark_interrupted(self) -> int:
+        """Flag jobs left unfinished by a previous process"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ? WHERE status IN (?, ?)",
+                (INTERRUPTED, time.time(), QUEUED, RUNNING),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        for name in ("payload", "result"):
+            if job.get(name):
+                job[name] = json.loads(job[name])
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        return job
+
+
+class JobContext:
+    """Handle passed to a running job for progress reporting and cancellation"""
+
+    def __init__(self, executor: "JobExecutor", job_id: str, case_id: str, phase_id: str):
+        self._executor = executor
+        self.job_id = job_id
+        self.case_id = case_id
+        self.phase_id = phase_id
+
+    @property
+    def cancelled(self) -> bool:
+        return self._executor._is_cancel_requested(self.job_id)
+
+    def check_cancelled(self) -> None:
+        if self.cancelled:
+            raise JobCancelled(self.job_id)
+
+    def report(self, progress: int, message: str = "") -> None:
+        """Record a pipeline checkpoint; raises JobCancelled if cancellation was requested"""
+        self._executor._update(self.job_id, progress=int(progress), message=message)
+        self.check_cancelled()
+
+
+JobFunction = Callable[[JobContext, Dict[str, Any]], Any]
+
+
+class JobExecutor:
+    """Worker pool with per-case concurrency limits and durable job state"""
+
+    def __init__(
+        self,
+        store: JobStore,
+        max_workers: int = 4,
+        per_case_limit: int = 1,
+        on_update: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.store = store
+        self.per_case_limit = max(1, per_case_limit)
+        self.on_update = on_update
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lf-job")
+        self._lock = threading.Lock()
+        self._running: Dict[str, int] = defaultdict(int)
+        self._pending: Dict[str, Deque[str]] = defaultdict(deque)
+        self._functions: Dict[str, JobFunction] = {}
+        self._cancel_events: Dict[str, threading.Event] = {}
+
+        interrupted = store.mark_interrupted()
+        if interrupted:
+            logger.warning(f"Marked {interrupted} unfinished job(s) from a previous run as interrupted")
+
+    def submit(
+        self, case_id: str, phase_id: str, fn: JobFunction, payload: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Queue a job and start it as soon as the case has a free slot"""
+        job_id = str(uuid.uuid4())
+        self.store.create(job_id, case_id, phase_id, payload or {})
+        with self._lock:
+            self._functions[job_id] = fn
+            self._cancel_events[job_id] = threading.Event()
+            self._pending[case_id].append(job_id)
+        self._notify(job_id)
+        self._dispatch(case_id)
+        return job_id
+
+    def accept(
+        self, case_id: str, phase_id: str, payload: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Record a job for a phase with no server-side pipeline
+
+        The job stays ``accepted`` (it is never run, so it never reports
+        completion) until it is cancelled.
+        """
+        job_id = str(uuid.uuid4())
+        self.store.create(job_id, case_id, phase_id, payload or {}, status=ACCEPTED)
+        self._update(job_id, progress=5, message=f"Starting {phase_id}...")
+        return job_id
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Request cancellation; queued and accepted jobs are cancelled immediately"""
+        job = self.store.get(job_id)
+        if job is None or job["status"] in FINAL_STATUSES:
+            return job
+        if job["status"] == ACCEPTED:
+            self._update(job_id, status=CANCELLED, finished_at=time.time())
+            return self.store.get(job_id)
+
+        with self._lock:
+            event = self._cancel_events.get(job_id)
+            if event is not None:
+                event.set()
+            pending = self._pending.get(job["case_id"])
+            was_queued = pending is not None and job_id in pending
+            if was_queued:
+                pending.remove(job_id)
+                self._forget(job_id)
+
+        if was_queued:
+            self._update(job_id, status=CANCELLED, finished_at=time.time())
+        else:
+            self._update(job_id, cancel_requested=1)
+        return self.store.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(job_id)
+
+    def list_jobs(self, case_id: str) -> List[Dict[str, Any]]:
+        return self.store.list_for_case(case_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            for event in self._cancel_events.values():
+                event.set()
+        self._pool.shutdown(wait=wait)
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _dispatch(self, case_id: str) -> None:
+        to_start = []
+        with self._lock:
+            pending = self._pending[case_id]
+            while pending and self._running[case_id] < self.per_case_limit:
+                job_id = pending.popleft()
+                self._running[case_id] += 1
+                to_start.append(job_id)
+        for job_id in to_start:
+            self._pool.submit(self._run, job_id, case_id)
+
+    def _run(self, job_id: str, case_id: str) -> None:
+        job = self.store.get(job_id) or {}
+        fn = self._functions.get(job_id)
+        context = JobContext(self, job_id, case_id, job.get("phase_id", ""))
+        try:
+            self._update(job_id, status=RUNNING, started_at=time.time())
+            context.check_cancelled()
+            result = fn(context, job.get("payload") or {})
+            self._update(
+                job_id, status=COMPLETED, progress=100, result=result, finished_at=time.time()
+            )
+        except JobCancelled:
+            logger.info(f"Job {job_id} cancelled")
+            self._update(job_id, status=CANCELLED, finished_at=time.time())
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            self._update(job_id, status=FAILED, error=str(e), finished_at=time.time())
+        finally:
+            with self._lock:
+                self._running[case_id] -= 1
+                self._forget(job_id)
+            self._dispatch(case_id)
+
+    def _forget(self, job_id: str) -> None:
+        self._functions.pop(job_id, None)
+        self._cancel_events.pop(job_id, None)
+
+    def _is_cancel_requested(self, job_id: str) -> bool:
+        event = self._cancel_events.get(job_id)
+        return event is not None and event.is_set()
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        self.store.update(job_id, **fields)
+        self._notify(job_id)
+
+    def _notify(self, job_id: str) -> None:
+        if self.on_update is None:
+            return
+        job = self.store.get(job_id)
+        if job is None:
+            return
+        try:
+            self.on_update(job)
+        except Exception as e:
+            logger.error(f"Job update callback failed for {job_id}: {e}")
@@ -0,0 +1,124 @@
+"""
+LawyerFactory LLM Client Registry
+Process-wide cache of provider SDK clients for the canonical API server.
+
+Provider SDK clients own an HTTP connection pool. Building one per request
+throws that pool away and pays a fresh TCP/TLS handshake on every call, so
+the server keeps one client per (provider, base_url, api_key) and reuses it.
+
+Key Features:
+- Thread-safe lazy construction keyed by (provider, base_url, api_key)
+- Keep-alive connection pooling via the SDK's own HTTP client
+- Explicit invalidation when /api/settings/llm changes the configuration
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ClientKey = Tuple[str, Optional[str], Optional[str]]
+
+LLM_CLIENT_TIMEOUT = float(os.getenv("LLM_CLIENT_TIMEOUT", "120"))
+LLM_CLIENT_MAX_RETRIES = int(os.getenv("LLM_CLIENT_MAX_RETRIES", "2"))
+
+
+def _build_openai_client(api_key: Optional[str], base_url: Optional[str]) -> Any:
+    import openai
+
+    client_kwargs: Dict[str, Any] = {
+        "api_key": api_key,
+        "timeout": LLM_CLIENT_TIMEOUT,
+        "max_retries": LLM_CLIENT_MAX_RETRIES,
+    }
+    if base_url:
+        client_kwargs["base_url"] = base_url
+    return openai.OpenAI(**client_kwargs)
+
+
+def _build_anthropic_client(api_key: Optional[str], base_url: Optional[str]) -> Any:
+    import anthropic
+
+    client_kwargs: Dict[str, Any] = {
+        "api_key": api_key,
+        "timeout": LLM_CLIENT_TIMEOUT,
+        "max_retries": LLM_CLIENT_MAX_RETRIES,
+    }
+    if base_url:
+        client_kwargs["base_url"] = base_url
+    return anthropic.Anthropic(**client_kwargs)
+
+
+DEFAULT_CLIENT_FACTORIES: Dict[str, Callable[[Optional[str], Optional[str]], Any]] = {
+    "openai": _build_openai_client,
+    "github-copilot": _build_openai_client,
+    "anthropic": _build_anthropic_client,
+}
+
+
+class LLMClientRegistry:
+    """Shared, lazily built LLM SDK clients"""
+
+    def __init__(
+        self,
+        factories: Optional[Dict[str, Callable[[Optional[str], Optional[str]], Any]]] = None,
+    ):
+        self._factories = dict(factories or DEFAULT_CLIENT_FACTORIES)
+        self._clients: Dict[ClientKey, Any] = {}
+        self._lock = threading.Lock()
+        self.stats = {"created": 0, "reused": 0, "invalidated": 0}
+
+    def supports(self, provider: str) -> bool:
+        return provider in self._factories
+
+    def get_client(
+        self, provider: str, base_url: Optional[str] = None, api_key: Optional[str] = None
+    ) -> Any:
+        """
+        Return the shared client for a provider configuration, building it on first use.
+
+        Raises:
+            ValueError: If no client factory is registered for the provider
+        """
+        key: ClientKey = (provider, base_url, api_key)
+        client = self._clients.get(key)
+        if client is not None:
+            self.stats["reused"] += 1
+            return client
+
+        factory = self._factories.get(provider)
+        if factory is None:
+            raise ValueError(f"No LLM client factory registered for provider '{provider}'")
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory(api_key, base_url)
+                self._clients[key] = client
+                self.stats["created"] += 1
+                logger.info(f"✓ Created shared {provider} client")
+            else:
+                self.stats["reused"] += 1
+        return client
+
+    def invalidate(self, provider: Optional[str] = None) -> int:
+        """
+        Drop cached clients so the next call picks up new configuration.
+
+        Clients are released rather than closed: a request already running on
+        another worker thread keeps its reference until it finishes, and the
+        SDK closes the pool when the client is garbage collected.
+        """
+        with self._lock:
+            stale = [key for key in self._clients if provider is None or key[0] == provider]
+            for key in stale:
+                del self._clients[key]
+            self.stats["invalidated"] += len(stale)
+        if stale:
+            logger.info(f"Invalidated {len(stale)} cached LLM client(s)")
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._clients)
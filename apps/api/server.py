@@ -67,6 +67,15 @@ from flask_cors import CORS
 from flask_socketio import SocketIO, emit, join_room, leave_room
 from werkzeug.utils import secure_filename
 
+try:
+    from .evidence_index import EvidenceIndex, parse_page_args, parse_relevance_score
+    from .job_executor import JobCancelled, JobContext, JobExecutor, JobStore
+    from .llm_clients import LLMClientRegistry
+except ImportError:  # Running as a script from apps/api
+    from evidence_index import EvidenceIndex, parse_page_args, parse_relevance_score
+    from job_executor import JobCancelled, JobContext, JobExecutor, JobStore
+    from llm_clients import LLMClientRegistry
+
 # ============================================================================
 # CONFIGURATION & LOGGING
 # ============================================================================
@@ -295,34 +304,98 @@ def serialize_llm_config() -> Dict[str, Any]:
 
 llm_config.update(build_llm_config())
 
+# Shared provider clients (one connection pool per provider configuration)
+llm_clients = LLMClientRegistry()
+
 # In-memory stores (replace with database for production)
 research_status_store = {}
 research_results_store = {}
 outline_status_store = {}
 outline_results_store = {}
-evidence_store = {}  # Temporary storage for development
+evidence_store = EvidenceIndex()  # Indexed in-memory storage for development
 phase_status_store = {}
 
-# Try to import LawyerFactory components
+# Coalescing Socket.IO event bus (falls back to direct emits)
+publish_event = None
+get_event_bus = None
+try:
+    from lawyerfactory.phases.socket_events import (
+        get_event_bus,
+        publish_event,
+        set_socketio_instance,
+    )
+
+    set_socketio_instance(
+        socketio,
+        window=float(os.getenv("LF_SOCKET_COALESCE_WINDOW", "0.1")),
+        batch_frames=os.getenv("LF_SOCKET_BATCH_FRAMES", "0") == "1",
+    )
+except ImportError as e:
+    logger.warning(f"Socket event bus not available, emitting directly: {e}")
+
+
+def broadcast_phase_progress(payload: Dict[str, Any]) -> None:
+    """Send phase_progress_update through the event bus, coalesced per task or phase"""
+    entity = payload.get("task_id") or payload.get("phase")
+    if not (publish_event and publish_event("phase_progress_update", payload, entity=entity)):
+        socketio.emit("phase_progress_update", payload)
+
+
+def _on_job_update(job: Dict[str, Any]) -> None:
+    """Mirror job state into phase_status_store and broadcast progress"""
+    phase_status_store[job["job_id"]] = {
+        "phase_id": job["phase_id"],
+        "case_id": job["case_id"],
+        "status": job["status"],
+        "progress": job["progress"],
+        "message": job.get("message"),
+        "started_at": job.get("started_at"),
+    }
+    broadcast_phase_progress(
+        {
+            "phase": job["phase_id"],
+            "case_id": job["case_id"],
+            "task_id": job["job_id"],
+            "status": job["status"],
+            "progress": job["progress"],
+            "message": job.get("message") or job["status"],
+        },
+    )
+
+
+# Background execution for phase work (durable state in local SQLite)
+_job_executor: Optional[JobExecutor] = None
+
+
+def get_job_executor() -> JobExecutor:
+    """Get the process-wide job executor, opening its job database on first use"""
+    global _job_executor
+    if _job_executor is None:
+        _job_executor = JobExecutor(
+            JobStore(os.getenv("LF_JOB_DB", "./workflow_storage/jobs.sqlite3")),
+            max_workers=int(os.getenv("LF_JOB_WORKERS", "4")),
+            per_case_limit=int(os.getenv("LF_JOBS_PER_CASE", "1")),
+            on_update=_on_job_update,
+        )
+    return _job_executor
+
+# Try to import LawyerFactory components. Storage and vector store
+# instances are heavy (databases, embedding models, remote clients), so they
+# are built on first use rather than at import time.
 LAWYERFACTORY_AVAILABLE = False
-unified_storage = None
-research_bot = None
 bartleby_handler = None
+_unified_storage = None
 
 try:
-    from lawyerfactory.agents.research.research import ResearchBot
     from lawyerfactory.chat.bartleby_handler import BartlebyChatHandler, register_chat_routes
     from lawyerfactory.storage.core.unified_storage_api import get_enhanced_unified_storage_api
-    from lawyerfactory.storage.vectors.enhanced_vector_store import EnhancedVectorStoreManager
+    from lawyerfactory.storage.vectors.enhanced_vector_store import get_enhanced_vector_store
 
     LAWYERFACTORY_AVAILABLE = True
-    unified_storage = get_enhanced_unified_storage_api()
-    research_bot = ResearchBot()
 
-    # Initialize Bartleby AI Legal Clerk
-    vector_store = EnhancedVectorStoreManager()
+    # Initialize Bartleby AI Legal Clerk (vector store is attached on first search)
     bartleby_handler = BartlebyChatHandler(
-        vector_store_manager=vector_store,
+        vector_store_factory=get_enhanced_vector_store,
         evidence_table=None,  # Will be set after evidence API initialization
     )
 
@@ -331,6 +404,15 @@ try:
 except ImportError as e:
     logger.warning(f"LawyerFactory components not available: {e}")
 
+
+def get_unified_storage():
+    """Get the shared unified storage API, creating it on first use"""
+    global _unified_storage
+    if _unified_storage is None and LAWYERFACTORY_AVAILABLE:
+        _unified_storage = get_enhanced_unified_storage_api()
+        _unified_storage.start_lifecycle()
+    return _unified_storage
+
 # ============================================================================
 # EVIDENCE MANAGEMENT ROUTES (Single Implementation)
 # ============================================================================
@@ -338,7 +420,7 @@ except ImportError as e:
 
 @app.route("/api/evidence", methods=["GET"])
 def get_evidence():
-    """Retrieve evidence table with filtering"""
+    """Retrieve a page of the evidence table with filtering, search and projection"""
     try:
         filters = {
             "evidence_source": request.args.get("evidence_source"),
@@ -349,28 +431,20 @@ def get_evidence():
         }
         filters = {k: v for k, v in filters.items() if v}
 
-        evidence_list = list(evidence_store.values())
-
-        if filters.get("search"):
-            search_term = filters["search"].lower()
-            evidence_list = [e for e in evidence_list if search_term in str(e).lower()]
-
-        if filters.get("evidence_source"):
-            evidence_list = [
-                e for e in evidence_list if e.get("evidence_source") == filters["evidence_source"]
-            ]
-
-        if filters.get("evidence_type"):
-            evidence_list = [
-                e for e in evidence_list if e.get("evidence_type") == filters["evidence_type"]
-            ]
+        try:
+            limit, cursor, fields = parse_page_args(request.args)
+            page = evidence_store.query(filters, limit=limit, cursor=cursor, fields=fields)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         return (
             jsonify(
                 {
                     "success": True,
-                    "evidence": evidence_list,
-                    "count": len(evidence_list),
+                    "evidence": page["evidence"],
+                    "count": page["count"],
+                    "total": page["total"],
+                    "next_cursor": page["next_cursor"],
                     "filters": filters,
                 }
             ),
@@ -392,6 +466,11 @@ def create_evidence():
         if not all(data.get(field) for field in required_fields):
             return jsonify({"error": "Missing required fields"}), 400
 
+        try:
+            relevance_score = parse_relevance_score(data.get("relevance_score", 0.0))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
         evidence_id = str(uuid.uuid4())
         evidence_entry = {
             "evidence_id": evidence_id,
@@ -401,7 +480,7 @@ def create_evidence():
             "content": data.get("content"),
             "evidence_type": data.get("evidence_type"),
             "evidence_source": data.get("evidence_source"),
-            "relevance_score": float(data.get("relevance_score", 0.0)),
+            "relevance_score": relevance_score,
             "relevance_level": data.get("relevance_level", "unknown"),
             "bluebook_citation": data.get("bluebook_citation", ""),
             "extracted_date": data.get("extracted_date"),
@@ -454,8 +533,12 @@ def update_evidence(evidence_id):
             return jsonify({"error": "Evidence not found"}), 404
 
         data = request.get_json()
-        evidence_store[evidence_id].update(data)
-        evidence_store[evidence_id]["updated_at"] = time.time()
+        if "relevance_score" in data:
+            try:
+                data["relevance_score"] = parse_relevance_score(data["relevance_score"])
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+        evidence_store.patch(evidence_id, {**data, "updated_at": time.time()})
 
         logger.info(f"✓ Updated evidence entry: {evidence_id}")
 
@@ -527,10 +610,16 @@ def batch_evidence_operations():
                     results.append({"id": eid, "status": "deleted"})
 
         elif operation == "update":
+            if "relevance_score" in operation_data:
+                try:
+                    operation_data["relevance_score"] = parse_relevance_score(
+                        operation_data["relevance_score"]
+                    )
+                except ValueError as e:
+                    return jsonify({"error": str(e)}), 400
             for eid in evidence_ids:
                 if eid in evidence_store:
-                    evidence_store[eid].update(operation_data)
-                    evidence_store[eid]["updated_at"] = time.time()
+                    evidence_store.patch(eid, {**operation_data, "updated_at": time.time()})
                     results.append({"id": eid, "status": "updated"})
 
         logger.info(f"✓ Batch operation '{operation}' completed: {len(results)} items")
@@ -546,31 +635,7 @@ def batch_evidence_operations():
 def get_evidence_stats():
     """Get evidence statistics"""
     try:
-        total = len(evidence_store)
-        by_source = {}
-        by_type = {}
-
-        for evidence in evidence_store.values():
-            source = evidence.get("evidence_source", "unknown")
-            etype = evidence.get("evidence_type", "unknown")
-            by_source[source] = by_source.get(source, 0) + 1
-            by_type[etype] = by_type.get(etype, 0) + 1
-
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "total_count": total,
-                    "by_source": by_source,
-                    "by_type": by_type,
-                    "average_relevance_score": sum(
-                        e.get("relevance_score", 0) for e in evidence_store.values()
-                    )
-                    / max(total, 1),
-                }
-            ),
-            200,
-        )
+        return jsonify({"success": True, **evidence_store.stats()}), 200
 
     except Exception as e:
         logger.error(f"Error getting evidence stats: {e}")
@@ -640,8 +705,7 @@ def start_research_phase():
             "created_at": time.time(),
         }
 
-        socketio.emit(
-            "phase_progress_update",
+        broadcast_phase_progress(
             {
                 "phase": "phaseA02_research",
                 "case_id": case_id,
@@ -822,8 +886,7 @@ def process_intake():
         data = request.get_json()
         case_id = str(uuid.uuid4())
 
-        socketio.emit(
-            "phase_progress_update",
+        broadcast_phase_progress(
             {
                 "phase": "phaseA01_intake",
                 "case_id": case_id,
@@ -867,23 +930,7 @@ def start_phase(phase_id):
         if not case_id:
             return jsonify({"error": "case_id required"}), 400
 
-        task_id = str(uuid.uuid4())
-        phase_status_store[task_id] = {
-            "phase_id": phase_id,
-            "case_id": case_id,
-            "status": "running",
-            "started_at": time.time(),
-        }
-
-        socketio.emit(
-            "phase_progress_update",
-            {
-                "phase": phase_id,
-                "case_id": case_id,
-                "progress": 5,
-                "message": f"Starting {phase_id}...",
-            },
-        )
+        task_id, status = start_phase_job(case_id, phase_id, data)
 
         logger.info(f"✓ Started phase {phase_id} for case {case_id}")
 
@@ -894,7 +941,7 @@ def start_phase(phase_id):
                     "phase_id": phase_id,
                     "case_id": case_id,
                     "task_id": task_id,
-                    "status": "started",
+                    "status": status,
                 }
             ),
             200,
@@ -909,9 +956,23 @@ def start_phase(phase_id):
 def get_phase_status(phase_id, task_id):
     """Get phase execution status"""
     try:
-        status = phase_status_store.get(
-            task_id, {"phase_id": phase_id, "status": "unknown", "progress": 0}
-        )
+        job = get_job_executor().get(task_id)
+        if job is None:
+            status = phase_status_store.get(
+                task_id, {"phase_id": phase_id, "status": "unknown", "progress": 0}
+            )
+            return (
+                jsonify(
+                    {
+                        "success": True,
+                        "phase_id": phase_id,
+                        "task_id": task_id,
+                        "status": status.get("status", "unknown"),
+                        "progress": status.get("progress", 0),
+                    }
+                ),
+                200,
+            )
 
         return (
             jsonify(
@@ -919,8 +980,12 @@ def get_phase_status(phase_id, task_id):
                     "success": True,
                     "phase_id": phase_id,
                     "task_id": task_id,
-                    "status": status.get("status", "unknown"),
-                    "progress": status.get("progress", 0),
+                    "status": job["status"],
+                    "progress": job["progress"],
+                    "message": job.get("message"),
+                    "error": job.get("error"),
+                    "result": job.get("result"),
+                    "cancel_requested": job["cancel_requested"],
                 }
             ),
             200,
@@ -938,14 +1003,18 @@ def cancel_phase(phase_id):
         data = request.get_json()
         task_id = data.get("task_id")
 
-        if task_id in phase_status_store:
-            phase_status_store[task_id]["status"] = "cancelled"
-            logger.info(f"✓ Cancelled phase {phase_id}")
+        job = get_job_executor().cancel(task_id) if task_id else None
+        if job is None:
+            if task_id in phase_status_store:
+                phase_status_store[task_id]["status"] = "cancelled"
+            status = "cancelled"
+        else:
+            # Running jobs stop at their next progress checkpoint
+            status = "cancelling" if job["status"] == "running" else job["status"]
+        logger.info(f"✓ Cancellation requested for phase {phase_id} ({task_id}): {status}")
 
         return (
-            jsonify(
-                {"success": True, "phase_id": phase_id, "task_id": task_id, "status": "cancelled"}
-            ),
+            jsonify({"success": True, "phase_id": phase_id, "task_id": task_id, "status": status}),
             200,
         )
 
@@ -969,8 +1038,7 @@ def generate_outline():
         if not case_id:
             return jsonify({"error": "case_id required"}), 400
 
-        socketio.emit(
-            "phase_progress_update",
+        broadcast_phase_progress(
             {
                 "phase": "phaseA03_outline",
                 "case_id": case_id,
@@ -1174,23 +1242,28 @@ Extract facts as a JSON array with this structure:
 
 Return ONLY the JSON array, no other text. Facts should be objective but emphasize facts favorable to the client."""
 
-        if provider in {"openai", "github-copilot"}:
+        if llm_clients.supports(provider):
             try:
-                import openai
-
-                client_kwargs = {"api_key": api_key}
-                base_url = get_provider_base_url(provider, llm_config.get("base_url"))
-                if base_url:
-                    client_kwargs["base_url"] = base_url
-
-                client = openai.OpenAI(**client_kwargs)
-                response = client.chat.completions.create(
-                    model=llm_config.get("model", get_default_llm_model(provider)),
-                    messages=[{"role": "user", "content": extraction_prompt}],
-                    temperature=0.1,
-                    max_tokens=3000,
+                client = llm_clients.get_client(
+                    provider, get_provider_base_url(provider, llm_config.get("base_url")), api_key
                 )
-                facts_json = response.choices[0].message.content or "[]"
+                model = llm_config.get("model", get_default_llm_model(provider))
+                if provider == "anthropic":
+                    response = client.messages.create(
+                        model=model,
+                        messages=[{"role": "user", "content": extraction_prompt}],
+                        temperature=0.1,
+                        max_tokens=3000,
+                    )
+                    facts_json = response.content[0].text if response.content else "[]"
+                else:
+                    response = client.chat.completions.create(
+                        model=model,
+                        messages=[{"role": "user", "content": extraction_prompt}],
+                        temperature=0.1,
+                        max_tokens=3000,
+                    )
+                    facts_json = response.choices[0].message.content or "[]"
             except Exception as e:
                 logger.warning(f"{provider} extraction failed: {e}; using heuristic")
                 return extract_facts_heuristic(user_narrative, evidence_items)
@@ -1362,8 +1435,7 @@ def generate_statement_of_facts_endpoint():
         with open(sof_path, "w") as f:
             f.write(sof_text)
 
-        socketio.emit(
-            "phase_progress_update",
+        broadcast_phase_progress(
             {
                 "phase": "phaseA03_outline",
                 "case_id": case_id,
@@ -1454,7 +1526,9 @@ def validate_rule_12b6():
 # ============================================================================
 
 
-async def handle_drafting_phase_async(case_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_drafting_phase_async(
+    case_id: str, data: Dict[str, Any], job: Optional[JobContext] = None
+) -> Dict[str, Any]:
     """
     Phase B02: Document Drafting - Sequential IRAC + RAG + Multi-Agent Approach
 
@@ -1472,7 +1546,24 @@ async def handle_drafting_phase_async(case_id: str, data: Dict[str, Any]) -> Dic
     - Vector RAG: Semantic search for evidence, case law, and legal facts
     - Multi-Agent Swarm: WriterBot (drafting) + EditorBot (validation) + Maestro (orchestration)
     - Evidence Table: Primary/secondary evidence access with citations
+
+    When run as a background job, each progress update is a job checkpoint and
+    raises JobCancelled once cancellation has been requested.
     """
+
+    def report(progress: int, message: str) -> None:
+        if job is not None:
+            job.report(progress, message)
+        else:
+            broadcast_phase_progress(
+                {
+                    "phase": "phaseB02_drafting",
+                    "case_id": case_id,
+                    "progress": progress,
+                    "message": message,
+                },
+            )
+
     llm_config_request = {
         "provider": data.get("llm_provider", llm_config.get("provider", "openai")),
         "model": data.get("llm_model", llm_config.get("model", "gpt-4")),
@@ -1481,14 +1572,10 @@ async def handle_drafting_phase_async(case_id: str, data: Dict[str, Any]) -> Dic
         "api_key": data.get("llm_api_key", llm_config.get("api_key")),
     }
 
-    socketio.emit(
-        "phase_progress_update",
-        {
-            "phase": "phaseB02_drafting",
-            "case_id": case_id,
-            "progress": 5,
-            "message": f"🚀 Initializing sequential IRAC + RAG drafting with {llm_config_request['provider']}/{llm_config_request['model']}...",
-        },
+    report(
+        5,
+        f"🚀 Initializing sequential IRAC + RAG drafting with "
+        f"{llm_config_request['provider']}/{llm_config_request['model']}...",
     )
 
     try:
@@ -1501,15 +1588,7 @@ async def handle_drafting_phase_async(case_id: str, data: Dict[str, Any]) -> Dic
                 "case_id": case_id,
             }
 
-        socketio.emit(
-            "phase_progress_update",
-            {
-                "phase": "phaseB02_drafting",
-                "case_id": case_id,
-                "progress": 10,
-                "message": "📂 Loading skeletal outline, claims matrix, evidence table, and shot                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                               .xvz,...",
-            },
-        )
+        report(10, "📂 Loading skeletal outline, claims matrix, evidence table, and shot list...")
 
         shotlist_facts = []
         claims_matrix_data = {}
@@ -1537,14 +1616,9 @@ async def handle_drafting_phase_async(case_id: str, data: Dict[str, Any]) -> Dic
             f"{len(skeletal_outline_data.get('sections', []))} skeleton sections"
         )
 
-        socketio.emit(
-            "phase_progress_update",
-            {
-                "phase": "phaseB02_drafting",
-                "case_id": case_id,
-                "progress": 15,
-                "message": f"✅ Loaded {len(skeletal_outline_data.get('sections', []))} sections to draft sequentially",
-            },
+        report(
+            15,
+            f"✅ Loaded {len(skeletal_outline_data.get('sections', []))} sections to draft sequentially",
         )
 
         try:
@@ -1566,7 +1640,7 @@ async def handle_drafting_phase_async(case_id: str, data: Dict[str, Any]) -> Dic
         except ImportError:
             bots_available = False
 
-        unified_storage_instance = unified_storage
+        unified_storage_instance = get_unified_storage()
         if not unified_storage_instance:
             try:
                 from lawyerfactory.storage.core.unified_storage_api import (
@@ -1577,15 +1651,7 @@ async def handle_drafting_phase_async(case_id: str, data: Dict[str, Any]) -> Dic
             except ImportError:
                 unified_storage_instance = None
 
-        socketio.emit(
-            "phase_progress_update",
-            {
-                "phase": "phaseB02_drafting",
-                "case_id": case_id,
-                "progress": 25,
-                "message": "🤖 Initializing WriterBot, EditorBot, and Maestro orchestrator...",
-            },
-        )
+        report(25, "🤖 Initializing WriterBot, EditorBot, and Maestro orchestrator...")
 
         if not (bots_available and irac_available):
             logger.warning("Core drafting components unavailable, using fallback")
@@ -1615,14 +1681,8 @@ async def handle_drafting_phase_async(case_id: str, data: Dict[str, Any]) -> Dic
             section_title = section.get("title", "Untitled Section")
 
             progress = 25 + int((idx / total_sections) * 65)
-            socketio.emit(
-                "phase_progress_update",
-                {
-                    "phase": "phaseB02_drafting",
-                    "case_id": case_id,
-                    "progress": progress,
-                    "message": f"📝 Sequential IRAC: {section_title} (Section {idx+1}/{total_sections})",
-                },
+            report(
+                progress, f"📝 Sequential IRAC: {section_title} (Section {idx+1}/{total_sections})"
             )
 
             try:
@@ -1702,15 +1762,7 @@ async def handle_drafting_phase_async(case_id: str, data: Dict[str, Any]) -> Dic
                     }
                 )
 
-        socketio.emit(
-            "phase_progress_update",
-            {
-                "phase": "phaseB02_drafting",
-                "case_id": case_id,
-                "progress": 95,
-                "message": "📄 Assembling final IRAC-driven complaint...",
-            },
-        )
+        report(95, "📄 Assembling final IRAC-driven complaint...")
 
         complaint_parts = [
             f"\n\n{'='*80}\n{s['title'].upper()}\n{'='*80}\n\n{s['content']}"
@@ -1726,14 +1778,10 @@ async def handle_drafting_phase_async(case_id: str, data: Dict[str, Any]) -> Dic
         with open(draft_path, "w") as f:
             f.write(full_complaint)
 
-        socketio.emit(
-            "phase_progress_update",
-            {
-                "phase": "phaseB02_drafting",
-                "case_id": case_id,
-                "progress": 100,
-                "message": f"✅ Sequential IRAC drafting complete: {total_word_count} words, {len(drafted_sections)} sections",
-            },
+        report(
+            100,
+            f"✅ Sequential IRAC drafting complete: {total_word_count} words, "
+            f"{len(drafted_sections)} sections",
         )
 
         return {
@@ -1748,6 +1796,8 @@ async def handle_drafting_phase_async(case_id: str, data: Dict[str, Any]) -> Dic
             "message": "Complaint drafted using sequential nested IRAC with RAG enhancement",
         }
 
+    except JobCancelled:
+        raise
     except Exception as e:
         logger.error(f"Phase B02 drafting error for case {case_id}: {e}")
         return {
@@ -1758,6 +1808,31 @@ async def handle_drafting_phase_async(case_id: str, data: Dict[str, Any]) -> Dic
         }
 
 
+def run_drafting_job(job: JobContext, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Job entry point for Phase B02 drafting"""
+    result = asyncio.run(handle_drafting_phase_async(job.case_id, data, job=job))
+    if result.get("status") == "error":
+        raise RuntimeError(result.get("error") or result.get("message", "Drafting failed"))
+    return result
+
+
+# Phase pipelines runnable through /api/phases/<phase_id>/start. Phases not
+# listed here have no server-side pipeline yet; they are accepted and tracked
+# but never run, so they are never reported as completed without doing work.
+PHASE_JOB_RUNNERS = {
+    "phaseB02_drafting": run_drafting_job,
+}
+
+
+def start_phase_job(case_id: str, phase_id: str, data: Dict[str, Any]) -> tuple:
+    """Submit a phase's job runner, or accept the phase if it has none; returns (task_id, status)"""
+    runner = PHASE_JOB_RUNNERS.get(phase_id)
+    if runner is None:
+        logger.info(f"Phase {phase_id} has no job runner; accepted for case {case_id}")
+        return get_job_executor().accept(case_id, phase_id, data), "accepted"
+    return get_job_executor().submit(case_id, phase_id, runner, data), "started"
+
+
 @app.route("/api/drafting/start", methods=["POST"])
 def start_drafting():
     """Start drafting phase"""
@@ -1768,15 +1843,7 @@ def start_drafting():
         if not case_id:
             return jsonify({"error": "case_id required"}), 400
 
-        socketio.emit(
-            "phase_progress_update",
-            {
-                "phase": "phaseB02_drafting",
-                "case_id": case_id,
-                "progress": 5,
-                "message": "Initializing sequential IRAC + RAG drafting...",
-            },
-        )
+        task_id = get_job_executor().submit(case_id, "phaseB02_drafting", run_drafting_job, data)
 
         logger.info(f"✓ Started drafting phase for case {case_id}")
 
@@ -1785,6 +1852,7 @@ def start_drafting():
                 {
                     "success": True,
                     "case_id": case_id,
+                    "task_id": task_id,
                     "status": "started",
                     "method": "sequential_nested_irac_rag",
                 }
@@ -1836,19 +1904,14 @@ def start_orchestration():
         if not case_id:
             return jsonify({"error": "case_id required"}), 400
 
-        socketio.emit(
-            "phase_progress_update",
-            {
-                "phase": "phaseC02_orchestration",
-                "case_id": case_id,
-                "progress": 5,
-                "message": "Starting final orchestration...",
-            },
-        )
+        task_id, status = start_phase_job(case_id, "phaseC02_orchestration", data)
 
         logger.info(f"✓ Started orchestration phase for case {case_id}")
 
-        return jsonify({"success": True, "case_id": case_id, "status": "started"}), 200
+        return (
+            jsonify({"success": True, "case_id": case_id, "task_id": task_id, "status": status}),
+            200,
+        )
 
     except Exception as e:
         logger.error(f"Error starting orchestration: {e}")
@@ -1970,6 +2033,7 @@ def update_llm_config():
             }
         )
         llm_config.update(normalized_config)
+        llm_clients.invalidate()
 
         logger.info(
             "✓ Updated LLM config: %s/%s",
@@ -2017,6 +2081,21 @@ def health_check():
         return jsonify({"status": "error", "error": str(e)}), 500
 
 
+@app.route("/api/events/metrics", methods=["GET"])
+def get_event_metrics():
+    """Socket.IO event bus metrics (published vs coalesced vs emitted)"""
+    try:
+        bus = get_event_bus() if get_event_bus else None
+        if bus is None:
+            return jsonify({"success": True, "enabled": False}), 200
+
+        return jsonify({"success": True, "enabled": True, "metrics": bus.get_metrics()}), 200
+
+    except Exception as e:
+        logger.error(f"Error getting event metrics: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
 # ============================================================================
 # SOCKET.IO EVENT HANDLERS
 # ============================================================================
@@ -2111,6 +2190,59 @@ def on_bartleby_narrate_phase(data):
         emit("bartleby_error", {"error": str(e)})
 
 
+@socketio.on("bartleby_chat_message")
+def on_bartleby_chat_message(data):
+    """
+    Stream a Bartleby reply to the case room, token by token.
+    A new message for the same case cancels the reply still in flight.
+
+    Expected data:
+    {
+        "case_id": str,
+        "message": str,
+        "context": dict (optional: outline, evidence, phases, attached),
+        "settings": dict (optional LLM settings)
+    }
+    """
+    case_id = data.get("case_id")
+    if not bartleby_handler:
+        emit(
+            "bartleby_error",
+            {"case_id": case_id, "message": "Bartleby AI Legal Clerk is not available"},
+        )
+        return
+    if not case_id:
+        # Without a case there is no room to stream to, so reply to the sender only
+        emit("bartleby_error", {"case_id": case_id, "message": "case_id required"})
+        return
+
+    from lawyerfactory.chat.bartleby_handler import ChatContext
+
+    context_data = data.get("context", {})
+    context = ChatContext(
+        case_id=case_id,
+        skeletal_outline=context_data.get("outline"),
+        evidence_data=context_data.get("evidence"),
+        phase_statuses=context_data.get("phases"),
+        attached_context=context_data.get("attached", []),
+    )
+    bartleby_handler.start_stream(
+        case_id,
+        data.get("message", ""),
+        context,
+        data.get("settings", {}),
+        emit=lambda event, payload: socketio.emit(event, payload, room=case_id),
+    )
+
+
+@socketio.on("bartleby_cancel_stream")
+def on_bartleby_cancel_stream(data):
+    """Stop the Bartleby reply currently streaming to a case"""
+    case_id = data.get("case_id")
+    if bartleby_handler:
+        bartleby_handler.cancel_stream(case_id)
+
+
 @socketio.on("bartleby_user_intervention")
 def on_bartleby_user_intervention(data):
     """
@@ -2217,16 +2349,20 @@ def main():
     logger.info(f"🚀 Starting LawyerFactory Canonical API Server")
     logger.info(f"📍 Host: {args.host}:{args.port}")
     logger.info(f"🤖 LawyerFactory available: {LAWYERFACTORY_AVAILABLE}")
-    logger.info(f"💾 Storage available: {unified_storage is not None}")
+    logger.info(f"💾 Storage available: {LAWYERFACTORY_AVAILABLE} (initialized on first use)")
 
     allow_unsafe = not EVENTLET_AVAILABLE
-    socketio.run(
-        app,
-        host=args.host,
-        port=args.port,
-        debug=args.debug,
-        allow_unsafe_werkzeug=allow_unsafe,
-    )
+    try:
+        socketio.run(
+            app,
+            host=args.host,
+            port=args.port,
+            debug=args.debug,
+            allow_unsafe_werkzeug=allow_unsafe,
+        )
+    finally:
+        if _unified_storage is not None:
+            asyncio.run(_unified_storage.close())
 
 
 if __name__ == "__main__":
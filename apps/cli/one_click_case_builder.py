@@ -11,6 +11,7 @@ from pathlib import Path
 from lawyerfactory.post_production.deliverables import CourtPacketInputs, build_cover_sheet_text
 from lawyerfactory.post_production.pdf_generator import (
     DocumentFormat,
+    PAGE_BREAK,
     DocumentMetadata,
     LegalPDFGenerator,
 )
@@ -145,14 +146,10 @@ def _slugify_case_id(plaintiff: str, defendant: str) -> str:
     return re.sub(r"[^A-Za-z0-9_]+", "_", raw).strip("_")
 
 
-async def build_case_package(
-    answers: IntakeAnswers,
-    output_dir: str = "output/cli",
-) -> CaseBuildResult:
-    """Generate a single PDF containing cover sheet and core case sections."""
-    evidence_files = _list_evidence_files(Path(answers.evidence_folder))
-    case_id = _slugify_case_id(answers.plaintiff, answers.defendant)
-
+def _build_package_content(
+    answers: IntakeAnswers, evidence_files: list[Path], case_id: str
+) -> str:
+    """Join the package sections, each starting on its own page."""
     cover_sheet = build_cover_sheet_text(
         CourtPacketInputs(
             case_id=case_id,
@@ -171,25 +168,39 @@ async def build_case_package(
         answers.defendant,
     )
 
-    merged_content = "\n\n".join(
+    # Page breaks let the PDF generator cache and reuse each section independently
+    return PAGE_BREAK.join(
         [cover_sheet, statement_of_facts, table_of_authorities, statement_of_claims]
     )
 
+
+async def build_case_package(
+    answers: IntakeAnswers,
+    output_dir: str = "output/cli",
+) -> CaseBuildResult:
+    """Generate a single PDF containing cover sheet and core case sections."""
+    evidence_files = _list_evidence_files(Path(answers.evidence_folder))
+    case_id = _slugify_case_id(answers.plaintiff, answers.defendant)
+    merged_content = _build_package_content(answers, evidence_files, case_id)
+
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
     generator = LegalPDFGenerator(output_directory=str(output_path))
-    result = await generator.generate_pdf(
-        content=merged_content,
-        metadata=DocumentMetadata(
-            title="Ready-to-File Complaint Package",
-            case_name=f"{answers.plaintiff} v. {answers.defendant}",
-            court=answers.venue,
-            case_number="TBD",
-            document_type=DocumentFormat.COMPLAINT,
-        ),
-        output_filename=f"{case_id}_ready_to_file.pdf",
-    )
+    try:
+        result = await generator.generate_pdf(
+            content=merged_content,
+            metadata=DocumentMetadata(
+                title="Ready-to-File Complaint Package",
+                case_name=f"{answers.plaintiff} v. {answers.defendant}",
+                court=answers.venue,
+                case_number="TBD",
+                document_type=DocumentFormat.COMPLAINT,
+            ),
+            output_filename=f"{case_id}_ready_to_file.pdf",
+        )
+    finally:
+        generator.close()
     if not result.success or not result.file_path:
         error = result.error_message or "Unknown PDF generation error"
         raise RuntimeError(f"Failed to generate output package: {error}")
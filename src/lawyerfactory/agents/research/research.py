@@ -12,19 +12,17 @@ Integrates with CourtListener API, Google Scholar, Tavily Search, and other lega
 """
 
 import asyncio
-import json
 import logging
 import os
 import re
 import time
-import urllib.error
-import urllib.parse
-import urllib.request
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from ...research.http_client import ResearchHttpClient, get_http_client
+
 # Import Tavily integration for comprehensive research
 try:
     from ...research.tavily_integration import (
@@ -163,11 +161,14 @@ class ResearchResult:
 
 
 class CourtListenerClient:
-    """Client for CourtListener API integration using urllib"""
+    """Client for CourtListener API integration over the shared research HTTP client"""
 
-    def __init__(self, api_token: str | None = None):
+    def __init__(
+        self, api_token: str | None = None, http_client: ResearchHttpClient | None = None
+    ):
         self.base_url = "https://www.courtlistener.com/api/rest/v4/"
         self.api_token = api_token or os.environ.get("COURTLISTENER_API_KEY")
+        self._http = http_client
         self.rate_limit = {
             "requests_per_minute": 5000 if self.api_token else 100,
             "last_request": 0,
@@ -175,6 +176,13 @@ class CourtListenerClient:
             "reset_time": time.time() + 60,
         }
 
+    @property
+    def http(self) -> ResearchHttpClient:
+        return self._http or get_http_client()
+
+    def _headers(self) -> dict[str, str]:
+        return {"Authorization": f"Token {self.api_token}"} if self.api_token else {}
+
     async def _rate_limit_check(self):
         """Enforce API rate limits"""
         current_time = time.time()
@@ -219,18 +227,9 @@ class CourtListenerClient:
             params["page_size4"] = str(min(limit, 100))  # API max, convert to string
 
         try:
-            url = f"{self.base_url}search/?" + urllib.parse.urlencode(params)
-            headers = {}
-            if self.api_token:
-                headers["Authorization"] = f"Token {self.api_token}"
-
-            request = urllib.request.Request(url, headers=headers)
-
-            # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, urllib.request.urlopen, request)
-
-            data = json.loads(response.read().decode("utf-8"))
+            data = await self.http.get_json(
+                f"{self.base_url}search/", params=params, headers=self._headers()
+            )
             return data.get("results", [])
 
         except Exception as e:
@@ -257,17 +256,9 @@ class CourtListenerClient:
         await self._rate_limit_check()
 
         try:
-            url = f"{self.base_url}opinions/{opinion_id}/"
-            headers = {}
-            if self.api_token:
-                headers["Authorization"] = f"Token {self.api_token}"
-
-            request = urllib.request.Request(url, headers=headers)
-
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, urllib.request.urlopen, request)
-
-            return json.loads(response.read().decode("utf-8"))
+            return await self.http.get_json(
+                f"{self.base_url}opinions/{opinion_id}/", headers=self._headers()
+            )
 
         except Exception as e:
             logger.error(f"Failed to get opinion details: {e}")
@@ -277,12 +268,9 @@ class CourtListenerClient:
         """Fetch opinion-cluster (to enumerate sub-opinions like concurrences/dissents)"""
         await self._rate_limit_check()
         try:
-            url = f"{self.base_url}opinion-clusters/{cluster_id}/"
-            headers = {"Authorization": f"Token {self.api_token}"} if self.api_token else {}
-            req = urllib.request.Request(url, headers=headers)
-            loop = asyncio.get_event_loop()
-            resp = await loop.run_in_executor(None, urllib.request.urlopen, req)
-            return json.loads(resp.read().decode("utf-8"))
+            return await self.http.get_json(
+                f"{self.base_url}opinion-clusters/{cluster_id}/", headers=self._headers()
+            )
         except Exception as e:
             logger.error(f"Failed to get opinion cluster: {e}")
             return {"mock": True, "cluster_id": cluster_id}
@@ -340,9 +328,16 @@ class CourtListenerClient:
 class OpenAlexClient:
     """Minimal OpenAlex client for academic law/secondary sources (no API key required)."""
 
-    def __init__(self, contact_email: str | None = None):
+    def __init__(
+        self, contact_email: str | None = None, http_client: ResearchHttpClient | None = None
+    ):
         self.base_url = "https://api.openalex.org/works"
         self.contact_email = contact_email or "mailto:researchbot@example.com"
+        self._http = http_client
+
+    @property
+    def http(self) -> ResearchHttpClient:
+        return self._http or get_http_client()
 
     async def search_legal(self, query: str, limit: int = 10) -> list[dict]:
         """
@@ -350,13 +345,9 @@ class OpenAlexClient:
         """
         params = {"search": query, "per_page": str(min(limit, 25))}
         # You can add filters like: primary_location.source.type:journal, from_publication_date:2010-01-01
-        url = f"{self.base_url}?" + urllib.parse.urlencode(params)
         headers = {"User-Agent": f"lawyerfactory/1.0 ({self.contact_email})"}
         try:
-            loop = asyncio.get_event_loop()
-            req = urllib.request.Request(url, headers=headers)
-            resp = await loop.run_in_executor(None, urllib.request.urlopen, req)
-            data = json.loads(resp.read().decode("utf-8"))
+            data = await self.http.get_json(self.base_url, params=params, headers=headers)
             results = data.get("results") or data.get("data") or []
             out = []
             for r in results[:limit]:
@@ -8,13 +8,30 @@ including:
 - Context-aware responses based on case state
 - Action execution for document modifications
 - Support for multiple LLM providers (OpenAI, Anthropic, GitHub Copilot, Ollama)
+- Streaming replies: token deltas are relayed to the case room as they arrive,
+  on async provider clients, and a new message cancels the reply in flight.
+  Every provider call runs on one background event loop, which owns the
+  clients' connection pools, whichever loop or thread the caller is on.
+- Per-case memory: a case context snapshot re-rendered only for the sections
+  that change, and a rolling conversation window whose older turns are folded
+  into a bounded summary. Prompts put the stable parts (system prompt, case
+  context) first so provider prompt caching can reuse them across turns.
 
 Named after the literary clerk Bartleby, but infinitely more helpful.
 """
 
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable
+import concurrent.futures
+import hashlib
 import json
 import logging
 import os
+import re
+import threading
+import time
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -36,11 +53,19 @@ except Exception as exc:  # pragma: no cover - optional dependency
 else:
     OPENAI_IMPORT_ERROR = None
 
+try:
+    import aiohttp
+except Exception:  # pragma: no cover - optional dependency
+    aiohttp = None
+
 import requests
 from flask import jsonify, request
 
 logger = logging.getLogger(__name__)
 
+# Marks the end of a provider stream relayed from the background loop
+_STREAM_DONE = object()
+
 if ANTHROPIC_IMPORT_ERROR:
     logger.warning("Anthropic SDK import failed: %s", ANTHROPIC_IMPORT_ERROR)
 if OPENAI_IMPORT_ERROR:
@@ -85,22 +110,289 @@ class ChatContext:
     attached_context: list[dict] = field(default_factory=list)
 
 
+def _parse_actions(json_text: str) -> list[dict[str, Any]]:
+    """Actions from one fenced JSON block: ``{"actions": [...]}`` or a bare list"""
+    try:
+        action_data = json.loads(json_text)
+    except json.JSONDecodeError:
+        logger.warning("Failed to parse JSON actions from response")
+        return []
+
+    if isinstance(action_data, dict) and "actions" in action_data:
+        return action_data["actions"]
+    if isinstance(action_data, list):
+        return action_data
+    return []
+
+
+class StreamingActionExtractor:
+    """
+    Extracts actions from ```json blocks as response text arrives
+
+    Each block is parsed once, as soon as its closing fence has been seen, so
+    actions can be surfaced before the reply finishes.
+    """
+
+    OPEN_FENCE = "```json"
+    CLOSE_FENCE = "```"
+
+    def __init__(self):
+        self._buffer = ""
+        self._scan = 0
+        self.actions: list[dict[str, Any]] = []
+
+    def feed(self, text: str) -> list[dict[str, Any]]:
+        """Add a chunk of response text; returns actions completed by it"""
+        self._buffer += text
+        found = []
+        while True:
+            start = self._buffer.find(self.OPEN_FENCE, self._scan)
+            if start == -1:
+                # An opening fence may still be split across chunks
+                self._scan = max(self._scan, len(self._buffer) - len(self.OPEN_FENCE) + 1)
+                break
+            body_start = start + len(self.OPEN_FENCE)
+            end = self._buffer.find(self.CLOSE_FENCE, body_start)
+            if end == -1:
+                self._scan = start
+                break
+            found.extend(_parse_actions(self._buffer[body_start:end].strip()))
+            self._scan = end + len(self.CLOSE_FENCE)
+        self.actions.extend(found)
+        return found
+
+
+def _render_case(case_id: str) -> str:
+    return f"**Current Case ID**: {case_id}" if case_id else ""
+
+
+def _render_outline(outline: dict) -> str:
+    if not outline:
+        return ""
+    return f"**Skeletal Outline**:\n```json\n{json.dumps(outline, indent=2)}\n```"
+
+
+def _render_evidence(evidence_data: list[dict]) -> str:
+    if not evidence_data:
+        return ""
+    sources = [str(e.get("evidence_source", "")).lower() for e in evidence_data]
+    return (
+        f"**Evidence Summary**: {len(evidence_data)} total ({sources.count('primary')} PRIMARY, "
+        f"{sources.count('secondary')} SECONDARY, {sources.count('tertiary')} TERTIARY)"
+    )
+
+
+def _render_phases(phase_statuses: dict) -> str:
+    if not phase_statuses:
+        return ""
+    statuses = [v.get("status") if isinstance(v, dict) else v for v in phase_statuses.values()]
+    active_count = sum(status in ("active", "in_progress") for status in statuses)
+    completed_count = statuses.count("completed")
+    return f"**Workflow Status**: {completed_count} phases completed, {active_count} active"
+
+
+def _render_attached(attached_context: list[dict]) -> str:
+    if not attached_context:
+        return ""
+    return f"**Attached Context**: {', '.join(c.get('type', 'unknown') for c in attached_context)}"
+
+
+# Case context sections in prompt order, with the ChatContext field each renders
+CONTEXT_SECTIONS = (
+    ("case", "case_id", _render_case),
+    ("outline", "skeletal_outline", _render_outline),
+    ("evidence", "evidence_data", _render_evidence),
+    ("phases", "phase_statuses", _render_phases),
+)
+
+
+def _fingerprint(value: Any) -> str:
+    return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CaseContextSnapshot:
+    """Rendered case context, re-rendered section by section only when a section changes"""
+    sections: dict[str, str] = field(default_factory=dict)
+    fingerprints: dict[str, str] = field(default_factory=dict)
+    version: int = 0
+
+    def update(self, context: ChatContext) -> list[str]:
+        """Apply the sections present in ``context``; returns the names that changed
+
+        A ``None`` field leaves that section as it was.
+        """
+        changed = []
+        for name, attribute, render in CONTEXT_SECTIONS:
+            value = getattr(context, attribute)
+            if value is None:
+                continue
+            fingerprint = _fingerprint(value)
+            if self.fingerprints.get(name) == fingerprint:
+                continue
+            self.fingerprints[name] = fingerprint
+            self.sections[name] = render(value)
+            changed.append(name)
+        if changed:
+            self.version += 1
+        return changed
+
+    def render(self) -> str:
+        parts = (self.sections.get(name) for name, _, _ in CONTEXT_SECTIONS)
+        return "\n\n".join(part for part in parts if part)
+
+
+def _summarize_turn(message: ChatMessage, max_chars: int = 200) -> str:
+    """One summary line for a turn: its first sentence, without code blocks"""
+    text = re.sub(r"```.*?(```|$)", " ", message.content, flags=re.S)
+    text = re.sub(r"\*\*User Query\*\*:\s*", "", text)
+    text = " ".join(text.split())
+    sentence_end = re.search(r"(?<=[.!?])\s", text)
+    if sentence_end and sentence_end.start() <= max_chars:
+        text = text[: sentence_end.start()]
+    elif len(text) > max_chars:
+        text = text[: max_chars - 1].rstrip() + "…"
+    return f"- {message.role}: {text}"
+
+
+class ConversationWindow:
+    """
+    Rolling conversation memory for one case
+
+    The most recent ``max_messages`` turns are kept verbatim. Older turns are
+    folded, a user/assistant pair at a time, into summary lines, and the
+    oldest summary lines are dropped beyond ``max_summary_chars``.
+    """
+
+    def __init__(self, max_messages: int = 12, max_summary_chars: int = 2000):
+        self.max_messages = max(2, max_messages - max_messages % 2)
+        self.max_summary_chars = max_summary_chars
+        self.messages: deque[ChatMessage] = deque()
+        self.summary_lines: deque[str] = deque()
+        self._summary_chars = 0
+
+    def add_turn(self, user_message: ChatMessage, assistant_message: ChatMessage) -> None:
+        self.messages.append(user_message)
+        self.messages.append(assistant_message)
+        while len(self.messages) > self.max_messages:
+            for _ in range(2):
+                self._fold(self.messages.popleft())
+
+    def _fold(self, message: ChatMessage) -> None:
+        line = _summarize_turn(message)
+        self.summary_lines.append(line)
+        self._summary_chars += len(line) + 1
+        while self._summary_chars > self.max_summary_chars and len(self.summary_lines) > 1:
+            self._summary_chars -= len(self.summary_lines.popleft()) + 1
+
+    @property
+    def summary(self) -> str:
+        return "\n".join(self.summary_lines)
+
+    def history(self) -> list[dict[str, str]]:
+        return [{"role": m.role, "content": m.content} for m in self.messages]
+
+
+@dataclass
+class CaseChatState:
+    """Everything Bartleby remembers about one case between messages
+
+    Socket.IO handler threads and the stream loop both touch this state, so
+    every read or write of it holds ``lock``.
+    """
+    snapshot: CaseContextSnapshot
+    window: ConversationWindow
+    # Phase narration and other system updates not yet shown to the model
+    notes: deque = field(default_factory=lambda: deque(maxlen=20))
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+
+@dataclass
+class ChatPrompt:
+    """
+    One chat turn's prompt, laid out most-stable first
+
+    The system prompt never changes and the case context changes only when
+    the case does, so both form a prefix that provider prompt caches (OpenAI
+    automatic caching, Anthropic ``cache_control``, Ollama's KV reuse) can hit
+    on every turn. The conversation summary, recent history and the new user
+    turn follow.
+    """
+    system: str
+    case_context: str = ""
+    summary: str = ""
+    history: list[dict[str, str]] = field(default_factory=list)
+    user: str = ""
+
+    def system_text(self) -> str:
+        parts = [self.system]
+        if self.case_context:
+            parts.append(f"# Case Context\n\n{self.case_context}")
+        if self.summary:
+            parts.append(f"# Earlier Conversation (summary)\n\n{self.summary}")
+        return "\n\n".join(parts)
+
+    def openai_messages(self) -> list[dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system_text()},
+            *self.history,
+            {"role": "user", "content": self.user},
+        ]
+
+    def anthropic_system(self) -> list[dict[str, Any]]:
+        blocks = [{"type": "text", "text": self.system}]
+        if self.case_context:
+            blocks.append({"type": "text", "text": f"# Case Context\n\n{self.case_context}"})
+        # Cache breakpoint after the last stable block
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+        if self.summary:
+            blocks.append(
+                {"type": "text", "text": f"# Earlier Conversation (summary)\n\n{self.summary}"}
+            )
+        return blocks
+
+    def anthropic_messages(self) -> list[dict[str, str]]:
+        return [*self.history, {"role": "user", "content": self.user}]
+
+    def text(self) -> str:
+        turns = [f"{m['role'].capitalize()}: {m['content']}" for m in self.history]
+        return "\n\n".join([self.system_text(), *turns, f"User: {self.user}"])
+
+
 class BartlebyChatHandler:
     """
     Handles chat interactions with Bartleby AI Legal Clerk
     """
 
-    def __init__(self, vector_store_manager=None, evidence_table=None):
+    def __init__(
+        self,
+        vector_store_manager=None,
+        evidence_table=None,
+        vector_store_factory=None,
+        history_messages: int = 12,
+        max_cases: int = 64,
+    ):
         """
         Initialize Bartleby chat handler
 
         Args:
             vector_store_manager: EnhancedVectorStoreManager instance
             evidence_table: Evidence table API instance
+            vector_store_factory: Zero-argument callable used to build the vector
+                store on first use when no manager is passed
+            history_messages: Recent messages per case kept verbatim in prompts
+            max_cases: Cases whose context and conversation are kept in memory
         """
-        self.vector_store = vector_store_manager
+        self._vector_store = vector_store_manager
+        self._vector_store_factory = vector_store_factory
         self.evidence_table = evidence_table
 
+        # Per-case context snapshots and conversation windows (LRU)
+        self.history_messages = history_messages
+        self.max_cases = max_cases
+        self._case_states: OrderedDict[str, CaseChatState] = OrderedDict()
+        self._case_states_lock = threading.Lock()
+
         # Initialize LLM clients
         self.openai_client = None
         self.anthropic_client = None
@@ -109,23 +401,29 @@ class BartlebyChatHandler:
         self.github_models_base_url = os.getenv(
             "GITHUB_MODELS_BASE_URL", "https://models.inference.ai.azure.com"
         )
+        self.ollama_timeout = float(os.getenv("OLLAMA_TIMEOUT", "120"))
+
+        # In-flight streamed replies, one per case, on a background event loop
+        self._stream_loop: asyncio.AbstractEventLoop | None = None
+        self._streams: dict[str, concurrent.futures.Future] = {}
+        self._streams_lock = threading.Lock()
 
-        # Load API keys
+        # Load API keys (async clients, so provider calls never block the event loop)
         openai_key = os.getenv("OPENAI_API_KEY")
         if openai_key and openai:
-            self.openai_client = openai.OpenAI(api_key=openai_key)
+            self.openai_client = openai.AsyncOpenAI(api_key=openai_key)
         elif openai_key:
             logger.warning("OPENAI_API_KEY set but OpenAI SDK unavailable")
 
         anthropic_key = os.getenv("ANTHROPIC_API_KEY")
         if anthropic_key and anthropic:
-            self.anthropic_client = anthropic.Anthropic(api_key=anthropic_key)
+            self.anthropic_client = anthropic.AsyncAnthropic(api_key=anthropic_key)
         elif anthropic_key:
             logger.warning("ANTHROPIC_API_KEY set but Anthropic SDK unavailable")
 
         github_models_key = os.getenv("GITHUB_MODELS_API_KEY") or os.getenv("GITHUB_TOKEN")
         if github_models_key and openai:
-            self.github_copilot_client = openai.OpenAI(
+            self.github_copilot_client = openai.AsyncOpenAI(
                 api_key=github_models_key,
                 base_url=self.github_models_base_url,
             )
@@ -163,6 +461,21 @@ When suggesting actions:
 Format your responses in Markdown for clarity.
 """
 
+    @property
+    def vector_store(self):
+        """Vector store manager, built from the factory the first time it is needed"""
+        if self._vector_store is None and self._vector_store_factory is not None:
+            factory, self._vector_store_factory = self._vector_store_factory, None
+            try:
+                self._vector_store = factory()
+            except Exception as e:
+                logger.warning(f"Vector store unavailable for Bartleby: {e}")
+        return self._vector_store
+
+    @vector_store.setter
+    def vector_store(self, value):
+        self._vector_store = value
+
     def get_llm_client(self, provider: str, model: str):
         """
         Get appropriate LLM client based on provider
@@ -254,45 +567,81 @@ Format your responses in Markdown for clarity.
         Returns:
             Formatted context string
         """
-        context_parts = []
-
-        if context.case_id:
-            context_parts.append(f"**Current Case ID**: {context.case_id}")
-
-        if context.skeletal_outline:
-            context_parts.append(f"**Skeletal Outline**:\n```json\n{json.dumps(context.skeletal_outline, indent=2)}\n```")
-
-        if context.evidence_data:
-            evidence_count = len(context.evidence_data)
-            primary_count = sum(
-                1
-                for e in context.evidence_data
-                if str(e.get("evidence_source", "")).lower() == "primary"
-            )
-            secondary_count = sum(
-                1
-                for e in context.evidence_data
-                if str(e.get("evidence_source", "")).lower() == "secondary"
-            )
-            tertiary_count = sum(
-                1
-                for e in context.evidence_data
-                if str(e.get("evidence_source", "")).lower() == "tertiary"
-            )
-            context_parts.append(
-                f"**Evidence Summary**: {evidence_count} total ({primary_count} PRIMARY, "
-                f"{secondary_count} SECONDARY, {tertiary_count} TERTIARY)"
-            )
+        context_parts = [
+            render(getattr(context, attribute)) for _, attribute, render in CONTEXT_SECTIONS
+        ]
+        context_parts.append(_render_attached(context.attached_context))
+        return "\n\n".join(part for part in context_parts if part)
+
+    def _new_case_state(self) -> CaseChatState:
+        return CaseChatState(CaseContextSnapshot(), ConversationWindow(self.history_messages))
+
+    def _case_state(self, case_id: str | None) -> CaseChatState:
+        """The case's remembered state; a throwaway state when there is no case"""
+        if not case_id:
+            return self._new_case_state()
+        with self._case_states_lock:
+            state = self._case_states.get(case_id)
+            if state is None:
+                state = self._case_states[case_id] = self._new_case_state()
+                while len(self._case_states) > self.max_cases:
+                    self._case_states.popitem(last=False)
+            else:
+                self._case_states.move_to_end(case_id)
+            return state
 
-        if context.phase_statuses:
-            active_phases = [k for k, v in context.phase_statuses.items() if v.get('status') in ['active', 'in_progress']]
-            completed_phases = [k for k, v in context.phase_statuses.items() if v.get('status') == 'completed']
-            context_parts.append(f"**Workflow Status**: {len(completed_phases)} phases completed, {len(active_phases)} active")
+    def update_case_context(
+        self,
+        case_id: str,
+        outline: dict | None = None,
+        evidence: list[dict] | None = None,
+        phases: dict | None = None,
+    ) -> list[str]:
+        """
+        Update a case's context snapshot when its outline, evidence or phases change
 
-        if context.attached_context:
-            context_parts.append(f"**Attached Context**: {', '.join(c.get('type', 'unknown') for c in context.attached_context)}")
+        Only changed sections are re-rendered; fields left as ``None`` are kept.
 
-        return "\n\n".join(context_parts)
+        Returns:
+            Names of the sections that changed
+        """
+        context = ChatContext(
+            case_id=case_id, skeletal_outline=outline, evidence_data=evidence, phase_statuses=phases
+        )
+        state = self._case_state(case_id)
+        with state.lock:
+            return state.snapshot.update(context)
+
+    def clear_case(self, case_id: str) -> None:
+        """Forget a case's context snapshot and conversation"""
+        with self._case_states_lock:
+            self._case_states.pop(case_id, None)
+
+    def _build_prompt(
+        self, message: str, context: ChatContext, state: CaseChatState
+    ) -> tuple[ChatPrompt, int]:
+        """Lay out a chat turn's prompt; returns it with the number of case notes it includes"""
+        with state.lock:
+            state.snapshot.update(context)
+            notes = list(state.notes)
+            case_context = state.snapshot.render()
+            summary = state.window.summary
+            history = state.window.history()
+
+        user_parts = []
+        if notes:
+            user_parts.append("**Case Updates**:\n" + "\n".join(f"- {note}" for note in notes))
+        user_parts.append(_render_attached(context.attached_context))
+        user_parts.append(f"**User Query**: {message}")
+
+        prompt = ChatPrompt(
+            system=self.system_prompt,
+            case_context=case_context,
+            summary=summary,
+            history=history,
+            user="\n\n".join(part for part in user_parts if part),
+        )
+        return prompt, len(notes)
 
     async def send_message(self, message: str, context: ChatContext, settings: dict) -> ChatMessage:
         """
@@ -306,94 +655,349 @@ Format your responses in Markdown for clarity.
         Returns:
             ChatMessage with response and actions
         """
+        response_message = None
+        async for event in self.stream_message(message, context, settings):
+            if event["type"] == "done":
+                response_message = event["message"]
+        return response_message
+
+    async def stream_message(
+        self, message: str, context: ChatContext, settings: dict
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Process a chat message, yielding the response as it is generated
+
+        Yields ``{"type": "delta", "content": str}`` for each chunk of text,
+        ``{"type": "action", "action": dict}`` as soon as an action block is
+        complete, and finally ``{"type": "done", "message": ChatMessage,
+        "first_token_ms": float | None, "latency_ms": float, "usage": dict}``.
+        Successful turns are added to the case's conversation window.
+
+        Args:
+            message: User message
+            context: Current case context
+            settings: LLM settings (model, temperature, etc.)
+        """
         provider = settings.get("provider") or settings.get("llmProvider", "openai")
         model = settings.get("model") or settings.get("aiModel", "gpt-5")
         temperature = settings.get("temperature", 0.7)
         max_tokens = settings.get("maxTokens") or settings.get("max_tokens", 4096)
 
-        # Build full prompt with context
-        context_prompt = self.build_context_prompt(context)
-        full_prompt = f"{context_prompt}\n\n**User Query**: {message}"
+        started = time.perf_counter()
+        first_token_ms = None
+        chunks: list[str] = []
+        extractor = StreamingActionExtractor()
+        usage = {"input_tokens": 0, "output_tokens": 0, "cached_input_tokens": 0}
+        state = self._case_state(context.case_id)
 
         try:
+            # Build the prompt from the case's snapshot and conversation window
+            prompt, notes_used = self._build_prompt(message, context, state)
             client, model_name = self.get_llm_client(provider, model)
 
-            if provider in {"openai", "github-copilot"}:
-                response = client.chat.completions.create(
-                    model=model_name,
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": full_prompt}
-                    ],
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
-
-                response_text = response.choices[0].message.content
-                input_tokens = response.usage.prompt_tokens
-                output_tokens = response.usage.completion_tokens
-
-            elif provider == "anthropic":
-                response = client.messages.create(
-                    model=model_name,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    system=self.system_prompt,
-                    messages=[
-                        {"role": "user", "content": full_prompt}
-                    ]
-                )
-
-                response_text = response.content[0].text
-                input_tokens = response.usage.input_tokens
-                output_tokens = response.usage.output_tokens
-
-            elif provider == "ollama":
-                # Ollama local API call
-                ollama_response = requests.post(
-                    f"{self.ollama_base_url}/api/generate",
-                    json={
-                        "model": model_name,
-                        "prompt": f"{self.system_prompt}\n\n{full_prompt}",
-                        "stream": False,
-                        "options": {
-                            "temperature": temperature,
-                            "num_predict": max_tokens,
-                        }
-                    }
+            deltas = self._on_stream_loop(
+                self._stream_completion(
+                    provider, client, model_name, prompt, temperature, max_tokens, usage
                 )
-                ollama_data = ollama_response.json()
-                response_text = ollama_data.get("response", "")
-                input_tokens = 0  # Ollama doesn't provide token counts
-                output_tokens = 0
-
-            else:
-                response_text = "Error: Unsupported LLM provider"
-                input_tokens = 0
-                output_tokens = 0
+            )
+            async for delta in deltas:
+                if not delta:
+                    continue
+                if first_token_ms is None:
+                    first_token_ms = round((time.perf_counter() - started) * 1000, 1)
+                chunks.append(delta)
+                yield {"type": "delta", "content": delta}
+                for action in extractor.feed(delta):
+                    yield {"type": "action", "action": action}
 
             # Calculate cost
-            cost = self.calculate_cost(provider, model, input_tokens, output_tokens)
-
-            # Extract actions from response (if any)
-            actions = self.extract_actions(response_text)
-
-            # Create response message
-            return ChatMessage(
+            cost = self.calculate_cost(
+                provider, model, usage["input_tokens"], usage["output_tokens"]
+            )
+            response_message = ChatMessage(
                 role="assistant",
-                content=response_text,
-                actions=actions,
-                cost=cost
+                content="".join(chunks),
+                actions=extractor.actions,
+                cost=cost,
             )
 
+            # Remember the turn; its case notes have now been shown to the model
+            with state.lock:
+                state.window.add_turn(
+                    ChatMessage(role="user", content=prompt.user), response_message
+                )
+                for _ in range(min(notes_used, len(state.notes))):
+                    state.notes.popleft()
+
         except Exception as e:
             logger.error(f"Chat error: {e}")
-            return ChatMessage(
+            response_message = ChatMessage(
                 role="assistant",
                 content=f"⚠️ Error processing your request: {str(e)}",
                 cost=0.0
             )
 
+        yield {
+            "type": "done",
+            "message": response_message,
+            "first_token_ms": first_token_ms,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            "usage": usage,
+        }
+
+    async def _stream_completion(
+        self,
+        provider: str,
+        client,
+        model_name: str,
+        prompt: ChatPrompt,
+        temperature: float,
+        max_tokens: int,
+        usage: dict[str, int],
+    ) -> AsyncIterator[str]:
+        """Yield response text deltas from the provider, recording token usage"""
+        if provider in {"openai", "github-copilot"}:
+            stream = await client.chat.completions.create(
+                model=model_name,
+                messages=prompt.openai_messages(),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+                    if getattr(chunk, "usage", None):
+                        usage["input_tokens"] = chunk.usage.prompt_tokens
+                        usage["output_tokens"] = chunk.usage.completion_tokens
+                        details = getattr(chunk.usage, "prompt_tokens_details", None)
+                        usage["cached_input_tokens"] = getattr(details, "cached_tokens", 0) or 0
+            finally:
+                await stream.close()
+
+        elif provider == "anthropic":
+            async with client.messages.stream(
+                model=model_name,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=prompt.anthropic_system(),
+                messages=prompt.anthropic_messages(),
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                final_message = await stream.get_final_message()
+                usage["input_tokens"] = final_message.usage.input_tokens
+                usage["output_tokens"] = final_message.usage.output_tokens
+                usage["cached_input_tokens"] = (
+                    getattr(final_message.usage, "cache_read_input_tokens", 0) or 0
+                )
+
+        elif provider == "ollama":
+            async for text in self._stream_ollama(
+                model_name, prompt.text(), temperature, max_tokens, usage
+            ):
+                yield text
+
+        else:
+            yield "Error: Unsupported LLM provider"
+
+    async def _on_stream_loop(self, deltas: AsyncIterator[str]) -> AsyncIterator[str]:
+        """
+        Iterate a provider stream on the background stream loop
+
+        Async SDK clients bind their connection pools to the loop that first
+        uses them, so callers on other loops (Flask async views, tests) have
+        the deltas relayed to them instead of driving the clients themselves.
+        """
+        loop = self._ensure_stream_loop()
+        if asyncio.get_running_loop() is loop:
+            async for delta in deltas:
+                yield delta
+            return
+
+        caller = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def put(item) -> None:
+            try:
+                caller.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                pass  # the caller's loop has closed
+
+        def finished(future: concurrent.futures.Future) -> None:
+            error = asyncio.CancelledError() if future.cancelled() else future.exception()
+            put((_STREAM_DONE, error))
+
+        async def pump() -> None:
+            async for delta in deltas:
+                put((delta, None))
+
+        future = asyncio.run_coroutine_threadsafe(pump(), loop)
+        future.add_done_callback(finished)
+        try:
+            while True:
+                delta, error = await queue.get()
+                if delta is _STREAM_DONE:
+                    if error is not None:
+                        raise error
+                    return
+                yield delta
+        finally:
+            future.cancel()
+
+    async def _stream_ollama(
+        self,
+        model_name: str,
+        prompt_text: str,
+        temperature: float,
+        max_tokens: int,
+        usage: dict[str, int],
+    ) -> AsyncIterator[str]:
+        """Ollama local API call; streams NDJSON over aiohttp when it is installed"""
+        url = f"{self.ollama_base_url}/api/generate"
+        payload = {
+            "model": model_name,
+            "prompt": prompt_text,
+            "stream": aiohttp is not None,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            }
+        }
+
+        if aiohttp is None:
+            response = await asyncio.to_thread(
+                requests.post, url, json=payload, timeout=self.ollama_timeout
+            )
+            response.raise_for_status()
+            ollama_data = response.json()
+            usage["input_tokens"] = ollama_data.get("prompt_eval_count", 0)
+            usage["output_tokens"] = ollama_data.get("eval_count", 0)
+            yield ollama_data.get("response", "")
+            return
+
+        timeout = aiohttp.ClientTimeout(total=self.ollama_timeout)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.post(url, json=payload) as response:
+                response.raise_for_status()
+                async for line in response.content:
+                    if not line.strip():
+                        continue
+                    ollama_data = json.loads(line)
+                    if ollama_data.get("response"):
+                        yield ollama_data["response"]
+                    if ollama_data.get("done"):
+                        usage["input_tokens"] = ollama_data.get("prompt_eval_count", 0)
+                        usage["output_tokens"] = ollama_data.get("eval_count", 0)
+                        break
+
+    def start_stream(
+        self,
+        case_id: str,
+        message: str,
+        context: ChatContext,
+        settings: dict,
+        emit: Callable[[str, dict], Any],
+    ) -> concurrent.futures.Future:
+        """
+        Stream a reply to a case room, cancelling the case's reply in flight
+
+        Runs on a background event loop so synchronous Socket.IO handlers can
+        call it. Events are delivered through ``emit(event_name, payload)``:
+        ``bartleby_stream_start``, ``bartleby_stream_delta``,
+        ``bartleby_stream_action``, ``bartleby_stream_end`` and, when a newer
+        message supersedes the reply, ``bartleby_stream_cancelled``.
+
+        Returns:
+            Future resolving to the final ChatMessage
+        """
+        loop = self._ensure_stream_loop()
+        self.cancel_stream(case_id)
+        future = asyncio.run_coroutine_threadsafe(
+            self._relay_stream(case_id, message, context, settings, emit), loop
+        )
+        with self._streams_lock:
+            self._streams[case_id] = future
+        future.add_done_callback(lambda done: self._forget_stream(case_id, done))
+        return future
+
+    def cancel_stream(self, case_id: str) -> bool:
+        """Cancel the reply being streamed to a case; returns True if one was running"""
+        with self._streams_lock:
+            future = self._streams.pop(case_id, None)
+        if future is None or future.done():
+            return False
+        return future.cancel()
+
+    def close(self) -> None:
+        """Cancel in-flight replies and stop the background event loop"""
+        with self._streams_lock:
+            case_ids = list(self._streams)
+        for case_id in case_ids:
+            self.cancel_stream(case_id)
+        if self._stream_loop is not None:
+            self._stream_loop.call_soon_threadsafe(self._stream_loop.stop)
+            self._stream_loop = None
+
+    def _ensure_stream_loop(self) -> asyncio.AbstractEventLoop:
+        with self._streams_lock:
+            if self._stream_loop is None:
+                self._stream_loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._stream_loop.run_forever,
+                    name="bartleby-stream",
+                    daemon=True,
+                ).start()
+            return self._stream_loop
+
+    def _forget_stream(self, case_id: str, future: concurrent.futures.Future) -> None:
+        with self._streams_lock:
+            if self._streams.get(case_id) is future:
+                del self._streams[case_id]
+
+    async def _relay_stream(
+        self,
+        case_id: str,
+        message: str,
+        context: ChatContext,
+        settings: dict,
+        emit: Callable[[str, dict], Any],
+    ) -> ChatMessage | None:
+        stream_id = uuid.uuid4().hex
+        base = {"case_id": case_id, "stream_id": stream_id}
+        emit("bartleby_stream_start", {**base, "timestamp": time.time()})
+
+        seq = 0
+        try:
+            async for event in self.stream_message(message, context, settings):
+                if event["type"] == "delta":
+                    emit("bartleby_stream_delta", {**base, "seq": seq, "delta": event["content"]})
+                    seq += 1
+                elif event["type"] == "action":
+                    emit("bartleby_stream_action", {**base, "action": event["action"]})
+                else:
+                    response_message = event["message"]
+                    emit(
+                        "bartleby_stream_end",
+                        {
+                            **base,
+                            "message": response_message.content,
+                            "actions": response_message.actions,
+                            "cost": response_message.cost,
+                            "first_token_ms": event["first_token_ms"],
+                            "latency_ms": event["latency_ms"],
+                            "usage": event["usage"],
+                            "timestamp": response_message.timestamp.isoformat(),
+                        },
+                    )
+                    return response_message
+        except asyncio.CancelledError:
+            emit("bartleby_stream_cancelled", {**base, "deltas_sent": seq})
+            raise
+        return None
+
     def extract_actions(self, response_text: str) -> list[dict[str, Any]]:
         """
         Extract structured actions from LLM response
@@ -406,25 +1010,7 @@ Format your responses in Markdown for clarity.
         Returns:
             List of action dictionaries
         """
-        actions = []
-
-        # Simple JSON extraction (would be more sophisticated in production)
-        if "```json" in response_text:
-            try:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_text = response_text[json_start:json_end].strip()
-                action_data = json.loads(json_text)
-
-                if isinstance(action_data, dict) and "actions" in action_data:
-                    actions = action_data["actions"]
-                elif isinstance(action_data, list):
-                    actions = action_data
-
-            except json.JSONDecodeError:
-                logger.warning("Failed to parse JSON actions from response")
-
-        return actions
+        return StreamingActionExtractor().feed(response_text)
 
     async def execute_action(self, action: dict[str, Any], case_id: str) -> dict[str, Any]:
         """
@@ -520,8 +1106,12 @@ Format your responses in Markdown for clarity.
             metadata: Optional metadata (phase, event, progress, etc.)
         """
         try:
-            # For now, just log it. In production, would store in database
             logger.info(f"[Bartleby System] Case {case_id}: {message}")
+            # Shown to the model with the case's next chat turn
+            if case_id:
+                state = self._case_state(case_id)
+                with state.lock:
+                    state.notes.append(message)
             if metadata:
                 logger.debug(f"[Bartleby System] Metadata: {json.dumps(metadata)}")
             return True
@@ -615,14 +1205,11 @@ Provide helpful guidance."""
                 "maxTokens": 1500,
             }
             
-            # Use synchronous version for simplicity in intervention handling
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            response_message = loop.run_until_complete(
-                self.send_message(prompt, intervention_context, settings)
-            )
-            loop.close()
+            # Block this (Socket.IO) thread on the stream loop, which owns the clients
+            response_message = asyncio.run_coroutine_threadsafe(
+                self.send_message(prompt, intervention_context, settings),
+                self._ensure_stream_loop(),
+            ).result()
             
             return {
                 "success": True,
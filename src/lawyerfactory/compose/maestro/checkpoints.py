@@ -6,95 +6,307 @@
 #   - Directory Group: Orchestration
 #   - Group Tags: orchestration
 Checkpoint management for workflow recovery and state persistence.
+
+Checkpoints are stored as an append-only journal per session: a full snapshot
+every ``snapshot_interval`` checkpoints, and compact deltas against the previous
+checkpoint in between. A small per-session index names the current snapshot and
+journal so restoring the latest state never has to scan the directory.
+
+Layout inside ``<storage_path>/checkpoints``:
+- ``<session>.index.json``              current snapshot/journal and retained segments
+- ``<session>.snapshot.<seq>.json``     full state at checkpoint ``seq``
+- ``<session>.journal.<seq>.jsonl``     deltas recorded after that snapshot
+
+Full-state ``checkpoint_<session>_<YYYYmmdd_HHMMSS>.json`` files written by
+earlier versions are still listed, restored and deleted.
 """
 
 import asyncio
+import copy
 from datetime import datetime
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+import re
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Delta operations: ["set", path, value], ["del", path], ["extend", path, items]
+DeltaOp = List[Any]
+
+# Timestamp suffix of the legacy one-file-per-checkpoint layout
+LEGACY_TIMESTAMP = re.compile(r"\d{8}_\d{6}")
+
+
+def diff_state(old: Any, new: Any, path: Optional[List[str]] = None) -> List[DeltaOp]:
+    """Describe how to turn ``old`` into ``new`` as a list of delta operations"""
+    path = path or []
+    ops: List[DeltaOp] = []
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() - new.keys():
+            ops.append(["del", path + [key]])
+        for key, value in new.items():
+            if key not in old:
+                ops.append(["set", path + [key], value])
+            elif old[key] != value:
+                ops.extend(diff_state(old[key], value, path + [key]))
+    elif (
+        path
+        and isinstance(old, list)
+        and isinstance(new, list)
+        and len(new) > len(old)
+        and new[: len(old)] == old
+    ):
+        # Task lists and logs only ever grow; record the new tail
+        ops.append(["extend", path, new[len(old) :]])
+    elif path:
+        ops.append(["set", path, new])
+    return ops
+
+
+def apply_delta(target: Dict[str, Any], ops: List[DeltaOp], copy_values: bool = False) -> None:
+    """Apply delta operations produced by :func:`diff_state` in place"""
+    for op in ops:
+        kind, path = op[0], op[1]
+        parent = target
+        for key in path[:-1]:
+            parent = parent[key]
+        key = path[-1]
+        if kind == "del":
+            parent.pop(key, None)
+            continue
+        value = copy.deepcopy(op[2]) if copy_values else op[2]
+        if kind == "extend":
+            parent[key].extend(value)
+        else:
+            parent[key] = value
+
+
+def _atomic_write_json(path: Path, data: Any) -> None:
+    """Write JSON to a temp file, fsync it and rename it over ``path``"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"), default=str)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _append_line(path: Path, line: str) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
 
 class CheckpointManager:
     """Manages workflow checkpoints for recovery"""
 
-    def __init__(self, storage_path: str):
+    def __init__(self, storage_path: str, snapshot_interval: int = 20, keep_snapshots: int = 2):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
         self.checkpoint_interval = 300  # 5 minutes
+        self.snapshot_interval = max(1, snapshot_interval)  # deltas between full snapshots
+        self.keep_snapshots = max(1, keep_snapshots)
 
         # Create checkpoints subdirectory
         self.checkpoints_dir = self.storage_path / "checkpoints"
         self.checkpoints_dir.mkdir(exist_ok=True)
 
+        # Last checkpointed state and index per session, kept to compute deltas
+        self._last_state: Dict[str, Dict[str, Any]] = {}
+        self._indexes: Dict[str, Dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _state_payload(workflow_state) -> Dict[str, Any]:
+        return {
+            "session_id": workflow_state.session_id,
+            "current_phase": workflow_state.current_phase.value,
+            "overall_status": workflow_state.overall_status.value,
+            "completed_tasks": list(workflow_state.completed_tasks),
+            "failed_tasks": list(workflow_state.failed_tasks),
+            "global_context": workflow_state.global_context,
+            "phases": {
+                phase.value: status.value for phase, status in workflow_state.phases.items()
+            },
+            "knowledge_graph_id": workflow_state.knowledge_graph_id,
+            "input_documents": list(workflow_state.input_documents),
+            "pending_approvals": list(workflow_state.pending_approvals),
+            "human_feedback_required": workflow_state.human_feedback_required,
+        }
+
     async def create_checkpoint(self, workflow_state) -> None:
-        """Create a workflow checkpoint"""
+        """Create a workflow checkpoint (a delta, or a full snapshot every N deltas)"""
         try:
-            checkpoint_data = {
-                "timestamp": datetime.now().isoformat(),
-                "session_id": workflow_state.session_id,
-                "current_phase": workflow_state.current_phase.value,
-                "overall_status": workflow_state.overall_status.value,
-                "completed_tasks": workflow_state.completed_tasks.copy(),
-                "failed_tasks": workflow_state.failed_tasks.copy(),
-                "global_context": workflow_state.global_context.copy(),
-                "phases": {
-                    phase.value: status.value
-                    for phase, status in workflow_state.phases.items()
-                },
-                "knowledge_graph_id": workflow_state.knowledge_graph_id,
-                "input_documents": workflow_state.input_documents.copy(),
-                "pending_approvals": workflow_state.pending_approvals.copy(),
-                "human_feedback_required": workflow_state.human_feedback_required,
-            }
-
-            # Generate checkpoint filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            checkpoint_file = (
-                self.checkpoints_dir
-                / f"checkpoint_{workflow_state.session_id}_{timestamp}.json"
-            )
-
-            # Write checkpoint data
-            with open(checkpoint_file, "w", encoding="utf-8") as f:
-                json.dump(checkpoint_data, f, indent=2, ensure_ascii=False)
+            session_id = workflow_state.session_id
+            state = self._state_payload(workflow_state)
+            timestamp = datetime.now().isoformat()
+
+            async with self._lock:
+                index = self._indexes.get(session_id) or self._load_index(session_id)
+                last = self._last_state.get(session_id)
+
+                if (
+                    last is None
+                    or index is None
+                    or index["deltas_since_snapshot"] >= self.snapshot_interval
+                ):
+                    # The writer thread gets a private copy; global_context
+                    # keeps changing on the event loop while it serializes
+                    snapshot_state = copy.deepcopy(state)
+                    index = await asyncio.to_thread(
+                        self._write_snapshot, session_id, snapshot_state, timestamp, index
+                    )
+                    self._last_state[session_id] = snapshot_state
+                    kind = "snapshot"
+                else:
+                    ops = diff_state(last, state)
+                    if not ops:
+                        workflow_state.last_checkpoint = datetime.now()
+                        return
+                    index["seq"] += 1
+                    index["deltas_since_snapshot"] += 1
+                    entry = {"seq": index["seq"], "timestamp": timestamp, "ops": ops}
+                    line = json.dumps(
+                        entry, ensure_ascii=False, separators=(",", ":"), default=str
+                    )
+                    await asyncio.to_thread(
+                        _append_line, self.checkpoints_dir / index["journal"], line
+                    )
+                    apply_delta(last, ops, copy_values=True)
+                    kind = "delta"
+                self._indexes[session_id] = index
 
             # Update workflow state
             workflow_state.last_checkpoint = datetime.now()
-            workflow_state.checkpoint_data = checkpoint_data
-
-            # Clean up old checkpoints (keep last 10)
-            await self._cleanup_old_checkpoints(workflow_state.session_id)
+            workflow_state.checkpoint_data = {
+                "seq": index["seq"],
+                "timestamp": timestamp,
+                "type": kind,
+            }
 
-            logger.info(f"Created checkpoint for session {workflow_state.session_id}")
+            logger.info(
+                f"Created {kind} checkpoint {index['seq']} for session {session_id}"
+            )
 
         except Exception as e:
             logger.error(f"Failed to create checkpoint: {e}")
             raise
 
+    def _write_snapshot(
+        self,
+        session_id: str,
+        state: Dict[str, Any],
+        timestamp: str,
+        index: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        seq = (index["seq"] if index else 0) + 1
+        snapshot_name = f"{session_id}.snapshot.{seq:08d}.json"
+        journal_name = f"{session_id}.journal.{seq:08d}.jsonl"
+        _atomic_write_json(
+            self.checkpoints_dir / snapshot_name,
+            {"seq": seq, "timestamp": timestamp, "state": state},
+        )
+
+        segments = list(index["segments"]) if index else []
+        segments.append(
+            {"seq": seq, "timestamp": timestamp, "snapshot": snapshot_name, "journal": journal_name}
+        )
+        expired, segments = segments[: -self.keep_snapshots], segments[-self.keep_snapshots :]
+
+        new_index = {
+            "session_id": session_id,
+            "snapshot_seq": seq,
+            "snapshot": snapshot_name,
+            "journal": journal_name,
+            "segments": segments,
+        }
+        _atomic_write_json(self._index_path(session_id), new_index)
+
+        # Prune only after the new index is durable
+        self._remove_segments(expired)
+        return {**new_index, "seq": seq, "deltas_since_snapshot": 0}
+
+    def _index_path(self, session_id: str) -> Path:
+        return self.checkpoints_dir / f"{session_id}.index.json"
+
+    def _load_index(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Read the on-disk index and recover the journal position after a restart"""
+        index = self._read_index(session_id)
+        if index is None:
+            return None
+        entries = self._read_journal(index["journal"])
+        index["seq"] = entries[-1]["seq"] if entries else index["snapshot_seq"]
+        index["deltas_since_snapshot"] = len(entries)
+        return index
+
+    def _read_index(self, session_id: str) -> Optional[Dict[str, Any]]:
+        index_path = self._index_path(session_id)
+        if not index_path.exists():
+            return None
+        with open(index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _read_journal(self, journal_name: str) -> List[Dict[str, Any]]:
+        journal_path = self.checkpoints_dir / journal_name
+        if not journal_path.exists():
+            return []
+        entries = []
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-append; everything before it is intact
+                    logger.warning(f"Ignoring incomplete checkpoint journal entry in {journal_name}")
+                    break
+        return entries
+
+    def _legacy_checkpoints(self, session_id: str) -> List[Path]:
+        """Pre-journal checkpoint files for a session, oldest first"""
+        prefix = f"checkpoint_{session_id}_"
+        return sorted(
+            path
+            for path in self.checkpoints_dir.glob(f"{prefix}*.json")
+            if LEGACY_TIMESTAMP.fullmatch(path.stem[len(prefix) :])
+        )
+
+    def _read_legacy(
+        self, session_id: str, checkpoint_timestamp: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        legacy = self._legacy_checkpoints(session_id)
+        if checkpoint_timestamp is not None:
+            legacy = [
+                path for path in legacy if path.stem.endswith(f"_{checkpoint_timestamp}")
+            ]
+        if not legacy:
+            return None
+        with open(legacy[-1], "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _remove_segments(self, segments: List[Dict[str, Any]]) -> None:
+        for segment in segments:
+            for name in (segment["snapshot"], segment["journal"]):
+                try:
+                    (self.checkpoints_dir / name).unlink(missing_ok=True)
+                    logger.info(f"Removed old checkpoint: {name}")
+                except Exception as ex:
+                    logger.warning(f"Failed to remove checkpoint {name}: {ex}")
+
     async def restore_workflow(
         self, session_id: str, checkpoint_timestamp: Optional[str] = None
     ):
-        """Restore workflow from a specific checkpoint"""
+        """Restore workflow from the latest checkpoint, or the one taken at a given timestamp"""
         try:
-            if checkpoint_timestamp:
-                checkpoint_file = (
-                    self.checkpoints_dir
-                    / f"checkpoint_{session_id}_{checkpoint_timestamp}.json"
-                )
-            else:
-                # Find the most recent checkpoint
-                checkpoint_file = self._find_latest_checkpoint(session_id)
-
-            if not checkpoint_file or not checkpoint_file.exists():
+            checkpoint_data = await asyncio.to_thread(
+                self._restore, session_id, checkpoint_timestamp
+            )
+            if checkpoint_data is None:
                 raise FileNotFoundError(f"No checkpoint found for session {session_id}")
 
-            with open(checkpoint_file, "r", encoding="utf-8") as f:
-                checkpoint_data = json.load(f)
-
             logger.info(f"Restored workflow from checkpoint for session {session_id}")
             return checkpoint_data
 
@@ -102,106 +314,87 @@ class CheckpointManager:
             logger.error(f"Failed to restore from checkpoint: {e}")
             raise
 
-    def _find_latest_checkpoint(self, session_id: str) -> Optional[Path]:
-        """Find the most recent checkpoint file for a session"""
-        pattern = f"checkpoint_{session_id}_*.json"
-        checkpoint_files = list(self.checkpoints_dir.glob(pattern))
-
-        if not checkpoint_files:
-            return None
-
-        # Sort by modification time and return the latest
-        checkpoint_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-        return checkpoint_files[0]
-
-    async def _cleanup_old_checkpoints(self, session_id: str, keep_count: int = 10):
-        """Clean up old checkpoint files, keeping only the most recent ones"""
-        try:
-            pattern = f"checkpoint_{session_id}_*.json"
-            checkpoint_files = list(self.checkpoints_dir.glob(pattern))
-
-            if len(checkpoint_files) <= keep_count:
-                return
-
-            # Sort by modification time (newest first)
-            checkpoint_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
-            # Remove old files beyond keep_count, run deletion in thread to avoid blocking event loop
-            old_files = checkpoint_files[keep_count:]
-
-            async def _remove_files(files):
-                from pathlib import Path
-
-                for old_file in files:
-                    try:
-                        # ensure file is a Path and exists before removal
-                        ofp = Path(old_file)
-                        if ofp.exists():
-                            ofp.unlink()
-                            logger.info(f"Removed old checkpoint: {ofp.name}")
-                    except Exception as ex:
-                        logger.warning(f"Failed to remove checkpoint {old_file}: {ex}")
-
-            await asyncio.to_thread(
-                lambda: asyncio.get_event_loop().run_until_complete(
-                    _remove_files(old_files)
-                )
-            )
-
-        except Exception as e:
-            logger.error(
-                f"Error during checkpoint cleanup for session {session_id}: {e}"
-            )
-            # Do not raise here to avoid breaking workflow; just log
-            return
+    def _restore(
+        self, session_id: str, checkpoint_timestamp: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        index = self._read_index(session_id)
+        if index is None:
+            return self._read_legacy(session_id, checkpoint_timestamp)
+
+        segments = index["segments"]
+        if checkpoint_timestamp is None:
+            segments = segments[-1:]
+        for segment in reversed(segments):
+            snapshot_path = self.checkpoints_dir / segment["snapshot"]
+            with open(snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            state, timestamp = snapshot["state"], snapshot["timestamp"]
+            if checkpoint_timestamp is not None and timestamp == checkpoint_timestamp:
+                return {"timestamp": timestamp, **state}
+
+            for entry in self._read_journal(segment["journal"]):
+                apply_delta(state, entry["ops"])
+                timestamp = entry["timestamp"]
+                if checkpoint_timestamp is not None and timestamp == checkpoint_timestamp:
+                    return {"timestamp": timestamp, **state}
+
+            if checkpoint_timestamp is None:
+                return {"timestamp": timestamp, **state}
+        return self._read_legacy(session_id, checkpoint_timestamp)
 
     def list_checkpoints(self, session_id: str) -> list:
         """List all available checkpoints for a session"""
-        pattern = f"checkpoint_{session_id}_*.json"
-        checkpoint_files = list(self.checkpoints_dir.glob(pattern))
+        index = self._read_index(session_id)
+        segments = index["segments"] if index else []
 
         checkpoints = []
-        for file_path in checkpoint_files:
-            try:
-                # Extract timestamp from filename
-                filename = file_path.stem
-                timestamp_part = filename.split("_")[
-                    -2:
-                ]  # Get last two parts (date_time)
-                timestamp_str = "_".join(timestamp_part)
-
-                # Get file stats
-                stat = file_path.stat()
-
+        for segment in segments:
+            checkpoints.append(
+                {
+                    "timestamp": segment["timestamp"],
+                    "seq": segment["seq"],
+                    "type": "snapshot",
+                    "file_path": str(self.checkpoints_dir / segment["snapshot"]),
+                }
+            )
+            for entry in self._read_journal(segment["journal"]):
                 checkpoints.append(
                     {
-                        "timestamp": timestamp_str,
-                        "file_path": str(file_path),
-                        "size": stat.st_size,
-                        "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                        "timestamp": entry["timestamp"],
+                        "seq": entry["seq"],
+                        "type": "delta",
+                        "file_path": str(self.checkpoints_dir / segment["journal"]),
                     }
                 )
-            except Exception as e:
-                logger.warning(f"Error reading checkpoint file {file_path}: {e}")
 
-        # Sort by timestamp (newest first)
-        checkpoints.sort(key=lambda c: c["timestamp"], reverse=True)
+        # Newest first; legacy files predate every journal segment
+        checkpoints.sort(key=lambda c: c["seq"], reverse=True)
+        prefix = f"checkpoint_{session_id}_"
+        for path in reversed(self._legacy_checkpoints(session_id)):
+            checkpoints.append(
+                {
+                    "timestamp": path.stem[len(prefix) :],
+                    "seq": None,
+                    "type": "legacy",
+                    "file_path": str(path),
+                }
+            )
         return checkpoints
 
     async def delete_checkpoints(self, session_id: str):
         """Delete all checkpoints for a session"""
         try:
-            pattern = f"checkpoint_{session_id}_*.json"
-            checkpoint_files = list(self.checkpoints_dir.glob(pattern))
-
-            for file_path in checkpoint_files:
-                file_path.unlink()
-                logger.debug(f"Deleted checkpoint: {file_path}")
-
-            logger.info(
-                f"Deleted {len(checkpoint_files)} checkpoints for session {session_id}"
-            )
+            async with self._lock:
+                index = self._read_index(session_id)
+                segments = index["segments"] if index else []
+                self._remove_segments(segments)
+                for path in self._legacy_checkpoints(session_id):
+                    path.unlink(missing_ok=True)
+                self._index_path(session_id).unlink(missing_ok=True)
+                self._indexes.pop(session_id, None)
+                self._last_state.pop(session_id, None)
+
+            logger.info(f"Deleted {len(segments)} checkpoint segments for session {session_id}")
 
         except Exception as e:
             logger.error(f"Failed to delete checkpoints: {e}")
@@ -210,29 +403,23 @@ class CheckpointManager:
     def get_storage_stats(self) -> Dict[str, Any]:
         """Get storage statistics for checkpoints"""
         try:
-            checkpoint_files = list(self.checkpoints_dir.glob("checkpoint_*.json"))
-
+            index_files = list(self.checkpoints_dir.glob("*.index.json"))
+            checkpoint_files = [
+                f for f in self.checkpoints_dir.iterdir() if f.is_file() and not f.name.endswith(".tmp")
+            ]
             total_size = sum(f.stat().st_size for f in checkpoint_files)
-            sessions = set()
-
-            for file_path in checkpoint_files:
-                try:
-                    # Extract session ID from filename
-                    filename = file_path.stem
-                    parts = filename.split("_")
-                    if len(parts) >= 3:
-                        session_id = "_".join(
-                            parts[1:-2]
-                        )  # Remove 'checkpoint' prefix and timestamp suffix
-                        sessions.add(session_id)
-                except Exception:
-                    pass
 
             return {
-                "total_checkpoints": len(checkpoint_files),
+                "total_checkpoints": sum(
+                    1
+                    for f in checkpoint_files
+                    if ".snapshot." in f.name
+                    or ".journal." in f.name
+                    or f.name.startswith("checkpoint_")
+                ),
                 "total_size_bytes": total_size,
                 "total_size_mb": round(total_size / (1024 * 1024), 2),
-                "unique_sessions": len(sessions),
+                "unique_sessions": len(index_files),
                 "storage_path": str(self.checkpoints_dir),
             }
 
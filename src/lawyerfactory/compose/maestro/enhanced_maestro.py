@@ -9,11 +9,14 @@
 """
 
 import asyncio
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+import heapq
+import itertools
 import logging
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import uuid
 
 from .checkpoints import CheckpointManager
@@ -88,34 +91,107 @@ class WorkflowStateManager:
 
 
 class TaskScheduler:
-    """Schedules and prioritizes workflow tasks"""
+    """Dependency-aware priority scheduler with per-agent-type concurrency limits"""
     
-    def __init__(self):
-        self.task_queue: List[WorkflowTask] = []
+    def __init__(
+        self,
+        agent_limits: Optional[Dict[str, int]] = None,
+        default_agent_limit: int = 2,
+    ):
+        self.agent_limits: Dict[str, int] = dict(agent_limits or {})
+        self.default_agent_limit = default_agent_limit
+        
+        # Heap of (-priority, insertion order, task) for tasks whose dependencies are met
+        self._ready: List[Tuple[int, int, WorkflowTask]] = []
+        self._order = itertools.count()
+        # Tasks still waiting on dependencies: task_id -> unfinished dependency ids
+        self._waiting: Dict[str, Set[str]] = {}
+        self._blocked: Dict[str, WorkflowTask] = {}
+        self._dependents: Dict[str, List[str]] = defaultdict(list)
+        self._known: Set[str] = set()
+        self._completed: Set[str] = set()
+        self._running: Dict[str, int] = defaultdict(int)  # agent_type -> tasks in flight
+    
+    @property
+    def task_queue(self) -> List[WorkflowTask]:
+        """Pending tasks (ready first, by priority, then blocked ones)"""
+        return [entry[2] for entry in sorted(self._ready)] + list(self._blocked.values())
+    
+    def agent_limit(self, agent_type: str) -> int:
+        return self.agent_limits.get(agent_type, self.default_agent_limit)
     
     def add_task(self, task: WorkflowTask) -> None:
-        """Add a task to the queue"""
-        self.task_queue.append(task)
-        # Sort by priority (higher priority first)
-        self.task_queue.sort(key=lambda t: t.priority.value if hasattr(t, 'priority') else 0, reverse=True)
+        """Add a task; it becomes ready once every task it depends on has completed"""
+        self._known.add(task.id)
+        waiting = {
+            dep for dep in task.depends_on if dep not in self._completed and dep != task.id
+        }
+        if waiting:
+            self._waiting[task.id] = waiting
+            self._blocked[task.id] = task
+            for dep in waiting:
+                self._dependents[dep].append(task.id)
+        else:
+            self._push_ready(task)
     
     def get_next_task(self) -> Optional[WorkflowTask]:
         """Get the next task to execute"""
-        if self.task_queue:
-            return self.task_queue.pop(0)
-        return None
+        tasks = self.get_ready_tasks(max_count=1)
+        return tasks[0] if tasks else None
     
     def get_ready_tasks(self, max_count: int = 5) -> List[WorkflowTask]:
-        """Get ready tasks for parallel execution"""
-        ready = []
-        remaining = []
-        for task in self.task_queue:
-            if len(ready) < max_count:
-                ready.append(task)
-            else:
-                remaining.append(task)
-        self.task_queue = remaining
-        return ready
+        """
+        Take up to ``max_count`` ready tasks, highest priority first.
+        
+        Tasks whose agent type is already running at its concurrency limit
+        stay queued. Each returned task holds an agent slot until
+        ``complete_task`` is called for it.
+        """
+        if not self._ready and self._blocked:
+            self._release_orphans()
+        
+        selected: List[WorkflowTask] = []
+        deferred = []
+        while self._ready and len(selected) < max_count:
+            entry = heapq.heappop(self._ready)
+            task = entry[2]
+            if self._running[task.agent_type] >= self.agent_limit(task.agent_type):
+                deferred.append(entry)
+                continue
+            self._running[task.agent_type] += 1
+            selected.append(task)
+        for entry in deferred:
+            heapq.heappush(self._ready, entry)
+        return selected
+    
+    def complete_task(self, task: WorkflowTask, succeeded: bool = True) -> None:
+        """Release the task's agent slot and unblock dependents if it succeeded"""
+        self._running[task.agent_type] = max(0, self._running[task.agent_type] - 1)
+        if not succeeded:
+            # Dependents of a failed task stay blocked
+            return
+        self._completed.add(task.id)
+        for dependent_id in self._dependents.pop(task.id, []):
+            waiting = self._waiting.get(dependent_id)
+            if waiting is None:
+                continue
+            waiting.discard(task.id)
+            if not waiting:
+                del self._waiting[dependent_id]
+                self._push_ready(self._blocked.pop(dependent_id))
+    
+    def _push_ready(self, task: WorkflowTask) -> None:
+        priority = task.priority.value if hasattr(task, 'priority') else 0
+        heapq.heappush(self._ready, (-priority, next(self._order), task))
+    
+    def _release_orphans(self) -> None:
+        """Drop dependencies on tasks that were never scheduled"""
+        for task_id in list(self._blocked):
+            waiting = self._waiting[task_id]
+            waiting.intersection_update(self._known)
+            if not waiting:
+                del self._waiting[task_id]
+                self._push_ready(self._blocked.pop(task_id))
 
 
 class EnhancedMaestro:
@@ -126,15 +202,17 @@ class EnhancedMaestro:
         knowledge_graph=None,
         llm_service=None,
         agents_registry=None,
-        storage_path: str = "workflow_storage"
+        storage_path: str = "workflow_storage",
+        max_parallel_tasks: int = 5,
     ):
         self.knowledge_graph = knowledge_graph
         self.llm_service = llm_service
         self.agents = agents_registry or {}
         self.storage_path = storage_path
+        self.max_parallel_tasks = max_parallel_tasks
         
         self.state_manager = WorkflowStateManager(storage_path)
-        self.scheduler = TaskScheduler()
+        self.scheduler = TaskScheduler(agent_limits=self._agent_limits(self.agents))
         self.event_bus = EventBus()
         self.checkpoint_manager = CheckpointManager(storage_path)
         
@@ -153,6 +231,12 @@ class EnhancedMaestro:
             WorkflowPhase.POST_PRODUCTION: ['FormatterBot'],
         }
     
+    @staticmethod
+    def _agent_limits(agents_registry) -> Dict[str, int]:
+        """Per-agent-type concurrency limits from an AgentRegistry, if one was given"""
+        configs = getattr(agents_registry, "agent_configs", None) or {}
+        return {agent_type: config.max_concurrent for agent_type, config in configs.items()}
+    
     def _initialize_phase_configs(self) -> Dict[WorkflowPhase, Dict[str, Any]]:
         """Initialize phase-specific configurations"""
         return {
@@ -228,7 +312,7 @@ class EnhancedMaestro:
         # Generate initial task plan
         tasks = await self._generate_task_plan(workflow_state)
         for task in tasks:
-            workflow_state.tasks[task.task_id] = task
+            workflow_state.tasks[task.id] = task
             self.scheduler.add_task(task)
         
         # Save initial state
@@ -250,11 +334,10 @@ class EnhancedMaestro:
         # Create intake tasks
         task_id = f"task_{workflow_state.session_id}_intake_1"
         tasks.append(WorkflowTask(
-            task_id=task_id,
+            id=task_id,
             phase=WorkflowPhase.INTAKE,
-            name="Document Ingestion",
-            description="Process and analyze input documents",
-            assigned_agents=self.agent_assignments.get(WorkflowPhase.INTAKE, []),
+            agent_type=self.agent_assignments[WorkflowPhase.INTAKE][0],
+            description="Document Ingestion: process and analyze input documents",
             priority=TaskPriority.HIGH,
             status=PhaseStatus.PENDING,
         ))
@@ -273,7 +356,7 @@ class EnhancedMaestro:
         while not self._is_workflow_complete(workflow_state):
             try:
                 # Get next executable tasks
-                ready_tasks = self.scheduler.get_ready_tasks()
+                ready_tasks = self.scheduler.get_ready_tasks(self.max_parallel_tasks)
                 
                 if not ready_tasks:
                     if workflow_state.human_feedback_required:
@@ -282,7 +365,7 @@ class EnhancedMaestro:
                     else:
                         break  # No more tasks to execute
                 
-                # Execute tasks concurrently (where possible)
+                # Execute tasks concurrently
                 await self._execute_tasks_batch(ready_tasks, workflow_state)
                 
                 # Update workflow state
@@ -302,6 +385,7 @@ class EnhancedMaestro:
                     "session_id": session_id,
                     "error": str(e),
                 })
+                await self.event_bus.close()
                 raise
         
         # Mark workflow complete
@@ -311,6 +395,9 @@ class EnhancedMaestro:
             "session_id": session_id,
             "case_name": workflow_state.case_name,
         })
+        # Subscribers run in their own tasks; let them see the final events,
+        # then stop the workers (the next emit starts them again)
+        await self.event_bus.close()
     
     def _is_workflow_complete(self, workflow_state: WorkflowState) -> bool:
         """Check if workflow is complete"""
@@ -327,31 +414,52 @@ class EnhancedMaestro:
         tasks: List[WorkflowTask],
         workflow_state: WorkflowState
     ) -> None:
-        """Execute a batch of tasks"""
-        for task in tasks:
-            try:
-                task.status = PhaseStatus.IN_PROGRESS
-                task.started_at = datetime.now()
-                
-                # Execute task (placeholder for actual execution logic)
-                result = await self._execute_task(task, workflow_state)
-                
-                task.status = PhaseStatus.COMPLETED
-                task.completed_at = datetime.now()
-                task.output = result
-                workflow_state.completed_tasks.append(task.task_id)
-                
-                await self.event_bus.emit("task_completed", {
-                    "task_id": task.task_id,
-                    "phase": task.phase.value,
-                    "result": result,
-                })
-                
-            except Exception as e:
-                task.status = PhaseStatus.FAILED
-                task.error = str(e)
-                workflow_state.failed_tasks.append(task.task_id)
-                logger.error(f"Task {task.task_id} failed: {e}")
+        """Execute a batch of ready tasks concurrently"""
+        if hasattr(asyncio, "TaskGroup"):
+            async with asyncio.TaskGroup() as group:
+                for task in tasks:
+                    group.create_task(self._run_scheduled_task(task, workflow_state))
+        else:  # Python 3.10
+            await asyncio.gather(
+                *(self._run_scheduled_task(task, workflow_state) for task in tasks)
+            )
+    
+    async def _run_scheduled_task(
+        self,
+        task: WorkflowTask,
+        workflow_state: WorkflowState
+    ) -> None:
+        """Run one task, record its outcome and release its scheduler slot"""
+        succeeded = False
+        load_balancer = getattr(self.agents, "load_balancer", None)
+        if load_balancer is not None:
+            load_balancer.record_usage(task.agent_type)
+        try:
+            task.status = PhaseStatus.IN_PROGRESS
+            task.started_at = datetime.now()
+            
+            # Execute task (placeholder for actual execution logic)
+            result = await self._execute_task(task, workflow_state)
+            
+            task.status = PhaseStatus.COMPLETED
+            task.completed_at = datetime.now()
+            task.output_data = result
+            workflow_state.completed_tasks.append(task.id)
+            succeeded = True
+            
+            await self.event_bus.emit("task_completed", {
+                "task_id": task.id,
+                "phase": task.phase.value,
+                "result": result,
+            })
+            
+        except Exception as e:
+            task.status = PhaseStatus.FAILED
+            task.error_message = str(e)
+            workflow_state.failed_tasks.append(task.id)
+            logger.error(f"Task {task.id} failed: {e}")
+        finally:
+            self.scheduler.complete_task(task, succeeded)
     
     async def _execute_task(
         self,
@@ -360,9 +468,9 @@ class EnhancedMaestro:
     ) -> Dict[str, Any]:
         """Execute a single task"""
         # Placeholder for actual task execution
-        logger.info(f"Executing task: {task.name}")
+        logger.info(f"Executing task: {task.description}")
         await asyncio.sleep(0.1)  # Simulate work
-        return {"status": "success", "task_id": task.task_id}
+        return {"status": "success", "task_id": task.id}
     
     async def _update_workflow_progress(self, workflow_state: WorkflowState) -> None:
         """Update workflow progress metrics"""
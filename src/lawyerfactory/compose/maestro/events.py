@@ -6,78 +6,243 @@
 #   - Directory Group: Orchestration
 #   - Group Tags: orchestration
 Event system for workflow coordination and monitoring.
+
+``emit`` records the event and hands it to each subscriber's bounded queue;
+a per-subscriber worker task runs the handler, so a slow handler no longer
+holds up the workflow loop. When a queue is full the overflow policy decides
+what happens: drop the oldest queued event, drop the new one, or block the
+emitter until there is room (backpressure).
 """
 
 import asyncio
+from collections import deque
 from datetime import datetime
 import logging
-from typing import Any, Callable, Dict, List, Optional
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+BLOCK = "block"
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, BLOCK)
+
+
+class _Subscription:
+    """A subscriber callback with its own bounded queue and worker task"""
+
+    def __init__(self, event_type: str, callback: Callable, max_queue_size: int, policy: str):
+        self.event_type = event_type
+        self.callback = callback
+        self.policy = policy
+        self.max_queue_size = max_queue_size
+        # The queue and worker belong to the loop that created them and are rebuilt
+        # when the bus is used from another loop (e.g. successive asyncio.run calls)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self.worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.handled = 0
+        self.errors = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def ensure_worker(self) -> None:
+        """Bind the queue and worker to the running loop, carrying over pending events"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            pending = []
+            while not self.queue.empty():
+                pending.append(self.queue.get_nowait())
+            self.queue = asyncio.Queue(maxsize=self.max_queue_size)
+            for event in pending:
+                self.queue.put_nowait(event)
+            self.worker = None
+            self._loop = loop
+        if self.worker is None or self.worker.done():
+            self.worker = loop.create_task(self._run())
+
+    async def put(self, event: Dict[str, Any]) -> None:
+        self.ensure_worker()
+
+        if self.queue.full():
+            if self.policy == DROP_NEWEST:
+                self.dropped += 1
+                return
+            if self.policy == DROP_OLDEST:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self.dropped += 1
+        await self.queue.put(event)
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    async def _run(self) -> None:
+        while True:
+            event = await self.queue.get()
+            started = time.perf_counter()
+            try:
+                if asyncio.iscoroutinefunction(self.callback):
+                    await self.callback(event)
+                else:
+                    self.callback(event)
+                self.handled += 1
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Error in event handler for {self.event_type}: {e}")
+            finally:
+                latency = time.perf_counter() - started
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+                self.queue.task_done()
+
+    def stop(self) -> None:
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+        self._loop = None
+
+    def metrics(self) -> Dict[str, Any]:
+        calls = self.handled + self.errors
+        return {
+            "handler": getattr(self.callback, "__qualname__", repr(self.callback)),
+            "queue_depth": self.queue.qsize(),
+            "max_queue_depth": self.max_depth,
+            "handled": self.handled,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "avg_latency_ms": round(self.total_latency / calls * 1000, 3) if calls else 0.0,
+            "max_latency_ms": round(self.max_latency * 1000, 3),
+        }
+
 
 class EventBus:
     """Event system for workflow coordination"""
 
-    def __init__(self):
-        self.subscribers: Dict[str, List[Callable]] = {}
-        self.event_history: List[Dict[str, Any]] = []
-        self.max_history_size = 1000
+    def __init__(
+        self,
+        max_history_size: int = 1000,
+        max_queue_size: int = 1000,
+        overflow_policy: str = DROP_OLDEST,
+    ):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        self.max_history_size = max_history_size
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+
+        self._subscriptions: Dict[str, List[_Subscription]] = {}
+        # Ring buffer of recent events plus a per-type index into the same events
+        self.event_history: Deque[Dict[str, Any]] = deque(maxlen=max_history_size)
+        self._history_by_type: Dict[str, Deque[Dict[str, Any]]] = {}
+        self.emitted = 0
+
+    @property
+    def subscribers(self) -> Dict[str, List[Callable]]:
+        return {
+            event_type: [s.callback for s in subscriptions]
+            for event_type, subscriptions in self._subscriptions.items()
+        }
 
     async def emit(self, event_type: str, data: Dict[str, Any]):
-        """Emit an event to all subscribers"""
+        """Record an event and queue it for every subscriber without waiting for handlers"""
         event = {
             "type": event_type,
             "data": data,
             "timestamp": datetime.now().isoformat(),
         }
+        self.emitted += 1
+        self._record(event)
+
+        # Notify subscribers
+        for subscription in list(self._subscriptions.get(event_type, ())):
+            await subscription.put(event)
 
-        # Add to history
+    def _record(self, event: Dict[str, Any]) -> None:
+        if self.max_history_size <= 0:
+            return
+        if len(self.event_history) == self.max_history_size:
+            # The evicted event is the oldest of its type as well
+            evicted = self.event_history[0]
+            by_type = self._history_by_type[evicted["type"]]
+            by_type.popleft()
+            if not by_type:
+                del self._history_by_type[evicted["type"]]
         self.event_history.append(event)
-        if len(self.event_history) > self.max_history_size:
-            self.event_history.pop(0)
+        self._history_by_type.setdefault(event["type"], deque()).append(event)
 
-        # Notify subscribers
-        if event_type in self.subscribers:
-            for callback in self.subscribers[event_type]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(event)
-                    else:
-                        callback(event)
-                except Exception as e:
-                    logger.error(f"Error in event handler for {event_type}: {e}")
-
-    def subscribe(self, event_type: str, callback: Callable):
-        """Subscribe to an event type"""
-        if event_type not in self.subscribers:
-            self.subscribers[event_type] = []
-        self.subscribers[event_type].append(callback)
+    def subscribe(
+        self,
+        event_type: str,
+        callback: Callable,
+        max_queue_size: Optional[int] = None,
+        overflow_policy: Optional[str] = None,
+    ):
+        """Subscribe to an event type, optionally overriding the queue size and overflow policy"""
+        policy = overflow_policy or self.overflow_policy
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        subscription = _Subscription(
+            event_type, callback, max_queue_size or self.max_queue_size, policy
+        )
+        self._subscriptions.setdefault(event_type, []).append(subscription)
         logger.debug(f"Subscribed to event type: {event_type}")
 
     def unsubscribe(self, event_type: str, callback: Callable):
         """Unsubscribe from an event type"""
-        if event_type in self.subscribers:
-            try:
-                self.subscribers[event_type].remove(callback)
-                if not self.subscribers[event_type]:
-                    del self.subscribers[event_type]
+        subscriptions = self._subscriptions.get(event_type, [])
+        for subscription in subscriptions:
+            if subscription.callback == callback:
+                subscription.stop()
+                subscriptions.remove(subscription)
+                if not subscriptions:
+                    del self._subscriptions[event_type]
                 logger.debug(f"Unsubscribed from event type: {event_type}")
-            except ValueError:
-                logger.warning(f"Callback not found for event type: {event_type}")
+                return
+        logger.warning(f"Callback not found for event type: {event_type}")
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been handled"""
+        for subscriptions in list(self._subscriptions.values()):
+            for subscription in subscriptions:
+                if subscription.worker is not None or not subscription.queue.empty():
+                    subscription.ensure_worker()
+                    await subscription.queue.join()
+
+    async def close(self) -> None:
+        """Handle any queued events, then stop the subscriber workers"""
+        await self.drain()
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.stop()
 
     def get_event_history(
         self, event_type: Optional[str] = None, limit: int = 100
     ) -> List[Dict[str, Any]]:
         """Get event history, optionally filtered by type"""
         if event_type:
-            events = [e for e in self.event_history if e["type"] == event_type]
+            events = self._history_by_type.get(event_type, ())
         else:
             events = self.event_history
 
-        return events[-limit:] if limit else events
+        if not limit or limit >= len(events):
+            return list(events)
+        return [events[i] for i in range(len(events) - limit, len(events))]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Emission counts plus queue depth and handler latency per subscriber"""
+        return {
+            "emitted": self.emitted,
+            "history_size": len(self.event_history),
+            "subscribers": {
+                event_type: [s.metrics() for s in subscriptions]
+                for event_type, subscriptions in self._subscriptions.items()
+            },
+        }
 
     def clear_history(self):
         """Clear event history"""
         self.event_history.clear()
+        self._history_by_type.clear()
         logger.info("Event history cleared")
@@ -0,0 +1,316 @@
+"""
+# Script Name: ingest_pipeline.py
+# Description: Pipelined parallel ingestion of case folder documents
+# Relationships:
+#   - Entity Type: Module
+#   - Directory Group: Orchestration
+#   - Group Tags: orchestration, ingestion
+Pipelined parallel ingestion of case folder documents.
+
+Files flow through four stages in batches: text extraction, classification,
+embedding and knowledge graph insertion. Each stage runs as its own task
+connected to the next by a bounded queue, so extraction of batch N+1 overlaps
+embedding of batch N. Extraction and classification fan out over a shared
+process (or thread) pool; embedding is batched per call to the configured
+embedding service and skipped when there is none; knowledge graph writes stay
+on the event loop thread because the SQLite connection is bound to the thread
+that opened it.
+"""
+
+import asyncio
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Any, Dict, Iterable, List, Optional
+import uuid
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("extract", "classify", "embed", "store")
+
+
+def extract_text(file_path: str) -> str:
+    """Extract plain text from a document; runs inside pool workers"""
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+    if suffix in (".txt", ".md"):
+        return path.read_text(encoding="utf-8", errors="replace")
+    if suffix == ".pdf":
+        try:
+            import PyPDF2
+
+            with open(path, "rb") as f:
+                reader = PyPDF2.PdfReader(f)
+                return "\n".join((p.extract_text() or "") for p in reader.pages)
+        except ImportError:
+            return f"[PDF file indexed: {path.name}]"
+    if suffix == ".docx":
+        try:
+            import docx
+
+            return "\n".join(p.text for p in docx.Document(str(path)).paragraphs)
+        except ImportError:
+            return f"[DOCX file indexed: {path.name}]"
+    return f"[Binary file indexed: {path.name}]"
+
+
+_categorizer = None
+
+
+def classify_text(text: str, filename: str) -> Dict[str, Any]:
+    """Categorize extracted text; runs inside pool workers"""
+    global _categorizer
+    if _categorizer is None:
+        from lawyerfactory.phases.phaseA01_intake.enhanced_document_categorizer import (
+            EnhancedDocumentCategorizer,
+        )
+
+        _categorizer = EnhancedDocumentCategorizer()
+    metadata = _categorizer.categorize_document(text, filename)
+    return {
+        "document_id": metadata.document_id,
+        "document_type": metadata.document_type.value,
+        "authority_level": metadata.authority_level.value,
+        "defendant_name": metadata.defendant_name,
+        "plaintiff_name": metadata.plaintiff_name,
+        "confidence_score": metadata.confidence_score,
+        "key_legal_issues": metadata.key_legal_issues,
+    }
+
+
+@dataclass
+class IngestedDocument:
+    path: str
+    text: str = ""
+    classification: Dict[str, Any] = field(default_factory=dict)
+    embedding: List[float] = field(default_factory=list)
+    entity_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class StageStats:
+    """Per-stage counters; throughput is measured over the stage's busy time"""
+
+    name: str
+    items: int = 0
+    batches: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "items": self.items,
+            "batches": self.batches,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 4),
+            "items_per_second": (
+                round(self.items / self.busy_seconds, 2) if self.busy_seconds else None
+            ),
+        }
+
+
+@dataclass
+class IngestReport:
+    documents: List[IngestedDocument]
+    stages: Dict[str, StageStats]
+    wall_seconds: float
+
+    @property
+    def failed(self) -> List[IngestedDocument]:
+        return [doc for doc in self.documents if doc.error]
+
+    def summary(self) -> Dict[str, Any]:
+        busy = sum(stats.busy_seconds for stats in self.stages.values())
+        return {
+            "documents": len(self.documents),
+            "failed": len(self.failed),
+            "wall_seconds": round(self.wall_seconds, 4),
+            "files_per_second": (
+                round(len(self.documents) / self.wall_seconds, 2) if self.wall_seconds else None
+            ),
+            # > 1.0 means stages ran concurrently
+            "stage_overlap": round(busy / self.wall_seconds, 2) if self.wall_seconds else None,
+            "stages": {name: stats.snapshot() for name, stats in self.stages.items()},
+        }
+
+
+class IngestPipeline:
+    """Batch-pipelined extract -> classify -> embed -> store ingestion
+
+    The worker pool is created on first use and reused across runs until
+    ``close()``, so repeated case ingestions don't pay process start-up again.
+    """
+
+    def __init__(
+        self,
+        knowledge_graph=None,
+        embedding_service=None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        queue_depth: int = 2,
+    ):
+        self.knowledge_graph = knowledge_graph
+        self.embedding_service = embedding_service
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.use_processes = use_processes
+        self.queue_depth = queue_depth
+        self._executor: Optional[Executor] = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                try:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                except (OSError, NotImplementedError) as e:
+                    logger.warning(f"Process pool unavailable ({e}), using threads")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="ingest"
+                )
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @property
+    def stages(self) -> List[str]:
+        """Stage names for a run; without an embedding service nothing is embedded"""
+        if self.embedding_service is None:
+            return [name for name in STAGES if name != "embed"]
+        return list(STAGES)
+
+    async def run(self, paths: Iterable[str], batch_size: int = 15) -> IngestReport:
+        names = self.stages
+        stats = {name: StageStats(name) for name in names}
+        queues = [asyncio.Queue(maxsize=self.queue_depth) for _ in names]
+        documents: List[IngestedDocument] = []
+        handlers = [getattr(self, f"_{name}") for name in names]
+
+        async def feed():
+            it = iter(paths)
+            while True:
+                batch = [IngestedDocument(str(p)) for p in islice(it, batch_size)]
+                if not batch:
+                    break
+                documents.extend(batch)
+                await queues[0].put(batch)
+            await queues[0].put(None)
+
+        async def stage(index: int):
+            name, handler = names[index], handlers[index]
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            while True:
+                batch = await inbox.get()
+                if batch is None:
+                    break
+                started = time.perf_counter()
+                await handler(batch, stats[name])
+                stats[name].busy_seconds += time.perf_counter() - started
+                stats[name].batches += 1
+                stats[name].items += len(batch)
+                if outbox is not None:
+                    await outbox.put(batch)
+            if outbox is not None:
+                await outbox.put(None)
+
+        started = time.perf_counter()
+        tasks = [asyncio.create_task(feed())]
+        tasks += [asyncio.create_task(stage(i)) for i in range(len(names))]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        report = IngestReport(documents, stats, time.perf_counter() - started)
+
+        summary = report.summary()
+        logger.info(
+            f"Ingested {summary['documents']} files in {summary['wall_seconds']}s "
+            f"({summary['files_per_second']} files/s, {summary['failed']} failed)"
+        )
+        for name, snapshot in summary["stages"].items():
+            logger.info(f"  {name}: {snapshot['items_per_second']} items/s busy")
+        return report
+
+    async def _in_pool(self, batch: List[IngestedDocument], stats: StageStats, fn, *arg_fns):
+        loop = asyncio.get_running_loop()
+        pending = [doc for doc in batch if not doc.error]
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(self.executor, fn, *(f(doc) for f in arg_fns))
+                for doc in pending
+            ),
+            return_exceptions=True,
+        )
+        for doc, result in zip(pending, results, strict=True):
+            if isinstance(result, BaseException):
+                doc.error = f"{stats.name}: {result}"
+                stats.errors += 1
+                logger.warning(f"Ingest {stats.name} failed for {doc.path}: {result}")
+            else:
+                yield doc, result
+
+    async def _extract(self, batch: List[IngestedDocument], stats: StageStats) -> None:
+        async for doc, text in self._in_pool(batch, stats, extract_text, lambda d: d.path):
+            doc.text = text
+
+    async def _classify(self, batch: List[IngestedDocument], stats: StageStats) -> None:
+        async for doc, classification in self._in_pool(
+            batch, stats, classify_text, lambda d: d.text, lambda d: Path(d.path).name
+        ):
+            doc.classification = classification
+
+    async def _embed(self, batch: List[IngestedDocument], stats: StageStats) -> None:
+        pending = [doc for doc in batch if not doc.error]
+        if not pending:
+            return
+        try:
+            vectors = await self.embedding_service.generate_embeddings(
+                [doc.text for doc in pending]
+            )
+            for doc, vector in zip(pending, vectors, strict=True):
+                doc.embedding = list(vector)
+        except Exception as e:
+            # Embeddings are optional; the documents are still stored without them
+            stats.errors += 1
+            logger.warning(f"Embedding service failed for {len(pending)} documents: {e}")
+
+    async def _store(self, batch: List[IngestedDocument], stats: StageStats) -> None:
+        kg = self.knowledge_graph
+        if kg is None or not hasattr(kg, "add_legal_entity"):
+            return
+        from lawyerfactory.kg.graph_api import LegalEntity, LegalEntityType
+
+        for doc in batch:
+            if doc.error:
+                continue
+            entity = LegalEntity(
+                id=doc.classification.get("document_id") or str(uuid.uuid4()),
+                entity_type=LegalEntityType.EVIDENCE,
+                name=Path(doc.path).name,
+                source_text=doc.text[:2000],
+                extraction_method="ingest_pipeline",
+                source_documents=[doc.path],
+                legal_attributes={"path": doc.path, **doc.classification},
+            )
+            try:
+                doc.entity_id = kg.add_legal_entity(entity)
+                if doc.embedding:
+                    kg._execute(
+                        "UPDATE entities SET embeddings = ? WHERE id = ?",
+                        (array("f", doc.embedding).tobytes(), doc.entity_id),
+                    )
+            except Exception as e:
+                doc.error = f"store: {e}"
+                stats.errors += 1
@@ -6,7 +6,9 @@
 #   - Directory Group: Orchestration
 #   - Group Tags: orchestration
 Prompt Chain Orchestrator for Skeletal Outline Generation
-Manages sequential LLM prompt execution with context preservation and anti-repetition protocols.
+Manages LLM prompt execution with context preservation and anti-repetition protocols.
+Independent sections are generated concurrently (bounded by the LLM concurrency
+limit); dependent sections start as soon as the sections they build on finish.
 Ensures coherent, comprehensive legal document generation that survives Rule 12(b)(6) motions.
 """
 
@@ -14,14 +16,23 @@ import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
-from typing import Dict, List
+import os
+import re
+from typing import Dict, Iterator, List, Optional
 
-from skeletal_outline_generator import SectionType, SkeletalOutline, SkeletalSection
+try:
+    from lawyerfactory.outline.generator import SectionType, SkeletalOutline, SkeletalSection
+except ImportError:
+    from skeletal_outline_generator import SectionType, SkeletalOutline, SkeletalSection
 
+from lawyerfactory.compose.maestro.section_scheduler import SectionScheduler
 from lawyerfactory.kg.graph_api import EnhancedKnowledgeGraph
 
 logger = logging.getLogger(__name__)
 
+# A numbered allegation at the start of a line, e.g. "12. Plaintiff ..."
+PARAGRAPH_NUMBER = re.compile(r"^(\s*)\d+\.(?=\s)", re.MULTILINE)
+
 
 @dataclass
 class GenerationContext:
@@ -43,6 +54,11 @@ class GenerationContext:
         default_factory=dict
     )  # section -> paragraph numbers
     content_tokens_used: int = 0  # Track token usage
+    # Owning section of each fact, evidence item and authority, fixed before
+    # any section runs so concurrent sections never race for the same item
+    fact_assignments: Dict[str, str] = field(default_factory=dict)
+    evidence_assignments: Dict[str, str] = field(default_factory=dict)
+    authority_assignments: Dict[str, str] = field(default_factory=dict)
     generation_log: List[str] = field(default_factory=list)  # Debug log
 
 
@@ -62,15 +78,29 @@ class PromptChainResult:
     success: bool
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
+    critical_path: List[str] = field(default_factory=list)  # Longest dependency chain
+    critical_path_seconds: float = 0.0  # Lower bound on generation time
 
 
 class PromptChainOrchestrator:
-    """Orchestrates sequential prompt execution for legal document generation"""
+    """Orchestrates dependency-ordered prompt execution for legal document generation"""
 
-    def __init__(self, enhanced_kg: EnhancedKnowledgeGraph, llm_service=None):
+    def __init__(
+        self,
+        enhanced_kg: EnhancedKnowledgeGraph,
+        llm_service=None,
+        max_llm_concurrency: Optional[int] = None,
+    ):
         self.kg = enhanced_kg
         self.llm_service = llm_service  # LLM service for actual generation
 
+        # Upper bound on LLM calls in flight across all sections and subsections
+        self.max_llm_concurrency = max(
+            1, max_llm_concurrency or int(os.getenv("LF_LLM_CONCURRENCY", "4"))
+        )
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
+        self.scheduler = SectionScheduler()
+
         # Anti-repetition tracking
         self.fact_usage_tracker = {}  # fact_id -> sections_used_in
         self.evidence_usage_tracker = {}  # evidence_id -> sections_used_in
@@ -96,16 +126,20 @@ class PromptChainOrchestrator:
                 f"Starting prompt chain execution for outline {skeletal_outline.outline_id}"
             )
 
-            # Sort sections by dependencies and priority
-            execution_order = self._determine_execution_order(skeletal_outline.sections)
+            self._allocate_section_materials(skeletal_outline, context)
+
+            # Run sections as a dependency graph; independent sections overlap
+            self._llm_semaphore = asyncio.Semaphore(self.max_llm_concurrency)
 
-            # Execute sections in order
-            for section in execution_order:
+            async def run_section(section: SkeletalSection) -> str:
                 section_content = await self._execute_section_prompt(
                     section, skeletal_outline, context
                 )
                 context.generated_content[section.section_id] = section_content
                 context.generation_log.append(f"Generated section: {section.title}")
+                return section_content
+
+            schedule = await self.scheduler.run(skeletal_outline.sections, run_section)
 
             # Compile final document
             final_document = self._compile_final_document(skeletal_outline, context)
@@ -132,10 +166,15 @@ class PromptChainOrchestrator:
                 rule_12b6_compliance_score=compliance_score,
                 generation_time_seconds=generation_time,
                 success=True,
+                critical_path=schedule.critical_path,
+                critical_path_seconds=schedule.critical_path_seconds,
             )
 
             logger.info(
-                f"Prompt chain execution completed successfully in {generation_time:.2f}s"
+                f"Prompt chain execution completed successfully in {generation_time:.2f}s "
+                f"(critical path {schedule.critical_path_seconds:.2f}s through "
+                f"{' -> '.join(schedule.critical_path)}, "
+                f"peak {schedule.max_parallelism} concurrent sections)"
             )
             return result
 
@@ -156,80 +195,80 @@ class PromptChainOrchestrator:
                 errors=[str(e)],
             )
 
-    def _determine_execution_order(
-        self, sections: List[SkeletalSection]
-    ) -> List[SkeletalSection]:
-        """Determine optimal execution order based on dependencies and priorities"""
-        # Create dependency graph
-        section_map = {section.section_id: section for section in sections}
-        ordered_sections = []
-        processed = set()
-
-        def can_process(section: SkeletalSection) -> bool:
-            return all(dep in processed for dep in section.dependencies)
-
-        # Process sections in dependency order
-        remaining = sections.copy()
-        while remaining:
-            # Find processable sections
-            ready = [s for s in remaining if can_process(s)]
-
-            if not ready:
-                # Break circular dependencies by processing highest priority
-                ready = [min(remaining, key=lambda x: x.priority_level)]
-
-            # Sort ready sections by priority
-            ready.sort(key=lambda x: x.priority_level)
-
-            # Process highest priority section
-            section = ready[0]
-            ordered_sections.append(section)
-            processed.add(section.section_id)
-            remaining.remove(section)
-
-        return ordered_sections
-
     async def _execute_section_prompt(
         self,
         section: SkeletalSection,
         outline: SkeletalOutline,
         context: GenerationContext,
     ) -> str:
-        """Execute prompt for individual section"""
+        """Execute prompt for individual section; failures propagate to the scheduler"""
+        # Build section-specific prompt
+        section_prompt = self._build_section_prompt(section, outline, context)
+
+        # Subsections and the main section prompt are independent of each
+        # other, so generate them concurrently
+        async def generate_main() -> str:
+            if self.llm_service:
+                return await self._call_llm_service(section_prompt, section)
+            # Mock generation for testing
+            return self._generate_mock_content(section, outline, context)
+
+        tasks = [asyncio.ensure_future(generate_main())]
+        tasks.extend(
+            asyncio.ensure_future(self._execute_section_prompt(subsection, outline, context))
+            for subsection in section.subsections
+        )
         try:
-            # Build section-specific prompt
-            section_prompt = self._build_section_prompt(section, outline, context)
-
-            # Execute subsections first if any
-            subsection_content = ""
-            for subsection in section.subsections:
-                sub_content = await self._execute_section_prompt(
-                    subsection, outline, context
+            section_content, *sub_contents = await asyncio.gather(*tasks)
+        except BaseException as e:
+            for task in tasks:
+                task.cancel()
+            if isinstance(e, Exception):
+                logger.error(
+                    f"Failed to execute section prompt for {section.section_id}: {e}"
                 )
-                context.generated_content[subsection.section_id] = sub_content
-                subsection_content += f"\n\n{sub_content}"
+            raise
 
-            # Execute main section prompt
-            if self.llm_service:
-                section_content = await self._call_llm_service(section_prompt, section)
-            else:
-                # Mock generation for testing
-                section_content = self._generate_mock_content(section, outline, context)
+        subsection_content = ""
+        for subsection, sub_content in zip(section.subsections, sub_contents, strict=True):
+            context.generated_content[subsection.section_id] = sub_content
+            subsection_content += f"\n\n{sub_content}"
 
-            # Combine with subsections
-            if subsection_content:
-                section_content += subsection_content
+        # Combine with subsections
+        if subsection_content:
+            section_content += subsection_content
 
-            # Update context tracking
-            self._update_context_tracking(section, context)
+        return section_content
 
-            return section_content
+    @staticmethod
+    def _walk_sections(sections: List[SkeletalSection]) -> Iterator[SkeletalSection]:
+        """Yield sections depth-first in document order, parents before subsections"""
+        for section in sections:
+            yield section
+            yield from PromptChainOrchestrator._walk_sections(section.subsections)
 
-        except Exception as e:
-            logger.error(
-                f"Failed to execute section prompt for {section.section_id}: {e}"
-            )
-            return f"[ERROR: Failed to generate content for {section.title}]"
+    def _allocate_section_materials(
+        self, outline: SkeletalOutline, context: GenerationContext
+    ) -> None:
+        """
+        Give every fact, evidence item and authority to exactly one section.
+
+        Higher-priority sections claim first, ties going to document order, so
+        the assignment is the same however the sections are later scheduled.
+        """
+        ranked = sorted(
+            enumerate(self._walk_sections(outline.sections)),
+            key=lambda item: (item[1].priority_level, item[0]),
+        )
+        for _, section in ranked:
+            for fact_ids in section.fact_mapping.values():
+                for fact_id in fact_ids:
+                    context.fact_assignments.setdefault(fact_id, section.section_id)
+            for evidence_ids in section.evidence_mapping.values():
+                for evidence_id in evidence_ids:
+                    context.evidence_assignments.setdefault(evidence_id, section.section_id)
+            for authority in section.legal_authorities:
+                context.authority_assignments.setdefault(authority, section.section_id)
 
     def _build_section_prompt(
         self,
@@ -266,56 +305,81 @@ class PromptChainOrchestrator:
         if section.fact_mapping or section.evidence_mapping:
             prompt_parts.append("\nRELEVANT FACTS AND EVIDENCE:")
 
-            # Add mapped facts
+            # Add mapped facts assigned to this section
             for element, fact_ids in section.fact_mapping.items():
-                unused_facts = [
-                    f_id for f_id in fact_ids if f_id not in context.used_facts
-                ]
-                if unused_facts:
-                    prompt_parts.append(f"\nFacts for {element}: {unused_facts}")
+                own_facts = self._owned_by(section, fact_ids, context.fact_assignments)
+                if own_facts:
+                    prompt_parts.append(f"\nFacts for {element}: {own_facts}")
 
-            # Add mapped evidence
+            # Add mapped evidence assigned to this section
             for element, evidence_ids in section.evidence_mapping.items():
-                unused_evidence = [
-                    e_id for e_id in evidence_ids if e_id not in context.used_evidence
-                ]
-                if unused_evidence:
-                    prompt_parts.append(f"\nEvidence for {element}: {unused_evidence}")
+                own_evidence = self._owned_by(
+                    section, evidence_ids, context.evidence_assignments
+                )
+                if own_evidence:
+                    prompt_parts.append(f"\nEvidence for {element}: {own_evidence}")
 
         # Add legal authorities
         if section.legal_authorities:
-            unused_authorities = [
-                auth
-                for auth in section.legal_authorities
-                if auth not in context.cited_authorities
-            ]
-            if unused_authorities:
-                prompt_parts.append(
-                    f"\nLEGAL AUTHORITIES TO CITE: {unused_authorities}"
-                )
+            own_authorities = self._owned_by(
+                section, section.legal_authorities, context.authority_assignments
+            )
+            if own_authorities:
+                prompt_parts.append(f"\nLEGAL AUTHORITIES TO CITE: {own_authorities}")
 
-        # Add paragraph numbering context
-        prompt_parts.append(
-            f"\nSTART PARAGRAPH NUMBERING AT: {context.paragraph_counter}"
-        )
+        # Paragraphs are renumbered across the document when it is compiled
+        prompt_parts.append("\nNUMBER PARAGRAPHS FROM 1")
 
         # Add word count target
         prompt_parts.append(f"\nTARGET WORD COUNT: {section.word_count_target} words")
 
-        # Add anti-repetition instructions
-        if context.used_facts or context.used_evidence:
+        # Add anti-repetition instructions for mapped items other sections cover
+        covered_facts = self._covered_elsewhere(
+            section, section.fact_mapping, context.fact_assignments
+        )
+        covered_evidence = self._covered_elsewhere(
+            section, section.evidence_mapping, context.evidence_assignments
+        )
+        if covered_facts or covered_evidence:
             prompt_parts.append(
-                "\nANTI-REPETITION: Do not repeat facts or evidence already used:"
+                "\nANTI-REPETITION: Do not repeat facts or evidence covered in other sections:"
             )
-            if context.used_facts:
-                prompt_parts.append(f"Used facts: {context.used_facts}")
-            if context.used_evidence:
-                prompt_parts.append(f"Used evidence: {context.used_evidence}")
+            if covered_facts:
+                prompt_parts.append(f"Covered facts: {covered_facts}")
+            if covered_evidence:
+                prompt_parts.append(f"Covered evidence: {covered_evidence}")
 
         return "\n".join(filter(None, prompt_parts))
 
+    @staticmethod
+    def _owned_by(
+        section: SkeletalSection, item_ids: List[str], assignments: Dict[str, str]
+    ) -> List[str]:
+        return [i for i in item_ids if assignments.get(i) == section.section_id]
+
+    @staticmethod
+    def _covered_elsewhere(
+        section: SkeletalSection,
+        mapping: Dict[str, List[str]],
+        assignments: Dict[str, str],
+    ) -> List[str]:
+        covered = []
+        for item_ids in mapping.values():
+            for item_id in item_ids:
+                owner = assignments.get(item_id)
+                if owner not in (None, section.section_id) and item_id not in covered:
+                    covered.append(item_id)
+        return covered
+
     async def _call_llm_service(self, prompt: str, section: SkeletalSection) -> str:
         """Call LLM service to generate content"""
+        if self._llm_semaphore is None:
+            self._llm_semaphore = asyncio.Semaphore(self.max_llm_concurrency)
+        async with self._llm_semaphore:
+            return await self._invoke_llm_service(prompt, section)
+
+    async def _invoke_llm_service(self, prompt: str, section: SkeletalSection) -> str:
+        """Single LLM request; callers hold the concurrency semaphore"""
         try:
             if hasattr(self.llm_service, "generate_content"):
                 response = await self.llm_service.generate_content(
@@ -327,12 +391,13 @@ class PromptChainOrchestrator:
                 )
                 return response.get("content", "")
             else:
-                # Fallback to synchronous call
-                response = self.llm_service.generate(prompt)
+                # Fallback to synchronous call, off the event loop so other
+                # sections keep generating
+                response = await asyncio.to_thread(self.llm_service.generate, prompt)
                 return response
         except Exception as e:
-            logger.error(f"LLM service call failed: {e}")
-            return f"[ERROR: LLM generation failed for {section.title}]"
+            logger.error(f"LLM service call failed for {section.section_id}: {e}")
+            raise
 
     def _generate_mock_content(
         self,
@@ -382,55 +447,48 @@ ________________________________/
         self, outline: SkeletalOutline, context: GenerationContext
     ) -> str:
         """Generate mock introduction content"""
-        context.paragraph_counter += 1
         return f"""
 I. INTRODUCTION
 
-{context.paragraph_counter}. This action arises under {outline.global_context.get('primary_cause_of_action', 'applicable law')} and seeks damages and equitable relief for violations of plaintiff's rights. This Court has jurisdiction over this matter, and venue is proper in this District. Plaintiff seeks compensatory damages, punitive damages, injunctive relief, and such other relief as this Court deems just and proper.
+1. This action arises under {outline.global_context.get('primary_cause_of_action', 'applicable law')} and seeks damages and equitable relief for violations of plaintiff's rights. This Court has jurisdiction over this matter, and venue is proper in this District. Plaintiff seeks compensatory damages, punitive damages, injunctive relief, and such other relief as this Court deems just and proper.
 """
 
     def _mock_jurisdiction_content(
         self, outline: SkeletalOutline, context: GenerationContext
     ) -> str:
         """Generate mock jurisdiction content"""
-        start_para = context.paragraph_counter + 1
-        context.paragraph_counter += 3
         return f"""
 II. JURISDICTION AND VENUE
 
-{start_para}. This Court has subject matter jurisdiction over this action pursuant to 28 U.S.C. § 1331 as this action arises under federal law.
+1. This Court has subject matter jurisdiction over this action pursuant to 28 U.S.C. § 1331 as this action arises under federal law.
 
-{start_para + 1}. This Court has personal jurisdiction over defendants because they conduct substantial business in {outline.jurisdiction} and the claims arise from their activities in this state.
+2. This Court has personal jurisdiction over defendants because they conduct substantial business in {outline.jurisdiction} and the claims arise from their activities in this state.
 
-{start_para + 2}. Venue is proper in this District pursuant to 28 U.S.C. § 1391(b) because defendants conduct business in this District and the events giving rise to this action occurred in this District.
+3. Venue is proper in this District pursuant to 28 U.S.C. § 1391(b) because defendants conduct business in this District and the events giving rise to this action occurred in this District.
 """
 
     def _mock_parties_content(
         self, outline: SkeletalOutline, context: GenerationContext
     ) -> str:
         """Generate mock parties content"""
-        start_para = context.paragraph_counter + 1
-        context.paragraph_counter += 2
         return f"""
 III. PARTIES
 
-{start_para}. Plaintiff [PLAINTIFF NAME] is [description] and is a resident of {outline.jurisdiction}.
+1. Plaintiff [PLAINTIFF NAME] is [description] and is a resident of {outline.jurisdiction}.
 
-{start_para + 1}. Defendant [DEFENDANT NAME] is [description] and conducts business in {outline.jurisdiction}.
+2. Defendant [DEFENDANT NAME] is [description] and conducts business in {outline.jurisdiction}.
 """
 
     def _mock_facts_content(
         self, outline: SkeletalOutline, context: GenerationContext
     ) -> str:
         """Generate mock statement of facts"""
-        start_para = context.paragraph_counter + 1
         fact_count = len(outline.evidence_summary.get("fact_assertions", []))
         para_count = max(5, fact_count)
-        context.paragraph_counter += para_count
 
         facts_content = "IV. STATEMENT OF FACTS\n\n"
         for i in range(para_count):
-            facts_content += f"{start_para + i}. [Factual allegation {i+1} with supporting evidence]\n\n"
+            facts_content += f"{i + 1}. [Factual allegation {i+1} with supporting evidence]\n\n"
 
         return facts_content
 
@@ -441,19 +499,17 @@ III. PARTIES
         context: GenerationContext,
     ) -> str:
         """Generate mock cause of action content"""
-        start_para = context.paragraph_counter + 1
         element_count = len(section.subsections) if section.subsections else 4
-        context.paragraph_counter += element_count + 2
 
         coa_content = f"{section.roman_numeral}. {section.title}\n\n"
-        coa_content += f"{start_para}. Plaintiff incorporates by reference all preceding allegations.\n\n"
+        coa_content += "1. Plaintiff incorporates by reference all preceding allegations.\n\n"
 
         for i, subsection in enumerate(section.subsections):
             coa_content += (
-                f"{start_para + i + 1}. [Element {subsection.title} allegations]\n\n"
+                f"{i + 2}. [Element {subsection.title} allegations]\n\n"
             )
 
-        coa_content += f"{start_para + element_count + 1}. As a direct and proximate result of defendants' conduct, plaintiff has suffered damages in an amount to be proven at trial.\n\n"
+        coa_content += f"{element_count + 2}. As a direct and proximate result of defendants' conduct, plaintiff has suffered damages in an amount to be proven at trial.\n\n"
 
         return coa_content
 
@@ -489,25 +545,31 @@ Respectfully submitted,
     def _update_context_tracking(
         self, section: SkeletalSection, context: GenerationContext
     ):
-        """Update context tracking after section generation"""
-        # Track used facts and evidence
-        for element, fact_ids in section.fact_mapping.items():
-            context.used_facts.extend(fact_ids)
-
-        for element, evidence_ids in section.evidence_mapping.items():
-            context.used_evidence.extend(evidence_ids)
-
-        # Track cited authorities
-        context.cited_authorities.extend(section.legal_authorities)
-
-        # Record paragraph numbers for this section
-        context.section_references[section.section_id] = list(
-            range(
-                context.paragraph_counter - 10,  # Rough estimate
-                context.paragraph_counter,
+        """Record the facts, evidence and authorities a generated section covered"""
+        for fact_ids in section.fact_mapping.values():
+            context.used_facts.extend(
+                self._owned_by(section, fact_ids, context.fact_assignments)
             )
+
+        for evidence_ids in section.evidence_mapping.values():
+            context.used_evidence.extend(
+                self._owned_by(section, evidence_ids, context.evidence_assignments)
+            )
+
+        context.cited_authorities.extend(
+            self._owned_by(section, section.legal_authorities, context.authority_assignments)
         )
 
+    def _renumber_paragraphs(self, content: str, context: GenerationContext) -> str:
+        """Number a section's paragraphs consecutively after the preceding sections"""
+
+        def next_number(match: re.Match) -> str:
+            number = context.paragraph_counter
+            context.paragraph_counter += 1
+            return f"{match.group(1)}{number}."
+
+        return PARAGRAPH_NUMBER.sub(next_number, content)
+
     def _compile_final_document(
         self, outline: SkeletalOutline, context: GenerationContext
     ) -> str:
@@ -519,10 +581,23 @@ Respectfully submitted,
         document_parts.append("=" * 50)
         document_parts.append("")
 
-        # Add sections in order
+        # Add sections in order; sections were generated concurrently, so
+        # usage tracking and paragraph numbering are settled here in document order
+        for section in self._walk_sections(outline.sections):
+            if section.section_id in context.generated_content:
+                self._update_context_tracking(section, context)
+
         for section in outline.sections:
             if section.section_id in context.generated_content:
-                document_parts.append(context.generated_content[section.section_id])
+                start = context.paragraph_counter
+                content = self._renumber_paragraphs(
+                    context.generated_content[section.section_id], context
+                )
+                context.generated_content[section.section_id] = content
+                context.section_references[section.section_id] = list(
+                    range(start, context.paragraph_counter)
+                )
+                document_parts.append(content)
                 document_parts.append("")
 
         # Add footer
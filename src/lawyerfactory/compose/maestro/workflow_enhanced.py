@@ -10,7 +10,6 @@ Integrates with the new maestro orchestration system while maintaining compatibi
 """
 
 import asyncio
-from itertools import islice
 import logging
 from pathlib import Path
 import sys
@@ -20,6 +19,7 @@ import uuid  # <-- added import
 from lawyerfactory.kg.graph_api import EnhancedKnowledgeGraph as KnowledgeGraph
 
 from .enhanced_maestro import EnhancedMaestro
+from .ingest_pipeline import IngestPipeline
 from .workflow_models import PhaseStatus, WorkflowPhase
 
 logger = logging.getLogger(__name__)
@@ -32,13 +32,20 @@ class EnhancedWorkflowManager:
         self,
         knowledge_graph_path: str = "knowledge_graph.db",
         storage_path: str = "workflow_storage",
+        embedding_service=None,
     ):
-        """Initialize the enhanced workflow manager"""
+        """Initialize the enhanced workflow manager
+
+        ``embedding_service`` (anything with an async ``generate_embeddings``)
+        embeds ingested documents; without one, ingestion skips embedding.
+        """
         self.knowledge_graph = KnowledgeGraph(knowledge_graph_path)
+        self.embedding_service = embedding_service
         self.maestro = EnhancedMaestro(
             knowledge_graph=self.knowledge_graph, storage_path=storage_path
         )
         self.active_sessions: Dict[str, str] = {}  # case_name -> session_id mapping
+        self._ingest_pipeline: Optional[IngestPipeline] = None
 
         # Subscribe to maestro events for monitoring
         self._setup_event_handlers()
@@ -84,21 +91,15 @@ class EnhancedWorkflowManager:
         data = event["data"]
         logger.debug(f"Task completed: {data['task_id']} in phase {data['phase']}")
 
-    def _batch_iterable(self, iterable: Any, batch_size: int):
-        """Yield successive batches from iterable."""
-        it = iter(iterable)
-        while True:
-            batch = list(islice(it, batch_size))
-            if not batch:
-                break
-            yield batch
-
-    async def _process_file_batch(self, file_batch: List[str]) -> None:
-        """Process a batch of files for ingestion"""
-        logger.info(f"Processing batch of {len(file_batch)} files")
-        # Implement batch processing logic here
-        # This could include parallel processing, indexing, etc.
-        await asyncio.sleep(0.1)  # Placeholder for actual batch processing
+    @property
+    def ingest_pipeline(self) -> IngestPipeline:
+        """Ingestion pipeline shared by all workflows of this manager"""
+        if self._ingest_pipeline is None:
+            self._ingest_pipeline = IngestPipeline(
+                knowledge_graph=self.knowledge_graph,
+                embedding_service=self.embedding_service,
+            )
+        return self._ingest_pipeline
 
     async def create_lawsuit_workflow(
         self,
@@ -152,6 +153,7 @@ class EnhancedWorkflowManager:
 
             # Check total document count
             total_documents = len(input_documents)
+            ingestion_summary = None
 
             if total_documents == 0:
                 logger.warning(f"No documents found for case: {case_name}")
@@ -162,14 +164,10 @@ class EnhancedWorkflowManager:
                 )
                 batch_size = 15  # Configurable batch size
 
-                # Process documents in batches for better performance
-                for batch_num, file_batch in enumerate(
-                    self._batch_iterable(input_documents, batch_size), 1
-                ):
-                    logger.info(
-                        f"Processing batch {batch_num} ({len(file_batch)} files)..."
-                    )
-                    await self._process_file_batch(file_batch)
+                # Extraction, classification, embedding and graph insertion run
+                # as overlapping stages over the shared worker pool
+                report = await self.ingest_pipeline.run(input_documents, batch_size)
+                ingestion_summary = report.summary()
 
                 logger.info(
                     f"Batch processing complete for {total_documents} documents"
@@ -187,6 +185,7 @@ class EnhancedWorkflowManager:
                 "document_count": total_documents,
                 "workflow_type": "lawsuit_generation",
                 "batch_processed": total_documents > 10,
+                "ingestion": ingestion_summary,
                 "has_uploaded_documents": bool(uploaded_documents),
                 "has_folder_documents": bool(
                     case_folder and total_documents > len(uploaded_documents or [])
@@ -732,6 +731,9 @@ class EnhancedWorkflowManager:
         """Shutdown the workflow manager and clean up resources"""
         try:
             await self.maestro.shutdown()
+            if self._ingest_pipeline is not None:
+                self._ingest_pipeline.close()
+                self._ingest_pipeline = None
             self.active_sessions.clear()
             logger.info("Enhanced workflow manager shutdown complete")
         except Exception as e:
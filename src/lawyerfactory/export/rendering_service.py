@@ -0,0 +1,351 @@
+"""
+# Script Name: rendering_service.py
+# Description: Concurrent multi-format rendering of legal documents
+# Relationships:
+#   - Entity Type: Module
+#   - Directory Group: Document Generation
+#   - Group Tags: null
+Concurrent multi-format rendering of legal documents.
+
+A content dict is walked once into a DocumentModel: a flat, picklable list of
+title/heading/paragraph blocks. Word, PDF and Markdown renderers are plain
+module-level functions over that model, so they can run side by side in a
+process pool; python-docx and reportlab are CPU-bound and would otherwise
+serialise on the event loop. Rendered files are cached by a hash of the
+model, so re-exporting unchanged content returns the existing files.
+"""
+
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Block:
+    """One structural element: title, heading, paragraph, italic, bullet or spacer"""
+
+    kind: str
+    text: str = ""
+    level: int = 0
+
+
+@dataclass(frozen=True)
+class DocumentModel:
+    document_type: str
+    title: str
+    case_name: str
+    jurisdiction: str
+    blocks: Tuple[Block, ...] = field(default_factory=tuple)
+
+    @property
+    def header(self) -> str:
+        return f"{self.case_name} - {self.title}"
+
+    def content_hash(self) -> str:
+        payload = json.dumps(asdict(self), sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _irac_blocks(irac: Dict[str, Any]) -> List[Block]:
+    blocks = []
+    for key, heading in (
+        ("issue", "ISSUE"),
+        ("rule", "RULE"),
+        ("analysis", "APPLICATION/ANALYSIS"),
+    ):
+        if irac.get(key):
+            blocks += [Block("heading", heading, 2), Block("paragraph", str(irac[key]))]
+    if irac.get("counterarguments"):
+        blocks.append(Block("heading", "COUNTERARGUMENTS", 2))
+        blocks += [Block("bullet", str(c)) for c in irac["counterarguments"]]
+    if irac.get("conclusion"):
+        blocks += [Block("heading", "CONCLUSION", 2), Block("paragraph", str(irac["conclusion"]))]
+    return blocks
+
+
+def build_document_model(
+    document_type: str, content: Dict[str, Any], metadata: Dict[str, Any]
+) -> DocumentModel:
+    """Walk ``content`` once into the format-independent document model"""
+    title = content.get("title") or "Legal Document"
+    blocks: List[Block] = [Block("title", title)]
+
+    if document_type == "statement_of_facts":
+        blocks.append(
+            Block(
+                "italic",
+                f"This action is brought in the {content.get('jurisdiction', '')} "
+                f"{content.get('court', '')}.",
+            )
+        )
+        blocks.append(Block("spacer"))
+        for i, fact in enumerate(content.get("facts", []), 1):
+            blocks.append(Block("paragraph", f"{i}. {fact}"))
+    elif document_type == "claims_of_action":
+        for i, claim in enumerate(content.get("claims", []), 1):
+            if not isinstance(claim, dict):
+                continue
+            blocks.append(Block("heading", f"{i}. {claim.get('title', f'Claim {i}')}", 1))
+            irac = claim.get("irac_analysis", {})
+            if content.get("use_irac", False) and irac:
+                blocks += _irac_blocks(irac)
+            else:
+                blocks += [Block("bullet", str(e)) for e in claim.get("elements", [])]
+            blocks.append(Block("spacer"))
+    elif document_type == "prayer_for_relief":
+        blocks.append(Block("heading", "WHEREFORE, Plaintiff prays for judgment as follows:", 1))
+        for i, remedy in enumerate(content.get("remedies", []), 1):
+            blocks.append(Block("paragraph", f"{i}. {remedy}"))
+        blocks += [Block("spacer"), Block("italic", "Respectfully submitted,")]
+    elif document_type == "remedies":
+        damages = content.get("damages", {})
+        if isinstance(damages, dict):
+            for damage_type, amount in damages.items():
+                blocks.append(Block("paragraph", f"{damage_type}: {amount}"))
+    else:
+        for key, value in content.items():
+            if key == "title" or not isinstance(value, (str, list)):
+                continue
+            blocks.append(Block("heading", key.replace("_", " ").title(), 1))
+            if isinstance(value, list):
+                blocks += [Block("bullet", str(item)) for item in value]
+            else:
+                blocks.append(Block("paragraph", value))
+
+    return DocumentModel(
+        document_type=document_type,
+        title=title,
+        case_name=metadata.get("case_name", "Unknown Case"),
+        jurisdiction=metadata.get("jurisdiction", "Unknown"),
+        blocks=tuple(blocks),
+    )
+
+
+def _write_placeholder(model: DocumentModel, path: str, extension: str) -> str:
+    placeholder = Path(path).with_name(f"{Path(path).stem}_placeholder.{extension}")
+    with open(placeholder, "w") as f:
+        f.write(f"Placeholder {extension.upper()} document: {model.document_type}\n")
+        f.write("Generated by LawyerFactory AI Maestro\n")
+        f.write(f"Timestamp: {datetime.now().isoformat()}\n")
+    return str(placeholder)
+
+
+def render_docx(model: DocumentModel, path: str) -> str:
+    try:
+        from docx import Document
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+    except ImportError:
+        logger.warning("python-docx not available, generating placeholder")
+        return _write_placeholder(model, path, "docx")
+
+    doc = Document()
+    doc.core_properties.title = model.title
+    doc.core_properties.author = "LawyerFactory AI Maestro"
+    doc.sections[0].header.paragraphs[0].text = model.header
+
+    for block in model.blocks:
+        if block.kind == "title":
+            doc.add_heading(block.text, 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
+        elif block.kind == "heading":
+            doc.add_heading(block.text, level=block.level)
+        elif block.kind == "italic":
+            doc.add_paragraph().add_run(block.text).italic = True
+        elif block.kind == "bullet":
+            doc.add_paragraph(f"• {block.text}")
+        elif block.kind == "spacer":
+            doc.add_paragraph()
+        else:
+            doc.add_paragraph(block.text)
+    doc.save(path)
+    return path
+
+
+def render_pdf(model: DocumentModel, path: str) -> str:
+    try:
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+        from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+    except ImportError:
+        logger.warning("reportlab not available, generating placeholder")
+        return _write_placeholder(model, path, "pdf")
+
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        "CustomTitle",
+        parent=styles["Heading1"],
+        fontSize=16,
+        alignment=TA_CENTER,
+        spaceAfter=30,
+    )
+    heading_styles = {1: styles["Heading2"], 2: styles["Heading3"]}
+
+    story = []
+    for block in model.blocks:
+        text = escape(block.text)
+        if block.kind == "title":
+            story += [Paragraph(text, title_style), Spacer(1, 20)]
+        elif block.kind == "heading":
+            story += [Paragraph(text, heading_styles.get(block.level, styles["Heading3"]))]
+            story.append(Spacer(1, 12))
+        elif block.kind == "italic":
+            story += [Paragraph(f"<i>{text}</i>", styles["Normal"]), Spacer(1, 20)]
+        elif block.kind == "bullet":
+            story += [Paragraph(f"• {text}", styles["Normal"]), Spacer(1, 6)]
+        elif block.kind == "spacer":
+            story.append(Spacer(1, 20))
+        else:
+            story += [Paragraph(text, styles["Normal"]), Spacer(1, 12)]
+    SimpleDocTemplate(path, pagesize=letter).build(story)
+    return path
+
+
+def render_markdown(model: DocumentModel, path: str) -> str:
+    md = [
+        f"# {model.title}",
+        "",
+        "## Document Information",
+        "- **Generated by:** LawyerFactory AI Maestro",
+        f"- **Timestamp:** {datetime.now().isoformat()}",
+        f"- **Case:** {model.case_name}",
+        f"- **Jurisdiction:** {model.jurisdiction}",
+        "",
+    ]
+    for block in model.blocks[1:] if model.blocks[:1] and model.blocks[0].kind == "title" else model.blocks:
+        if block.kind == "heading":
+            md += [f"{'#' * (block.level + 2)} {block.text}", ""]
+        elif block.kind == "italic":
+            md += [f"*{block.text}*", ""]
+        elif block.kind == "bullet":
+            md.append(f"- {block.text}")
+        elif block.kind == "spacer":
+            md.append("")
+        else:
+            md.append(block.text)
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(md))
+    return path
+
+
+RENDERERS: Dict[str, Tuple[Callable[[DocumentModel, str], str], str]] = {
+    "word": (render_docx, "docx"),
+    "pdf": (render_pdf, "pdf"),
+    "markdown": (render_markdown, "md"),
+}
+
+
+def output_filename(model: DocumentModel, extension: str, content_hash: str) -> str:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{model.document_type}_{timestamp}_{content_hash[:8]}.{extension}"
+
+
+class RenderingService:
+    """Renders one document model into several formats concurrently
+
+    The worker pool is created on first use and kept for the life of the
+    service. Rendered paths are cached per (model hash, format) for as long as
+    the file still exists.
+    """
+
+    def __init__(
+        self,
+        output_dirs: Dict[str, Path],
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        max_cached_outputs: int = 256,
+    ):
+        self.output_dirs = {name: Path(path) for name, path in output_dirs.items()}
+        self.max_workers = max_workers or min(len(RENDERERS), os.cpu_count() or 1)
+        self.use_processes = use_processes
+        self.max_cached_outputs = max_cached_outputs
+        self._executor: Optional[Executor] = None
+        self._outputs: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self.stats = {"rendered": 0, "cache_hits": 0, "failures": 0}
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                try:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                except (OSError, NotImplementedError) as e:
+                    logger.warning(f"Process pool unavailable ({e}), rendering in threads")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="render"
+                )
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _cached(self, key: Tuple[str, str]) -> Optional[str]:
+        path = self._outputs.get(key)
+        if path is None:
+            return None
+        if not Path(path).exists():
+            del self._outputs[key]
+            return None
+        self._outputs.move_to_end(key)
+        return path
+
+    async def render(self, model: DocumentModel, format_name: str) -> str:
+        if format_name not in RENDERERS or format_name not in self.output_dirs:
+            raise ValueError(f"Unsupported format: {format_name}")
+        content_hash = model.content_hash()
+        key = (content_hash, format_name)
+        cached = self._cached(key)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+            return cached
+
+        renderer, extension = RENDERERS[format_name]
+        output_dir = self.output_dirs[format_name]
+        output_dir.mkdir(exist_ok=True, parents=True)
+        path = str(output_dir / output_filename(model, extension, content_hash))
+        loop = asyncio.get_running_loop()
+        path = await loop.run_in_executor(self.executor, renderer, model, path)
+
+        self.stats["rendered"] += 1
+        self._outputs[key] = path
+        while len(self._outputs) > self.max_cached_outputs:
+            self._outputs.popitem(last=False)
+        return path
+
+    async def render_all(
+        self,
+        document_type: str,
+        content: Dict[str, Any],
+        metadata: Dict[str, Any],
+        formats: Optional[List[str]] = None,
+    ) -> Dict[str, str]:
+        """Render every requested format at once; failed formats map to "Error: ..." """
+        model = build_document_model(document_type, content, metadata)
+        formats = formats or list(self.output_dirs)
+        results = await asyncio.gather(
+            *(self.render(model, name) for name in formats), return_exceptions=True
+        )
+
+        rendered = {}
+        for name, result in zip(formats, results, strict=True):
+            if isinstance(result, BaseException):
+                self.stats["failures"] += 1
+                logger.error(f"Failed to generate {name} format: {result}")
+                rendered[name] = f"Error: {result}"
+            else:
+                rendered[name] = result
+        return rendered
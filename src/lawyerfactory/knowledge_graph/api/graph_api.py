@@ -9,6 +9,7 @@ Consolidated Knowledge Graph Module
 Merged from root knowledge_graph.py and lawyerfactory/knowledge_graph.py
 """
 
+import importlib.util
 import json
 
 # === Content from root knowledge_graph.py ===
@@ -30,25 +31,26 @@ except ImportError:
 
     logger.warning("pysqlcipher3 not available, using standard sqlite3")
 
+# sentence-transformers and spaCy pull in torch/thinc and take seconds to
+# import, so only check they are installed here and import them on first use.
 try:
     import numpy as np
-    from sentence_transformers import SentenceTransformer
 
-    HAS_EMBEDDINGS = True
+    HAS_EMBEDDINGS = importlib.util.find_spec("sentence_transformers") is not None
 except ImportError:
     HAS_EMBEDDINGS = False
+if not HAS_EMBEDDINGS:
     logger.warning(
         "sentence-transformers or numpy not available, semantic search disabled"
     )
 
-try:
-    import spacy
-
-    HAS_SPACY = True
-except ImportError:
-    HAS_SPACY = False
+HAS_SPACY = importlib.util.find_spec("spacy") is not None
+if not HAS_SPACY:
     logger.warning("spaCy not available, NER disabled")
 
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+SPACY_MODEL_NAME = "en_core_web_lg"
+
 
 class KnowledgeGraph:
     """
@@ -64,18 +66,33 @@ class KnowledgeGraph:
         try:
             self._configure_encryption()
             self._initialize_schema()
-
-            # Initialize embedder for semantic search if available
-            if HAS_EMBEDDINGS:
-                self.embedder = SentenceTransformer("all-MiniLM-L6-v2")
-            else:
-                self.embedder = None
+            # Embedder for semantic search is loaded on first access
+            self._embedder = None
+            self._embedder_loaded = not HAS_EMBEDDINGS
 
             logger.info("Knowledge graph database initialized at %s", self.db_path)
         except Exception as e:
             logger.exception("Failed to initialize knowledge graph: %s", e)
             raise
 
+    @property
+    def embedder(self):
+        """SentenceTransformer model, loaded the first time it is needed."""
+        if not self._embedder_loaded:
+            self._embedder_loaded = True
+            try:
+                from sentence_transformers import SentenceTransformer
+
+                self._embedder = SentenceTransformer(EMBEDDING_MODEL_NAME)
+            except Exception as e:
+                logger.warning("Failed to load embedding model, semantic search disabled: %s", e)
+        return self._embedder
+
+    @embedder.setter
+    def embedder(self, value):
+        self._embedder = value
+        self._embedder_loaded = True
+
     def _configure_encryption(self):
         """Configure database encryption if key provided."""
         if self.key:
@@ -298,16 +315,29 @@ class DocumentIngestionPipeline:
 
     def __init__(self, kg: KnowledgeGraph):
         self.kg = kg
-
-        # Initialize spaCy NLP if available
-        if HAS_SPACY:
+        # spaCy NLP pipeline is loaded on first access
+        self._nlp = None
+        self._nlp_loaded = not HAS_SPACY
+
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded the first time a document needs NER."""
+        if not self._nlp_loaded:
+            self._nlp_loaded = True
             try:
-                self.nlp = spacy.load("en_core_web_lg")
+                import spacy
+
+                self._nlp = spacy.load(SPACY_MODEL_NAME)
             except OSError:
-                logger.warning("en_core_web_lg model not found, NER disabled")
-                self.nlp = None
-        else:
-            self.nlp = None
+                logger.warning("%s model not found, NER disabled", SPACY_MODEL_NAME)
+            except ImportError as e:
+                logger.warning("spaCy could not be imported, NER disabled: %s", e)
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, value):
+        self._nlp = value
+        self._nlp_loaded = True
 
     def ingest(self, file_path: str):
         """Main ingestion method for processing documents."""
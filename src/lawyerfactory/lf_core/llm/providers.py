@@ -358,35 +358,61 @@ class OpenAIProvider(LLMProvider):
 class OllamaProvider(LLMProvider):
     """Ollama provider implementation"""
 
+    # How long to wait for a freshly spawned Ollama process to answer
+    STARTUP_TIMEOUT = float(os.getenv("OLLAMA_STARTUP_TIMEOUT", "3"))
+    STARTUP_POLL_INTERVAL = 0.25
+
     def __init__(self, config_manager):
         super().__init__(config_manager, "ollama")
         self._base_url = None
+        self._server_checked = False
+        self._server_lock: asyncio.Lock | None = None
         self._initialize_client()
 
     def _initialize_client(self):
-        """Initialize Ollama client and ensure local server is running if required"""
+        """Resolve the Ollama endpoint.
+
+        Probing (and possibly launching) the local server is deferred to the
+        first request so constructing the provider never blocks on the network.
+        """
         config = self.get_config() or {}
         self._base_url = config.get("base_url", "http://localhost:11434")
 
-        # quick check if service is responding
-        def _is_running():
-            try:
-                # prefer requests if available for simplicity
-                import requests  # type: ignore
+    async def _is_running(self) -> bool:
+        """Quick check if the Ollama service is responding"""
+        try:
+            import aiohttp
 
-                resp = requests.get(f"{self._base_url}/api/tags", timeout=2)
-                return resp.status_code == 200
-            except Exception:
-                return False
+            timeout = aiohttp.ClientTimeout(total=2)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.get(f"{self._base_url}/api/tags") as response:
+                    return response.status == 200
+        except Exception:
+            return False
 
-        if _is_running():
+    async def _ensure_server(self):
+        """Make sure a local Ollama server is up, launching it once if needed"""
+        if self._server_checked:
             return
+        if self._server_lock is None:
+            self._server_lock = asyncio.Lock()
+        async with self._server_lock:
+            if self._server_checked:
+                return
+            self._server_checked = True
+
+            if await self._is_running():
+                return
+
+            # attempt to launch ollama if installed and user expects local usage
+            ollama_cmd = shutil.which("ollama")
+            if not ollama_cmd:
+                logger.warning(
+                    "Ollama binary not found in PATH; ensure Ollama is installed and running"
+                )
+                return
 
-        # attempt to launch ollama if installed and user expects local usage
-        ollama_cmd = shutil.which("ollama")
-        if ollama_cmd:
             try:
-                # Start the model run in background; best-effort non-blocking
                 logger.info(
                     "Ollama not responding; attempting to start 'ollama run lllama3' in background"
                 )
@@ -396,26 +422,25 @@ class OllamaProvider(LLMProvider):
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
                 )
-                # wait briefly and re-check
-                time.sleep(3)
-                if _is_running():
-                    logger.info("Ollama started successfully")
-                else:
-                    logger.warning(
-                        "Attempted to start Ollama but service still not responding"
-                    )
             except Exception as e:
                 logger.warning(f"Failed to start Ollama process: {e}")
-        else:
-            logger.warning(
-                "Ollama binary not found in PATH; ensure Ollama is installed and running"
-            )
+                return
+
+            # poll instead of sleeping for the whole startup window
+            deadline = time.monotonic() + self.STARTUP_TIMEOUT
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.STARTUP_POLL_INTERVAL)
+                if await self._is_running():
+                    logger.info("Ollama started successfully")
+                    return
+            logger.warning("Attempted to start Ollama but service still not responding")
 
     async def generate_text(self, prompt: str, **kwargs) -> dict[str, Any]:
         """Generate text using Ollama"""
         try:
             import aiohttp
 
+            await self._ensure_server()
             config = self.get_config()
             url = f"{self._base_url}/api/generate"
 
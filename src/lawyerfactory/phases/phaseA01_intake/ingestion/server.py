@@ -179,15 +179,23 @@ try:
 except Exception:
     UNIFIED_STORAGE_AVAILABLE = False
 
-# Initialize unified storage API
+# Unified storage API, built on first use so importing the server stays cheap
 unified_storage = None
-if UNIFIED_STORAGE_AVAILABLE:
-    try:
-        unified_storage = EnhancedUnifiedStorageAPI(storage_path="data/intake_storage")
-        logger.info("Unified Storage API initialized for ingestion server")
-    except Exception as e:
-        logger.warning(f"Failed to initialize unified storage: {e}")
-        unified_storage = None
+_unified_storage_initialized = False
+
+
+def get_unified_storage():
+    """Return the ingestion server's unified storage API, or None if unavailable"""
+    global unified_storage, _unified_storage_initialized
+    if not _unified_storage_initialized and UNIFIED_STORAGE_AVAILABLE:
+        _unified_storage_initialized = True
+        try:
+            unified_storage = EnhancedUnifiedStorageAPI(storage_path="data/intake_storage")
+            logger.info("Unified Storage API initialized for ingestion server")
+        except Exception as e:
+            logger.warning(f"Failed to initialize unified storage: {e}")
+            unified_storage = None
+    return unified_storage
 
 
 # Fallback mechanisms for unified storage
@@ -203,7 +211,8 @@ async def safe_unified_storage_operation(operation_func, fallback_func=None, *ar
     Returns:
         Tuple of (success: bool, result: Any, storage_type: str)
     """
-    if unified_storage and UNIFIED_STORAGE_AVAILABLE:
+    storage = get_unified_storage()
+    if storage:
         try:
             result = await operation_func(*args, **kwargs)
             if result and (result.get("success") is True or "success" not in result):
@@ -348,7 +357,8 @@ async def check_unified_storage_health():
     Returns:
         dict: Health status information
     """
-    if not unified_storage or not UNIFIED_STORAGE_AVAILABLE:
+    storage = get_unified_storage()
+    if not storage:
         return {
             "healthy": False,
             "reason": "Unified storage not available",
@@ -357,7 +367,7 @@ async def check_unified_storage_health():
 
     try:
         # Try a simple operation to test connectivity
-        test_result = await unified_storage.list_files(limit=1)
+        test_result = await storage.list_files(limit=1)
         return {
             "healthy": True,
             "reason": "Unified storage operational",
@@ -1333,10 +1343,11 @@ async def handle_upload(request):
     storage_info = {}
     local_path = None
 
-    if unified_storage and UNIFIED_STORAGE_AVAILABLE:
+    storage = get_unified_storage()
+    if storage:
         try:
             # Upload to unified storage
-            upload_result = await unified_storage.upload_file(
+            upload_result = await storage.upload_file(
                 file_content=file_content,
                 filename=original_filename,
                 file_id=file_id,
@@ -1385,7 +1396,7 @@ async def handle_upload(request):
     if storage_success and storage_info.get("storage_type") == "unified":
         # For unified storage, we need to retrieve content for processing
         try:
-            content_result = await unified_storage.retrieve_file(
+            content_result = await storage.retrieve_file(
                 file_id=storage_info.get("storage_id")
             )
             if content_result.get("success"):
@@ -1491,10 +1502,11 @@ async def handle_upload_fact_draft(request):
         storage_info = {}
         local_path = None
 
-        if unified_storage and UNIFIED_STORAGE_AVAILABLE:
+        storage = get_unified_storage()
+        if storage:
             try:
                 # Upload to unified storage
-                upload_result = await unified_storage.upload_file(
+                upload_result = await storage.upload_file(
                     file_content=file_content,
                     filename=original_filename,
                     file_id=file_id,
@@ -1544,7 +1556,7 @@ async def handle_upload_fact_draft(request):
         if storage_success and storage_info.get("storage_type") == "unified":
             # For unified storage, retrieve content for processing
             try:
-                content_result = await unified_storage.retrieve_file(
+                content_result = await storage.retrieve_file(
                     file_id=storage_info.get("storage_id")
                 )
                 if content_result.get("success"):
@@ -1648,10 +1660,11 @@ async def handle_upload_case_draft(request):
         storage_info = {}
         local_path = None
 
-        if unified_storage and UNIFIED_STORAGE_AVAILABLE:
+        storage = get_unified_storage()
+        if storage:
             try:
                 # Upload to unified storage
-                upload_result = await unified_storage.upload_file(
+                upload_result = await storage.upload_file(
                     file_content=file_content,
                     filename=original_filename,
                     file_id=file_id,
@@ -1701,7 +1714,7 @@ async def handle_upload_case_draft(request):
         if storage_success and storage_info.get("storage_type") == "unified":
             # For unified storage, retrieve content for processing
             try:
-                content_result = await unified_storage.retrieve_file(
+                content_result = await storage.retrieve_file(
                     file_id=storage_info.get("storage_id")
                 )
                 if content_result.get("success"):
@@ -1793,9 +1806,10 @@ async def handle_search(request):
     all_results = []
 
     # Try unified storage search first
-    if unified_storage and UNIFIED_STORAGE_AVAILABLE:
+    storage = get_unified_storage()
+    if storage:
         try:
-            search_result = await unified_storage.search_files(query)
+            search_result = await storage.search_files(query)
             if search_result.get("success"):
                 unified_results = search_result.get("results", [])
                 for result in unified_results:
@@ -1873,9 +1887,10 @@ async def handle_fetch(request):
         return web.json_response({"error": "file id is required"}, status=400)
 
     # Try unified storage first
-    if unified_storage and UNIFIED_STORAGE_AVAILABLE:
+    storage = get_unified_storage()
+    if storage:
         try:
-            retrieve_result = await unified_storage.retrieve_file(file_id=file_id)
+            retrieve_result = await storage.retrieve_file(file_id=file_id)
             if retrieve_result.get("success"):
                 file_content = retrieve_result.get("content", b"")
                 if isinstance(file_content, bytes):
@@ -2002,7 +2017,8 @@ async def handle_uploaded_file(request):
     name = request.match_info.get("name")
 
     # Try unified storage first if available
-    if unified_storage and UNIFIED_STORAGE_AVAILABLE:
+    storage = get_unified_storage()
+    if storage:
         try:
             # Extract file ID from the path
             file_id = name
@@ -2011,7 +2027,7 @@ async def handle_uploaded_file(request):
             elif "case_drafts" in str(request.url):
                 file_id = f"case_draft_{name}" if not name.startswith("case_draft_") else name
 
-            retrieve_result = await unified_storage.retrieve_file(file_id=file_id)
+            retrieve_result = await storage.retrieve_file(file_id=file_id)
             if retrieve_result.get("success"):
                 file_content = retrieve_result.get("content", b"")
                 if isinstance(file_content, bytes):
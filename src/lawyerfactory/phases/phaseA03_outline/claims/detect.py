@@ -12,7 +12,6 @@ Identifies legal claims from case facts and builds element breakdown for Claims
 from dataclasses import dataclass
 from datetime import datetime
 import logging
-import re
 from typing import Any, Dict, List, Optional
 
 from enhanced_knowledge_graph import (
@@ -24,6 +23,10 @@ from enhanced_knowledge_graph import (
 )
 
 from lawyerfactory.kg.jurisdiction import JurisdictionManager
+from lawyerfactory.phases.phaseA03_outline.claims.matcher import (
+    CausePatternMatcher,
+    MatchReport,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +55,15 @@ class CauseOfActionDetector:
         self.jurisdiction_manager = jurisdiction_manager
         self.cause_patterns = self._initialize_cause_patterns()
         self.element_templates = self._initialize_element_templates()
+        self.matcher = CausePatternMatcher(
+            self.cause_patterns,
+            {
+                keyword
+                for elements in self.element_templates.values()
+                for element_name in elements
+                for keyword in self._get_element_keywords(element_name)
+            },
+        )
 
     def _initialize_cause_patterns(self) -> Dict[str, Dict[str, Any]]:
         """Initialize regex patterns for cause of action detection"""
@@ -244,10 +256,10 @@ class CauseOfActionDetector:
             if not case_facts:
                 return []
 
-            # Combine all fact text for analysis
-            combined_text = " ".join(
+            # Scan all fact text once for every cause pattern and element keyword
+            report = self.matcher.scan(
                 [
-                    fact.get("name", "") + " " + fact.get("description", "")
+                    (fact.get("name", "") + " " + fact.get("description", "")).lower()
                     for fact in case_facts
                 ]
             )
@@ -256,16 +268,16 @@ class CauseOfActionDetector:
 
             for cause_name, cause_config in self.cause_patterns.items():
                 confidence_score = self._calculate_cause_confidence(
-                    combined_text, cause_config, case_facts
+                    report, cause_name, cause_config, case_facts
                 )
 
                 if confidence_score > 0.3:  # Minimum threshold
                     supporting_facts = self._identify_supporting_facts(
-                        case_facts, cause_config["patterns"]
+                        case_facts, report, cause_name
                     )
 
                     elements_detected = self._detect_elements_for_cause(
-                        combined_text, cause_name
+                        report, cause_name
                     )
 
                     detection_result = CauseDetectionResult(
@@ -289,22 +301,16 @@ class CauseOfActionDetector:
             return []
 
     def _calculate_cause_confidence(
-        self, text: str, cause_config: Dict[str, Any], facts: List[Dict[str, Any]]
+        self,
+        report: MatchReport,
+        cause_name: str,
+        cause_config: Dict[str, Any],
+        facts: List[Dict[str, Any]],
     ) -> float:
         """Calculate confidence score for a potential cause of action"""
         try:
-            patterns = cause_config["patterns"]
-            element_weights = cause_config.get("confidence_weights", {})
-
-            pattern_matches = 0
-            total_patterns = len(patterns)
-
-            text_lower = text.lower()
-
-            # Check pattern matches
-            for pattern in patterns:
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    pattern_matches += 1
+            pattern_matches = len(report.cause_patterns.get(cause_name, ()))
+            total_patterns = len(cause_config["patterns"])
 
             pattern_confidence = (
                 pattern_matches / total_patterns if total_patterns > 0 else 0
@@ -329,25 +335,17 @@ class CauseOfActionDetector:
             return 0.0
 
     def _identify_supporting_facts(
-        self, facts: List[Dict[str, Any]], patterns: List[str]
+        self, facts: List[Dict[str, Any]], report: MatchReport, cause_name: str
     ) -> List[str]:
         """Identify facts that support a specific cause of action"""
-        supporting_facts = []
-
-        for fact in facts:
-            fact_text = (
-                fact.get("name", "") + " " + fact.get("description", "")
-            ).lower()
-
-            for pattern in patterns:
-                if re.search(pattern, fact_text, re.IGNORECASE):
-                    supporting_facts.append(fact.get("id", fact.get("name", "Unknown")))
-                    break
-
-        return supporting_facts
+        return [
+            fact.get("id", fact.get("name", "Unknown"))
+            for fact, causes in zip(facts, report.fact_causes, strict=True)
+            if cause_name in causes
+        ]
 
     def _detect_elements_for_cause(
-        self, text: str, cause_name: str
+        self, report: MatchReport, cause_name: str
     ) -> List[Dict[str, Any]]:
         """Detect which legal elements are present for a cause of action"""
         elements_detected = []
@@ -362,9 +360,8 @@ class CauseOfActionDetector:
             element_keywords = self._get_element_keywords(element_name)
             element_confidence = 0.0
 
-            text_lower = text.lower()
             keyword_matches = sum(
-                1 for keyword in element_keywords if keyword in text_lower
+                1 for keyword in element_keywords if keyword in report.keywords
             )
 
             if keyword_matches > 0:
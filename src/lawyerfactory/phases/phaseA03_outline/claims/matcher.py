@@ -0,0 +1,146 @@
+"""
+# Script Name: matcher.py
+# Description: Compiled multi-pattern matcher for cause of action detection
+# Relationships:
+#   - Entity Type: Module
+#   - Directory Group: Workflow
+#   - Group Tags: claims-analysis
+Compiled multi-pattern matcher for cause of action detection.
+
+All cause patterns are folded into one regex: a lookahead gate that only
+stops at positions where some pattern can start, followed by one optional
+named lookahead per pattern, so every pattern starting at that position is
+recorded from a single scan. Element keywords go into an Aho-Corasick
+automaton. Detection therefore walks the text once for patterns and once
+for keywords regardless of how many causes are configured.
+"""
+
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton reporting which keywords occur in a text"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[str]] = [set()]
+
+        for keyword in keywords:
+            if keyword:
+                self._add(keyword)
+        self._build_failure_links()
+
+    def _add(self, keyword: str) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = next_state
+        self._output[state].add(keyword)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] |= self._output[self._fail[child]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return the set of keywords that occur anywhere in text"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[str] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+@dataclass
+class MatchReport:
+    """Everything detection needs from one scan of the case facts"""
+
+    cause_patterns: Dict[str, Set[int]] = field(default_factory=dict)
+    fact_causes: List[Set[str]] = field(default_factory=list)
+    keywords: Set[str] = field(default_factory=set)
+
+
+class CausePatternMatcher:
+    """Matches every cause pattern and element keyword in one pass over the facts"""
+
+    def __init__(
+        self,
+        cause_patterns: Dict[str, Dict[str, object]],
+        keywords: Iterable[str] = (),
+    ):
+        self._labels: Dict[str, Tuple[str, int]] = {}
+        self._compiled: Dict[str, re.Pattern] = {}
+        gate = []
+        probes = []
+        for cause_name, config in cause_patterns.items():
+            for index, pattern in enumerate(config.get("patterns", [])):
+                group = f"p{len(self._labels)}"
+                self._labels[group] = (cause_name, index)
+                self._compiled[group] = re.compile(pattern, re.IGNORECASE)
+                gate.append(f"(?:{pattern})")
+                probes.append(f"(?:(?=(?P<{group}>{pattern})))?")
+
+        self._regex = (
+            re.compile(f"(?=(?:{'|'.join(gate)})){''.join(probes)}", re.IGNORECASE)
+            if gate
+            else None
+        )
+        self._keywords = KeywordAutomaton(keywords)
+
+    def scan(self, segments: List[str]) -> MatchReport:
+        """Scan lowercased fact texts as if joined by single spaces"""
+        text = " ".join(segments)
+        starts: List[int] = []
+        ends: List[int] = []
+        offset = 0
+        for segment in segments:
+            starts.append(offset)
+            ends.append(offset + len(segment))
+            offset += len(segment) + 1
+
+        report = MatchReport(
+            fact_causes=[set() for _ in segments],
+            keywords=self._keywords.find_all(text),
+        )
+        if self._regex is None or not segments:
+            return report
+
+        for match in self._regex.finditer(text):
+            position = match.start()
+            fact = bisect_right(starts, position) - 1
+            for group, value in match.groupdict().items():
+                if value is None:
+                    continue
+                cause_name, index = self._labels[group]
+                report.cause_patterns.setdefault(cause_name, set()).add(index)
+                if cause_name in report.fact_causes[fact] or position >= ends[fact]:
+                    continue
+                # A match running past the end of the fact may still match inside it
+                if match.end(group) <= ends[fact] or self._compiled[group].match(
+                    text, position, ends[fact]
+                ):
+                    report.fact_causes[fact].add(cause_name)
+        return report
@@ -0,0 +1,206 @@
+"""
+# Script Name: definition_registry.py
+# Description: Process-wide registry of static cause of action definition tables
+# Relationships:
+#   - Entity Type: Module
+#   - Directory Group: Workflow
+#   - Group Tags: claims-analysis
+Process-wide registry of static cause of action definition tables.
+
+Legal definitions, element breakdowns, provable questions and decision trees
+are data, not code: they live in one JSON shard per jurisdiction under
+``definitions/`` (e.g. ``definitions/ca_state.json``). A shard is parsed the
+first time it is requested and the resulting read-only tables are shared by
+every CauseOfActionDefinitionEngine in the process.
+"""
+
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFINITIONS_DIR = Path(__file__).parent / "definitions"
+
+
+@dataclass(frozen=True)
+class LegalDefinition:
+    """Comprehensive legal definition with authorities and clickable terms"""
+
+    definition_id: str
+    cause_of_action: str
+    jurisdiction: str
+    primary_definition: str
+    authority_citations: List[str]
+    clickable_terms: Dict[str, str] = field(default_factory=dict)
+    alternative_definitions: Dict[str, str] = field(default_factory=dict)
+    jury_instructions: List[str] = field(default_factory=list)
+    case_law_examples: List[str] = field(default_factory=list)
+    statutory_references: List[str] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(frozen=True)
+class ElementBreakdown:
+    """Detailed element breakdown with sub-elements and decision trees"""
+
+    element_id: str
+    element_name: str
+    primary_definition: str
+    authority_citations: List[str]
+    sub_elements: List[Dict[str, Any]]
+    decision_trees: List[Dict[str, Any]]
+    burden_of_proof: str
+    proof_standards: Dict[str, str]
+    common_defenses: List[str]
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(frozen=True)
+class ProvableQuestion:
+    """Attorney-ready provable question with guidance"""
+
+    question_id: str
+    question_text: str
+    element_name: str
+    question_type: str  # threshold, factual, legal, credibility
+    evidence_types: List[str]
+    proof_methods: List[str]
+    common_challenges: List[str]
+    practice_tips: List[str]
+    sub_questions: List[str]
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(frozen=True)
+class DecisionTreeNode:
+    """Decision tree node for cascading legal analysis"""
+
+    node_id: str
+    condition: str
+    true_path: Optional[str]
+    false_path: Optional[str]
+    outcome: Optional[str]
+    legal_standard: str
+    authority_citation: str
+    practice_notes: List[str]
+
+
+@dataclass(frozen=True)
+class DefinitionTables:
+    """Read-only definition tables for one jurisdiction"""
+
+    jurisdiction: str
+    definitions: Mapping[str, LegalDefinition]
+    element_breakdowns: Mapping[str, Mapping[str, ElementBreakdown]]
+    question_generators: Mapping[str, Tuple[ProvableQuestion, ...]]
+    decision_trees: Mapping[str, Tuple[DecisionTreeNode, ...]]
+
+
+def _record(obj) -> Dict[str, Any]:
+    data = asdict(obj)
+    data.pop("created_at", None)
+    return data
+
+
+def _build(cls, data: Dict[str, Any]):
+    names = {f.name for f in fields(cls)}
+    return cls(**{k: v for k, v in data.items() if k in names})
+
+
+def tables_from_dict(data: Dict[str, Any]) -> DefinitionTables:
+    return DefinitionTables(
+        jurisdiction=data["jurisdiction"],
+        definitions=MappingProxyType(
+            {k: _build(LegalDefinition, v) for k, v in data.get("definitions", {}).items()}
+        ),
+        element_breakdowns=MappingProxyType(
+            {
+                cause: MappingProxyType(
+                    {name: _build(ElementBreakdown, v) for name, v in elements.items()}
+                )
+                for cause, elements in data.get("element_breakdowns", {}).items()
+            }
+        ),
+        question_generators=MappingProxyType(
+            {
+                k: tuple(_build(ProvableQuestion, q) for q in v)
+                for k, v in data.get("question_generators", {}).items()
+            }
+        ),
+        decision_trees=MappingProxyType(
+            {
+                k: tuple(_build(DecisionTreeNode, n) for n in v)
+                for k, v in data.get("decision_trees", {}).items()
+            }
+        ),
+    )
+
+
+def tables_to_dict(tables: DefinitionTables) -> Dict[str, Any]:
+    """Inverse of tables_from_dict, used to (re)generate shard files"""
+    return {
+        "jurisdiction": tables.jurisdiction,
+        "definitions": {k: _record(v) for k, v in tables.definitions.items()},
+        "element_breakdowns": {
+            cause: {name: _record(v) for name, v in elements.items()}
+            for cause, elements in tables.element_breakdowns.items()
+        },
+        "question_generators": {
+            k: [_record(q) for q in v] for k, v in tables.question_generators.items()
+        },
+        "decision_trees": {
+            k: [_record(n) for n in v] for k, v in tables.decision_trees.items()
+        },
+    }
+
+
+class DefinitionRegistry:
+    """Lazily loads and caches one DefinitionTables per jurisdiction shard"""
+
+    def __init__(self, data_dir: Path = DEFINITIONS_DIR):
+        self.data_dir = Path(data_dir)
+        self._tables: Dict[str, Optional[DefinitionTables]] = {}
+        self._lock = threading.Lock()
+
+    def jurisdictions(self) -> List[str]:
+        return sorted(path.stem for path in self.data_dir.glob("*.json"))
+
+    def tables(self, jurisdiction: str) -> Optional[DefinitionTables]:
+        """Tables for ``jurisdiction``, or None if there is no shard for it"""
+        if jurisdiction in self._tables:
+            return self._tables[jurisdiction]
+        with self._lock:
+            if jurisdiction not in self._tables:
+                self._tables[jurisdiction] = self._load(jurisdiction)
+            return self._tables[jurisdiction]
+
+    def _load(self, jurisdiction: str) -> Optional[DefinitionTables]:
+        path = self.data_dir / f"{Path(jurisdiction).name}.json"
+        if not path.is_file():
+            return None
+        with open(path, encoding="utf-8") as f:
+            tables = tables_from_dict(json.load(f))
+        logger.info(
+            f"Loaded {len(tables.definitions)} cause of action definitions for {jurisdiction}"
+        )
+        return tables
+
+
+_registry: Optional[DefinitionRegistry] = None
+
+
+def get_definition_registry() -> DefinitionRegistry:
+    """Registry shared by all definition engines in the process"""
+    global _registry
+    if _registry is None:
+        _registry = DefinitionRegistry(
+            Path(os.getenv("LF_DEFINITIONS_DIR", str(DEFINITIONS_DIR)))
+        )
+    return _registry
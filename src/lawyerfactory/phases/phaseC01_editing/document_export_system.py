@@ -10,6 +10,7 @@ Provides multi-format export capabilities, version control, and change tracking
 for Statement of Facts and other legal documents.
 """
 
+from collections import OrderedDict
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -17,9 +18,12 @@ import hashlib
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import zipfile
 
+from lawyerfactory.phases.phaseC01_editing.document_diff import diff_documents, iter_hunks
+from lawyerfactory.phases.phaseC01_editing.version_store import ContentStore, VersionManifest
+
 logger = logging.getLogger(__name__)
 
 
@@ -96,7 +100,7 @@ class ExportPackage:
 class DocumentExportSystem:
     """Comprehensive document export and version control system"""
 
-    def __init__(self, storage_path: str = "export_storage"):
+    def __init__(self, storage_path: str = "export_storage", max_cached_diffs: int = 64):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
         self.versions_path = self.storage_path / "versions"
@@ -107,6 +111,18 @@ class DocumentExportSystem:
         self.version_registry: Dict[str, List[VersionInfo]] = {}
         self.document_registry: Dict[str, DocumentMetadata] = {}
 
+        # Versions are chunk lists in a content-addressed store; registry changes
+        # are appended to a journal that is replayed on startup
+        self.content_store = ContentStore(self.versions_path)
+        self.journal_path = self.storage_path / "registry_journal.jsonl"
+        self.version_manifests: Dict[str, VersionManifest] = {}
+        self._latest_content: Dict[str, Tuple[bytes, VersionManifest]] = {}
+        self._load_registries()
+
+        # Versions are immutable, so a diff between two of them never goes stale
+        self.max_cached_diffs = max_cached_diffs
+        self._diff_cache: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
+
     def create_document_version(
         self,
         document_id: str,
@@ -140,17 +156,36 @@ class DocumentExportSystem:
         )
 
         # Store document content
-        self._save_document_version(document_id, version_id, content)
+        manifest = self._save_document_version(
+            document_id, version_id, content, version_info.parent_version
+        )
 
         # Update registries
         self.version_registry.setdefault(document_id, []).append(version_info)
+        record = {
+            "op": "version",
+            "document_id": document_id,
+            "version": self._version_to_record(version_info),
+        }
+        parent = self.version_manifests.get(version_info.parent_version or "")
+        if parent is not None:
+            record["manifest_delta"] = manifest.delta_from(parent)
+        else:
+            record["manifest"] = manifest.to_dict()
+        self.version_manifests[version_id] = manifest
+        self._append_journal(record)
 
         if metadata:
             metadata.last_modified = datetime.now()
             metadata.version = version_number
             self.document_registry[document_id] = metadata
-
-        self._save_registries()
+            self._append_journal(
+                {
+                    "op": "metadata",
+                    "document_id": document_id,
+                    "metadata": json.loads(json.dumps(asdict(metadata), default=str)),
+                }
+            )
 
         return version_info
 
@@ -374,13 +409,13 @@ class DocumentExportSystem:
         self, document_id: str, old_version: str, new_version: str
     ) -> Dict[str, Any]:
         """Track and analyze changes between document versions"""
-        old_content = self._load_document_version(document_id, old_version)
-        new_content = self._load_document_version(document_id, new_version)
-
-        if not old_content or not new_content:
-            raise ValueError("Cannot load document versions for comparison")
+        key = (document_id, old_version, new_version)
+        if key in self._diff_cache:
+            self._diff_cache.move_to_end(key)
+            return self._diff_cache[key]
 
-        changes = self._analyze_document_changes(old_content, new_content)
+        old_content, new_content = self._load_version_pair(document_id, old_version, new_version)
+        changes = diff_documents(old_content, new_content)
 
         # Store change analysis
         change_log = {
@@ -397,66 +432,32 @@ class DocumentExportSystem:
         with open(change_log_path, "w") as f:
             json.dump(change_log, f, indent=2, default=str)
 
+        self._diff_cache[key] = changes
+        while len(self._diff_cache) > self.max_cached_diffs:
+            self._diff_cache.popitem(last=False)
         return changes
 
-    def _analyze_document_changes(
-        self, old_content: str, new_content: str
-    ) -> Dict[str, Any]:
-        """Analyze changes between two document versions"""
-        old_lines = old_content.split("\n")
-        new_lines = new_content.split("\n")
-
-        # Simple line-by-line comparison (could be enhanced with difflib)
-        added_lines = []
-        removed_lines = []
-        modified_lines = []
-
-        max_lines = max(len(old_lines), len(new_lines))
-        for i in range(max_lines):
-            old_line = old_lines[i] if i < len(old_lines) else ""
-            new_line = new_lines[i] if i < len(new_lines) else ""
-
-            if old_line != new_line:
-                if not old_line:
-                    added_lines.append({"line_number": i + 1, "content": new_line})
-                elif not new_line:
-                    removed_lines.append({"line_number": i + 1, "content": old_line})
-                else:
-                    modified_lines.append(
-                        {
-                            "line_number": i + 1,
-                            "old_content": old_line,
-                            "new_content": new_line,
-                        }
-                    )
-
-        return {
-            "total_changes": len(added_lines)
-            + len(removed_lines)
-            + len(modified_lines),
-            "lines_added": len(added_lines),
-            "lines_removed": len(removed_lines),
-            "lines_modified": len(modified_lines),
-            "added_content": added_lines,
-            "removed_content": removed_lines,
-            "modified_content": modified_lines,
-            "change_percentage": self._calculate_change_percentage(
-                old_content, new_content
-            ),
-        }
-
-    def _calculate_change_percentage(self, old_content: str, new_content: str) -> float:
-        """Calculate percentage of content that changed"""
-        old_words = set(old_content.split())
-        new_words = set(new_content.split())
-
-        if not old_words:
-            return 100.0 if new_words else 0.0
-
-        common_words = old_words.intersection(new_words)
-        change_ratio = 1 - (len(common_words) / len(old_words))
+    def iter_document_changes(
+        self, document_id: str, old_version: str, new_version: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream change hunks between two versions, e.g. for a redline view of a
+        long brief; nothing is cached or written to disk"""
+        key = (document_id, old_version, new_version)
+        if key in self._diff_cache:
+            yield from self._diff_cache[key]["hunks"]
+            return
+        old_content, new_content = self._load_version_pair(document_id, old_version, new_version)
+        yield from iter_hunks(old_content, new_content)
+
+    def _load_version_pair(
+        self, document_id: str, old_version: str, new_version: str
+    ) -> Tuple[str, str]:
+        old_content = self._load_document_version(document_id, old_version)
+        new_content = self._load_document_version(document_id, new_version)
 
-        return round(change_ratio * 100, 2)
+        if old_content is None or new_content is None:
+            raise ValueError("Cannot load document versions for comparison")
+        return old_content, new_content
 
     def get_document_history(self, document_id: str) -> Dict[str, Any]:
         """Get complete history of document versions"""
@@ -483,25 +484,37 @@ class DocumentExportSystem:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         return f"pkg_{timestamp}"
 
-    def _save_document_version(self, document_id: str, version_id: str, content: str):
-        """Save document version to storage"""
-        version_path = self.versions_path / document_id
-        version_path.mkdir(exist_ok=True)
-
-        content_path = version_path / f"{version_id}.txt"
-        with open(content_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        # Create content hash for integrity checking
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        hash_path = version_path / f"{version_id}.hash"
-        with open(hash_path, "w") as f:
-            f.write(content_hash)
+    def _save_document_version(
+        self,
+        document_id: str,
+        version_id: str,
+        content: str,
+        parent_version: Optional[str] = None,
+    ) -> VersionManifest:
+        """Save document version to the chunk store, delta against its parent"""
+        data = content.encode("utf-8")
+        base = self._latest_content.get(document_id)
+        if base is None and parent_version in self.version_manifests:
+            parent = self.version_manifests[parent_version]
+            base = (self.content_store.read(parent), parent)
+
+        manifest = self.content_store.write(data, base)
+        self._latest_content[document_id] = (data, manifest)
+        return manifest
 
     def _load_document_version(
         self, document_id: str, version_id: str
     ) -> Optional[str]:
         """Load document version from storage"""
+        manifest = self.version_manifests.get(version_id)
+        if manifest is not None:
+            try:
+                return self.content_store.read(manifest).decode("utf-8")
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to load {document_id}:{version_id}: {e}")
+                return None
+
+        # Versions written before the chunk store existed are plain text files
         content_path = self.versions_path / document_id / f"{version_id}.txt"
 
         if not content_path.exists():
@@ -571,29 +584,66 @@ The documents herein are certified to be true and complete copies of the origina
 Generated by LawyerFactory Document Export System
 """
 
-    def _save_registries(self):
-        """Save version and document registries"""
-        version_registry_path = self.storage_path / "version_registry.json"
-        document_registry_path = self.storage_path / "document_registry.json"
+    def _append_journal(self, record: Dict[str, Any]):
+        """Append one registry change to the journal"""
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
 
-        with open(version_registry_path, "w") as f:
-            json.dump(
-                {
-                    k: [asdict(v) for v in versions]
-                    for k, versions in self.version_registry.items()
-                },
-                f,
-                indent=2,
-                default=str,
-            )
+    def _load_registries(self):
+        """Rebuild version and document registries by replaying the journal"""
+        if not self.journal_path.exists():
+            return
 
-        with open(document_registry_path, "w") as f:
-            json.dump(
-                {k: asdict(v) for k, v in self.document_registry.items()},
-                f,
-                indent=2,
-                default=str,
-            )
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                    document_id = record["document_id"]
+                    if record["op"] == "version":
+                        version = self._version_from_record(record["version"])
+                        if "manifest_delta" in record:
+                            manifest = VersionManifest.from_delta(
+                                self.version_manifests[version.parent_version],
+                                record["manifest_delta"],
+                            )
+                        else:
+                            manifest = VersionManifest.from_dict(record["manifest"])
+                        self.version_manifests[version.version_id] = manifest
+                        self.version_registry.setdefault(document_id, []).append(version)
+                    elif record["op"] == "metadata":
+                        self.document_registry[document_id] = self._metadata_from_record(
+                            record["metadata"]
+                        )
+                except (KeyError, TypeError, ValueError) as e:
+                    # A torn final line from an interrupted write is expected
+                    logger.warning(f"Skipping journal line {line_number}: {e}")
+
+    @staticmethod
+    def _version_to_record(version: VersionInfo) -> Dict[str, Any]:
+        record = asdict(version)
+        record["timestamp"] = version.timestamp.isoformat()
+        record["action"] = version.action.value
+        return record
+
+    @staticmethod
+    def _version_from_record(record: Dict[str, Any]) -> VersionInfo:
+        return VersionInfo(
+            **{
+                **record,
+                "timestamp": datetime.fromisoformat(record["timestamp"]),
+                "action": VersionControlAction(record["action"]),
+            }
+        )
+
+    @staticmethod
+    def _metadata_from_record(record: Dict[str, Any]) -> DocumentMetadata:
+        return DocumentMetadata(
+            **{
+                **record,
+                "creation_date": datetime.fromisoformat(record["creation_date"]),
+                "last_modified": datetime.fromisoformat(record["last_modified"]),
+            }
+        )
 
     def _add_word_headers(
         self, content: str, metadata: Optional[DocumentMetadata]
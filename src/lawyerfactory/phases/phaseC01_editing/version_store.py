@@ -0,0 +1,263 @@
+"""
+# Script Name: version_store.py
+# Description: Content-addressed, deduplicating chunk store for document versions
+# Relationships:
+#   - Entity Type: Module
+#   - Directory Group: Document Generation
+#   - Group Tags: null
+Content-addressed, deduplicating chunk store for document versions.
+
+Document text is split with a gear rolling hash into content-defined chunks,
+so an edit only changes the chunks it touches. Each chunk is stored once as a
+compressed blob named by its sha256; a version is just the ordered list of
+chunk digests. When the previous version is supplied as a base, chunking
+restarts at the last boundary before the edit and stops as soon as it
+re-synchronises with the old boundaries after it, so both chunking work and
+bytes written scale with the size of the edit.
+
+Blobs are zstd-compressed when the optional ``zstandard`` package is
+installed and zlib-compressed otherwise; the codec is recorded per blob.
+"""
+
+from dataclasses import dataclass, field
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import zlib
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MIN_CHUNK = 512
+MAX_CHUNK = 8192
+_BOUNDARY_BITS = 10  # ~1 KiB average beyond MIN_CHUNK
+_MASK32 = 0xFFFFFFFF
+_GEAR = [
+    int.from_bytes(hashlib.blake2b(bytes([i]), digest_size=4).digest(), "big")
+    for i in range(256)
+]
+
+_CODEC_RAW = b"r"
+_CODEC_ZLIB = b"z"
+_CODEC_ZSTD = b"s"
+
+
+def next_boundary(data: bytes, start: int) -> int:
+    """End offset of the chunk starting at ``start``
+
+    The decision depends only on bytes inside the chunk, which is what lets
+    unchanged regions keep their boundaries across edits.
+    """
+    end = min(start + MAX_CHUNK, len(data))
+    if end - start <= MIN_CHUNK:
+        return end
+    gear = _GEAR
+    shift = 32 - _BOUNDARY_BITS
+    h = 0
+    for i in range(start + MIN_CHUNK, end):
+        h = ((h << 1) + gear[data[i]]) & _MASK32
+        if not h >> shift:
+            return i + 1
+    return end
+
+
+def chunk_offsets(data: bytes, start: int = 0) -> List[int]:
+    """Chunk end offsets for ``data[start:]``"""
+    ends = []
+    while start < len(data):
+        start = next_boundary(data, start)
+        ends.append(start)
+    return ends
+
+
+def _common_prefix(a: bytes, b: bytes) -> int:
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a: bytes, b: bytes, limit: int) -> int:
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid :] == b[len(b) - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+@dataclass
+class VersionManifest:
+    """Ordered chunk list for one version; ``chunks`` holds (sha256, length)"""
+
+    chunks: List[Tuple[str, int]]
+    size: int
+    sha256: str
+
+    def to_dict(self) -> Dict:
+        return {"chunks": [list(c) for c in self.chunks], "size": self.size, "sha256": self.sha256}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "VersionManifest":
+        return cls([tuple(c) for c in data["chunks"]], data["size"], data["sha256"])
+
+    def delta_from(self, base: "VersionManifest") -> Dict:
+        """Compact encoding of this manifest as a splice of ``base``'s chunk list"""
+        head = 0
+        limit = min(len(base.chunks), len(self.chunks))
+        while head < limit and base.chunks[head] == self.chunks[head]:
+            head += 1
+        tail = 0
+        while (
+            tail < limit - head
+            and base.chunks[len(base.chunks) - 1 - tail] == self.chunks[len(self.chunks) - 1 - tail]
+        ):
+            tail += 1
+        return {
+            "keep_head": head,
+            "insert": [list(c) for c in self.chunks[head : len(self.chunks) - tail]],
+            "keep_tail": tail,
+            "size": self.size,
+            "sha256": self.sha256,
+        }
+
+    @classmethod
+    def from_delta(cls, base: "VersionManifest", delta: Dict) -> "VersionManifest":
+        tail = base.chunks[len(base.chunks) - delta["keep_tail"] :] if delta["keep_tail"] else []
+        chunks = base.chunks[: delta["keep_head"]] + [tuple(c) for c in delta["insert"]] + tail
+        return cls(chunks, delta["size"], delta["sha256"])
+
+
+@dataclass
+class StoreStats:
+    versions_written: int = 0
+    bytes_rechunked: int = 0
+    chunks_reused: int = 0
+    blobs_written: int = 0
+    blobs_deduplicated: int = 0
+    bytes_stored: int = 0
+    codec: str = field(default_factory=lambda: "zstd" if ZSTD_AVAILABLE else "zlib")
+
+
+class ContentStore:
+    """Blob store under ``root/objects/<2 hex>/<62 hex>`` plus chunked versions"""
+
+    def __init__(self, root: Path, compression_level: int = 3):
+        self.root = Path(root)
+        self.objects_path = self.root / "objects"
+        self.objects_path.mkdir(parents=True, exist_ok=True)
+        self.compression_level = compression_level
+        self.stats = StoreStats()
+        self._compressor = (
+            zstandard.ZstdCompressor(level=compression_level) if ZSTD_AVAILABLE else None
+        )
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.objects_path / digest[:2] / digest[2:]
+
+    def _encode(self, data: bytes) -> bytes:
+        if self._compressor is not None:
+            packed, codec = self._compressor.compress(data), _CODEC_ZSTD
+        else:
+            packed, codec = zlib.compress(data, self.compression_level), _CODEC_ZLIB
+        if len(packed) >= len(data):
+            packed, codec = data, _CODEC_RAW
+        return codec + packed
+
+    @staticmethod
+    def _decode(blob: bytes) -> bytes:
+        codec, payload = blob[:1], blob[1:]
+        if codec == _CODEC_ZLIB:
+            return zlib.decompress(payload)
+        if codec == _CODEC_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("zstandard is required to read this version store")
+            return zstandard.ZstdDecompressor().decompress(payload)
+        return payload
+
+    def put_blob(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if path.exists():
+            self.stats.blobs_deduplicated += 1
+            return digest
+        path.parent.mkdir(exist_ok=True)
+        encoded = self._encode(data)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(encoded)
+        os.replace(tmp_path, path)
+        self.stats.blobs_written += 1
+        self.stats.bytes_stored += len(encoded)
+        return digest
+
+    def get_blob(self, digest: str) -> bytes:
+        with open(self._blob_path(digest), "rb") as f:
+            data = self._decode(f.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Corrupt blob {digest}")
+        return data
+
+    def write(
+        self, data: bytes, base: Optional[Tuple[bytes, VersionManifest]] = None
+    ) -> VersionManifest:
+        """Store ``data``, reusing the unchanged chunks of ``base`` (old data, manifest)"""
+        chunks: List[Tuple[str, int]] = []
+        pos = 0
+        old_tail: Dict[int, int] = {}
+
+        if base is not None:
+            old, manifest = base
+            prefix = _common_prefix(old, data)
+            suffix = _common_suffix(old, data, min(len(old), len(data)) - prefix)
+            # Old chunks wholly inside the common prefix keep their boundaries; the
+            # final old chunk is excluded because it may have been cut by EOF
+            for digest, length in manifest.chunks[:-1]:
+                if pos + length > prefix:
+                    break
+                chunks.append((digest, length))
+                pos += length
+            self.stats.chunks_reused += len(chunks)
+            # New offset -> old chunk index, for old chunk starts in the common suffix
+            delta = len(old) - len(data)
+            offset = 0
+            for index, (_, length) in enumerate(manifest.chunks):
+                if offset - delta >= len(data) - suffix:
+                    old_tail[offset - delta] = index
+                offset += length
+
+        while pos < len(data):
+            if pos in old_tail:
+                # Re-synchronised with the old chunking: the rest is unchanged
+                rest = base[1].chunks[old_tail[pos] :]
+                self.stats.chunks_reused += len(rest)
+                chunks.extend(rest)
+                break
+            end = next_boundary(data, pos)
+            chunks.append((self.put_blob(data[pos:end]), end - pos))
+            self.stats.bytes_rechunked += end - pos
+            pos = end
+
+        self.stats.versions_written += 1
+        return VersionManifest(chunks, len(data), hashlib.sha256(data).hexdigest())
+
+    def read(self, manifest: VersionManifest) -> bytes:
+        data = b"".join(self.get_blob(digest) for digest, _ in manifest.chunks)
+        if hashlib.sha256(data).hexdigest() != manifest.sha256:
+            raise ValueError("Reassembled version does not match its recorded hash")
+        return data
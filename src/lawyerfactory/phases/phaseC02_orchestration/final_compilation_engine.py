@@ -5,6 +5,7 @@ Orchestrates document aggregation, validation, quality assurance, and
 deliverable packaging for court-ready submission.
 """
 
+import asyncio
 import json
 import logging
 import zipfile
@@ -664,6 +665,7 @@ class FinalCompilationEngine:
             "evidence_appendix",
         }
 
+        renders = []
         for deliverable in deliverables:
             if deliverable.get("type") not in supported_types:
                 continue
@@ -676,12 +678,17 @@ class FinalCompilationEngine:
             else:
                 content_payload = {"title": deliverable.get("title"), "body": json.dumps(content)}
 
-            formats = await self.document_generator.generate_all_formats(
-                deliverable.get("type", "document"),
-                content_payload,
-                case_metadata,
+            renders.append(
+                self.document_generator.generate_all_formats(
+                    deliverable.get("type", "document"),
+                    content_payload,
+                    case_metadata,
+                )
             )
 
+        # Deliverables share the generator's rendering pool, so packaging waits
+        # on the slowest render rather than the sum of all of them
+        for formats in await asyncio.gather(*renders):
             for file_path in formats.values():
                 if file_path and not file_path.startswith("Error"):
                     export_paths.append(file_path)
@@ -1,24 +1,205 @@
 """
 Socket.IO event emitter for phase progress and evidence updates
 Provides a clean interface for phases to emit real-time events without direct Socket.IO dependency
+
+Events are routed through a ProgressEventBus that coalesces updates per
+(event, case, entity) over a short window: a newer update for the same entity
+replaces the pending one, so superseded progress values are never sent.
 """
 
 import logging
-from typing import Any, Dict, Optional
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Global socketio instance (will be injected from server)
 _socketio_instance = None
+_event_bus: Optional["ProgressEventBus"] = None
+
+DEFAULT_COALESCE_WINDOW = 0.1  # seconds
+BATCH_EVENT_NAME = "event_batch"
+
+EventKey = Tuple[str, Optional[str], str]
+
+
+class ProgressEventBus:
+    """
+    Coalescing, rate-limited event broadcaster.
+
+    Updates are buffered per (event, case_id, entity). Within a flush window
+    only the latest update for each key survives; on flush the survivors are
+    sent either as one ``event_batch`` frame per case room or, in legacy mode,
+    as individual broadcasts under their original event names.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[..., Any],
+        window: float = DEFAULT_COALESCE_WINDOW,
+        batch_frames: bool = False,
+        sleep: Optional[Callable[[float], Any]] = None,
+        start_background_task: Optional[Callable[..., Any]] = None,
+    ):
+        self._emit = emit
+        self.window = window
+        self.batch_frames = batch_frames
+        self._sleep = sleep or time.sleep
+        self._start_background_task = start_background_task
+        self._lock = threading.Lock()
+        self._pending: Dict[EventKey, Dict[str, Any]] = {}
+        self._running = False
+        self._sequence = 0
+        self.metrics = {
+            "published": 0,
+            "coalesced": 0,
+            "emitted_events": 0,
+            "frames": 0,
+            "flushes": 0,
+            "errors": 0,
+        }
+
+    def publish(self, event: str, data: Dict[str, Any], entity: Optional[str] = None) -> None:
+        """
+        Queue an event for the next flush.
+
+        Args:
+            event: Socket.IO event name
+            data: Event payload
+            entity: Coalescing key within the case; events without one are never merged
+        """
+        with self._lock:
+            self.metrics["published"] += 1
+            if entity is None:
+                self._sequence += 1
+                entity = f"#{self._sequence}"
+            key = (event, data.get("case_id"), entity)
+            previous = self._pending.get(key)
+            if previous is not None:
+                self.metrics["coalesced"] += 1
+                data = self._merge(previous["data"], data)
+            else:
+                self._sequence += 1
+            self._pending[key] = {
+                "event": event,
+                "data": data,
+                "order": previous["order"] if previous else self._sequence,
+            }
+
+        if not self._running:
+            # No flusher thread (e.g. tests or scripts) - deliver synchronously
+            self.flush()
+
+    @staticmethod
+    def _merge(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+        merged = dict(newer)
+        # A status transition collapsed over the window starts where the first one did
+        if "old_status" in older and "old_status" in newer:
+            merged["old_status"] = older["old_status"]
+        return merged
+
+    def flush(self) -> int:
+        """Send everything pending; returns the number of events delivered"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending = sorted(self._pending.values(), key=lambda item: item["order"])
+            self._pending = {}
+            self.metrics["flushes"] += 1
+
+        if self.batch_frames:
+            by_room: Dict[Optional[str], List[Dict[str, Any]]] = {}
+            for item in pending:
+                by_room.setdefault(item["data"].get("case_id"), []).append(
+                    {"event": item["event"], "data": item["data"]}
+                )
+            for room, events in by_room.items():
+                frame = {"case_id": room, "events": events, "timestamp": time.time()}
+                self._send(BATCH_EVENT_NAME, frame, room, len(events))
+        else:
+            for item in pending:
+                self._send(item["event"], item["data"], None, 1)
 
+        return len(pending)
 
-def set_socketio_instance(socketio):
-    """Set the global Socket.IO instance from the Flask app"""
-    global _socketio_instance
+    def _send(self, event: str, data: Dict[str, Any], room: Optional[str], count: int) -> None:
+        try:
+            if room is not None:
+                self._emit(event, data, to=room)
+            else:
+                self._emit(event, data)
+            self.metrics["frames"] += 1
+            self.metrics["emitted_events"] += count
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"Failed to emit {event}: {e}")
+
+    def start(self) -> None:
+        """Start the background flusher; until then publish() delivers synchronously"""
+        if self._running:
+            return
+        self._running = True
+        if self._start_background_task:
+            self._start_background_task(self._run)
+        else:
+            threading.Thread(target=self._run, name="lf-event-bus", daemon=True).start()
+
+    def stop(self) -> None:
+        self._running = False
+        self.flush()
+
+    def _run(self) -> None:
+        while self._running:
+            self._sleep(self.window)
+            self.flush()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = dict(self.metrics)
+            metrics["pending"] = len(self._pending)
+        published = metrics["published"] or 1
+        metrics["coalesce_ratio"] = metrics["coalesced"] / published
+        return metrics
+
+
+def set_socketio_instance(
+    socketio, window: float = DEFAULT_COALESCE_WINDOW, batch_frames: bool = False
+):
+    """Set the global Socket.IO instance from the Flask app and start the event bus"""
+    global _socketio_instance, _event_bus
+    if _event_bus is not None:
+        _event_bus.stop()
     _socketio_instance = socketio
+    _event_bus = ProgressEventBus(
+        socketio.emit,
+        window=window,
+        batch_frames=batch_frames,
+        sleep=getattr(socketio, "sleep", None),
+        start_background_task=getattr(socketio, "start_background_task", None),
+    )
+    _event_bus.start()
     logger.info("Socket.IO instance registered for phase events")
 
 
+def get_event_bus() -> Optional[ProgressEventBus]:
+    """Return the active event bus, if a Socket.IO instance has been registered"""
+    return _event_bus
+
+
+def publish_event(event: str, data: Dict[str, Any], entity: Optional[str] = None) -> bool:
+    """
+    Publish an event through the coalescing bus
+
+    Returns:
+        False when no Socket.IO instance is registered
+    """
+    if _event_bus is None:
+        return False
+    _event_bus.publish(event, data, entity)
+    return True
+
+
 def emit_evidence_processed(
     case_id: str,
     evidence_id: str,
@@ -38,7 +219,7 @@ def emit_evidence_processed(
         status: Processing status (stored, processing, analyzed, error)
         metadata: Additional metadata
     """
-    if not _socketio_instance:
+    if not _event_bus:
         logger.warning("Socket.IO not available - cannot emit evidence_processed event")
         return
     
@@ -52,7 +233,7 @@ def emit_evidence_processed(
             "metadata": metadata or {}
         }
         
-        _socketio_instance.emit("evidence_processed", event_data)
+        publish_event("evidence_processed", event_data, entity=evidence_id)
         logger.debug(f"Emitted evidence_processed: {filename} ({status})")
     except Exception as e:
         logger.error(f"Failed to emit evidence_processed event: {e}")
@@ -77,7 +258,7 @@ def emit_evidence_uploaded(
         file_size: File size in bytes
         phase: Source phase
     """
-    if not _socketio_instance:
+    if not _event_bus:
         logger.warning("Socket.IO not available - cannot emit evidence_uploaded event")
         return
     
@@ -91,7 +272,7 @@ def emit_evidence_uploaded(
             "phase": phase
         }
         
-        _socketio_instance.emit("evidence_uploaded", event_data)
+        publish_event("evidence_uploaded", event_data, entity=evidence_id)
         logger.debug(f"Emitted evidence_uploaded: {filename}")
     except Exception as e:
         logger.error(f"Failed to emit evidence_uploaded event: {e}")
@@ -114,7 +295,7 @@ def emit_evidence_status_changed(
         old_status: Previous status
         new_status: New status
     """
-    if not _socketio_instance:
+    if not _event_bus:
         logger.warning("Socket.IO not available - cannot emit evidence_status_changed event")
         return
     
@@ -127,7 +308,7 @@ def emit_evidence_status_changed(
             "new_status": new_status
         }
         
-        _socketio_instance.emit("evidence_status_changed", event_data)
+        publish_event("evidence_status_changed", event_data, entity=evidence_id)
         logger.debug(f"Emitted evidence_status_changed: {filename} ({old_status} → {new_status})")
     except Exception as e:
         logger.error(f"Failed to emit evidence_status_changed event: {e}")
@@ -150,7 +331,7 @@ def emit_phase_progress(
         case_id: Optional case identifier
         metadata: Additional metadata
     """
-    if not _socketio_instance:
+    if not _event_bus:
         logger.warning("Socket.IO not available - cannot emit phase_progress event")
         return
     
@@ -163,7 +344,8 @@ def emit_phase_progress(
             "metadata": metadata or {}
         }
         
-        _socketio_instance.emit("phase_progress_update", event_data)
+        publish_event("phase_progress_update", event_data, entity=phase)
         logger.debug(f"Emitted phase_progress_update: {phase} ({progress}%)")
     except Exception as e:
         logger.error(f"Failed to emit phase_progress_update event: {e}")
+
@@ -13,12 +13,20 @@ This module provides professional PDF generation capabilities for legal document
 with proper formatting, headers, footers, and legal document structure.
 """
 
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+import hashlib
+import io
+import json
 import logging
 import os
 import tempfile
-from dataclasses import dataclass
-from datetime import datetime
-from enum import Enum
+from typing import Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +37,7 @@ try:
     from reportlab.lib.pagesizes import legal, letter
     from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
     from reportlab.lib.units import inch
+    from reportlab.pdfgen import canvas as pdf_canvas
     from reportlab.platypus import (
         PageBreak,
         Paragraph,
@@ -43,6 +52,13 @@ except ImportError:
     logger.warning("ReportLab not available. PDF generation will use fallback method.")
     REPORTLAB_AVAILABLE = False
 
+try:
+    from PyPDF2 import PdfReader, PdfWriter
+
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
 
 class DocumentFormat(Enum):
     """Legal document formats"""
@@ -110,6 +126,222 @@ class PDFGenerationResult:
     warnings: list[str]
     generation_time: float
     metadata: DocumentMetadata
+    sections_rendered: int = 0
+    sections_reused: int = 0
+
+
+# Bump when the fragment layout changes so cached fragments are not reused
+FRAGMENT_FORMAT_VERSION = 2
+
+# Form feed in the content: an explicit page break, and so a fragment boundary
+PAGE_BREAK = "\f"
+
+# (kind, value): court, caption, title, heading, body, signature, spacer or page_break
+Block = Tuple[str, Any]
+
+
+def _is_heading(text: str) -> bool:
+    return text.isupper() and len(text) < 100
+
+
+def fragment_key(blocks: list[Block], formatting: FormattingOptions) -> str:
+    """Content hash of one section under the given formatting"""
+    payload = json.dumps(
+        [FRAGMENT_FORMAT_VERSION, blocks, asdict(formatting)], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def legal_styles():
+    """Legal document stylesheet, built once per process"""
+    styles = getSampleStyleSheet()
+
+    # Legal document specific styles
+    styles.add(
+        ParagraphStyle(
+            name="LegalTitle",
+            parent=styles["Heading1"],
+            fontSize=14,
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            fontName="Times-Bold",
+        )
+    )
+
+    styles.add(
+        ParagraphStyle(
+            name="LegalHeading",
+            parent=styles["Heading2"],
+            fontSize=12,
+            spaceAfter=6,
+            spaceBefore=12,
+            alignment=TA_CENTER,
+            fontName="Times-Bold",
+        )
+    )
+
+    styles.add(
+        ParagraphStyle(
+            name="LegalBody",
+            parent=styles["Normal"],
+            fontSize=12,
+            spaceAfter=12,
+            spaceBefore=6,
+            alignment=TA_JUSTIFY,
+            fontName="Times-Roman",
+            leading=18,  # 1.5 line spacing
+        )
+    )
+
+    styles.add(
+        ParagraphStyle(
+            name="LegalBodyDouble",
+            parent=styles["LegalBody"],
+            leading=24,  # Double spacing for pleadings
+        )
+    )
+
+    styles.add(
+        ParagraphStyle(
+            name="Signature",
+            parent=styles["Normal"],
+            fontSize=12,
+            alignment=TA_LEFT,
+            fontName="Times-Roman",
+            spaceAfter=6,
+        )
+    )
+    return styles
+
+
+def _page_size(formatting: FormattingOptions):
+    if formatting.page_size == PageSize.LETTER:
+        return letter
+    if formatting.page_size == PageSize.LEGAL:
+        return legal
+    return (595.276, 841.890)  # A4 in points
+
+
+def _caption_table(caption) -> Table:
+    case_name, case_number, title = caption
+    case_table = Table(
+        [[case_name, case_number], ["", ""], [title, ""]],
+        colWidths=[4 * inch, 2 * inch],
+    )
+    case_table.setStyle(
+        TableStyle(
+            [
+                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("FONTNAME", (0, 0), (-1, -1), "Times-Roman"),
+                ("FONTSIZE", (0, 0), (-1, -1), 12),
+                ("LINEBELOW", (0, 1), (0, 1), 1, colors.black),
+                ("RIGHTPADDING", (1, 0), (1, -1), 0),
+            ]
+        )
+    )
+    return case_table
+
+
+def _flowables(blocks: list[Block], formatting: FormattingOptions) -> list:
+    styles = legal_styles()
+    if formatting.double_space_pleadings:
+        body_style = styles["LegalBodyDouble"]
+    else:
+        body_style = styles["LegalBody"]
+
+    story = []
+    for kind, value in blocks:
+        if kind == "spacer":
+            story.append(Spacer(1, value))
+        elif kind == "page_break":
+            story.append(PageBreak())
+        elif kind == "caption":
+            story.append(_caption_table(value))
+        elif kind in ("court", "title"):
+            story.append(Paragraph(value, styles["LegalTitle"]))
+        elif kind == "heading":
+            story.append(Paragraph(value, styles["LegalHeading"]))
+        elif kind == "signature":
+            story.append(Paragraph(value, styles["Signature"]))
+        else:
+            story.append(Paragraph(value, body_style))
+    return story
+
+
+def _no_page_decoration(canvas, doc):
+    pass
+
+
+def _draw_page_number(canvas, doc):
+    canvas.drawRightString(doc.pagesize[0] - inch, 0.75 * inch, f"Page {canvas.getPageNumber()}")
+
+
+def render_fragment(
+    blocks: list[Block], formatting: FormattingOptions, path: str, number_pages: bool = False
+) -> int:
+    """Render blocks to a standalone PDF; runs in pool workers, returns the page count"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    doc = SimpleDocTemplate(
+        tmp_path,
+        pagesize=_page_size(formatting),
+        topMargin=formatting.margin_top * inch,
+        bottomMargin=formatting.margin_bottom * inch,
+        leftMargin=formatting.margin_left * inch,
+        rightMargin=formatting.margin_right * inch,
+    )
+    later_pages = (
+        _draw_page_number
+        if number_pages and formatting.include_page_numbers
+        else _no_page_decoration
+    )
+    doc.build(
+        _flowables(blocks, formatting),
+        onFirstPage=_no_page_decoration,
+        onLaterPages=later_pages,
+    )
+    os.replace(tmp_path, path)
+    return doc.page
+
+
+def count_pages(path: str) -> int:
+    """Page count of an existing PDF; runs in pool workers"""
+    return len(PdfReader(path).pages)
+
+
+def _page_number_overlay(page_count: int, formatting: FormattingOptions):
+    """One page per output page carrying only its page number (none on page 1)"""
+    page_size = _page_size(formatting)
+    buffer = io.BytesIO()
+    overlay = pdf_canvas.Canvas(buffer, pagesize=page_size)
+    for number in range(1, page_count + 1):
+        if number > 1:
+            overlay.drawRightString(page_size[0] - inch, 0.75 * inch, f"Page {number}")
+        overlay.showPage()
+    overlay.save()
+    buffer.seek(0)
+    return PdfReader(buffer)
+
+
+def merge_fragments(paths: list[str], formatting: FormattingOptions, output_path: str) -> int:
+    """Concatenate fragment PDFs and stamp running page numbers; returns the page count"""
+    writer = PdfWriter()
+    for path in paths:
+        for page in PdfReader(path).pages:
+            writer.add_page(page)
+
+    page_count = len(writer.pages)
+    if formatting.include_page_numbers and page_count > 1:
+        overlay = _page_number_overlay(page_count, formatting)
+        for number in range(1, page_count):
+            writer.pages[number].merge_page(overlay.pages[number])
+
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        writer.write(f)
+    os.replace(tmp_path, output_path)
+    return page_count
 
 
 class LegalPDFGenerator:
@@ -120,10 +352,23 @@ class LegalPDFGenerator:
     appropriate spacing, headers, footers, and court formatting requirements.
     """
 
-    def __init__(self, output_directory: str | None = None):
+    def __init__(
+        self,
+        output_directory: str | None = None,
+        max_workers: int | None = None,
+        use_processes: bool = True,
+        max_cached_fragments: int = 512,
+    ):
         """Initialize the PDF generator"""
         self.output_directory = output_directory or tempfile.gettempdir()
+        self.fragment_directory = os.path.join(self.output_directory, ".pdf_fragments")
         self.style_cache = {}
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.use_processes = use_processes
+        self.max_cached_fragments = max_cached_fragments
+        self._executor: Executor | None = None
+        # Fragment content hash -> page count, least recently used first
+        self._fragment_pages: OrderedDict[str, int] = OrderedDict()
         self._setup_styles()
         logger.info(
             f"LegalPDFGenerator initialized with output directory: {self.output_directory}"
@@ -132,63 +377,7 @@ class LegalPDFGenerator:
     def _setup_styles(self):
         """Setup document styles"""
         if REPORTLAB_AVAILABLE:
-            self.styles = getSampleStyleSheet()
-
-            # Legal document specific styles
-            self.styles.add(
-                ParagraphStyle(
-                    name="LegalTitle",
-                    parent=self.styles["Heading1"],
-                    fontSize=14,
-                    spaceAfter=12,
-                    alignment=TA_CENTER,
-                    fontName="Times-Bold",
-                )
-            )
-
-            self.styles.add(
-                ParagraphStyle(
-                    name="LegalHeading",
-                    parent=self.styles["Heading2"],
-                    fontSize=12,
-                    spaceAfter=6,
-                    spaceBefore=12,
-                    alignment=TA_CENTER,
-                    fontName="Times-Bold",
-                )
-            )
-
-            self.styles.add(
-                ParagraphStyle(
-                    name="LegalBody",
-                    parent=self.styles["Normal"],
-                    fontSize=12,
-                    spaceAfter=12,
-                    spaceBefore=6,
-                    alignment=TA_JUSTIFY,
-                    fontName="Times-Roman",
-                    leading=18,  # 1.5 line spacing
-                )
-            )
-
-            self.styles.add(
-                ParagraphStyle(
-                    name="LegalBodyDouble",
-                    parent=self.styles["LegalBody"],
-                    leading=24,  # Double spacing for pleadings
-                )
-            )
-
-            self.styles.add(
-                ParagraphStyle(
-                    name="Signature",
-                    parent=self.styles["Normal"],
-                    fontSize=12,
-                    alignment=TA_LEFT,
-                    fontName="Times-Roman",
-                    spaceAfter=6,
-                )
-            )
+            self.styles = legal_styles()
 
     async def generate_pdf(
         self,
@@ -200,6 +389,12 @@ class LegalPDFGenerator:
         """
         Generate a PDF from document content.
 
+        The document is split into sections at its explicit page breaks (form
+        feeds), so every section already starts on a new page. Each section
+        renders off the event loop into its own fragment PDF, cached by content
+        hash, and the fragments are merged into the final file. An edit to one
+        section re-renders only that section.
+
         Args:
             content: Document content as text
             metadata: Document metadata
@@ -232,38 +427,31 @@ class LegalPDFGenerator:
                 output_filename += ".pdf"
 
             file_path = os.path.join(self.output_directory, output_filename)
+            sections = self._plan_sections(content, metadata, formatting)
+            loop = asyncio.get_running_loop()
 
-            # Create PDF document
-            doc = self._create_pdf_document(file_path, formatting)
-
-            # Build document content
-            story = []
-
-            # Add header section
-            if formatting.include_header:
-                story.extend(self._build_header(metadata, formatting))
-
-            # Add document body
-            story.extend(self._build_body(content, formatting))
-
-            # Add signature block
-            story.extend(self._build_signature_block(metadata))
-
-            # Build the PDF
-            doc.build(
-                story,
-                onFirstPage=self._on_first_page,
-                onLaterPages=self._on_later_pages,
-            )
+            if PYPDF_AVAILABLE:
+                page_count, rendered = await self._build_from_fragments(
+                    sections, formatting, file_path
+                )
+            else:
+                warnings.append("PyPDF2 not available, built the PDF in a single pass")
+                blocks: list[Block] = []
+                for section in sections:
+                    if blocks:
+                        blocks.append(("page_break", None))
+                    blocks += section
+                page_count = await loop.run_in_executor(
+                    self.executor, render_fragment, blocks, formatting, file_path, True
+                )
+                rendered = len(sections)
 
-            # Get file info
             file_size = os.path.getsize(file_path)
-            page_count = self._estimate_page_count(content, formatting)
-
             generation_time = (datetime.now() - start_time).total_seconds()
 
             logger.info(
-                f"PDF generated successfully: {file_path} ({file_size} bytes, ~{page_count} pages)"
+                f"PDF generated successfully: {file_path} ({file_size} bytes, {page_count} pages, "
+                f"{rendered}/{len(sections)} sections rendered)"
             )
 
             return PDFGenerationResult(
@@ -275,6 +463,8 @@ class LegalPDFGenerator:
                 warnings=warnings,
                 generation_time=generation_time,
                 metadata=metadata,
+                sections_rendered=rendered,
+                sections_reused=len(sections) - rendered,
             )
 
         except Exception as e:
@@ -292,169 +482,158 @@ class LegalPDFGenerator:
                 metadata=metadata,
             )
 
-    def _create_pdf_document(
-        self, file_path: str, formatting: FormattingOptions
-    ) -> SimpleDocTemplate:
-        """Create PDF document with proper formatting"""
-
-        # Set page size
-        if formatting.page_size == PageSize.LETTER:
-            page_size = letter
-        elif formatting.page_size == PageSize.LEGAL:
-            page_size = legal
-        else:  # A4
-            page_size = (595.276, 841.890)  # A4 in points
-
-        # Create document
-        doc = SimpleDocTemplate(
+    @property
+    def executor(self) -> Executor:
+        """Worker pool for rendering, created on first use"""
+        if self._executor is None:
+            if self.use_processes:
+                try:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                except (OSError, NotImplementedError) as e:
+                    logger.warning(f"Process pool unavailable ({e}), rendering PDFs in threads")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="pdf"
+                )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the rendering worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _build_from_fragments(
+        self, sections: list[list[Block]], formatting: FormattingOptions, file_path: str
+    ) -> tuple[int, int]:
+        """Render missing section fragments concurrently, then merge them all"""
+        loop = asyncio.get_running_loop()
+        keys = [fragment_key(section, formatting) for section in sections]
+        cached = await asyncio.gather(*(self._cached_fragment(key) for key in keys))
+        missing = {
+            key: section
+            for key, section, pages in zip(keys, sections, cached, strict=True)
+            if pages is None
+        }
+
+        os.makedirs(self.fragment_directory, exist_ok=True)
+        page_counts = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self.executor, render_fragment, section, formatting, self._fragment_path(key)
+                )
+                for key, section in missing.items()
+            )
+        )
+        for key, pages in zip(missing, page_counts, strict=True):
+            self._fragment_pages[key] = pages
+
+        page_count = await loop.run_in_executor(
+            self.executor,
+            merge_fragments,
+            [self._fragment_path(key) for key in keys],
+            formatting,
             file_path,
-            pagesize=page_size,
-            topMargin=formatting.margin_top * inch,
-            bottomMargin=formatting.margin_bottom * inch,
-            leftMargin=formatting.margin_left * inch,
-            rightMargin=formatting.margin_right * inch,
         )
-
-        return doc
-
-    def _build_header(
-        self, metadata: DocumentMetadata, formatting: FormattingOptions
-    ) -> list:
+        self._evict_fragments()
+        return page_count, len(missing)
+
+    def _fragment_path(self, key: str) -> str:
+        return os.path.join(self.fragment_directory, f"{key}.pdf")
+
+    async def _cached_fragment(self, key: str) -> int | None:
+        """Page count of a rendered fragment, or None if it must be rendered"""
+        path = self._fragment_path(key)
+        if not os.path.exists(path):
+            self._fragment_pages.pop(key, None)
+            return None
+        if key not in self._fragment_pages:
+            # Rendered by an earlier generator over the same output directory
+            pages = await asyncio.get_running_loop().run_in_executor(
+                self.executor, count_pages, path
+            )
+            self._fragment_pages[key] = pages
+        self._fragment_pages.move_to_end(key)
+        return self._fragment_pages[key]
+
+    def _evict_fragments(self) -> None:
+        while len(self._fragment_pages) > self.max_cached_fragments:
+            key, _ = self._fragment_pages.popitem(last=False)
+            try:
+                os.remove(self._fragment_path(key))
+            except OSError:
+                pass
+
+    def _plan_sections(
+        self, content: str, metadata: DocumentMetadata, formatting: FormattingOptions
+    ) -> list[list[Block]]:
+        """Split the document into independently rendered sections
+
+        Sections end only at explicit page breaks, where the layout starts a
+        new page anyway, so merging the fragments gives the same pages as a
+        single pass. The caption joins the first section and the signature
+        block the last.
+        """
+        sections: list[list[Block]] = []
+        for page_text in content.split(PAGE_BREAK):
+            blocks: list[Block] = []
+            for para_text in page_text.split("\n\n"):
+                para_text = para_text.strip()
+                if para_text:
+                    kind = "heading" if _is_heading(para_text) else "body"
+                    blocks += [(kind, para_text), ("spacer", 6)]
+            if blocks:
+                sections.append(blocks)
+
+        if not sections:
+            sections.append([])
+        if formatting.include_header:
+            sections[0] = self._header_blocks(metadata) + sections[0]
+        sections[-1] += self._signature_blocks(metadata)
+        return sections
+
+    def _header_blocks(self, metadata: DocumentMetadata) -> list[Block]:
         """Build document header section"""
-        story = []
+        blocks: list[Block] = []
 
         # Court header for legal documents
         if metadata.court and metadata.document_type != DocumentFormat.LETTER:
-            court_header = Paragraph(metadata.court.upper(), self.styles["LegalTitle"])
-            story.append(court_header)
-            story.append(Spacer(1, 12))
+            blocks += [("court", metadata.court.upper()), ("spacer", 12)]
 
         # Case caption
         if metadata.case_name and metadata.case_number:
-            # Create case caption table
-            case_data = [
-                [metadata.case_name, f"Case No. {metadata.case_number}"],
-                ["", ""],
-                [f"{metadata.title}", ""],
-            ]
-
-            case_table = Table(case_data, colWidths=[4 * inch, 2 * inch])
-            case_table.setStyle(
-                TableStyle(
-                    [
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                        ("FONTNAME", (0, 0), (-1, -1), "Times-Roman"),
-                        ("FONTSIZE", (0, 0), (-1, -1), 12),
-                        ("LINEBELOW", (0, 1), (0, 1), 1, colors.black),
-                        ("RIGHTPADDING", (1, 0), (1, -1), 0),
-                    ]
-                )
-            )
-
-            story.append(case_table)
-            story.append(Spacer(1, 24))
-
+            caption = (metadata.case_name, f"Case No. {metadata.case_number}", metadata.title)
+            blocks += [("caption", caption), ("spacer", 24)]
         elif metadata.title:
             # Simple title for non-litigation documents
-            title = Paragraph(metadata.title, self.styles["LegalTitle"])
-            story.append(title)
-            story.append(Spacer(1, 18))
-
-        return story
-
-    def _build_body(self, content: str, formatting: FormattingOptions) -> list:
-        """Build document body content"""
-        story = []
-
-        # Choose appropriate style based on document type
-        if formatting.double_space_pleadings:
-            body_style = self.styles["LegalBodyDouble"]
-        else:
-            body_style = self.styles["LegalBody"]
-
-        # Split content into paragraphs
-        paragraphs = content.split("\n\n")
-
-        for para_text in paragraphs:
-            para_text = para_text.strip()
-            if para_text:
-                # Handle different paragraph types
-                if para_text.isupper() and len(para_text) < 100:
-                    # Likely a heading
-                    para = Paragraph(para_text, self.styles["LegalHeading"])
-                else:
-                    # Regular body text
-                    para = Paragraph(para_text, body_style)
-
-                story.append(para)
-                story.append(Spacer(1, 6))
+            blocks += [("title", metadata.title), ("spacer", 18)]
 
-        return story
+        return blocks
 
-    def _build_signature_block(self, metadata: DocumentMetadata) -> list:
+    def _signature_blocks(self, metadata: DocumentMetadata) -> list[Block]:
         """Build signature block"""
-        story = []
+        blocks: list[Block] = []
 
         if metadata.attorney_name or metadata.law_firm:
-            story.append(Spacer(1, 36))  # Space before signature
+            blocks.append(("spacer", 36))  # Space before signature
 
             if metadata.attorney_name:
-                story.append(
-                    Paragraph("Respectfully submitted,", self.styles["Signature"])
-                )
-                story.append(Spacer(1, 36))  # Space for signature
-                story.append(
-                    Paragraph("____________________________", self.styles["Signature"])
-                )
-                story.append(
-                    Paragraph(metadata.attorney_name, self.styles["Signature"])
-                )
-
+                blocks += [
+                    ("signature", "Respectfully submitted,"),
+                    ("spacer", 36),  # Space for signature
+                    ("signature", "____________________________"),
+                    ("signature", metadata.attorney_name),
+                ]
                 if metadata.attorney_bar_number:
-                    story.append(
-                        Paragraph(
-                            f"Bar No. {metadata.attorney_bar_number}",
-                            self.styles["Signature"],
-                        )
-                    )
+                    blocks.append(("signature", f"Bar No. {metadata.attorney_bar_number}"))
 
             if metadata.law_firm:
-                story.append(Paragraph(metadata.law_firm, self.styles["Signature"]))
+                blocks.append(("signature", metadata.law_firm))
 
             if metadata.party_represented:
-                story.append(
-                    Paragraph(
-                        f"Attorney for {metadata.party_represented}",
-                        self.styles["Signature"],
-                    )
-                )
-
-        return story
-
-    def _on_first_page(self, canvas, doc):
-        """First page formatting"""
-        # Add any first-page specific formatting here
-        pass
-
-    def _on_later_pages(self, canvas, doc):
-        """Later pages formatting"""
-        # Add page numbers and running headers
-        page_num = canvas.getPageNumber()
-        text = f"Page {page_num}"
-        canvas.drawRightString(doc.pagesize[0] - inch, 0.75 * inch, text)
-
-    def _estimate_page_count(self, content: str, formatting: FormattingOptions) -> int:
-        """Estimate number of pages"""
-        # Rough estimation based on character count and formatting
-        chars_per_line = 80  # Approximate
-        lines_per_page = 45 if formatting.double_space_pleadings else 55
-
-        total_chars = len(content)
-        estimated_lines = total_chars / chars_per_line
-        estimated_pages = max(1, int(estimated_lines / lines_per_page) + 1)
+                blocks.append(("signature", f"Attorney for {metadata.party_represented}"))
 
-        return estimated_pages
+        return blocks
 
     async def _generate_fallback_pdf(
         self,
@@ -0,0 +1,363 @@
+"""
+# Script Name: http_client.py
+# Description: Shared async HTTP layer for research API clients
+# Relationships:
+#   - Entity Type: Module
+#   - Directory Group: Research
+#   - Group Tags: legal-research
+Shared async HTTP layer for research API clients.
+
+CourtListener, OpenAlex, Google Scholar and Tavily all go through one
+ResearchHttpClient so they share keep-alive connection pools and a per-host
+concurrency cap. Failed requests are retried with jittered exponential
+backoff, honouring Retry-After; a per-host circuit breaker stops hammering a
+host that keeps failing. GET responses carrying an ETag or Last-Modified are
+revalidated with conditional requests and served from memory on 304.
+
+The wire layer is a pluggable transport: RequestsTransport (a pooled
+requests.Session run in worker threads) by default, MockTransport for tests.
+"""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+import json
+import logging
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import urllib.parse
+import weakref
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Statuses that mean the server did not act on the request, so even non-idempotent
+# requests may be retried
+SAFE_RETRY_STATUS = {429, 503}
+
+
+class HttpError(Exception):
+    """Final non-success response after retries"""
+
+    def __init__(self, status: int, url: str, body: bytes = b""):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+        self.body = body
+
+
+class CircuitOpenError(Exception):
+    """Raised without contacting the host while its circuit breaker is open"""
+
+
+@dataclass
+class HttpRequest:
+    method: str
+    url: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[bytes] = None
+    timeout: float = 30.0
+
+    @property
+    def host(self) -> str:
+        return urllib.parse.urlsplit(self.url).netloc
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    url: str = ""
+    from_cache: bool = False
+
+    def header(self, name: str) -> Optional[str]:
+        return self.headers.get(name.lower())
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8")) if self.body else None
+
+
+class RequestsTransport:
+    """Pooled keep-alive transport backed by a shared requests.Session"""
+
+    def __init__(self, pool_connections: int = 16, pool_maxsize: int = 16):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            # Retries are handled by ResearchHttpClient, not urllib3
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                max_retries=0,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def _send(self, request: HttpRequest) -> HttpResponse:
+        response = self.session.request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            data=request.body,
+            timeout=request.timeout,
+        )
+        return HttpResponse(
+            status=response.status_code,
+            headers={k.lower(): v for k, v in response.headers.items()},
+            body=response.content,
+            url=request.url,
+        )
+
+    async def send(self, request: HttpRequest) -> HttpResponse:
+        return await asyncio.to_thread(self._send, request)
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+class MockTransport:
+    """In-process transport for tests; ``handler`` maps a request to a response"""
+
+    def __init__(
+        self,
+        handler: Callable[[HttpRequest], "HttpResponse | Awaitable[HttpResponse]"],
+    ):
+        self.handler = handler
+        self.requests: List[HttpRequest] = []
+
+    async def send(self, request: HttpRequest) -> HttpResponse:
+        self.requests.append(request)
+        response = self.handler(request)
+        if asyncio.iscoroutine(response):
+            response = await response
+        response.url = response.url or request.url
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures; after
+    ``reset_timeout`` seconds one trial request is let through (half-open)"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self._clock() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = self._clock()
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class ResearchHttpClient:
+    """Async HTTP client with per-host limits, retries, circuit breakers and
+    conditional GET caching"""
+
+    def __init__(
+        self,
+        transport=None,
+        per_host_limit: int = 4,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_cached_responses: int = 256,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.transport = transport or RequestsTransport()
+        self.per_host_limit = per_host_limit
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_cached_responses = max_cached_responses
+        self._sleep = sleep
+        self._clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        # Semaphores are tied to the event loop they were first awaited on
+        self._host_limits: "weakref.WeakKeyDictionary[Any, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._validators: "OrderedDict[str, HttpResponse]" = OrderedDict()
+        self.stats = {"requests": 0, "retries": 0, "not_modified": 0, "circuit_rejections": 0}
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        per_loop = self._host_limits.setdefault(asyncio.get_running_loop(), {})
+        if host not in per_loop:
+            per_loop[host] = asyncio.Semaphore(self.per_host_limit)
+        return per_loop[host]
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker(
+                self.failure_threshold, self.reset_timeout, self._clock
+            )
+        return self._breakers[host]
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        # Full jitter keeps concurrent retries from synchronising
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        json_body: Any = None,
+        timeout: float = 30.0,
+    ) -> HttpResponse:
+        method = method.upper()
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urllib.parse.urlencode(params)}"
+        request = HttpRequest(method, url, dict(headers or {}), None, timeout)
+        if json_body is not None:
+            request.body = json.dumps(json_body).encode("utf-8")
+            request.headers.setdefault("Content-Type", "application/json")
+
+        cached = self._validators.get(url) if method == "GET" else None
+        if cached is not None:
+            if cached.header("etag"):
+                request.headers["If-None-Match"] = cached.header("etag")
+            if cached.header("last-modified"):
+                request.headers["If-Modified-Since"] = cached.header("last-modified")
+
+        response = await self._send_with_retries(request)
+
+        if response.status == 304 and cached is not None:
+            self.stats["not_modified"] += 1
+            self._validators.move_to_end(url)
+            return HttpResponse(cached.status, cached.headers, cached.body, url, from_cache=True)
+        if response.status >= 400:
+            raise HttpError(response.status, url, response.body)
+        if method == "GET" and (response.header("etag") or response.header("last-modified")):
+            self._validators[url] = response
+            self._validators.move_to_end(url)
+            while len(self._validators) > self.max_cached_responses:
+                self._validators.popitem(last=False)
+        return response
+
+    async def _send_with_retries(self, request: HttpRequest) -> HttpResponse:
+        breaker = self.breaker(request.host)
+        idempotent = request.method in ("GET", "HEAD", "OPTIONS")
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                self.stats["circuit_rejections"] += 1
+                raise CircuitOpenError(f"Circuit open for {request.host}")
+
+            retry_after = None
+            try:
+                async with self._host_semaphore(request.host):
+                    self.stats["requests"] += 1
+                    response = await self.transport.send(request)
+            except Exception as e:
+                breaker.record_failure()
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                logger.warning(f"Request to {request.host} failed ({e}), retrying")
+            else:
+                if response.status not in RETRYABLE_STATUS:
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                retryable = idempotent or response.status in SAFE_RETRY_STATUS
+                if not retryable or attempt >= self.max_retries:
+                    return response
+                retry_after = _retry_after_seconds(response.header("retry-after"))
+                logger.info(f"{request.host} returned {response.status}, retrying")
+
+            self.stats["retries"] += 1
+            await self._sleep(self._backoff(attempt, retry_after))
+            attempt += 1
+
+    async def get_json(self, url: str, **kwargs) -> Any:
+        return (await self.request("GET", url, **kwargs)).json()
+
+    async def post_json(self, url: str, json_body: Any, **kwargs) -> Any:
+        return (await self.request("POST", url, json_body=json_body, **kwargs)).json()
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+_http_client: Optional[ResearchHttpClient] = None
+
+
+def get_http_client() -> ResearchHttpClient:
+    """Process-wide client shared by all research API clients"""
+    global _http_client
+    if _http_client is None:
+        _http_client = ResearchHttpClient(
+            per_host_limit=int(os.getenv("LF_HTTP_PER_HOST_LIMIT", "4"))
+        )
+    return _http_client
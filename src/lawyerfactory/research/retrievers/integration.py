@@ -30,9 +30,26 @@ from lawyerfactory.compose.bots.research import (
 from lawyerfactory.kg.graph_api import EnhancedKnowledgeGraph
 from lawyerfactory.kg.jurisdiction import JurisdictionManager
 from lawyerfactory.phases.phaseA01_intake.cause_of_action_detector import CauseOfActionDetector
+from lawyerfactory.research.retrievers.scheduler import (
+    PriorityResearchScheduler,
+    TokenBucket,
+)
+from lawyerfactory.research.retrievers.semantic_cache import (
+    QueryFingerprint,
+    SemanticResearchCache,
+    fingerprint_request,
+)
 
 logger = logging.getLogger(__name__)
 
+# Per-API quotas enforced as token buckets refilled at per_day / 86400 tokens per
+# second, with at most `burst` requests available at once.
+API_RATE_LIMITS = {
+    "courtlistener": {"per_day": 5000, "burst": 200, "max_concurrent": 4},
+    "openalex": {"per_day": 10000, "burst": 400, "max_concurrent": 4},
+    "scholar": {"per_day": 100, "burst": 10, "max_concurrent": 1},
+}
+
 
 class ResearchPriority(Enum):
     """Priority levels for legal research requests"""
@@ -44,6 +61,17 @@ class ResearchPriority(Enum):
     BACKGROUND = "background"  # Process when system is idle
 
 
+# Queue deadline per priority in seconds; requests are served earliest deadline
+# first, so lower priorities age towards the front instead of starving.
+RESEARCH_DEADLINES = {
+    ResearchPriority.CRITICAL: 0,
+    ResearchPriority.HIGH: 5 * 60,
+    ResearchPriority.MEDIUM: 30 * 60,
+    ResearchPriority.LOW: 2 * 3600,
+    ResearchPriority.BACKGROUND: 6 * 3600,
+}
+
+
 class AuthorityLevel(Enum):
     """Legal authority hierarchy levels"""
 
@@ -107,6 +135,7 @@ class LegalResearchAPIIntegration:
         cause_detector: CauseOfActionDetector,
         courtlistener_token: Optional[str] = None,
         scholar_contact_email: Optional[str] = None,
+        research_workers: int = 3,
     ):
         """Initialize the legal research integration system"""
         self.kg = enhanced_kg
@@ -119,38 +148,37 @@ class LegalResearchAPIIntegration:
         self.scholar_client = GoogleScholarClient()
 
         # API quota management
-        self.api_quotas = {
-            "courtlistener": {
-                "daily_limit": 5000,
-                "used": 0,
-                "reset_time": self._get_next_reset(),
-            },
-            "openalex": {
-                "daily_limit": 10000,
-                "used": 0,
-                "reset_time": self._get_next_reset(),
-            },
-            "scholar": {
-                "daily_limit": 100,
-                "used": 0,
-                "reset_time": self._get_next_reset(),
-            },
+        self.api_rate_limiters = {
+            api_name: TokenBucket(limits["per_day"] / 86400, limits["burst"])
+            for api_name, limits in API_RATE_LIMITS.items()
+        }
+        self.api_semaphores = {
+            api_name: asyncio.Semaphore(limits["max_concurrent"])
+            for api_name, limits in API_RATE_LIMITS.items()
+        }
+        self.api_usage = {
+            api_name: {"requests": 0, "results": 0, "throttled": 0}
+            for api_name in API_RATE_LIMITS
         }
 
         # Research processing queue
-        self.research_queue = asyncio.Queue()
+        self.research_scheduler = PriorityResearchScheduler(
+            self.execute_research_request, workers=research_workers
+        )
         self.background_processor_running = False
 
         # Cache management
-        self.cache_stats = {"hits": 0, "misses": 0, "invalidations": 0, "size_mb": 0.0}
+        self.cache_stats = {
+            "hits": 0,
+            "misses": 0,
+            "semantic_hits": 0,
+            "invalidations": 0,
+            "size_mb": 0.0,
+        }
+        self.semantic_cache = SemanticResearchCache()
 
         logger.info("Legal Research API Integration system initialized")
 
-    def _get_next_reset(self) -> datetime:
-        """Get next API quota reset time (daily)"""
-        tomorrow = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        return tomorrow + timedelta(days=1)
-
     async def start_background_processor(self):
         """Start background research processing"""
         if self.background_processor_running:
@@ -160,18 +188,23 @@ class LegalResearchAPIIntegration:
         logger.info("Starting background research processor")
 
         # Start background tasks
-        asyncio.create_task(self._background_research_processor())
+        self.research_scheduler.start()
         asyncio.create_task(self._cache_maintenance_task())
-        asyncio.create_task(self._quota_reset_task())
 
     async def stop_background_processor(self):
         """Stop background research processing"""
         self.background_processor_running = False
+        await self.research_scheduler.stop()
         logger.info("Stopped background research processor")
 
     async def submit_research_request(self, request: LegalResearchRequest) -> str:
         """Submit a research request for processing"""
-        await self.research_queue.put(request)
+        await self.research_scheduler.submit(
+            request.request_id,
+            request,
+            deadline_seconds=RESEARCH_DEADLINES.get(request.priority, 0),
+            label=request.priority.value,
+        )
         logger.info(
             f"Submitted research request {request.request_id} with priority {request.priority.value}"
         )
@@ -364,14 +397,15 @@ class LegalResearchAPIIntegration:
     ) -> List[LegalCitation]:
         """Research using CourtListener API with Claims Matrix context"""
         try:
-            if not self._check_api_quota("courtlistener"):
+            if not self._acquire_api_quota("courtlistener"):
                 logger.warning("CourtListener API quota exceeded")
                 return []
 
             # Use existing CourtListener client with enhanced context
-            results = await self.courtlistener_client.search_opinions(
-                query.query_text, limit=20
-            )
+            async with self.api_semaphores["courtlistener"]:
+                results = await self.courtlistener_client.search_opinions(
+                    query.query_text, limit=20
+                )
             citations = []
 
             for result in results:
@@ -395,13 +429,16 @@ class LegalResearchAPIIntegration:
     ) -> List[LegalCitation]:
         """Research using Google Scholar with enhanced parsing"""
         try:
-            if not self._check_api_quota("scholar"):
+            if not self._acquire_api_quota("scholar"):
                 logger.warning("Google Scholar API quota exceeded")
                 return []
 
             # Enhanced query for legal scholarship
             enhanced_query = f"{query.query_text} legal analysis precedent"
-            results = await self.scholar_client.search_legal(enhanced_query, limit=10)
+            async with self.api_semaphores["scholar"]:
+                results = await self.scholar_client.search_legal(
+                    enhanced_query, limit=10
+                )
 
             citations = []
             for result in results:
@@ -433,13 +470,16 @@ class LegalResearchAPIIntegration:
     ) -> List[LegalCitation]:
         """Research using OpenAlex API with legal focus"""
         try:
-            if not self._check_api_quota("openalex"):
+            if not self._acquire_api_quota("openalex"):
                 logger.warning("OpenAlex API quota exceeded")
                 return []
 
             # Enhanced query for legal academic research
             enhanced_query = f"{query.query_text} law legal jurisprudence"
-            results = await self.openalex_client.search_legal(enhanced_query, limit=15)
+            async with self.api_semaphores["openalex"]:
+                results = await self.openalex_client.search_legal(
+                    enhanced_query, limit=15
+                )
 
             citations = []
             for result in results:
@@ -912,59 +952,99 @@ class LegalResearchAPIIntegration:
         return round(confidence, 3)
 
     def _check_api_quota(self, api_name: str) -> bool:
-        """Check if API quota is available"""
-        quota_info = self.api_quotas.get(api_name, {})
-        current_time = datetime.now()
-
-        # Reset quota if needed
-        if current_time >= quota_info.get("reset_time", current_time):
-            quota_info["used"] = 0
-            quota_info["reset_time"] = self._get_next_reset()
-
-        return quota_info.get("used", 0) < quota_info.get("daily_limit", 1000)
+        """Check if API quota is available without consuming it"""
+        limiter = self.api_rate_limiters.get(api_name)
+        return limiter is None or limiter.tokens >= 1
+
+    def _acquire_api_quota(self, api_name: str) -> bool:
+        """Consume one request from the API's token bucket"""
+        limiter = self.api_rate_limiters.get(api_name)
+        if limiter is None:
+            return True
+        if limiter.try_acquire():
+            self.api_usage[api_name]["requests"] += 1
+            return True
+        self.api_usage[api_name]["throttled"] += 1
+        return False
 
     def _update_api_usage(self, api_name: str, count: int):
         """Update API usage statistics"""
-        if api_name in self.api_quotas:
-            self.api_quotas[api_name]["used"] += count
+        if api_name in self.api_usage:
+            self.api_usage[api_name]["results"] += count
 
     async def _check_research_cache(
         self, request: LegalResearchRequest
     ) -> Optional[ResearchResult]:
-        """Check if research results are cached"""
+        """Check if research results are cached, falling back to a near-duplicate match"""
         cache_key = self._generate_cache_key(request)
 
         try:
-            # Query cache from database
-            cached_data = self.kg._execute(
-                """
-                SELECT result_data, cache_expiry, relevance_score
-                FROM legal_research_cache 
-                WHERE jurisdiction = ? AND search_query = ? 
-                AND cache_expiry > datetime('now')
-                ORDER BY created_at DESC LIMIT 1
-            """,
-                (request.jurisdiction, cache_key),
-            ).fetchone()
-
-            if cached_data:
-                result_data, cache_expiry, relevance_score = cached_data
-
-                # Parse cached result
-                result_dict = json.loads(result_data)
-                result = ResearchResult(**result_dict)
-
-                # Update cache access statistics
+            fingerprint = self._fingerprint_request(request)
+            result = self._load_cached_result(request.jurisdiction, cache_key)
+            if result:
+                # Re-index exact hits so near-duplicates work after a restart
+                self.semantic_cache.add(cache_key, fingerprint)
                 self._update_cache_access(cache_key)
-
                 return result
 
-            return None
+            match = self.semantic_cache.lookup(fingerprint, exclude=cache_key)
+            if not match:
+                return None
+
+            matched_key, similarity = match
+            result = self._load_cached_result(request.jurisdiction, matched_key)
+            if not result:
+                self.semantic_cache.discard(matched_key)  # expired or evicted
+                return None
+
+            saved_calls = len(await self._build_research_queries(request)) * len(
+                self.api_rate_limiters
+            )
+            self.semantic_cache.record_hit(
+                request.request_id, matched_key, similarity, saved_calls
+            )
+            self.cache_stats["semantic_hits"] += 1
+            self._update_cache_access(matched_key)
+            logger.info(
+                f"Near-duplicate cache hit for {request.request_id} "
+                f"(similarity {similarity:.2f}, ~{saved_calls} upstream calls saved)"
+            )
+            return result
 
         except Exception as e:
             logger.error(f"Cache check failed: {e}")
             return None
 
+    def _load_cached_result(
+        self, jurisdiction: str, cache_key: str
+    ) -> Optional[ResearchResult]:
+        """Load an unexpired cached result by exact cache key"""
+        cached_data = self.kg._execute(
+            """
+            SELECT result_data, cache_expiry, relevance_score
+            FROM legal_research_cache 
+            WHERE jurisdiction = ? AND search_query = ? 
+            AND cache_expiry > datetime('now')
+            ORDER BY created_at DESC LIMIT 1
+        """,
+            (jurisdiction, cache_key),
+        ).fetchone()
+
+        if not cached_data:
+            return None
+
+        result_data, cache_expiry, relevance_score = cached_data
+        return ResearchResult(**json.loads(result_data))
+
+    def _fingerprint_request(self, request: LegalResearchRequest) -> QueryFingerprint:
+        """Normalised fingerprint used for near-duplicate cache lookups"""
+        return fingerprint_request(
+            request.cause_of_action,
+            request.jurisdiction,
+            request.legal_elements,
+            request.fact_context,
+        )
+
     def _generate_cache_key(self, request: LegalResearchRequest) -> str:
         """Generate cache key for research request"""
         key_components = [
@@ -1006,6 +1086,7 @@ class LegalResearchAPIIntegration:
             )
 
             self.kg.conn.commit()
+            self.semantic_cache.add(cache_key, self._fingerprint_request(request))
             logger.debug(f"Cached research result for key: {cache_key}")
 
         except Exception as e:
@@ -1054,58 +1135,6 @@ class LegalResearchAPIIntegration:
         except Exception as e:
             logger.error(f"Failed to store research in knowledge graph: {e}")
 
-    async def _background_research_processor(self):
-        """Background processor for research requests"""
-        logger.info("Background research processor started")
-
-        while self.background_processor_running:
-            try:
-                # Process research queue with priority ordering
-                pending_requests = []
-
-                # Collect all pending requests
-                while not self.research_queue.empty():
-                    try:
-                        request = self.research_queue.get_nowait()
-                        pending_requests.append(request)
-                    except asyncio.QueueEmpty:
-                        break
-
-                if pending_requests:
-                    # Sort by priority
-                    priority_order = {
-                        ResearchPriority.CRITICAL: 0,
-                        ResearchPriority.HIGH: 1,
-                        ResearchPriority.MEDIUM: 2,
-                        ResearchPriority.LOW: 3,
-                        ResearchPriority.BACKGROUND: 4,
-                    }
-
-                    pending_requests.sort(
-                        key=lambda r: priority_order.get(r.priority, 5)
-                    )
-
-                    # Process high priority requests first
-                    for request in pending_requests:
-                        if not self.background_processor_running:
-                            break
-
-                        try:
-                            await self.execute_research_request(request)
-                        except Exception as e:
-                            logger.error(
-                                f"Background research failed for {request.request_id}: {e}"
-                            )
-
-                # Sleep before next iteration
-                await asyncio.sleep(30)  # Check every 30 seconds
-
-            except Exception as e:
-                logger.error(f"Background processor error: {e}")
-                await asyncio.sleep(60)  # Longer sleep on error
-
-        logger.info("Background research processor stopped")
-
     async def _cache_maintenance_task(self):
         """Background task for cache maintenance"""
         while self.background_processor_running:
@@ -1139,27 +1168,18 @@ class LegalResearchAPIIntegration:
                 logger.error(f"Cache maintenance error: {e}")
                 await asyncio.sleep(1800)  # 30 minutes on error
 
-    async def _quota_reset_task(self):
-        """Background task to reset API quotas daily"""
-        while self.background_processor_running:
-            try:
-                current_time = datetime.now()
-
-                for api_name, quota_info in self.api_quotas.items():
-                    if current_time >= quota_info["reset_time"]:
-                        quota_info["used"] = 0
-                        quota_info["reset_time"] = self._get_next_reset()
-                        logger.info(f"Reset API quota for {api_name}")
-
-                await asyncio.sleep(3600)  # Check every hour
-
-            except Exception as e:
-                logger.error(f"Quota reset task error: {e}")
-                await asyncio.sleep(1800)
-
     async def get_research_status(self, request_id: str) -> Dict[str, Any]:
         """Get status of a research request"""
         try:
+            queue_wait_times = self.research_scheduler.wait_time_histograms()
+            scheduled = self.research_scheduler.status(request_id)
+            if scheduled:
+                status = {"request_id": request_id, **scheduled}
+                if scheduled["status"] == "queued":
+                    status["queue_size"] = self.research_scheduler.qsize()
+                status["queue_wait_times"] = queue_wait_times
+                return status
+
             # Check if completed (in cache or knowledge graph)
             cached_result = self.kg._execute(
                 """
@@ -1177,17 +1197,15 @@ class LegalResearchAPIIntegration:
                     "status": "completed",
                     "completion_time": cached_result[2],
                     "confidence_score": cached_result[1],
+                    "queue_wait_times": queue_wait_times,
                 }
 
-            # Check queue
-            queue_size = self.research_queue.qsize()
-
             return {
                 "request_id": request_id,
-                "status": "queued" if queue_size > 0 else "processing",
-                "queue_position": queue_size,
-                "estimated_completion": datetime.now()
-                + timedelta(minutes=queue_size * 5),
+                "status": "unknown",
+                "queue_size": self.research_scheduler.qsize(),
+                "active_requests": self.research_scheduler.active,
+                "queue_wait_times": queue_wait_times,
             }
 
         except Exception as e:
@@ -1201,6 +1219,8 @@ class LegalResearchAPIIntegration:
             / max(self.cache_stats["hits"] + self.cache_stats["misses"], 1),
             "total_hits": self.cache_stats["hits"],
             "total_misses": self.cache_stats["misses"],
+            "semantic_hits": self.cache_stats["semantic_hits"],
+            "semantic_cache": self.semantic_cache.statistics(),
             "cache_size_mb": self.cache_stats["size_mb"],
             "invalidations": self.cache_stats["invalidations"],
         }
@@ -1209,10 +1229,12 @@ class LegalResearchAPIIntegration:
         """Get current API quota usage"""
         return {
             api_name: {
-                "used": info["used"],
-                "limit": info["daily_limit"],
-                "reset_time": info["reset_time"].isoformat(),
-                "remaining": info["daily_limit"] - info["used"],
+                "used": self.api_usage[api_name]["requests"],
+                "results": self.api_usage[api_name]["results"],
+                "throttled": self.api_usage[api_name]["throttled"],
+                "limit": API_RATE_LIMITS[api_name]["per_day"],
+                "burst": limiter.capacity,
+                "remaining": int(limiter.tokens),
             }
-            for api_name, info in self.api_quotas.items()
+            for api_name, limiter in self.api_rate_limiters.items()
         }
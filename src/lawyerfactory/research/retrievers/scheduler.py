@@ -0,0 +1,195 @@
+"""
+# Script Name: scheduler.py
+# Description: Priority scheduling and rate limiting for legal research requests
+# Relationships:
+#   - Entity Type: Module
+#   - Directory Group: Research
+#   - Group Tags: legal-research
+Priority scheduling and rate limiting for legal research requests.
+
+Requests are ordered earliest-deadline-first: each one is queued under
+``submitted_at + deadline_seconds``, so a CRITICAL request (deadline 0) jumps
+ahead of everything that is not already overdue, while a BACKGROUND request
+ages towards the front and is never starved. A pool of workers waits on the
+queue and picks up new work as soon as it is submitted.
+"""
+
+import asyncio
+from collections import OrderedDict
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket rate limiter refilled continuously at ``rate_per_second``"""
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if they are available right now"""
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+
+class WaitTimeHistogram:
+    """Cumulative histogram of queue wait times in seconds"""
+
+    BUCKETS = (0.1, 0.5, 1.0, 5.0, 30.0, 120.0, 600.0)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(self.BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = {}
+        cumulative = 0
+        # The last count is the overflow bucket, reported as le_inf below
+        for bound, count in zip(self.BUCKETS, self.counts[:-1], strict=True):
+            cumulative += count
+            buckets[f"le_{bound:g}s"] = cumulative
+        buckets["le_inf"] = self.count
+        return {
+            "count": self.count,
+            "avg_seconds": round(self.total / self.count, 3) if self.count else 0.0,
+            "max_seconds": round(self.max, 3),
+            "buckets": buckets,
+        }
+
+
+class PriorityResearchScheduler:
+    """Worker pool draining a deadline-ordered research queue"""
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[Any]],
+        workers: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+        max_tracked_requests: int = 1000,
+    ):
+        self.handler = handler
+        self.workers = workers
+        self._clock = clock
+        self._max_tracked = max_tracked_requests
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self._workers: List[asyncio.Task] = []
+        self._states: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._wait_times: Dict[str, WaitTimeHistogram] = {}
+        self.active = 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    async def submit(
+        self, request_id: str, item: Any, deadline_seconds: float = 0.0, label: str = "default"
+    ) -> None:
+        """Queue an item; lower ``deadline_seconds`` means sooner"""
+        enqueued_at = self._clock()
+        key = (enqueued_at + deadline_seconds, next(self._sequence))
+        self._track(request_id, {"status": "queued", "key": key, "priority": label})
+        await self._queue.put((key, request_id, label, enqueued_at, item))
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"research-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def join(self) -> None:
+        """Wait until every queued item has been handled"""
+        await self._queue.join()
+
+    async def _worker(self) -> None:
+        while True:
+            _key, request_id, label, enqueued_at, item = await self._queue.get()
+            self._wait_times.setdefault(label, WaitTimeHistogram()).observe(
+                self._clock() - enqueued_at
+            )
+            self._track(request_id, {"status": "processing", "priority": label})
+            self.active += 1
+            try:
+                await self.handler(item)
+                self._track(request_id, {"status": "completed", "priority": label})
+            except Exception as e:
+                logger.error(f"Background research failed for {request_id}: {e}")
+                self._track(
+                    request_id, {"status": "failed", "priority": label, "error": str(e)}
+                )
+            finally:
+                self.active -= 1
+                self._queue.task_done()
+
+    def _track(self, request_id: str, state: Dict[str, Any]) -> None:
+        self._states[request_id] = state
+        self._states.move_to_end(request_id)
+        while len(self._states) > self._max_tracked:
+            self._states.popitem(last=False)
+
+    def status(self, request_id: str) -> Optional[Dict[str, Any]]:
+        """Current state of a request, with its queue position while queued"""
+        state = self._states.get(request_id)
+        if state is None:
+            return None
+        result = {k: v for k, v in state.items() if k != "key"}
+        if state["status"] == "queued":
+            result["queue_position"] = sum(
+                1
+                for other in self._states.values()
+                if other["status"] == "queued" and other["key"] < state["key"]
+            )
+        return result
+
+    def wait_time_histograms(self) -> Dict[str, Dict[str, Any]]:
+        return {label: hist.snapshot() for label, hist in self._wait_times.items()}
@@ -0,0 +1,216 @@
+"""
+# Script Name: semantic_cache.py
+# Description: Near-duplicate lookup for cached legal research results
+# Relationships:
+#   - Entity Type: Module
+#   - Directory Group: Research
+#   - Group Tags: legal-research
+Near-duplicate lookup for cached legal research results.
+
+The exact research cache key hashes the raw request text, so reworded or
+reordered facts miss it. This module fingerprints a request from normalised
+terms instead: element names are canonicalised, words are lowercased, stripped
+of stopwords and lightly stemmed, and the fact text is summarised as a MinHash
+signature over word and word-pair shingles. Requests for the same cause and
+jurisdiction can reuse a cached result when it covered every requested
+element and the facts are similar enough.
+"""
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+import hashlib
+from itertools import pairwise
+import re
+from typing import Any, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+STOPWORDS = frozenset(
+    "a an and are as at be been by for from had has have he her his in into is it its "
+    "of on or she that the their them they this to was were which who will with".split()
+)
+
+_SUFFIXES = (
+    ("ational", "ate"),
+    ("ations", "ate"),
+    ("ation", "ate"),
+    ("ments", ""),
+    ("ment", ""),
+    ("ness", ""),
+    ("ing", ""),
+    ("ies", "y"),
+    ("ied", "y"),
+    ("ed", ""),
+    ("ly", ""),
+    ("s", ""),
+)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_NUM_PERM = 64
+
+
+def _hash64(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+
+
+_PERMUTATIONS = [
+    (_hash64(f"a{i}") % _MERSENNE_PRIME or 1, _hash64(f"b{i}") % _MERSENNE_PRIME)
+    for i in range(_NUM_PERM)
+]
+
+
+def stem(word: str) -> str:
+    """Strip common English suffixes, keeping at least a three letter stem"""
+    for suffix, replacement in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3 and not word.endswith("ss"):
+            word = word[: -len(suffix)] + replacement
+            break
+    # Collapse the doubled consonant left by e.g. "slipped" and drop a final "e"
+    # so "damage", "damages" and "damaged" share a stem
+    if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "aeiouls":
+        word = word[:-1]
+    if len(word) > 4 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+
+def normalize_terms(text: str) -> List[str]:
+    """Lowercased, stopword-free, stemmed word list"""
+    return [
+        stem(word)
+        for word in re.findall(r"[a-z0-9]+", text.lower())
+        if word not in STOPWORDS
+    ]
+
+
+def canonical_element(name: str) -> str:
+    """Canonical element name, e.g. "Breach of Duty" -> "breach_duty" """
+    return "_".join(normalize_terms(name))
+
+
+def _shingles(facts: Iterable[str]) -> Set[str]:
+    shingles: Set[str] = set()
+    for fact in facts:
+        terms = normalize_terms(fact)
+        shingles.update(terms)
+        shingles.update(f"{a} {b}" for a, b in pairwise(terms))
+    return shingles
+
+
+def minhash(shingles: Iterable[str]) -> Tuple[int, ...]:
+    """MinHash signature; the fraction of equal slots estimates Jaccard similarity"""
+    hashes = [_hash64(shingle) for shingle in shingles]
+    if not hashes:
+        return tuple([_MERSENNE_PRIME] * _NUM_PERM)
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS
+    )
+
+
+@dataclass(frozen=True)
+class QueryFingerprint:
+    """Normalised view of a research request used for near-duplicate matching"""
+
+    cause: str
+    jurisdiction: str
+    elements: FrozenSet[str]
+    signature: Tuple[int, ...]
+
+    @property
+    def bucket(self) -> Tuple[str, str]:
+        return (self.jurisdiction, self.cause)
+
+    def similarity(self, other: "QueryFingerprint") -> float:
+        """Estimated fact similarity to a cached request ``other``
+
+        0.0 for a different cause or jurisdiction, or when ``other`` did not
+        research every element this request asks for.
+        """
+        if self.bucket != other.bucket or not self.elements <= other.elements:
+            return 0.0
+        return sum(1 for x, y in zip(self.signature, other.signature, strict=True) if x == y) / len(
+            self.signature
+        )
+
+
+def fingerprint_request(
+    cause_of_action: str,
+    jurisdiction: str,
+    legal_elements: Iterable[str],
+    fact_context: Iterable[str],
+) -> QueryFingerprint:
+    return QueryFingerprint(
+        cause=canonical_element(cause_of_action),
+        jurisdiction=jurisdiction.strip().lower(),
+        elements=frozenset(canonical_element(e) for e in legal_elements),
+        signature=minhash(_shingles(fact_context)),
+    )
+
+
+class SemanticResearchCache:
+    """In-memory index from fingerprints to exact research cache keys"""
+
+    def __init__(
+        self, threshold: float = 0.85, max_entries: int = 5000, max_recent_hits: int = 100
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, QueryFingerprint]" = OrderedDict()
+        self._buckets: Dict[Tuple[str, str], Set[str]] = {}
+        self.hits = 0
+        self.saved_upstream_calls = 0
+        self.recent_hits: Deque[Dict[str, Any]] = deque(maxlen=max_recent_hits)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, cache_key: str, fingerprint: QueryFingerprint) -> None:
+        previous = self._entries.pop(cache_key, None)
+        if previous is not None:
+            self._buckets[previous.bucket].discard(cache_key)
+        self._entries[cache_key] = fingerprint
+        self._buckets.setdefault(fingerprint.bucket, set()).add(cache_key)
+
+        while len(self._entries) > self.max_entries:
+            old_key, old = self._entries.popitem(last=False)
+            self._buckets[old.bucket].discard(old_key)
+
+    def discard(self, cache_key: str) -> None:
+        fingerprint = self._entries.pop(cache_key, None)
+        if fingerprint is not None:
+            self._buckets[fingerprint.bucket].discard(cache_key)
+
+    def lookup(
+        self, fingerprint: QueryFingerprint, exclude: Optional[str] = None
+    ) -> Optional[Tuple[str, float]]:
+        """Most similar cached key at or above the threshold"""
+        best: Optional[Tuple[str, float]] = None
+        for cache_key in self._buckets.get(fingerprint.bucket, ()):
+            if cache_key == exclude:
+                continue
+            score = fingerprint.similarity(self._entries[cache_key])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (cache_key, score)
+        return best
+
+    def record_hit(
+        self, request_id: str, cache_key: str, similarity: float, saved_calls: int
+    ) -> None:
+        self.hits += 1
+        self.saved_upstream_calls += saved_calls
+        self._entries.move_to_end(cache_key)
+        self.recent_hits.append(
+            {
+                "request_id": request_id,
+                "matched_cache_key": cache_key,
+                "similarity": round(similarity, 3),
+                "saved_upstream_calls": saved_calls,
+            }
+        )
+
+    def statistics(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "saved_upstream_calls": self.saved_upstream_calls,
+            "recent_hits": list(self.recent_hits),
+        }
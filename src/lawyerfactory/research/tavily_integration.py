@@ -2,7 +2,9 @@
 Tavily Research Integration for LawyerFactory
 
 This module provides enhanced web research capabilities using Tavily API
-for tertiary knowledge, academic sources, and claim validation.
+for tertiary knowledge, academic sources, and claim validation. Requests go
+through the shared research HTTP client rather than the blocking SDK, so the
+concurrent searches in comprehensive_research really run in parallel.
 """
 
 import asyncio
@@ -23,8 +25,12 @@ except ImportError:
     TavilyClient = None
     weave = None
 
+from lawyerfactory.research.http_client import ResearchHttpClient, get_http_client
+
 logger = logging.getLogger(__name__)
 
+TAVILY_API_URL = "https://api.tavily.com"
+
 
 @dataclass
 class ResearchQuery:
@@ -61,15 +67,13 @@ class TavilyResearchIntegration:
     with specialized academic and news source capabilities.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
-        if not TAVILY_AVAILABLE:
-            raise ImportError(
-                "Tavily dependencies not available. Install tavily-python and langchain-tavily"
-            )
-
+    def __init__(
+        self, api_key: Optional[str] = None, http_client: Optional[ResearchHttpClient] = None
+    ):
         self.api_key = api_key or os.getenv("TAVILY_API_KEY")
         if not self.api_key:
             raise ValueError("TAVILY_API_KEY environment variable required")
+        self._http = http_client
 
         # Initialize Weave for observability (optional - don't block on connection errors)
         if weave:
@@ -79,9 +83,8 @@ class TavilyResearchIntegration:
             except Exception as e:
                 logger.warning(f"Weave initialization failed (non-critical): {e}")
 
-        if TavilyClient is None:
-            raise ImportError("TavilyClient not available")
-        self.client = TavilyClient(api_key=self.api_key)
+        # SDK client kept for callers that use it directly; searches use the REST API
+        self.client = TavilyClient(api_key=self.api_key) if TavilyClient else None
 
         # Specialized search configurations
         self.academic_domains = [
@@ -112,6 +115,19 @@ class TavilyResearchIntegration:
 
         logger.info("Tavily Research Integration initialized")
 
+    @property
+    def http(self) -> ResearchHttpClient:
+        return self._http or get_http_client()
+
+    async def _call(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST to a Tavily REST endpoint through the shared HTTP client"""
+        response = await self.http.post_json(
+            f"{TAVILY_API_URL}/{endpoint}",
+            payload,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+        )
+        return response or {}
+
     async def search_academic_sources(
         self, query: str, max_results: int = 8, time_range: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -130,7 +146,7 @@ class TavilyResearchIntegration:
             if time_range:
                 search_params["time_range"] = time_range
 
-            response = self.client.search(**search_params)
+            response = await self._call("search", search_params)
 
             # Filter and enhance results
             academic_results = []
@@ -170,7 +186,7 @@ class TavilyResearchIntegration:
             if time_range:
                 search_params["time_range"] = time_range
 
-            response = self.client.search(**search_params)
+            response = await self._call("search", search_params)
 
             # Enhance news results
             news_results = []
@@ -198,26 +214,25 @@ class TavilyResearchIntegration:
         Extract full content from specified URLs
         """
         try:
-            extracted_content = []
-
-            for url in urls[:5]:  # Limit to 5 URLs per call
+            async def extract_one(url: str) -> Optional[Dict[str, Any]]:
+                payload: Dict[str, Any] = {"urls": [url]}
+                if extract_depth in ("basic", "advanced"):
+                    payload["extract_depth"] = extract_depth
                 try:
-                    # Handle extract_depth parameter with proper typing
-                    if extract_depth == "basic":
-                        response = self.client.extract(urls=[url], extract_depth="basic")
-                    elif extract_depth == "advanced":
-                        response = self.client.extract(urls=[url], extract_depth="advanced")
-                    else:
-                        response = self.client.extract(urls=[url])
-
-                    if response.get("results"):
-                        result = response["results"][0]
-                        result["source_url"] = url
-                        result["extraction_timestamp"] = datetime.now().isoformat()
-                        extracted_content.append(result)
-
+                    response = await self._call("extract", payload)
                 except Exception as e:
                     logger.warning(f"Failed to extract from {url}: {e}")
+                    return None
+                if not response.get("results"):
+                    return None
+                result = response["results"][0]
+                result["source_url"] = url
+                result["extraction_timestamp"] = datetime.now().isoformat()
+                return result
+
+            # Limit to 5 URLs per call; the HTTP client caps per-host concurrency
+            extracted = await asyncio.gather(*(extract_one(url) for url in urls[:5]))
+            extracted_content = [result for result in extracted if result]
 
             return {
                 "urls_requested": urls,
@@ -8,7 +8,7 @@ Features:
 - S3 integration for permanent document storage
 - Local temporary storage for processing
 - Automatic synchronization between storage layers
-- Storage tier management (hot/cold storage)
+- Storage tier management (hot/warm/cold) with a background lifecycle engine
 - Backup and recovery capabilities
 """
 
@@ -18,25 +18,16 @@ import json
 import logging
 import os
 from pathlib import Path
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 import uuid
 
 from ..vectors.enhanced_vector_store import EnhancedVectorStoreManager, VectorStoreType
+from .tier_lifecycle import LocalBlobStore, StorageTier, TierLifecycleEngine
 
 logger = logging.getLogger(__name__)
 
 
-from enum import Enum
-
-
-class StorageTier(Enum):
-    """Storage tier definitions"""
-
-    HOT = "hot"  # Frequently accessed, local storage
-    WARM = "warm"  # Occasionally accessed, fast cloud storage
-    COLD = "cold"  # Rarely accessed, archival storage
-
-
 class CloudStorageManager:
     """
     Manages integration between vector store and cloud storage
@@ -47,18 +38,28 @@ class CloudStorageManager:
         vector_store_manager: Optional[EnhancedVectorStoreManager] = None,
         s3_service=None,
         local_temp_dir: str = "./uploads/tmp",
+        blob_dir: str = "./uploads/blobs",
     ):
         self.vector_store = vector_store_manager or EnhancedVectorStoreManager()
         self.s3_service = s3_service  # S3 service instance
         self.local_temp_dir = Path(local_temp_dir)
         self.local_temp_dir.mkdir(parents=True, exist_ok=True)
 
-        # Storage mappings
-        self.storage_mappings: Dict[str, Dict[str, Any]] = {}
-
         # Storage tier policies
         self.tier_policies = self._initialize_tier_policies()
 
+        # Tier lifecycle over a local stand-in for the blob bucket; storage
+        # mappings are owned and persisted by the lifecycle engine
+        self.blob_store = LocalBlobStore(blob_dir)
+        self.lifecycle = TierLifecycleEngine(
+            self.tier_policies,
+            self.local_temp_dir,
+            self.blob_store,
+            Path(blob_dir) / "storage_mappings.json",
+        )
+        self.storage_mappings: Dict[str, Dict[str, Any]] = self.lifecycle.mappings
+        self._lifecycle_loop: Optional[asyncio.AbstractEventLoop] = None
+
         # Cleanup settings
         self.temp_file_retention_days = 7
         self.cleanup_interval_hours = 24
@@ -73,18 +74,23 @@ class CloudStorageManager:
                 "max_size_gb": 10,
                 "sync_interval_hours": 1,
                 "backup_enabled": True,
+                "demote_after_idle_days": 7,
+                "demote_below_score": 1.0,
             },
             StorageTier.WARM: {
                 "retention_days": 90,
                 "max_size_gb": 100,
                 "sync_interval_hours": 6,
                 "backup_enabled": True,
+                "demote_after_idle_days": 30,
+                "demote_below_score": 1.0,
             },
             StorageTier.COLD: {
                 "retention_days": 365,
                 "max_size_gb": 1000,
                 "sync_interval_hours": 24,
                 "backup_enabled": False,
+                "demote_after_idle_days": None,
             },
         }
 
@@ -128,16 +134,17 @@ class CloudStorageManager:
                 cloud_info = await self._upload_to_cloud(local_path, storage_id, metadata)
 
             # Store mapping information
-            self.storage_mappings[doc_id] = {
+            mapping = {
                 "storage_id": storage_id,
                 "vector_doc_id": doc_id,
                 "local_path": str(local_path) if local_path else None,
                 "cloud_info": cloud_info,
-                "storage_tier": storage_tier.value,
+                "storage_tier": StorageTier.HOT.value,
                 "created_at": datetime.now().isoformat(),
                 "last_accessed": datetime.now().isoformat(),
                 "access_count": 0,
             }
+            self.lifecycle.register(doc_id, mapping)
 
             # Apply storage tier policy
             await self._apply_storage_tier_policy(doc_id, storage_tier)
@@ -148,7 +155,7 @@ class CloudStorageManager:
                 "storage_id": storage_id,
                 "local_path": str(local_path) if local_path else None,
                 "cloud_url": cloud_info.get("url") if cloud_info else None,
-                "storage_tier": storage_tier.value,
+                "storage_tier": self.storage_mappings[doc_id]["storage_tier"],
             }
 
         except Exception as e:
@@ -173,9 +180,19 @@ class CloudStorageManager:
 
             mapping = self.storage_mappings[doc_id]
 
+            # Demoted evidence is read from its blob and promoted back to hot
+            if mapping.get("blob_key"):
+                source = mapping["storage_tier"]
+                content = await self.lifecycle.read(doc_id)
+                return {
+                    "success": True,
+                    "content": content,
+                    "source": f"blob_{source}",
+                    "storage_tier": mapping.get("storage_tier"),
+                }
+
             # Update access tracking
-            mapping["last_accessed"] = datetime.now().isoformat()
-            mapping["access_count"] += 1
+            self.lifecycle.touch(doc_id)
 
             # Try local storage first (hot tier)
             if mapping.get("local_path"):
@@ -285,7 +302,7 @@ class CloudStorageManager:
             logger.error(f"Error caching locally: {e}")
 
     async def _apply_storage_tier_policy(self, doc_id: str, storage_tier: StorageTier):
-        """Apply storage tier policy to document"""
+        """Apply storage tier policy to document, moving it into the requested tier"""
         try:
             policy = self.tier_policies[storage_tier]
 
@@ -294,8 +311,12 @@ class CloudStorageManager:
 
             # Update mapping with policy info
             if doc_id in self.storage_mappings:
-                self.storage_mappings[doc_id]["retention_date"] = retention_date.isoformat()
-                self.storage_mappings[doc_id]["tier_policy"] = policy
+                mapping = self.storage_mappings[doc_id]
+                mapping["retention_date"] = retention_date.isoformat()
+                if mapping.get("local_path") and storage_tier is not StorageTier.HOT:
+                    await self.lifecycle.move(doc_id, storage_tier)
+                else:
+                    self.lifecycle.save()
 
         except Exception as e:
             logger.error(f"Error applying storage tier policy: {e}")
@@ -327,23 +348,53 @@ class CloudStorageManager:
             "uploaded_at": datetime.now().isoformat(),
         }
 
-    async def cleanup_temp_files(self):
-        """Clean up temporary files based on retention policy"""
+    async def delete_evidence(self, storage_id: str) -> bool:
+        """Delete a stored document's local copy, blob and vector entry"""
+        doc_id = next(
+            (d for d, m in self.storage_mappings.items() if m.get("storage_id") == storage_id),
+            None,
+        )
+        if doc_id is None:
+            return False
+        await self.lifecycle.unregister(doc_id)
+        await self.vector_store.delete_document(doc_id)
+        return True
+
+    async def cleanup_temp_files(self) -> Dict[str, Any]:
+        """Free local storage by running a tier lifecycle pass
+
+        Idle or over-budget hot files are demoted to compressed blobs rather
+        than deleted, so the local copy is never the only one lost.
+        """
         try:
-            cutoff_date = datetime.now() - timedelta(days=self.temp_file_retention_days)
-
-            for mapping in self.storage_mappings.values():
-                if mapping.get("local_path"):
-                    local_path = Path(mapping["local_path"])
-                    if (
-                        local_path.exists()
-                        and datetime.fromtimestamp(local_path.stat().st_mtime) < cutoff_date
-                    ):
-                        local_path.unlink()
-                        logger.info(f"Cleaned up temp file: {local_path}")
-
+            return await self.lifecycle.run_once()
         except Exception as e:
             logger.error(f"Error during temp file cleanup: {e}")
+            return {"error": str(e)}
+
+    def start_lifecycle(self, interval_hours: Optional[float] = None):
+        """Start background tier lifecycle passes on a dedicated loop thread
+
+        Callers each run short-lived loops (one per request or job), so the
+        passes get a loop of their own that outlives them.
+        """
+        hours = interval_hours or self.tier_policies[StorageTier.HOT]["sync_interval_hours"]
+        if self._lifecycle_loop is None:
+            self._lifecycle_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=self._lifecycle_loop.run_forever,
+                name="storage-lifecycle",
+                daemon=True,
+            ).start()
+        self._lifecycle_loop.call_soon_threadsafe(self.lifecycle.start, hours * 3600)
+
+    async def stop_lifecycle(self):
+        """Stop background lifecycle passes and persist the storage mappings"""
+        if self._lifecycle_loop is None:
+            return
+        loop, self._lifecycle_loop = self._lifecycle_loop, None
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self.lifecycle.stop(), loop))
+        loop.call_soon_threadsafe(loop.stop)
 
     def get_storage_stats(self) -> Dict[str, Any]:
         """Get comprehensive storage statistics"""
@@ -368,6 +419,8 @@ class CloudStorageManager:
                 if mapping.get("cloud_info"):
                     stats["cloud_stored_files"] += 1
 
+            stats["tier_usage_bytes"] = self.lifecycle.tier_usage()
+            stats["lifecycle"] = dict(self.lifecycle.stats)
             return stats
 
         except Exception as e:
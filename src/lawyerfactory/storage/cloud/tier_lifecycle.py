@@ -0,0 +1,392 @@
+"""
+Storage Tier Lifecycle Engine for LawyerFactory Evidence
+
+Moves evidence between the HOT, WARM and COLD storage tiers based on how it is
+actually used:
+
+- HOT evidence is a plain file in local temporary storage
+- WARM evidence is zlib-compressed under the ``warm/`` blob prefix
+- COLD evidence is lzma-compressed under the ``cold/`` blob prefix
+
+A periodic pass demotes evidence that has gone idle and has a low access score
+(access count divided by days since last access), then enforces each tier's
+``max_size_gb`` by demoting the lowest-scoring evidence first. Reading WARM or
+COLD evidence promotes it back to HOT. The doc_id -> placement mappings are
+persisted as JSON, so tiering survives restarts.
+
+LocalBlobStore is a filesystem stand-in for the S3 bucket; any object with the
+same put/get/delete/exists methods can be used instead.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+import json
+import logging
+import lzma
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import zlib
+
+logger = logging.getLogger(__name__)
+
+GIB = 1024**3
+
+
+class StorageTier(Enum):
+    """Storage tier definitions"""
+
+    HOT = "hot"  # Frequently accessed, local storage
+    WARM = "warm"  # Occasionally accessed, fast cloud storage
+    COLD = "cold"  # Rarely accessed, archival storage
+
+
+TIER_ORDER = (StorageTier.HOT, StorageTier.WARM, StorageTier.COLD)
+TIER_CODECS = {StorageTier.HOT: "raw", StorageTier.WARM: "zlib", StorageTier.COLD: "lzma"}
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec == "zlib":
+        return zlib.compress(data, 6)
+    if codec == "lzma":
+        return lzma.compress(data, preset=6)
+    return data
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zlib":
+        return zlib.decompress(data)
+    if codec == "lzma":
+        return lzma.decompress(data)
+    return data
+
+
+def access_score(mapping: Dict[str, Any], now: datetime) -> float:
+    """Access count discounted by days since last access; higher is hotter"""
+    last_accessed = datetime.fromisoformat(mapping.get("last_accessed") or mapping["created_at"])
+    idle_days = max(0.0, (now - last_accessed).total_seconds() / 86400)
+    return mapping.get("access_count", 0) / (1.0 + idle_days)
+
+
+def idle_days(mapping: Dict[str, Any], now: datetime) -> float:
+    last_accessed = datetime.fromisoformat(mapping.get("last_accessed") or mapping["created_at"])
+    return (now - last_accessed).total_seconds() / 86400
+
+
+def is_placed(mapping: Dict[str, Any]) -> bool:
+    """Whether the lifecycle holds a copy (local file or blob) it can move"""
+    return bool(mapping.get("local_path") or mapping.get("blob_key"))
+
+
+class LocalBlobStore:
+    """Filesystem stand-in for S3: each key is a file under ``root``"""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if self.root.resolve() not in path.parents:
+            raise ValueError(f"Blob key escapes the store: {key}")
+        return path
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def get(self, key: str) -> bytes:
+        return self._path(key).read_bytes()
+
+    def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+
+@dataclass
+class TierMove:
+    doc_id: str
+    source: StorageTier
+    target: StorageTier
+    reason: str  # "idle", "size" or "access"
+
+
+class TierLifecycleEngine:
+    """Plans and applies tier moves for the mapped evidence documents"""
+
+    def __init__(
+        self,
+        tier_policies: Dict[StorageTier, Dict[str, Any]],
+        hot_dir: Path,
+        blob_store: LocalBlobStore,
+        mapping_path: Path,
+    ):
+        self.tier_policies = tier_policies
+        self.hot_dir = Path(hot_dir)
+        self.blob_store = blob_store
+        self.mapping_path = Path(mapping_path)
+        self.mappings: Dict[str, Dict[str, Any]] = self._load()
+        self.stats = {"passes": 0, "demoted": 0, "promoted": 0, "failed": 0}
+        # Created on first use so the lock belongs to the loop that awaits it
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.mapping_path.exists():
+            return {}
+        try:
+            with open(self.mapping_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load storage mappings from {self.mapping_path}: {e}")
+            return {}
+
+    def _loop_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def save(self) -> None:
+        self.mapping_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.mapping_path.with_name(f"{self.mapping_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.mappings, f, indent=2)
+        os.replace(tmp_path, self.mapping_path)
+        self._dirty = False
+
+    def register(self, doc_id: str, mapping: Dict[str, Any]) -> None:
+        """Track a newly stored HOT document
+
+        A document without a local copy is tracked with zero size and is never
+        planned for a move.
+        """
+        local_path = Path(mapping["local_path"]) if mapping.get("local_path") else None
+        size = local_path.stat().st_size if local_path else 0
+        mapping.update(
+            {
+                "local_name": local_path.name if local_path else None,
+                "blob_key": None,
+                "codec": TIER_CODECS[StorageTier.HOT],
+                "size_bytes": size,
+                "content_bytes": size,
+                "tier_changed_at": datetime.now().isoformat(),
+            }
+        )
+        self.mappings[doc_id] = mapping
+        self.save()
+
+    def touch(self, doc_id: str) -> Dict[str, Any]:
+        mapping = self.mappings[doc_id]
+        mapping["last_accessed"] = datetime.now().isoformat()
+        mapping["access_count"] = mapping.get("access_count", 0) + 1
+        self._dirty = True
+        return mapping
+
+    def tier_usage(self) -> Dict[str, int]:
+        usage = {tier.value: 0 for tier in TIER_ORDER}
+        for mapping in self.mappings.values():
+            usage[mapping["storage_tier"]] += mapping.get("size_bytes", 0)
+        return usage
+
+    def plan(self, now: Optional[datetime] = None) -> List[TierMove]:
+        """Moves needed to satisfy the idle and size policies, coldest first"""
+        now = now or datetime.now()
+        current = {
+            doc_id: StorageTier(m["storage_tier"])
+            for doc_id, m in self.mappings.items()
+            if is_placed(m)
+        }
+        target = dict(current)
+        reasons: Dict[str, str] = {}
+
+        for doc_id, tier in current.items():
+            mapping = self.mappings[doc_id]
+            policy = self.tier_policies[tier]
+            after = policy.get("demote_after_idle_days")
+            if (
+                tier is not TIER_ORDER[-1]
+                and after is not None
+                and idle_days(mapping, now) >= after
+                and access_score(mapping, now) < policy.get("demote_below_score", 1.0)
+            ):
+                target[doc_id] = TIER_ORDER[TIER_ORDER.index(tier) + 1]
+                reasons[doc_id] = "idle"
+
+        # Demoted documents are counted at their uncompressed size against the
+        # lower tier, which can only overestimate its usage
+        for index, tier in enumerate(TIER_ORDER):
+            members = [doc_id for doc_id, t in target.items() if t is tier]
+            usage = sum(
+                self.mappings[d]["size_bytes" if current[d] is tier else "content_bytes"]
+                for d in members
+            )
+            limit = self.tier_policies[tier]["max_size_gb"] * GIB
+            if usage <= limit:
+                continue
+            if tier is TIER_ORDER[-1]:
+                logger.warning(
+                    f"{tier.value} tier holds {usage} bytes, over its {limit:.0f} byte limit"
+                )
+                continue
+            members.sort(key=lambda d: access_score(self.mappings[d], now))
+            for doc_id in members:
+                if usage <= limit:
+                    break
+                usage -= self.mappings[doc_id][
+                    "size_bytes" if current[doc_id] is tier else "content_bytes"
+                ]
+                target[doc_id] = TIER_ORDER[index + 1]
+                reasons.setdefault(doc_id, "size")
+
+        moves = [
+            TierMove(doc_id, current[doc_id], target[doc_id], reasons[doc_id])
+            for doc_id in target
+            if target[doc_id] is not current[doc_id]
+        ]
+        moves.sort(key=lambda move: access_score(self.mappings[move.doc_id], now))
+        return moves
+
+    def _read_sync(self, mapping: Dict[str, Any]) -> bytes:
+        if mapping["storage_tier"] == StorageTier.HOT.value:
+            return Path(mapping["local_path"]).read_bytes()
+        return decompress(self.blob_store.get(mapping["blob_key"]), mapping["codec"])
+
+    def _move_sync(self, doc_id: str, target: StorageTier, data: Optional[bytes] = None) -> None:
+        mapping = self.mappings[doc_id]
+        if data is None:
+            data = self._read_sync(mapping)
+        old_local, old_key = mapping.get("local_path"), mapping.get("blob_key")
+        codec = TIER_CODECS[target]
+
+        # Write the new copy before removing the old one
+        if target is StorageTier.HOT:
+            local_name = mapping.get("local_name") or f"{mapping['storage_id']}.txt"
+            local_path = self.hot_dir / local_name
+            local_path.write_bytes(data)
+            mapping.update(local_path=str(local_path), blob_key=None, size_bytes=len(data))
+        else:
+            key = f"{target.value}/{mapping['storage_id']}"
+            packed = compress(data, codec)
+            self.blob_store.put(key, packed)
+            mapping.update(local_path=None, blob_key=key, size_bytes=len(packed))
+
+        if old_local and old_local != mapping["local_path"]:
+            Path(old_local).unlink(missing_ok=True)
+        if old_key and old_key != mapping["blob_key"]:
+            self.blob_store.delete(old_key)
+
+        mapping.update(
+            storage_tier=target.value,
+            codec=codec,
+            content_bytes=len(data),
+            tier_changed_at=datetime.now().isoformat(),
+        )
+
+    async def move(self, doc_id: str, target: StorageTier) -> None:
+        async with self._loop_lock():
+            await asyncio.to_thread(self._move_sync, doc_id, target)
+            self.save()
+
+    def _unregister_sync(self, doc_id: str) -> None:
+        mapping = self.mappings.pop(doc_id)
+        if mapping.get("local_path"):
+            Path(mapping["local_path"]).unlink(missing_ok=True)
+        if mapping.get("blob_key"):
+            self.blob_store.delete(mapping["blob_key"])
+
+    async def unregister(self, doc_id: str) -> bool:
+        """Stop tracking a document and delete its local copy or blob"""
+        async with self._loop_lock():
+            if doc_id not in self.mappings:
+                return False
+            await asyncio.to_thread(self._unregister_sync, doc_id)
+            self.save()
+            return True
+
+    async def read(self, doc_id: str, promote: bool = True) -> str:
+        """Read a document's content, promoting it to HOT if it was demoted"""
+        async with self._loop_lock():
+            mapping = self.touch(doc_id)
+            data = await asyncio.to_thread(self._read_sync, mapping)
+            if promote and mapping["storage_tier"] != StorageTier.HOT.value:
+                source = mapping["storage_tier"]
+                await asyncio.to_thread(self._move_sync, doc_id, StorageTier.HOT, data)
+                self.stats["promoted"] += 1
+                self.save()
+                logger.info(f"Promoted {doc_id} from {source} to hot on access")
+            return data.decode("utf-8")
+
+    async def run_once(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """One lifecycle pass: plan, apply and persist"""
+        async with self._loop_lock():
+            moves = self.plan(now)
+            applied = 0
+            for move in moves:
+                try:
+                    await asyncio.to_thread(self._move_sync, move.doc_id, move.target)
+                    applied += 1
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    logger.error(
+                        f"Failed to move {move.doc_id} from {move.source.value} "
+                        f"to {move.target.value}: {e}"
+                    )
+            self.stats["passes"] += 1
+            self.stats["demoted"] += applied
+            if moves or self._dirty:
+                self.save()
+
+        if moves:
+            logger.info(f"Storage lifecycle pass moved {applied}/{len(moves)} documents")
+        return {
+            "planned": len(moves),
+            "applied": applied,
+            "moves": [
+                {
+                    "doc_id": m.doc_id,
+                    "from": m.source.value,
+                    "to": m.target.value,
+                    "reason": m.reason,
+                }
+                for m in moves
+            ],
+            "tier_usage": self.tier_usage(),
+        }
+
+    def start(self, interval_seconds: float) -> None:
+        """Run lifecycle passes in the background on the current event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_forever(interval_seconds))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._dirty:
+            self.save()
+
+    async def _run_forever(self, interval_seconds: float) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Storage lifecycle pass failed: {e}")
+            await asyncio.sleep(interval_seconds)
@@ -0,0 +1,330 @@
+"""
+Indexed ObjectID Registry for the Enhanced Unified Storage API
+
+Stores evidence by content hash in SQLite. Each distinct sha256 of uploaded
+bytes gets one ``contents`` row holding the per-tier storage results (blob,
+vectors, evidence table entry). Every upload of those bytes gets its own
+ObjectID in ``objects`` and increments the content's reference count.
+Re-uploading identical bytes is a handful of indexed lookups and inserts, with
+no new tier writes, and the registry is never rewritten as a whole.
+
+Vector and evidence ids are indexed back to their content, so search results
+resolve to ObjectIDs without scanning the registry. One content can back
+ObjectIDs from several cases or phases, so lookups by tier id return every
+referencing ObjectID, optionally filtered by case, phase and tags.
+"""
+
+from datetime import datetime
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contents (
+    content_hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    storage_results TEXT NOT NULL,
+    ref_count INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS objects (
+    object_id TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL REFERENCES contents(content_hash),
+    metadata TEXT NOT NULL,
+    source_phase TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS objects_by_content ON objects(content_hash, created_at);
+CREATE TABLE IF NOT EXISTS tier_refs (
+    tier TEXT NOT NULL,
+    ref_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL REFERENCES contents(content_hash),
+    PRIMARY KEY (tier, ref_id)
+);
+"""
+
+
+def _tier_refs(storage_results: dict[str, Any]) -> list[tuple[str, str]]:
+    refs = [("vector", vid) for vid in storage_results.get("vector", {}).get("vector_ids", [])]
+    evidence_id = storage_results.get("evidence", {}).get("evidence_id")
+    if evidence_id:
+        refs.append(("evidence", evidence_id))
+    return refs
+
+
+def _object_tags(metadata: dict[str, Any]) -> set[str]:
+    tags = metadata.get("custom_metadata", {}).get("tags") or []
+    if isinstance(tags, str):
+        tags = tags.split(",")
+    return {str(tag).strip().lower() for tag in tags if str(tag).strip()}
+
+
+def _matches(
+    row: sqlite3.Row,
+    case_id: str | None,
+    source_phase: str | None,
+    tags: list[str] | None,
+) -> bool:
+    if source_phase is not None and row["source_phase"] != source_phase:
+        return False
+    if case_id is None and not tags:
+        return True
+    metadata = json.loads(row["metadata"])
+    if case_id is not None:
+        custom = metadata.get("custom_metadata", {})
+        if custom.get("case_id", metadata.get("case_id")) != case_id:
+            return False
+    if tags and not {tag.strip().lower() for tag in tags} <= _object_tags(metadata):
+        return False
+    return True
+
+
+class ObjectRegistry:
+    """SQLite-backed ObjectID registry with content-hash deduplication
+
+    Supports the read-only mapping protocol over ObjectIDs (``in``, ``[]``,
+    ``len``, ``items``), returning entries in the legacy JSON registry shape.
+    """
+
+    def __init__(self, db_path: Path, legacy_json_path: Path | None = None):
+        self.db_path = Path(db_path)
+        is_new = not self.db_path.exists()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(_SCHEMA)
+        if is_new and legacy_json_path is not None and Path(legacy_json_path).exists():
+            self._import_legacy(Path(legacy_json_path))
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _import_legacy(self, path: Path) -> None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load legacy object registry {path}: {e}")
+            return
+        # Legacy entries have no content hash; each keeps a private content row
+        for object_id, entry in entries.items():
+            metadata = entry.get("metadata", {})
+            self.add_content(
+                f"legacy:{object_id}",
+                metadata.get("file_size", 0),
+                entry.get("storage_results", {}),
+            )
+            self.add_object(
+                object_id, f"legacy:{object_id}", metadata, entry.get("source_phase")
+            )
+        logger.info(f"Imported {len(entries)} objects from legacy registry {path}")
+
+    # Writes
+
+    def add_content(self, content_hash: str, size: int, storage_results: dict[str, Any]) -> None:
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO contents (content_hash, size, storage_results, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    content_hash,
+                    size,
+                    json.dumps(storage_results, default=str),
+                    datetime.now().isoformat(),
+                ),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO tier_refs (tier, ref_id, content_hash) VALUES (?, ?, ?)",
+                [(tier, ref_id, content_hash) for tier, ref_id in _tier_refs(storage_results)],
+            )
+
+    def update_storage_results(self, content_hash: str, storage_results: dict[str, Any]) -> None:
+        """Replace a content's tier results, e.g. after retrying failed tiers"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE contents SET storage_results = ? WHERE content_hash = ?",
+                (json.dumps(storage_results, default=str), content_hash),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO tier_refs (tier, ref_id, content_hash) VALUES (?, ?, ?)",
+                [(tier, ref_id, content_hash) for tier, ref_id in _tier_refs(storage_results)],
+            )
+
+    def add_object(
+        self,
+        object_id: str,
+        content_hash: str,
+        metadata: dict[str, Any],
+        source_phase: str | None,
+    ) -> int:
+        """Register an ObjectID for stored content; returns the new reference count"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO objects (object_id, content_hash, metadata, source_phase, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    object_id,
+                    content_hash,
+                    json.dumps(metadata, default=str),
+                    source_phase,
+                    datetime.now().isoformat(),
+                ),
+            )
+            self.conn.execute(
+                "UPDATE contents SET ref_count = ref_count + 1 WHERE content_hash = ?",
+                (content_hash,),
+            )
+            row = self.conn.execute(
+                "SELECT ref_count FROM contents WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+        return row["ref_count"]
+
+    def release(self, object_id: str) -> dict[str, Any] | None:
+        """Drop an ObjectID; returns its content row, with ``ref_count`` 0 once unreferenced
+
+        Unreferenced content rows and their tier refs are removed, and the
+        caller is responsible for deleting the stored content itself.
+        """
+        with self._lock, self.conn:
+            row = self.conn.execute(
+                "SELECT content_hash FROM objects WHERE object_id = ?", (object_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            content_hash = row["content_hash"]
+            self.conn.execute("DELETE FROM objects WHERE object_id = ?", (object_id,))
+            self.conn.execute(
+                "UPDATE contents SET ref_count = ref_count - 1 WHERE content_hash = ?",
+                (content_hash,),
+            )
+            content = self.conn.execute(
+                "SELECT * FROM contents WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+            if content["ref_count"] <= 0:
+                self.conn.execute("DELETE FROM tier_refs WHERE content_hash = ?", (content_hash,))
+                self.conn.execute("DELETE FROM contents WHERE content_hash = ?", (content_hash,))
+        return self._content_dict(content)
+
+    # Lookups
+
+    @staticmethod
+    def _content_dict(row: sqlite3.Row) -> dict[str, Any]:
+        return {
+            "content_hash": row["content_hash"],
+            "size": row["size"],
+            "storage_results": json.loads(row["storage_results"]),
+            "ref_count": row["ref_count"],
+            "created_at": row["created_at"],
+        }
+
+    def get_content(self, content_hash: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT * FROM contents WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+        return self._content_dict(row) if row else None
+
+    def objects_for_ref(
+        self,
+        tier: str,
+        ref_id: str,
+        case_id: str | None = None,
+        source_phase: str | None = None,
+        tags: list[str] | None = None,
+    ) -> list[str]:
+        """ObjectIDs, oldest first, whose content owns the given vector or evidence id
+
+        Only objects from ``case_id`` and ``source_phase`` that carry all of
+        ``tags`` are returned, when given.
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT o.object_id, o.metadata, o.source_phase FROM tier_refs r "
+                "JOIN objects o ON o.content_hash = r.content_hash "
+                "WHERE r.tier = ? AND r.ref_id = ? ORDER BY o.created_at",
+                (tier, ref_id),
+            ).fetchall()
+        return [row["object_id"] for row in rows if _matches(row, case_id, source_phase, tags)]
+
+    def object_for_ref(self, tier: str, ref_id: str, **filters) -> str | None:
+        """Earliest matching ObjectID for a vector or evidence id; see ``objects_for_ref``"""
+        object_ids = self.objects_for_ref(tier, ref_id, **filters)
+        return object_ids[0] if object_ids else None
+
+    def objects_for_content(self, content_hash: str) -> list[str]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT object_id FROM objects WHERE content_hash = ? ORDER BY created_at",
+                (content_hash,),
+            ).fetchall()
+        return [row["object_id"] for row in rows]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT COUNT(*) AS contents, COALESCE(SUM(size), 0) AS stored_bytes, "
+                "COALESCE(SUM(size * ref_count), 0) AS logical_bytes FROM contents"
+            ).fetchone()
+            objects = self.conn.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+        return {"objects": objects, **dict(row)}
+
+    # Read-only mapping protocol over ObjectIDs
+
+    _ENTRY_QUERY = (
+        "SELECT o.object_id, o.metadata, o.source_phase, o.created_at, o.content_hash, "
+        "c.storage_results, c.ref_count FROM objects o "
+        "JOIN contents c ON c.content_hash = o.content_hash"
+    )
+
+    @staticmethod
+    def _entry(row: sqlite3.Row) -> dict[str, Any]:
+        return {
+            "metadata": json.loads(row["metadata"]),
+            "storage_results": json.loads(row["storage_results"]),
+            "created_at": row["created_at"],
+            "source_phase": row["source_phase"],
+            "content_hash": row["content_hash"],
+            "ref_count": row["ref_count"],
+        }
+
+    def get(self, object_id: str, default=None) -> dict[str, Any] | None:
+        with self._lock:
+            row = self.conn.execute(
+                f"{self._ENTRY_QUERY} WHERE o.object_id = ?", (object_id,)
+            ).fetchone()
+        return self._entry(row) if row else default
+
+    def __getitem__(self, object_id: str) -> dict[str, Any]:
+        entry = self.get(object_id)
+        if entry is None:
+            raise KeyError(object_id)
+        return entry
+
+    def __contains__(self, object_id: object) -> bool:
+        with self._lock:
+            return (
+                self.conn.execute(
+                    "SELECT 1 FROM objects WHERE object_id = ?", (object_id,)
+                ).fetchone()
+                is not None
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+
+    def items(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        with self._lock:
+            rows = self.conn.execute(f"{self._ENTRY_QUERY} ORDER BY o.created_at").fetchall()
+        for row in rows:
+            yield row["object_id"], self._entry(row)
+
+    def keys(self) -> list[str]:
+        return [object_id for object_id, _ in self.items()]
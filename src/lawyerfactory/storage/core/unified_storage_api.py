@@ -4,18 +4,33 @@ Enhanced Unified Storage API for LawyerFactory - Production Implementation
 This module provides the single, unified interface for all storage operations across LawyerFactory.
 Coordinates three storage tiers: S3 Raw Storage, Evidence Table, Vector Store with ObjectID tracking.
 Integrates with existing evidence ingestion pipeline and claims matrix system.
+
+Uploads are deduplicated by content hash: identical bytes are stored once in
+each tier and every upload gets its own reference-counted ObjectID. A duplicate
+upload retries any tier the first upload failed to write, and releasing the
+last reference deletes the content from every tier. Tier writes
+and searches fan out concurrently under per-tier timeouts, and multi-tier
+search results are merged with reciprocal-rank fusion.
 """
 
-import json
+import asyncio
+import hashlib
 import logging
+import time
 import uuid
+import weakref
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from .object_registry import ObjectRegistry
+
 logger = logging.getLogger(__name__)
 
+# Reciprocal-rank fusion constant; damps the weight of the top few ranks
+RRF_K = 60
+
 # Import existing storage components
 try:
     from .cloud.cloud_storage_integration import CloudStorageManager, StorageTier
@@ -42,6 +57,17 @@ class StorageResult:
     vector_ids: list[str] = field(default_factory=list)
     error: str | None = None
     processing_time: float = 0.0
+    content_hash: str | None = None
+    deduplicated: bool = False
+    tier_latencies: dict[str, float] = field(default_factory=dict)
+
+
+class SearchResults(list):
+    """Ranked search hits, plus how long each searched tier took for this call"""
+
+    def __init__(self, hits=(), tier_latencies: dict[str, float] | None = None):
+        super().__init__(hits)
+        self.tier_latencies = tier_latencies or {}
 
 
 @dataclass
@@ -66,18 +92,29 @@ class EnhancedUnifiedStorageAPI:
     Integrates with existing evidence ingestion pipeline and sophisticated storage components.
     """
 
-    def __init__(self, storage_path: str = "data/storage"):
+    def __init__(self, storage_path: str = "data/storage", tier_timeout: float = 30.0):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
+        # Per-tier timeout in seconds for writes and searches
+        self.tier_timeouts = {"vector": tier_timeout, "cloud": tier_timeout, "evidence": tier_timeout}
+
         # Initialize storage tier managers
         self.vector_store_manager = None
         self.cloud_storage_manager = None
         self.evidence_table = None
 
-        # ObjectID registry for tracking across all tiers
-        self.object_registry_path = self.storage_path / "object_registry.json"
-        self.object_registry = self._load_object_registry()
+        # ObjectID registry for tracking across all tiers, indexed by content hash
+        self.object_registry_path = self.storage_path / "object_registry.db"
+        self.object_registry = ObjectRegistry(
+            self.object_registry_path,
+            legacy_json_path=self.storage_path / "object_registry.json",
+        )
+        # One in-flight store per content hash, so concurrent duplicate uploads
+        # wait for the first instead of storing the bytes twice
+        self._content_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
 
         # Initialize storage managers if available
         if STORAGE_COMPONENTS_AVAILABLE:
@@ -98,23 +135,15 @@ class EnhancedUnifiedStorageAPI:
 
         logger.info("Enhanced Unified Storage API initialized")
 
-    def _load_object_registry(self) -> dict[str, dict[str, Any]]:
-        """Load the object registry from disk"""
-        if self.object_registry_path.exists():
-            try:
-                with open(self.object_registry_path, encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load object registry: {e}")
-        return {}
+    def start_lifecycle(self) -> None:
+        """Start background tier lifecycle passes for cloud-backed evidence"""
+        if self.cloud_storage_manager:
+            self.cloud_storage_manager.start_lifecycle()
 
-    def _save_object_registry(self):
-        """Save the object registry to disk"""
-        try:
-            with open(self.object_registry_path, "w", encoding="utf-8") as f:
-                json.dump(self.object_registry, f, indent=2, ensure_ascii=False, default=str)
-        except Exception as e:
-            logger.error(f"Failed to save object registry: {e}")
+    async def close(self) -> None:
+        """Stop background lifecycle passes"""
+        if self.cloud_storage_manager:
+            await self.cloud_storage_manager.stop_lifecycle()
 
     def register_storage_client(self, client_type: str, client_instance):
         """Register a storage client for integration"""
@@ -143,88 +172,170 @@ class EnhancedUnifiedStorageAPI:
         """
         start_time = datetime.now()
         object_id = str(uuid.uuid4())
+        content_hash = hashlib.sha256(file_content).hexdigest()
+        object_metadata = {
+            "object_id": object_id,
+            "original_filename": filename,
+            "content_type": self._guess_content_type(filename),
+            "file_size": len(file_content),
+            "upload_timestamp": start_time.isoformat(),
+            "source_phase": source_phase,
+            "custom_metadata": metadata or {},
+            "content_hash": content_hash,
+        }
 
-        try:
-            # Create evidence metadata
-            evidence_metadata = EvidenceMetadata(
-                object_id=object_id,
-                original_filename=filename,
-                content_type=self._guess_content_type(filename),
-                file_size=len(file_content),
-                upload_timestamp=datetime.now(),
-                source_phase=source_phase,
-                custom_metadata=metadata or {},
-            )
-
-            # Convert content to string for processing
-            try:
-                content_str = file_content.decode("utf-8", errors="replace")
-            except:
-                content_str = f"[Binary content: {filename}, {len(file_content)} bytes]"
-
-            # Process through all storage tiers
-            storage_results = {}
+        lock = self._content_locks.get(content_hash)
+        if lock is None:
+            lock = self._content_locks[content_hash] = asyncio.Lock()
 
-            # 1. Vector Store Integration
-            if self.vector_store_manager:
+        async with lock:
+            stored = self.object_registry.get_content(content_hash)
+            if stored is not None:
+                # Identical bytes are already stored: only add a reference, after
+                # retrying any tier the earlier upload failed to write
+                storage_results = stored["storage_results"]
                 try:
-                    vector_result = await self._store_in_vector_store(
-                        content_str, evidence_metadata
+                    retry = self._unwritten_tiers(storage_results)
+                    if retry:
+                        writes = self._tier_writes(
+                            file_content, filename, metadata, source_phase, object_id, retry
+                        )
+                        retried, _ = await self._fan_out(writes, lambda message: {"error": message})
+                        storage_results = {**storage_results, **retried}
+                        self.object_registry.update_storage_results(content_hash, storage_results)
+                        logger.info(f"Retried {', '.join(retry)} tiers for {content_hash[:12]}")
+                    ref_count = self.object_registry.add_object(
+                        object_id, content_hash, object_metadata, source_phase
                     )
-                    storage_results["vector"] = vector_result
                 except Exception as e:
-                    logger.error(f"Vector store error: {e}")
-                    storage_results["vector"] = {"error": str(e)}
-
-            # 2. Cloud Storage Integration
-            if self.cloud_storage_manager:
-                try:
-                    cloud_result = await self._store_in_cloud_storage(
-                        file_content, evidence_metadata
+                    logger.error(f"Failed to register duplicate evidence {object_id}: {e}")
+                    return StorageResult(
+                        success=False,
+                        object_id=object_id,
+                        error=str(e),
+                        processing_time=(datetime.now() - start_time).total_seconds(),
+                        content_hash=content_hash,
                     )
-                    storage_results["cloud"] = cloud_result
-                except Exception as e:
-                    logger.error(f"Cloud storage error: {e}")
-                    storage_results["cloud"] = {"error": str(e)}
+                logger.info(
+                    f"Deduplicated upload {filename} as {object_id} "
+                    f"({ref_count} references to {content_hash[:12]})"
+                )
+                return self._storage_result(
+                    object_id, content_hash, storage_results, start_time, True
+                )
+
+            return await self._store_new_content(
+                file_content,
+                filename,
+                metadata,
+                source_phase,
+                object_id,
+                content_hash,
+                object_metadata,
+                start_time,
+            )
 
-            # 3. Evidence Table Integration
-            if self.evidence_table:
-                try:
-                    evidence_result = await self._store_in_evidence_table(
-                        content_str, evidence_metadata
-                    )
-                    storage_results["evidence"] = evidence_result
-                except Exception as e:
-                    logger.error(f"Evidence table error: {e}")
-                    storage_results["evidence"] = {"error": str(e)}
-
-            # Register the object
-            self.object_registry[object_id] = {
-                "metadata": {
-                    "object_id": object_id,
-                    "original_filename": filename,
-                    "content_type": evidence_metadata.content_type,
-                    "file_size": evidence_metadata.file_size,
-                    "upload_timestamp": evidence_metadata.upload_timestamp.isoformat(),
-                    "source_phase": source_phase,
-                    "custom_metadata": metadata or {},
-                },
-                "storage_results": storage_results,
-                "created_at": datetime.now().isoformat(),
-                "source_phase": source_phase,
-            }
-            self._save_object_registry()
+    def _storage_result(
+        self,
+        object_id: str,
+        content_hash: str,
+        storage_results: dict[str, Any],
+        start_time: datetime,
+        deduplicated: bool,
+    ) -> StorageResult:
+        return StorageResult(
+            success=True,
+            object_id=object_id,
+            s3_url=storage_results.get("cloud", {}).get("url"),
+            evidence_id=storage_results.get("evidence", {}).get("evidence_id"),
+            vector_ids=storage_results.get("vector", {}).get("vector_ids", []),
+            processing_time=(datetime.now() - start_time).total_seconds(),
+            content_hash=content_hash,
+            deduplicated=deduplicated,
+        )
+
+    def _configured_tiers(self) -> list[str]:
+        managers = {
+            "vector": self.vector_store_manager,
+            "cloud": self.cloud_storage_manager,
+            "evidence": self.evidence_table,
+        }
+        return [tier for tier, manager in managers.items() if manager]
 
-            processing_time = (datetime.now() - start_time).total_seconds()
+    def _unwritten_tiers(self, storage_results: dict[str, Any]) -> list[str]:
+        """Configured tiers without a successful write in ``storage_results``"""
+        return [
+            tier
+            for tier in self._configured_tiers()
+            if tier not in storage_results or "error" in storage_results[tier]
+        ]
 
-            return StorageResult(
-                success=True,
-                object_id=object_id,
-                s3_url=storage_results.get("cloud", {}).get("url"),
-                evidence_id=storage_results.get("evidence", {}).get("evidence_id"),
-                vector_ids=storage_results.get("vector", {}).get("vector_ids", []),
-                processing_time=processing_time,
+    def _tier_writes(
+        self,
+        file_content: bytes,
+        filename: str,
+        metadata: dict[str, Any] | None,
+        source_phase: str,
+        object_id: str,
+        tiers: list[str],
+    ) -> dict[str, Any]:
+        """Tier write coroutines, keyed by tier, for the given tiers"""
+        evidence_metadata = EvidenceMetadata(
+            object_id=object_id,
+            original_filename=filename,
+            content_type=self._guess_content_type(filename),
+            file_size=len(file_content),
+            upload_timestamp=datetime.now(),
+            source_phase=source_phase,
+            custom_metadata=metadata or {},
+        )
+
+        # Convert content to string for processing
+        try:
+            content_str = file_content.decode("utf-8", errors="replace")
+        except:
+            content_str = f"[Binary content: {filename}, {len(file_content)} bytes]"
+
+        writes = {}
+        if "vector" in tiers:
+            writes["vector"] = self._store_in_vector_store(content_str, evidence_metadata)
+        if "cloud" in tiers:
+            writes["cloud"] = self._store_in_cloud_storage(file_content, evidence_metadata)
+        if "evidence" in tiers:
+            writes["evidence"] = self._store_in_evidence_table(content_str, evidence_metadata)
+        return writes
+
+    async def _store_new_content(
+        self,
+        file_content: bytes,
+        filename: str,
+        metadata: dict[str, Any] | None,
+        source_phase: str,
+        object_id: str,
+        content_hash: str,
+        object_metadata: dict[str, Any],
+        start_time: datetime,
+    ) -> StorageResult:
+        """Write content seen for the first time to every storage tier"""
+        try:
+            # Process through all storage tiers concurrently
+            writes = self._tier_writes(
+                file_content, filename, metadata, source_phase, object_id, self._configured_tiers()
+            )
+            storage_results, tier_latencies = await self._fan_out(
+                writes, lambda message: {"error": message}
+            )
+
+            # Register the content and its first object; failed tiers are kept
+            # as errors and retried by the next upload of the same bytes
+            self.object_registry.add_content(content_hash, len(file_content), storage_results)
+            self.object_registry.add_object(object_id, content_hash, object_metadata, source_phase)
+
+            result = self._storage_result(
+                object_id, content_hash, storage_results, start_time, False
             )
+            result.tier_latencies = tier_latencies
+            return result
 
         except Exception as e:
             logger.error(f"Failed to store evidence {object_id}: {e}")
@@ -233,8 +344,78 @@ class EnhancedUnifiedStorageAPI:
                 object_id=object_id,
                 error=str(e),
                 processing_time=(datetime.now() - start_time).total_seconds(),
+                content_hash=content_hash,
             )
 
+    async def _run_tier(self, tier: str, operation, failure) -> tuple[Any, float]:
+        """Await one tier operation under its timeout; failures become ``failure(message)``"""
+        started = time.perf_counter()
+        timeout = self.tier_timeouts.get(tier)
+        try:
+            result = await asyncio.wait_for(operation, timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"{tier} tier timed out after {timeout}s")
+            result = failure(f"{tier} tier timed out after {timeout}s")
+        except Exception as e:
+            logger.error(f"{tier} tier error: {e}")
+            result = failure(str(e))
+        return result, round(time.perf_counter() - started, 4)
+
+    async def _fan_out(self, operations: dict[str, Any], failure) -> tuple[dict, dict]:
+        """Run tier operations concurrently; returns (results, latencies) keyed by tier"""
+        tiers = list(operations)
+        outcomes = await asyncio.gather(
+            *(self._run_tier(tier, operations[tier], failure) for tier in tiers)
+        )
+        results = {tier: outcome[0] for tier, outcome in zip(tiers, outcomes, strict=True)}
+        latencies = {tier: outcome[1] for tier, outcome in zip(tiers, outcomes, strict=True)}
+        return results, latencies
+
+    async def release_evidence(self, object_id: str) -> dict[str, Any]:
+        """
+        Drop one reference to stored evidence
+
+        The content stays in every tier while other ObjectIDs still reference
+        it. With the last reference, the registry entry and the content's
+        vectors, evidence table entry and cloud copy are deleted.
+
+        Returns:
+            Remaining reference count, content hash and any deleted tiers, or an error
+        """
+        content = self.object_registry.release(object_id)
+        if content is None:
+            return {"error": "ObjectID not found"}
+        result = {
+            "object_id": object_id,
+            "content_hash": content["content_hash"],
+            "remaining_references": max(0, content["ref_count"]),
+        }
+        if content["ref_count"] <= 0:
+            logger.info(f"Released last reference to content {content['content_hash'][:12]}")
+            result["deleted_tiers"] = await self._delete_content(content["storage_results"])
+        return result
+
+    async def _delete_content(self, storage_results: dict[str, Any]) -> dict[str, Any]:
+        """Delete unreferenced content from every tier it was written to"""
+        stored = {
+            tier: result for tier, result in storage_results.items() if "error" not in result
+        }
+        deletes = {}
+        if "vector" in stored and self.vector_store_manager:
+            deletes["vector"] = self._delete_from_vector_store(stored["vector"])
+        if "cloud" in stored and self.cloud_storage_manager:
+            deletes["cloud"] = self._delete_from_cloud_storage(stored["cloud"])
+        if "evidence" in stored and self.evidence_table:
+            deletes["evidence"] = self._delete_from_evidence_table(stored["evidence"])
+        results, _ = await self._fan_out(deletes, lambda message: {"error": message})
+        return results
+
+    def get_storage_stats(self) -> dict[str, Any]:
+        """Deduplication statistics: objects, distinct contents and bytes saved"""
+        stats = self.object_registry.stats()
+        stats["bytes_saved"] = stats["logical_bytes"] - stats["stored_bytes"]
+        return stats
+
     async def get_evidence(
         self, object_id: str, target_tier: str | None = None
     ) -> dict[str, Any]:
@@ -288,43 +469,84 @@ class EnhancedUnifiedStorageAPI:
         return result
 
     async def search_evidence(
-        self, query: str, search_tier: str = "vector"
-    ) -> list[dict[str, Any]]:
+        self,
+        query: str,
+        search_tier: str = "vector",
+        case_id: str | None = None,
+        source_phase: str | None = None,
+        tags: list[str] | None = None,
+    ) -> SearchResults:
         """
         Search for evidence across storage tiers
 
         Args:
             query: Search query
             search_tier: Which tier to search in ("vector", "evidence", "all")
+            case_id: Only return ObjectIDs uploaded for this case
+            source_phase: Only return ObjectIDs uploaded in this phase
+            tags: Only return ObjectIDs carrying all of these tags
 
         Returns:
-            List of matching evidence with ObjectIDs
+            List of matching evidence with ObjectIDs, with per-tier latencies
+            in its ``tier_latencies`` attribute
         """
-        results = []
+        filters = {"case_id": case_id, "source_phase": source_phase, "tags": tags}
+        searches = {}
+        if search_tier in ("vector", "all") and self.vector_store_manager:
+            searches["vector"] = self._search_vector_store(query, filters)
+        if search_tier in ("evidence", "all") and self.evidence_table:
+            searches["evidence"] = self._search_evidence_table(query, filters)
 
         try:
-            if search_tier == "vector" and self.vector_store_manager:
-                vector_results = await self._search_vector_store(query)
-                results.extend(vector_results)
-
-            elif search_tier == "evidence" and self.evidence_table:
-                evidence_results = await self._search_evidence_table(query)
-                results.extend(evidence_results)
-
-            elif search_tier == "all":
-                # Search all available tiers
-                if self.vector_store_manager:
-                    vector_results = await self._search_vector_store(query)
-                    results.extend(vector_results)
-
-                if self.evidence_table:
-                    evidence_results = await self._search_evidence_table(query)
-                    results.extend(evidence_results)
-
+            ranked, latencies = await self._fan_out(searches, lambda message: [])
         except Exception as e:
             logger.error(f"Failed to search evidence: {e}")
-
-        return results
+            return SearchResults()
+
+        ranked = {tier: self._dedupe_by_object(results) for tier, results in ranked.items()}
+        if len(ranked) == 1:
+            return SearchResults(next(iter(ranked.values())), latencies)
+        return SearchResults(self._fuse_results(ranked), latencies)
+
+    @staticmethod
+    def _dedupe_by_object(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Keep each ObjectID's best-ranked hit, e.g. when several chunks match"""
+        seen = set()
+        unique = []
+        for result in results:
+            if result["object_id"] not in seen:
+                seen.add(result["object_id"])
+                unique.append(result)
+        return unique
+
+    def _fuse_results(self, ranked: dict[str, list[dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Merge per-tier rankings with reciprocal-rank fusion, one entry per ObjectID
+
+        Each tier's ranking must already hold one entry per ObjectID, so a tier
+        contributes at most once to an ObjectID's score.
+        """
+        merged: dict[str, dict[str, Any]] = {}
+        for tier, results in ranked.items():
+            for rank, result in enumerate(results, 1):
+                entry = merged.get(result["object_id"])
+                if entry is None:
+                    entry = merged[result["object_id"]] = {
+                        **result,
+                        "search_tiers": [],
+                        "fusion_score": 0.0,
+                    }
+                else:
+                    # Keep tier-specific payloads such as vector_data and evidence_data
+                    for key, value in result.items():
+                        entry.setdefault(key, value)
+                entry["search_tiers"].append(tier)
+                entry["fusion_score"] += 1.0 / (RRF_K + rank)
+
+        fused = sorted(merged.values(), key=lambda entry: entry["fusion_score"], reverse=True)
+        for entry in fused:
+            entry["fusion_score"] = round(entry["fusion_score"], 6)
+            entry["search_tier"] = "+".join(entry["search_tiers"])
+        return fused
 
     def _guess_content_type(self, filename: str) -> str:
         """Guess content type from filename"""
@@ -444,7 +666,7 @@ class EnhancedUnifiedStorageAPI:
             )
 
             # Add to evidence table
-            self.evidence_table.add_evidence(evidence_entry)
+            await asyncio.to_thread(self.evidence_table.add_evidence, evidence_entry)
 
             return {
                 "success": True,
@@ -645,7 +867,7 @@ class EnhancedUnifiedStorageAPI:
         try:
             evidence_id = evidence_result.get("evidence_id")
             if evidence_id:
-                return self.evidence_table.get_evidence(evidence_id)
+                return await asyncio.to_thread(self.evidence_table.get_evidence, evidence_id)
         except Exception as e:
             logger.error(f"Evidence table retrieval error: {e}")
 
@@ -678,10 +900,32 @@ class EnhancedUnifiedStorageAPI:
 
         return None
 
+    # Deletion methods for each storage tier
+
+    async def _delete_from_vector_store(self, vector_result: dict[str, Any]) -> dict[str, Any]:
+        vector_ids = vector_result.get("vector_ids", [])
+        for vector_id in vector_ids:
+            await self.vector_store_manager.delete_document(vector_id)
+        return {"success": True, "vector_ids": vector_ids}
+
+    async def _delete_from_cloud_storage(self, cloud_result: dict[str, Any]) -> dict[str, Any]:
+        storage_id = cloud_result.get("storage_id")
+        if storage_id:
+            await self.cloud_storage_manager.delete_evidence(storage_id)
+        return {"success": True, "storage_id": storage_id}
+
+    async def _delete_from_evidence_table(self, evidence_result: dict[str, Any]) -> dict[str, Any]:
+        evidence_id = evidence_result.get("evidence_id")
+        if evidence_id:
+            await asyncio.to_thread(self.evidence_table.delete_evidence, evidence_id)
+        return {"success": True, "evidence_id": evidence_id}
+
     # Search methods for each storage tier
 
-    async def _search_vector_store(self, query: str) -> list[dict[str, Any]]:
-        """Search vector store and return results with ObjectIDs"""
+    async def _search_vector_store(
+        self, query: str, filters: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """Search vector store and return results with the matching ObjectIDs"""
         if not self.vector_store_manager:
             return []
 
@@ -693,29 +937,25 @@ class EnhancedUnifiedStorageAPI:
 
             results = []
             for doc, score in search_results:
-                # Find corresponding ObjectID
-                vector_id = doc.id
-                for obj_id, registry_entry in self.object_registry.items():
-                    vector_ids = (
-                        registry_entry.get("storage_results", {})
-                        .get("vector", {})
-                        .get("vector_ids", [])
+                # Find the ObjectIDs for this content within the caller's scope
+                obj_ids = self.object_registry.objects_for_ref("vector", doc.id, **(filters or {}))
+                if obj_ids:
+                    obj_id = obj_ids[0]
+                    registry_entry = self.object_registry[obj_id]
+                    results.append(
+                        {
+                            "object_id": obj_id,
+                            "object_ids": obj_ids,
+                            "metadata": registry_entry.get("metadata", {}),
+                            "relevance_score": score,
+                            "vector_data": {
+                                "id": doc.id,
+                                "content": doc.content,
+                                "metadata": doc.metadata,
+                            },
+                            "search_tier": "vector",
+                        }
                     )
-                    if vector_id in vector_ids:
-                        results.append(
-                            {
-                                "object_id": obj_id,
-                                "metadata": registry_entry.get("metadata", {}),
-                                "relevance_score": score,
-                                "vector_data": {
-                                    "id": doc.id,
-                                    "content": doc.content,
-                                    "metadata": doc.metadata,
-                                },
-                                "search_tier": "vector",
-                            }
-                        )
-                        break
 
             return results
 
@@ -766,35 +1006,34 @@ class EnhancedUnifiedStorageAPI:
 
         return status
 
-    async def _search_evidence_table(self, query: str) -> list[dict[str, Any]]:
-        """Search evidence table and return results with ObjectIDs"""
+    async def _search_evidence_table(
+        self, query: str, filters: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """Search evidence table and return results with the matching ObjectIDs"""
         if not self.evidence_table:
             return []
 
         try:
             # Search using evidence table search functionality
-            search_results = self.evidence_table.search_evidence(query)
+            search_results = await asyncio.to_thread(self.evidence_table.search_evidence, query)
 
             results = []
             for result in search_results:
-                # Find corresponding ObjectID
-                evidence_id = result.get("evidence_id")
-                for obj_id, registry_entry in self.object_registry.items():
-                    if (
-                        registry_entry.get("storage_results", {})
-                        .get("evidence", {})
-                        .get("evidence_id")
-                        == evidence_id
-                    ):
-                        results.append(
-                            {
-                                "object_id": obj_id,
-                                "metadata": registry_entry.get("metadata", {}),
-                                "evidence_data": result,
-                                "search_tier": "evidence",
-                            }
-                        )
-                        break
+                # Find the ObjectIDs for this content within the caller's scope
+                obj_ids = self.object_registry.objects_for_ref(
+                    "evidence", result.get("evidence_id"), **(filters or {})
+                )
+                if obj_ids:
+                    obj_id = obj_ids[0]
+                    results.append(
+                        {
+                            "object_id": obj_id,
+                            "object_ids": obj_ids,
+                            "metadata": self.object_registry[obj_id].get("metadata", {}),
+                            "evidence_data": result,
+                            "search_tier": "evidence",
+                        }
+                    )
 
             return results
 
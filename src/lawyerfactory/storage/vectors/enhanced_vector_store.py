@@ -230,6 +230,7 @@ class EnhancedVectorStoreManager:
         # Initialize Qdrant client if available
         self.qdrant_client = None
         self.qdrant_collection = os.getenv("QDRANT_COLLECTION", "lawyerfactory_vectors")
+        self._qdrant_collection_ready = False
         
         if QDRANT_AVAILABLE:
             try:
@@ -245,8 +246,8 @@ class EnhancedVectorStoreManager:
                     api_key=qdrant_api_key,
                 )
                 
-                # Test connection and create collection if needed
-                asyncio.create_task(self._ensure_qdrant_collection())
+                # Collection is checked/created on first store or search so
+                # construction never blocks on (or requires) a running loop
                 logger.info("Qdrant client initialized successfully")
             except Exception as e:
                 logger.warning(f"Failed to initialize Qdrant client: {e}")
@@ -278,9 +279,9 @@ class EnhancedVectorStoreManager:
 
     async def _ensure_qdrant_collection(self):
         """Ensure Qdrant collection exists with proper configuration"""
-        if not self.qdrant_client:
+        if not self.qdrant_client or self._qdrant_collection_ready:
             return
-            
+
         try:
             # Check if collection exists
             collections = self.qdrant_client.get_collections()
@@ -298,13 +299,15 @@ class EnhancedVectorStoreManager:
                 logger.info(f"Created Qdrant collection: {self.qdrant_collection}")
             else:
                 logger.info(f"Qdrant collection already exists: {self.qdrant_collection}")
-                
+            self._qdrant_collection_ready = True
+
         except Exception as e:
             logger.error(f"Failed to ensure Qdrant collection: {e}")
             self.qdrant_client = None  # Fall back to in-memory
 
     async def _store_in_qdrant(self, vector_doc: VectorDocument):
         """Store a vector document in Qdrant"""
+        await self._ensure_qdrant_collection()
         if not self.qdrant_client:
             raise RuntimeError("Qdrant client not available")
             
@@ -344,6 +347,7 @@ class EnhancedVectorStoreManager:
         top_k: int
     ) -> List[Tuple[VectorDocument, float]]:
         """Search Qdrant for similar vectors"""
+        await self._ensure_qdrant_collection()
         if not self.qdrant_client:
             return []
             
@@ -678,6 +682,30 @@ class EnhancedVectorStoreManager:
             logger.error(f"Error ingesting file {filename}: {e}")
             return ""
 
+    async def delete_document(self, doc_id: str) -> bool:
+        """Remove a document and its GENERAL_RAG copy from every store"""
+        doc_ids = [doc_id, f"rag_{doc_id}"]
+        removed = False
+        for store_type, store in self.vector_stores.items():
+            for key in doc_ids:
+                if store.pop(key, None) is not None:
+                    self.store_metrics[store_type].total_documents -= 1
+                    self.store_metrics[store_type].total_vectors -= 1
+                    removed = True
+        for sub in self.validation_sub_vectors.values():
+            sub.document_ids.difference_update(doc_ids)
+
+        if self.qdrant_client:
+            try:
+                self.qdrant_client.delete(
+                    collection_name=self.qdrant_collection,
+                    points_selector=models.PointIdsList(points=doc_ids),
+                )
+                removed = True
+            except Exception as e:
+                logger.warning(f"Qdrant delete failed for {doc_id}: {e}")
+        return removed
+
     async def add_research_round(
         self, research_content: str, metadata: Dict[str, Any], round_number: int
     ) -> str:
@@ -850,6 +878,20 @@ class EnhancedVectorStoreManager:
         return metrics
 
 
+# Global instance, created on first use so importing this module stays cheap
+_enhanced_vector_store: Optional[EnhancedVectorStoreManager] = None
+
+
+def get_enhanced_vector_store() -> EnhancedVectorStoreManager:
+    """Get the global enhanced vector store manager instance"""
+    global _enhanced_vector_store
+    if _enhanced_vector_store is None:
+        _enhanced_vector_store = EnhancedVectorStoreManager()
+    return _enhanced_vector_store
+
 
-# Global instance for easy access
-enhanced_vector_store = EnhancedVectorStoreManager()
+def __getattr__(name: str) -> Any:
+    # Keep ``from enhanced_vector_store import enhanced_vector_store`` working
+    if name == "enhanced_vector_store":
+        return get_enhanced_vector_store()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,18 +8,27 @@
 MCP Memory Server Integration for LawyerFactory
 Pneumonic memory compression system using Model Context Protocol for context management.
 Provides intelligent context compression, retrieval, and workflow state persistence.
+
+Frequently read memories are kept in a bytes-bounded LRU cache of compressed
+payloads, with a separate LRU of decompressed views, so cached entries are
+never overwritten by their decompressed text. Session compression works from a
+per-session index of memory metadata and runs incrementally, in batches, on a
+background worker.
 """
 
 import asyncio
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+MIB = 1024**2
+
 
 class MemoryType(Enum):
     """Types of memory stored in the MCP system"""
@@ -64,20 +73,142 @@ class MemoryEntry:
         self.last_accessed = datetime.now()
 
 
+# Memory types read often enough to keep in the local cache
+CACHED_MEMORY_TYPES = (MemoryType.CASE_CONTEXT, MemoryType.WORKFLOW_STATE)
+
+
+class MemoryCache:
+    """
+    Bytes-bounded LRU cache of memory entries
+
+    Entries hold their stored (compressed) content. Decompressed content lives
+    in a second LRU of views with its own byte budget, so reading an entry never
+    changes the cached payload and a view is computed once per entry.
+    """
+
+    def __init__(self, max_bytes: int = 32 * MIB, max_view_bytes: int = 16 * MIB):
+        self.max_bytes = max_bytes
+        self.max_view_bytes = max_view_bytes
+        self._entries: "OrderedDict[str, MemoryEntry]" = OrderedDict()
+        self._views: "OrderedDict[str, str]" = OrderedDict()
+        self.bytes = 0
+        self.view_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "view_hits": 0, "view_misses": 0}
+
+    @staticmethod
+    def _size(text: str) -> int:
+        return len(text.encode("utf-8"))
+
+    def put(self, entry: MemoryEntry) -> bool:
+        """Cache an entry, replacing any previous version and its view"""
+        self.pop(entry.id)
+        size = self._size(entry.content)
+        if size > self.max_bytes:
+            return False
+        self._entries[entry.id] = entry
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            self.pop(next(iter(self._entries)))
+            self.stats["evictions"] += 1
+        return True
+
+    def get(self, memory_id: str) -> Optional[MemoryEntry]:
+        entry = self._entries.get(memory_id)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(memory_id)
+        self.stats["hits"] += 1
+        return entry
+
+    def peek(self, memory_id: str) -> Optional[MemoryEntry]:
+        """Look up an entry without touching LRU order or hit statistics"""
+        return self._entries.get(memory_id)
+
+    def pop(self, memory_id: str) -> Optional[MemoryEntry]:
+        entry = self._entries.pop(memory_id, None)
+        if entry is not None:
+            self.bytes -= self._size(entry.content)
+        view = self._views.pop(memory_id, None)
+        if view is not None:
+            self.view_bytes -= self._size(view)
+        return entry
+
+    def get_view(self, memory_id: str) -> Optional[str]:
+        view = self._views.get(memory_id)
+        if view is None:
+            self.stats["view_misses"] += 1
+            return None
+        self._views.move_to_end(memory_id)
+        self.stats["view_hits"] += 1
+        return view
+
+    def put_view(self, memory_id: str, view: str) -> None:
+        """Cache the decompressed content of a cached entry"""
+        if memory_id not in self._entries:
+            return
+        old = self._views.pop(memory_id, None)
+        if old is not None:
+            self.view_bytes -= self._size(old)
+        size = self._size(view)
+        if size > self.max_view_bytes:
+            return
+        self._views[memory_id] = view
+        self.view_bytes += size
+        while self.view_bytes > self.max_view_bytes:
+            _, evicted = self._views.popitem(last=False)
+            self.view_bytes -= self._size(evicted)
+
+    def __contains__(self, memory_id: object) -> bool:
+        return memory_id in self._entries
+
+    def __getitem__(self, memory_id: str) -> MemoryEntry:
+        return self._entries[memory_id]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class SessionMemoryRef:
+    """What session compression needs to rank a memory without loading its content"""
+
+    memory_type: MemoryType
+    compression_level: CompressionLevel
+    access_count: int = 0
+    relevance_score: float = 1.0
+
+
 class MCPMemoryManager:
     """Enhanced memory manager using MCP servers for pneumonic compression"""
 
-    def __init__(self, mcp_tools=None):
+    def __init__(
+        self,
+        mcp_tools=None,
+        cache_max_bytes: int = 32 * MIB,
+        view_cache_max_bytes: int = 16 * MIB,
+        compression_batch_size: int = 20,
+    ):
         """
         Initialize MCP memory manager
 
         Args:
             mcp_tools: Dictionary of MCP tool functions for memory operations
+            cache_max_bytes: Budget for cached compressed memory payloads
+            view_cache_max_bytes: Budget for cached decompressed views
+            compression_batch_size: Memories compressed between event loop yields
         """
         self.mcp_tools = mcp_tools or {}
         self.compression_strategies = self._initialize_compression_strategies()
-        self.memory_cache = {}  # Local cache for frequently accessed memories
+        # Local cache for frequently accessed memories
+        self.memory_cache = MemoryCache(cache_max_bytes, view_cache_max_bytes)
         self.compression_queue = asyncio.Queue()  # Queue for background compression
+        self.compression_batch_size = compression_batch_size
+        # session_id -> memory_id -> ranking metadata, kept as memories are stored
+        self.session_index: Dict[str, Dict[str, SessionMemoryRef]] = {}
+        self._memory_sessions: Dict[str, str] = {}
+        self._scheduled_sessions: Set[str] = set()
+        self._compression_task: Optional[asyncio.Task] = None
 
     def _initialize_compression_strategies(self) -> Dict[MemoryType, Dict[str, Any]]:
         """Initialize compression strategies for different memory types"""
@@ -167,8 +298,11 @@ class MCPMemoryManager:
             await self._store_in_mcp(memory_entry, session_id)
 
             # Cache locally if frequently accessed type
-            if memory_type in [MemoryType.CASE_CONTEXT, MemoryType.WORKFLOW_STATE]:
-                self.memory_cache[memory_id] = memory_entry
+            if memory_type in CACHED_MEMORY_TYPES:
+                self.memory_cache.put(memory_entry)
+
+            self._index_memory(session_id, memory_entry)
+            self._maybe_schedule_compression(session_id, memory_type)
 
             logger.info(
                 f"Stored memory {memory_id} with compression {compression_level.name}"
@@ -194,16 +328,11 @@ class MCPMemoryManager:
         """
         try:
             # Check local cache first
-            if memory_id in self.memory_cache:
-                memory = self.memory_cache[memory_id]
+            memory = self.memory_cache.get(memory_id)
+            if memory is not None:
                 memory.update_access()
-
-                if decompress and memory.compression_level != CompressionLevel.NONE:
-                    memory.content = await self._decompress_content(
-                        memory.content, memory.memory_type
-                    )
-
-                return memory
+                self._note_access(memory)
+                return await self._reader_copy(memory, decompress)
 
             # Retrieve from MCP server
             memory_data = await self._retrieve_from_mcp(memory_id)
@@ -213,19 +342,16 @@ class MCPMemoryManager:
             # Reconstruct memory entry
             memory = self._reconstruct_memory_entry(memory_data)
             memory.update_access()
-
-            # Decompress if requested
-            if decompress and memory.compression_level != CompressionLevel.NONE:
-                memory.content = await self._decompress_content(
-                    memory.content, memory.memory_type
-                )
+            self._note_access(memory)
+            if memory.memory_type in CACHED_MEMORY_TYPES:
+                self.memory_cache.put(memory)
 
             # Update MCP with access tracking
             await self._update_memory_access(
                 memory_id, memory.access_count, memory.last_accessed
             )
 
-            return memory
+            return await self._reader_copy(memory, decompress)
 
         except Exception as e:
             logger.error(f"Failed to retrieve memory {memory_id}: {e}")
@@ -284,7 +410,12 @@ class MCPMemoryManager:
         self, session_id: str, compression_target: float = 0.7
     ) -> Dict[str, Any]:
         """
-        Compress all context for a session using pneumonic techniques
+        Compress context for a session using pneumonic techniques
+
+        Memories are ranked from the session index, so only the memories that
+        need a stronger compression level than they already have are loaded
+        and rewritten, in batches that yield to the event loop. Repeated runs
+        only touch memories added since the previous run.
 
         Args:
             session_id: Session to compress
@@ -294,22 +425,22 @@ class MCPMemoryManager:
             Compression summary with statistics
         """
         try:
-            # Retrieve all memories for session
-            session_memories = await self._get_session_memories(session_id)
+            session_refs = self.session_index.get(session_id)
+            if session_refs is None:
+                # Unknown session (e.g. after a restart): index it from MCP once
+                session_refs = await self._seed_session_index(session_id)
 
-            if not session_memories:
+            if not session_refs:
                 return {"status": "no_memories", "session_id": session_id}
 
             # Group memories by type
-            memory_groups = {}
-            for memory in session_memories:
-                if memory.memory_type not in memory_groups:
-                    memory_groups[memory.memory_type] = []
-                memory_groups[memory.memory_type].append(memory)
+            memory_groups: Dict[MemoryType, List[str]] = {}
+            for memory_id, ref in session_refs.items():
+                memory_groups.setdefault(ref.memory_type, []).append(memory_id)
 
             compression_stats = {
                 "session_id": session_id,
-                "original_count": len(session_memories),
+                "original_count": len(session_refs),
                 "compressed_count": 0,
                 "compression_ratio": 0.0,
                 "preserved_memories": [],
@@ -317,28 +448,23 @@ class MCPMemoryManager:
             }
 
             # Apply compression strategies by type
-            for memory_type, memories in memory_groups.items():
+            for memory_type, memory_ids in memory_groups.items():
                 strategy = self.compression_strategies.get(memory_type, {})
-                threshold = strategy.get("compression_threshold", 0.7)
 
-                if len(memories) > strategy.get("max_entries", 100):
+                if len(memory_ids) > strategy.get("max_entries", 100):
                     # Apply aggressive compression
                     compressed = await self._apply_pneumonic_compression(
-                        memories, compression_target
+                        session_id, memory_ids, compression_target
                     )
                     compression_stats["compressed_memories"].extend(compressed)
                 else:
                     # Preserve memories below threshold
-                    compression_stats["preserved_memories"].extend(
-                        [m.id for m in memories]
-                    )
+                    compression_stats["preserved_memories"].extend(memory_ids)
 
             # Calculate final statistics
             total_compressed = len(compression_stats["compressed_memories"])
             compression_stats["compressed_count"] = total_compressed
-            compression_stats["compression_ratio"] = total_compressed / len(
-                session_memories
-            )
+            compression_stats["compression_ratio"] = total_compressed / len(session_refs)
 
             # Store compression summary
             await self._store_compression_summary(session_id, compression_stats)
@@ -352,6 +478,82 @@ class MCPMemoryManager:
             logger.error(f"Failed to compress session context: {e}")
             return {"status": "error", "error": str(e)}
 
+    def schedule_session_compression(
+        self, session_id: str, compression_target: float = 0.7
+    ) -> None:
+        """Queue a session for the background compression worker, starting it if needed"""
+        if session_id in self._scheduled_sessions:
+            return
+        self._scheduled_sessions.add(session_id)
+        self.compression_queue.put_nowait((session_id, compression_target))
+        if self._compression_task is None or self._compression_task.done():
+            self._compression_task = asyncio.get_running_loop().create_task(
+                self._compression_worker()
+            )
+
+    async def join_compression(self) -> None:
+        """Wait until every queued session compression has finished"""
+        await self.compression_queue.join()
+
+    async def stop_background_compression(self) -> None:
+        if self._compression_task is not None:
+            self._compression_task.cancel()
+            try:
+                await self._compression_task
+            except asyncio.CancelledError:
+                pass
+            self._compression_task = None
+
+    async def _compression_worker(self) -> None:
+        while True:
+            session_id, compression_target = await self.compression_queue.get()
+            self._scheduled_sessions.discard(session_id)
+            try:
+                await self.compress_session_context(session_id, compression_target)
+            except Exception as e:
+                logger.error(f"Background compression of session {session_id} failed: {e}")
+            finally:
+                self.compression_queue.task_done()
+
+    def _maybe_schedule_compression(self, session_id: str, memory_type: MemoryType) -> None:
+        """Schedule compression once a session holds more memories of a type than allowed"""
+        max_entries = self.compression_strategies.get(memory_type, {}).get("max_entries", 100)
+        count = sum(
+            ref.memory_type is memory_type for ref in self.session_index[session_id].values()
+        )
+        if count > max_entries:
+            self.schedule_session_compression(session_id)
+
+    def _index_memory(self, session_id: str, memory: MemoryEntry) -> None:
+        self.session_index.setdefault(session_id, {})[memory.id] = SessionMemoryRef(
+            memory_type=memory.memory_type,
+            compression_level=memory.compression_level,
+            access_count=memory.access_count,
+            relevance_score=memory.relevance_score,
+        )
+        self._memory_sessions[memory.id] = session_id
+
+    def _note_access(self, memory: MemoryEntry) -> None:
+        session_id = self._memory_sessions.get(memory.id)
+        if session_id is not None:
+            self.session_index[session_id][memory.id].access_count = memory.access_count
+
+    async def _seed_session_index(self, session_id: str) -> Dict[str, SessionMemoryRef]:
+        for memory in await self._get_session_memories(session_id):
+            self._index_memory(session_id, memory)
+        return self.session_index.get(session_id, {})
+
+    async def _reader_copy(self, memory: MemoryEntry, decompress: bool) -> MemoryEntry:
+        """A copy for the caller, with decompressed content taken from the view cache"""
+        if not decompress or memory.compression_level == CompressionLevel.NONE:
+            return replace(memory)
+
+        view = self.memory_cache.get_view(memory.id)
+        if view is None:
+            view = await self._decompress_content(memory.content, memory.memory_type)
+            self.memory_cache.put_view(memory.id, view)
+        return replace(memory, content=view)
+
     def _determine_compression_level(
         self, content: str, memory_type: MemoryType
     ) -> CompressionLevel:
@@ -630,41 +832,69 @@ class MCPMemoryManager:
             return None
 
     async def _apply_pneumonic_compression(
-        self, memories: List[MemoryEntry], target_ratio: float
+        self, session_id: str, memory_ids: List[str], target_ratio: float
     ) -> List[str]:
         """Apply pneumonic compression techniques to memory groups"""
+        session_refs = self.session_index[session_id]
+
         # Sort memories by access patterns and relevance
-        memories.sort(key=lambda m: (m.access_count, m.relevance_score), reverse=True)
+        ranked = sorted(
+            memory_ids,
+            key=lambda memory_id: (
+                session_refs[memory_id].access_count,
+                session_refs[memory_id].relevance_score,
+            ),
+            reverse=True,
+        )
 
         # Calculate how many to compress
-        target_count = int(len(memories) * target_ratio)
+        target_count = int(len(ranked) * target_ratio)
 
-        compressed_ids = []
-        for i in range(target_count, len(memories)):
-            memory = memories[i]
+        pending: List[Tuple[str, CompressionLevel]] = []
+        for memory_id in ranked[target_count:]:
+            ref = session_refs[memory_id]
 
             # Apply higher compression to less accessed memories
             new_level = (
-                CompressionLevel.HIGH
-                if memory.access_count < 3
-                else CompressionLevel.MEDIUM
+                CompressionLevel.HIGH if ref.access_count < 3 else CompressionLevel.MEDIUM
             )
+            # Memories already compressed at least this much are left alone
+            if ref.compression_level.value < new_level.value:
+                pending.append((memory_id, new_level))
 
-            # Compress content
-            compressed_content = await self._compress_content(
-                memory.content, memory.memory_type, new_level
-            )
+        compressed_ids = []
+        batch_size = max(1, self.compression_batch_size)
+        for start in range(0, len(pending), batch_size):
+            for memory_id, new_level in pending[start : start + batch_size]:
+                memory = await self._load_for_compression(memory_id)
+                if memory is None:
+                    continue
+
+                # Compress content
+                memory.content = await self._compress_content(
+                    memory.content, memory.memory_type, new_level
+                )
+                memory.compression_level = new_level
 
-            # Update memory
-            memory.content = compressed_content
-            memory.compression_level = new_level
+                # Update in MCP, the cache and the index
+                await self._store_in_mcp(memory, session_id)
+                if memory_id in self.memory_cache:
+                    self.memory_cache.put(memory)
+                session_refs[memory_id].compression_level = new_level
+                compressed_ids.append(memory_id)
 
-            # Update in MCP
-            await self._store_in_mcp(memory, "compressed_session")
-            compressed_ids.append(memory.id)
+            # Let other work run between batches
+            await asyncio.sleep(0)
 
         return compressed_ids
 
+    async def _load_for_compression(self, memory_id: str) -> Optional[MemoryEntry]:
+        cached = self.memory_cache.peek(memory_id)
+        if cached is not None:
+            return replace(cached)
+        memory_data = await self._retrieve_from_mcp(memory_id)
+        return self._reconstruct_memory_entry(memory_data) if memory_data else None
+
     async def _store_compression_summary(self, session_id: str, stats: Dict[str, Any]):
         """Store compression summary in MCP"""
         if "create_entities" in self.mcp_tools:
@@ -5,7 +5,6 @@ End-to-end tests for the lawsuit creation workflow phases and transitions.
 from __future__ import annotations
 
 import asyncio
-import json
 from dataclasses import dataclass
 from pathlib import Path
 import sys
@@ -17,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 sys.modules.setdefault("numpy", types.ModuleType("numpy"))
 
 from lawyerfactory.agents.orchestration import maestro as maestro_module
+from lawyerfactory.storage import enhanced_unified_storage_api as storage_api_module
 from lawyerfactory.storage.core.unified_storage_api import EnhancedUnifiedStorageAPI
 
 LAW_LAWSUIT_PHASE_SEQUENCE = [
@@ -95,15 +95,16 @@ def lawsuit_workflow_fixture(
     """Provide a Maestro instance backed by temporary storage."""
     storage_path = tmp_path / "storage"
     storage = EnhancedUnifiedStorageAPI(storage_path=str(storage_path))
+    # Maestro imports the getter from the compatibility module when constructed
     monkeypatch.setattr(
-        maestro_module,
+        storage_api_module,
         "get_enhanced_unified_storage_api",
         lambda: storage,
     )
     return LawsuitWorkflowFixture(
         maestro=maestro_module.Maestro(),
         storage=storage,
-        storage_registry_path=storage_path / "object_registry.json",
+        storage_registry_path=storage_path / "object_registry.db",
     )
 
 
@@ -177,5 +178,5 @@ def test_lawsuit_workflow_end_to_end(
 
     registry_path = lawsuit_workflow_fixture.storage_registry_path
     assert registry_path.exists()
-    registry_contents = json.loads(registry_path.read_text(encoding="utf-8"))
+    registry_contents = lawsuit_workflow_fixture.storage.object_registry
     assert len(registry_contents) >= len(LAW_LAWSUIT_PHASE_EXPECTATIONS) + 1
@@ -27,6 +27,8 @@ sys.modules['lawyerfactory.agents'] = MagicMock()
 sys.modules['lawyerfactory.chat'] = MagicMock()
 sys.modules['lawyerfactory.storage'] = MagicMock()
 
+import server
+from job_executor import JobExecutor, JobStore
 from server import app, evidence_store, phase_status_store
 
 
@@ -281,6 +283,72 @@ class TestEvidenceCRUD:
         assert 'average_relevance_score' in data
 
 
+@pytest.fixture
+def job_executor(monkeypatch):
+    """Use an in-memory job store for phase routes."""
+    executor = JobExecutor(JobStore(), on_update=server._on_job_update)
+    monkeypatch.setattr(server, "_job_executor", executor)
+    yield executor
+    executor.shutdown()
+
+
+class TestPhaseStart:
+    """Test phase start endpoints for phases without a server-side pipeline."""
+
+    def test_start_intake_phase_is_accepted(self, client, job_executor, cleanup_phase_store):
+        """Test starting a non-drafting phase returns a task that never auto-completes."""
+        response = client.post('/api/phases/phaseA01_intake/start',
+                              data=json.dumps({"case_id": "case_123"}),
+                              content_type='application/json')
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['success'] is True
+        assert data['status'] == 'accepted'
+
+        status = client.get(f"/api/phases/phaseA01_intake/status/{data['task_id']}")
+        assert json.loads(status.data)['status'] == 'accepted'
+
+        cancel = client.post('/api/phases/phaseA01_intake/cancel',
+                            data=json.dumps({"task_id": data['task_id']}),
+                            content_type='application/json')
+        assert json.loads(cancel.data)['status'] == 'cancelled'
+
+    def test_start_orchestration_is_accepted(self, client, job_executor, cleanup_phase_store):
+        """Test /api/orchestration/start returns a task id."""
+        response = client.post('/api/orchestration/start',
+                              data=json.dumps({"case_id": "case_123"}),
+                              content_type='application/json')
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['status'] == 'accepted'
+        assert job_executor.get(data['task_id'])['phase_id'] == 'phaseC02_orchestration'
+
+
+class TestBartlebyChat:
+    """Test Bartleby chat socket events."""
+
+    def test_chat_without_case_id_errors_to_sender_only(self, monkeypatch):
+        """Test a message without a case_id is rejected before streaming."""
+        handler = MagicMock()
+        monkeypatch.setattr(server, "bartleby_handler", handler)
+        sender = server.socketio.test_client(app)
+        other = server.socketio.test_client(app)
+        sender.get_received()
+        other.get_received()
+
+        sender.emit('bartleby_chat_message', {"message": "Hello"})
+
+        received = sender.get_received()
+        assert [r['name'] for r in received] == ['bartleby_error']
+        assert received[0]['args'][0]['message'] == 'case_id required'
+        assert other.get_received() == []
+        handler.start_stream.assert_not_called()
+        sender.disconnect()
+        other.disconnect()
+
+
 class TestResearchPhase:
     """Test research phase endpoints."""
 
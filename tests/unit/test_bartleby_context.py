@@ -0,0 +1,176 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from lawyerfactory.chat.bartleby_handler import (
+    BartlebyChatHandler,
+    ChatContext,
+    ChatMessage,
+    ChatPrompt,
+    ConversationWindow,
+)
+
+EVIDENCE = [
+    {"evidence_id": "ev-1", "evidence_source": "primary"},
+    {"evidence_id": "ev-2", "evidence_source": "secondary"},
+]
+OUTLINE = {"claims": ["Breach of contract"]}
+SETTINGS = {"provider": "openai", "model": "gpt-4o"}
+
+
+class FakeStream:
+    def __init__(self, text):
+        self.text = text
+
+    def __aiter__(self):
+        return self._chunks()
+
+    async def _chunks(self):
+        yield SimpleNamespace(
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=self.text))], usage=None
+        )
+        yield SimpleNamespace(
+            choices=[],
+            usage=SimpleNamespace(
+                prompt_tokens=2000,
+                completion_tokens=50,
+                prompt_tokens_details=SimpleNamespace(cached_tokens=1536),
+            ),
+        )
+
+    async def close(self):
+        pass
+
+
+class RecordingOpenAI:
+    """Streams a fixed reply and records the messages of every request"""
+
+    def __init__(self):
+        self.requests = []
+
+        async def create(**kwargs):
+            self.requests.append(kwargs["messages"])
+            return FakeStream(f"Answer {len(self.requests)}. More detail follows.")
+
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+
+@pytest.fixture
+def handler():
+    handler = BartlebyChatHandler(history_messages=4)
+    handler.openai_client = RecordingOpenAI()
+    return handler
+
+
+def _context(**kwargs):
+    return ChatContext(case_id="case-7", **kwargs)
+
+
+def test_snapshot_rerenders_only_changed_sections(handler):
+    assert handler.update_case_context("case-7", outline=OUTLINE, evidence=EVIDENCE) == [
+        "case",
+        "outline",
+        "evidence",
+    ]
+    assert handler.update_case_context("case-7", outline=OUTLINE, evidence=EVIDENCE) == []
+
+    changed = handler.update_case_context("case-7", evidence=EVIDENCE + [{"evidence_source": "primary"}])
+
+    assert changed == ["evidence"]
+    rendered = handler._case_state("case-7").snapshot.render()
+    assert "3 total (2 PRIMARY, 1 SECONDARY, 0 TERTIARY)" in rendered
+    assert "Breach of contract" in rendered
+
+
+@pytest.mark.asyncio
+async def test_stable_prefix_is_identical_across_turns(handler):
+    await handler.send_message("What claims do we have?", _context(evidence_data=EVIDENCE), SETTINGS)
+    done = None
+    async for event in handler.stream_message("And the damages?", _context(evidence_data=EVIDENCE), SETTINGS):
+        done = event
+
+    first, second = handler.openai_client.requests
+    assert first[0]["content"].startswith(handler.system_prompt)
+    assert "2 total (1 PRIMARY" in first[0]["content"]
+    assert second[0] == first[0]
+    assert [m["role"] for m in second] == ["system", "user", "assistant", "user"]
+    assert second[2]["content"] == "Answer 1. More detail follows."
+    assert done["usage"]["cached_input_tokens"] == 1536
+
+
+@pytest.mark.asyncio
+async def test_older_turns_fold_into_a_summary(handler):
+    for i in range(4):
+        await handler.send_message(f"Question {i}. With detail.", _context(), SETTINGS)
+
+    state = handler._case_state("case-7")
+    last_request = handler.openai_client.requests[-1]
+    assert len(state.window.messages) == 4
+    assert state.window.summary.splitlines() == [
+        "- user: Question 0.",
+        "- assistant: Answer 1.",
+        "- user: Question 1.",
+        "- assistant: Answer 2.",
+    ]
+    assert "- user: Question 0." in last_request[0]["content"]
+    assert len(last_request) == 1 + 4 + 1
+
+
+@pytest.mark.asyncio
+async def test_system_messages_reach_the_next_turn_once(handler):
+    handler.add_system_message("case-7", "Phase A02 research completed")
+
+    await handler.send_message("Status?", _context(), SETTINGS)
+    await handler.send_message("Anything else?", _context(), SETTINGS)
+
+    first, second = handler.openai_client.requests
+    assert "Phase A02 research completed" in first[-1]["content"]
+    assert "Phase A02 research completed" not in second[-1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_notes_from_other_threads_reach_the_model_exactly_once(handler):
+    def narrate(worker):
+        for i in range(5):
+            handler.add_system_message("case-7", f"note {worker}-{i}")
+
+    threads = [threading.Thread(target=narrate, args=(w,)) for w in range(4)]
+    for thread in threads:
+        thread.start()
+    for i in range(3):
+        await handler.send_message(f"Status {i}?", _context(), SETTINGS)
+    for thread in threads:
+        thread.join()
+    await handler.send_message("Final status?", _context(), SETTINGS)
+
+    shown = [
+        line
+        for request in handler.openai_client.requests
+        for line in request[-1]["content"].splitlines()
+        if line.startswith("- note ")
+    ]
+    assert sorted(shown) == sorted(f"- note {w}-{i}" for w in range(4) for i in range(5))
+    assert not handler._case_state("case-7").notes
+
+
+def test_window_summary_is_bounded():
+    window = ConversationWindow(max_messages=2, max_summary_chars=120)
+    for i in range(20):
+        window.add_turn(
+            ChatMessage(role="user", content=f"Question number {i} about the lease."),
+            ChatMessage(role="assistant", content=f"Answer {i}.\n```json\n[]\n```"),
+        )
+
+    assert len(window.messages) == 2
+    assert len(window.summary) <= 120
+    assert window.summary.splitlines()[-1] == "- assistant: Answer 18."
+
+
+def test_anthropic_layout_caches_the_case_context():
+    prompt = ChatPrompt(system="SYS", case_context="CTX", summary="SUM", user="Q")
+
+    blocks = prompt.anthropic_system()
+
+    assert [b["text"].split()[-1] for b in blocks] == ["SYS", "CTX", "SUM"]
+    assert [("cache_control" in b) for b in blocks] == [False, True, False]
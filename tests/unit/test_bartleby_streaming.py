@@ -0,0 +1,153 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from lawyerfactory.chat.bartleby_handler import (
+    BartlebyChatHandler,
+    ChatContext,
+    StreamingActionExtractor,
+)
+
+REPLY = [
+    "The lease ",
+    "was breached.\n```js",
+    'on\n{"actions": [{"type": "search_vectors", ',
+    '"data": {"query": "lease"}}]}\n``',
+    "`\nLet me know.",
+]
+
+
+class FakeStream:
+    def __init__(self, pieces, delay):
+        self.pieces = pieces
+        self.delay = delay
+        self.closed = False
+
+    def __aiter__(self):
+        return self._chunks()
+
+    async def _chunks(self):
+        for piece in self.pieces:
+            await asyncio.sleep(self.delay)
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))], usage=None
+            )
+        yield SimpleNamespace(
+            choices=[], usage=SimpleNamespace(prompt_tokens=1000, completion_tokens=500)
+        )
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeOpenAI:
+    def __init__(self, delay=0.0):
+        self.streams = []
+
+        async def create(**kwargs):
+            assert kwargs["stream"] is True
+            stream = FakeStream(REPLY, delay)
+            self.streams.append(stream)
+            return stream
+
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+
+def _handler(delay=0.0):
+    handler = BartlebyChatHandler()
+    handler.openai_client = FakeOpenAI(delay)
+    return handler
+
+
+SETTINGS = {"provider": "openai", "model": "gpt-4o"}
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_deltas_and_actions_before_done():
+    handler = _handler()
+
+    events = [e async for e in handler.stream_message("Was the lease breached?", ChatContext(), SETTINGS)]
+
+    kinds = [e["type"] for e in events]
+    assert kinds.count("delta") == len(REPLY)
+    assert kinds.index("action") < kinds.index("done") == len(kinds) - 1
+    done = events[-1]
+    assert done["message"].content == "".join(REPLY)
+    assert done["message"].actions == [{"type": "search_vectors", "data": {"query": "lease"}}]
+    assert done["message"].cost == pytest.approx(0.0125)
+    assert done["first_token_ms"] is not None
+    assert handler.openai_client.streams[0].closed
+
+
+@pytest.mark.asyncio
+async def test_send_message_returns_the_complete_reply():
+    handler = _handler()
+
+    response = await handler.send_message("Was the lease breached?", ChatContext(), SETTINGS)
+
+    assert response.content == "".join(REPLY)
+    assert len(response.actions) == 1
+
+
+def test_extractor_handles_fences_split_across_chunks():
+    extractor = StreamingActionExtractor()
+
+    found = [extractor.feed(chunk) for chunk in REPLY]
+
+    assert found == [[], [], [], [], [{"type": "search_vectors", "data": {"query": "lease"}}]]
+
+
+def test_new_message_cancels_the_reply_in_flight():
+    handler = _handler(delay=0.2)
+    events = []
+    lock = threading.Lock()
+
+    def emit(name, payload):
+        with lock:
+            events.append((name, payload))
+
+    first = handler.start_stream("case-1", "first", ChatContext(case_id="case-1"), SETTINGS, emit)
+    second = handler.start_stream("case-1", "second", ChatContext(case_id="case-1"), SETTINGS, emit)
+    try:
+        assert second.result(timeout=5).content == "".join(REPLY)
+        assert first.cancelled()
+
+        names = [name for name, _ in events]
+        assert names.count("bartleby_stream_start") == 2
+        assert names.count("bartleby_stream_end") == 1
+        assert "bartleby_stream_cancelled" in names
+        deltas = [p for name, p in events if name == "bartleby_stream_delta"]
+        assert [p["seq"] for p in deltas] == list(range(len(REPLY)))
+        assert handler.cancel_stream("case-1") is False
+    finally:
+        handler.close()
+
+
+def test_provider_calls_share_one_loop_across_callers(monkeypatch):
+    monkeypatch.delenv("LLM_PROVIDER", raising=False)
+    handler = _handler()
+    loops = []
+    create = handler.openai_client.chat.completions.create
+
+    async def recording_create(**kwargs):
+        loops.append(asyncio.get_running_loop())
+        return await create(**kwargs)
+
+    handler.openai_client.chat.completions.create = recording_create
+    try:
+        for _ in range(2):
+            asyncio.run(handler.send_message("Was the lease breached?", ChatContext(), SETTINGS))
+        result = handler.handle_intervention(
+            "case-1", "phaseA01", "question", "Why?", {"status": "running"}
+        )
+        handler.start_stream(
+            "case-1", "again", ChatContext(case_id="case-1"), SETTINGS, lambda *_: None
+        ).result(timeout=5)
+
+        assert result["success"]
+        assert len(loops) == 4
+        assert set(loops) == {handler._stream_loop}
+    finally:
+        handler.close()
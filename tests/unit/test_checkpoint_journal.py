@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from lawyerfactory.compose.maestro.checkpoints import CheckpointManager, apply_delta, diff_state
+from lawyerfactory.compose.maestro.enhanced_maestro import WorkflowState
+from lawyerfactory.compose.maestro.workflow_models import PhaseStatus, WorkflowPhase
+
+
+def _state():
+    state = WorkflowState(session_id="s1", case_name="Case")
+    state.phases = {phase: PhaseStatus.PENDING for phase in WorkflowPhase}
+    state.global_context = {"research": {"round_1": ["a" * 200]}}
+    return state
+
+
+def test_diff_and_apply_round_trip():
+    old = {"tasks": ["t1"], "ctx": {"keep": 1, "drop": 2, "nested": {"x": 1}}}
+    new = {"tasks": ["t1", "t2"], "ctx": {"keep": 1, "nested": {"x": 2}, "added": [1]}}
+
+    ops = diff_state(old, new)
+    assert ["extend", ["tasks"], ["t2"]] in ops
+    apply_delta(old, ops)
+    assert old == new
+
+
+@pytest.mark.asyncio
+async def test_deltas_are_small_and_snapshots_rotate(tmp_path):
+    manager = CheckpointManager(str(tmp_path), snapshot_interval=3, keep_snapshots=2)
+    state = _state()
+
+    await manager.create_checkpoint(state)
+    assert state.checkpoint_data["type"] == "snapshot"
+
+    for i in range(1, 10):
+        state.completed_tasks.append(f"task_{i}")
+        state.global_context["progress_percentage"] = i * 10
+        await manager.create_checkpoint(state)
+
+    index = json.loads((manager.checkpoints_dir / "s1.index.json").read_text())
+    assert index["snapshot_seq"] == 9
+    assert [segment["seq"] for segment in index["segments"]] == [5, 9]
+    assert not (manager.checkpoints_dir / "s1.snapshot.00000001.json").exists()
+
+    journal = (manager.checkpoints_dir / "s1.journal.00000005.jsonl").read_text().splitlines()
+    assert len(journal) == 3
+    assert "a" * 200 not in journal[0]  # unchanged research is not rewritten
+
+    restored = await manager.restore_workflow("s1")
+    assert restored["completed_tasks"] == [f"task_{i}" for i in range(1, 10)]
+    assert restored["global_context"]["progress_percentage"] == 90
+
+
+@pytest.mark.asyncio
+async def test_restore_after_restart_and_torn_journal_line(tmp_path):
+    manager = CheckpointManager(str(tmp_path), snapshot_interval=10)
+    state = _state()
+    await manager.create_checkpoint(state)
+    state.completed_tasks.append("task_1")
+    await manager.create_checkpoint(state)
+    timestamp = state.checkpoint_data["timestamp"]
+    state.completed_tasks.append("task_2")
+    await manager.create_checkpoint(state)
+
+    journal = manager.checkpoints_dir / "s1.journal.00000001.jsonl"
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"seq": 4, "timestamp": "x", "ops": [["set"')
+
+    fresh = CheckpointManager(str(tmp_path))
+    assert (await fresh.restore_workflow("s1"))["completed_tasks"] == ["task_1", "task_2"]
+    assert (await fresh.restore_workflow("s1", timestamp))["completed_tasks"] == ["task_1"]
+
+    # A restarted manager starts a new snapshot segment instead of appending
+    await fresh.create_checkpoint(state)
+    assert state.checkpoint_data == {
+        "seq": 4,
+        "timestamp": state.checkpoint_data["timestamp"],
+        "type": "snapshot",
+    }
+
+    await fresh.delete_checkpoints("s1")
+    with pytest.raises(FileNotFoundError):
+        await fresh.restore_workflow("s1")
+
+
+@pytest.mark.asyncio
+async def test_legacy_checkpoint_files_are_still_restored(tmp_path):
+    manager = CheckpointManager(str(tmp_path))
+    history = [("20240101_090000", ["task_1"]), ("20240102_090000", ["task_1", "task_2"])]
+    for stamp, tasks in history:
+        legacy = {"timestamp": stamp, "session_id": "s1", "completed_tasks": tasks}
+        (manager.checkpoints_dir / f"checkpoint_s1_{stamp}.json").write_text(json.dumps(legacy))
+
+    assert (await manager.restore_workflow("s1"))["completed_tasks"] == ["task_1", "task_2"]
+
+    state = _state()
+    await manager.create_checkpoint(state)
+    assert (await manager.restore_workflow("s1"))["completed_tasks"] == []
+    older = await manager.restore_workflow("s1", "20240101_090000")
+    assert older["completed_tasks"] == ["task_1"]
+    assert [c["type"] for c in manager.list_checkpoints("s1")] == ["snapshot", "legacy", "legacy"]
+
+    await manager.delete_checkpoints("s1")
+    assert not list(manager.checkpoints_dir.glob("checkpoint_s1_*.json"))
+
+
+@pytest.mark.asyncio
+async def test_snapshot_writer_gets_a_private_copy(tmp_path, monkeypatch):
+    manager = CheckpointManager(str(tmp_path))
+    state = _state()
+    written = []
+    write_snapshot = manager._write_snapshot
+
+    def recording_write(session_id, snapshot_state, timestamp, index):
+        written.append(snapshot_state)
+        return write_snapshot(session_id, snapshot_state, timestamp, index)
+
+    monkeypatch.setattr(manager, "_write_snapshot", recording_write)
+
+    await manager.create_checkpoint(state)
+
+    assert written[0]["global_context"] == state.global_context
+    assert written[0]["global_context"] is not state.global_context
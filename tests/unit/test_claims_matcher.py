@@ -0,0 +1,58 @@
+import re
+
+from lawyerfactory.phases.phaseA03_outline.claims.matcher import (
+    CausePatternMatcher,
+    KeywordAutomaton,
+)
+
+CAUSES = {
+    "negligence": {
+        "patterns": [
+            r"(?:negligent|negligence)",
+            r"(?:duty\s+of\s+care|breach.*duty)",
+            r"(?:caused.*(?:injury|damage|harm))",
+        ]
+    },
+    "fraud": {"patterns": [r"(?:fraud|false\s+statement)", r"(?:relied\s+on)"]},
+    "defamation": {"patterns": [r"(?:false\s+statement|published)", r"(?:IIED|reputation)"]},
+}
+
+FACTS = [
+    "defendant made a false statement about the plaintiff",
+    "the statement was published and relied on by buyers",
+    "breach of the agreement",
+    "owed a duty of care; caused injury",
+]
+
+
+def test_scan_matches_per_pattern_search():
+    report = CausePatternMatcher(CAUSES).scan(FACTS)
+    combined = " ".join(FACTS)
+
+    for cause, config in CAUSES.items():
+        expected = {
+            i for i, p in enumerate(config["patterns"]) if re.search(p, combined, re.IGNORECASE)
+        }
+        assert report.cause_patterns.get(cause, set()) == expected
+
+        for fact, causes in zip(FACTS, report.fact_causes, strict=True):
+            hit = any(re.search(p, fact, re.IGNORECASE) for p in config["patterns"])
+            assert (cause in causes) == hit, (cause, fact)
+
+
+def test_match_spanning_facts_only_counts_for_combined_text():
+    causes = {"negligence": {"patterns": [r"breach.*duty"]}}
+    report = CausePatternMatcher(causes).scan(["breach of the agreement", "a duty to pay"])
+
+    assert report.cause_patterns == {"negligence": {0}}
+    assert report.fact_causes == [set(), set()]
+
+
+def test_keyword_automaton_finds_overlapping_keywords():
+    automaton = KeywordAutomaton(["he", "she", "hers", "his", "substantial factor"])
+    assert automaton.find_all("ushers") == {"he", "she", "hers"}
+    assert automaton.find_all("a substantial factor") == {"substantial factor"}
+    assert automaton.find_all("") == set()
+
+    report = CausePatternMatcher(CAUSES, ["care", "harm"]).scan(FACTS)
+    assert report.keywords == {"care"}
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from lawyerfactory.phases.phaseA03_outline.cause_of_action_engine import (
+    CauseOfActionDefinitionEngine,
+)
+from lawyerfactory.phases.phaseA03_outline.definition_registry import (
+    DefinitionRegistry,
+    get_definition_registry,
+    tables_to_dict,
+)
+
+
+def test_engines_share_one_set_of_tables():
+    first = CauseOfActionDefinitionEngine(None, None)
+    second = CauseOfActionDefinitionEngine(None, None)
+
+    assert first.california_definitions is second.california_definitions
+    assert first.decision_trees is second.decision_trees
+    assert "ca_state" in get_definition_registry().jurisdictions()
+
+    negligence = first.generate_comprehensive_definition("negligence", "ca_state")
+    assert negligence.authority_citations[0].startswith("Rowland v. Christian")
+    duty = first.generate_element_breakdown("negligence", "duty", "ca_state")
+    assert duty.element_id == "ca_neg_duty_001"
+    assert first.generate_provable_questions("negligence", "duty")
+
+
+def test_tables_are_read_only():
+    tables = get_definition_registry().tables("ca_state")
+    with pytest.raises(TypeError):
+        tables.definitions["negligence"] = None
+    with pytest.raises(AttributeError):
+        tables.definitions["negligence"].primary_definition = "changed"
+
+
+def test_jurisdiction_shards_load_lazily(tmp_path):
+    ca = tables_to_dict(get_definition_registry().tables("ca_state"))
+    ny = {**ca, "jurisdiction": "ny_state"}
+    ny["definitions"] = {
+        "negligence": {**ca["definitions"]["negligence"], "jurisdiction": "ny_state"}
+    }
+    (tmp_path / "ny_state.json").write_text(json.dumps(ny))
+
+    registry = DefinitionRegistry(tmp_path)
+    assert registry.jurisdictions() == ["ny_state"]
+    assert registry.tables("ca_state") is None
+    tables = registry.tables("ny_state")
+    assert tables is registry.tables("ny_state")
+    assert tables.definitions["negligence"].jurisdiction == "ny_state"
@@ -0,0 +1,76 @@
+import random
+
+from lawyerfactory.phases.phaseC01_editing.document_diff import (
+    diff_documents,
+    iter_hunks,
+    iter_opcodes,
+)
+from lawyerfactory.phases.phaseC01_editing.document_export_system import DocumentExportSystem
+
+PARAGRAPHS = [
+    f"{i}. On day {i} the defendant acted. Plaintiff relied on that conduct." for i in range(1, 41)
+]
+BRIEF = "\n\n".join(PARAGRAPHS)
+
+
+def test_opcodes_reconstruct_the_new_sequence():
+    rng = random.Random(5)
+    for _ in range(500):
+        a = [rng.choice("abcde") for _ in range(rng.randint(0, 25))]
+        b = list(a)
+        for _ in range(rng.randint(0, 5)):
+            if b and rng.random() < 0.5:
+                del b[rng.randrange(len(b))]
+            else:
+                b.insert(rng.randint(0, len(b)), rng.choice("abcxyz"))
+
+        rebuilt, i, j = [], 0, 0
+        for tag, i1, i2, j1, j2 in iter_opcodes(a, b):
+            assert (i1, j1) == (i, j)
+            if tag == "equal":
+                assert a[i1:i2] == b[j1:j2]
+            rebuilt += b[j1:j2]
+            i, j = i2, j2
+        assert (i, j) == (len(a), len(b)) and rebuilt == b
+
+
+def test_inserted_paragraph_does_not_shift_everything():
+    new = "\n\n".join(["PRELIMINARY STATEMENT"] + PARAGRAPHS)
+    changes = diff_documents(BRIEF, new)
+
+    assert changes["total_changes"] == 1
+    assert changes["hunks"] == [
+        {"op": "insert", "old": [0, 0], "new": [0, 1], "added": ["PRELIMINARY STATEMENT"]}
+    ]
+    assert changes["paragraphs_modified"] == 0
+    assert changes["change_percentage"] < 1
+
+
+def test_edited_sentence_is_isolated_and_rewrapping_ignored():
+    edited = list(PARAGRAPHS)
+    edited[9] = edited[9].replace("Plaintiff relied", "Plaintiff reasonably relied")
+    edited[20] = edited[20].replace(" the ", "\nthe  ")
+    hunks = list(iter_hunks(BRIEF, "\n\n".join(edited)))
+
+    assert len(hunks) == 1
+    assert hunks[0]["op"] == "replace" and hunks[0]["old"] == [9, 10]
+    assert hunks[0]["sentences"] == [
+        {
+            "op": "replace",
+            "old": ["Plaintiff relied on that conduct."],
+            "new": ["Plaintiff reasonably relied on that conduct."],
+        }
+    ]
+
+
+def test_export_system_caches_and_streams_changes(tmp_path):
+    system = DocumentExportSystem(str(tmp_path / "export"))
+    v1 = system.create_document_version("brief", BRIEF, "alice", "draft")
+    v2 = system.create_document_version(
+        "brief", BRIEF.replace("On day 7", "On or about day 7"), "bob", "hedge"
+    )
+
+    streamed = list(system.iter_document_changes("brief", v1.version_id, v2.version_id))
+    changes = system.track_document_changes("brief", v1.version_id, v2.version_id)
+    assert changes["hunks"] == streamed and changes["paragraphs_modified"] == 1
+    assert system.track_document_changes("brief", v1.version_id, v2.version_id) is changes
@@ -0,0 +1,134 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from lawyerfactory.export import rendering_service
+from lawyerfactory.export.rendering_service import (
+    RenderingService,
+    build_document_model,
+    render_markdown,
+)
+
+CLAIMS = {
+    "title": "CLAIMS OF ACTION",
+    "use_irac": True,
+    "claims": [
+        {
+            "title": "Negligence",
+            "irac_analysis": {
+                "issue": "Whether Defendant breached a duty of care.",
+                "rule": "A driver owes a duty of reasonable care.",
+                "analysis": "Defendant ran a red light.",
+                "counterarguments": ["Comparative fault"],
+                "conclusion": "Defendant is liable.",
+            },
+        }
+    ],
+}
+METADATA = {"case_name": "Smith v. Jones", "jurisdiction": "California"}
+
+
+def _service(tmp_path, **kwargs):
+    dirs = {name: tmp_path / name for name in ("word", "pdf", "markdown")}
+    return RenderingService(dirs, use_processes=False, **kwargs)
+
+
+def test_model_is_format_independent_and_hash_stable():
+    model = build_document_model("claims_of_action", CLAIMS, METADATA)
+    kinds = [block.kind for block in model.blocks]
+
+    assert model.header == "Smith v. Jones - CLAIMS OF ACTION"
+    assert kinds[:2] == ["title", "heading"]
+    assert "bullet" in kinds
+    assert model.content_hash() == build_document_model(
+        "claims_of_action", dict(CLAIMS), dict(METADATA)
+    ).content_hash()
+
+
+def test_markdown_rendering(tmp_path):
+    model = build_document_model("claims_of_action", CLAIMS, METADATA)
+    path = render_markdown(model, str(tmp_path / "claims.md"))
+    text = Path(path).read_text()
+
+    assert text.startswith("# CLAIMS OF ACTION")
+    assert "- **Case:** Smith v. Jones" in text
+    assert "### 1. Negligence" in text
+    assert "#### CONCLUSION" in text
+    assert "- Comparative fault" in text
+
+
+@pytest.mark.asyncio
+async def test_render_all_writes_every_format_and_caches(tmp_path):
+    service = _service(tmp_path)
+    try:
+        first = await service.render_all("claims_of_action", CLAIMS, METADATA)
+        second = await service.render_all("claims_of_action", CLAIMS, METADATA)
+    finally:
+        service.close()
+
+    assert set(first) == {"word", "pdf", "markdown"}
+    assert all(Path(path).exists() for path in first.values())
+    assert second == first
+    assert service.stats["rendered"] == 3
+    assert service.stats["cache_hits"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_misses_when_content_or_file_changes(tmp_path):
+    service = _service(tmp_path)
+    try:
+        first = await service.render_all("remedies", {"title": "REMEDIES"}, METADATA, ["markdown"])
+        Path(first["markdown"]).unlink()
+        again = await service.render_all("remedies", {"title": "REMEDIES"}, METADATA, ["markdown"])
+        changed = await service.render_all(
+            "remedies", {"title": "REMEDIES", "damages": {"Medical": "$10"}}, METADATA, ["markdown"]
+        )
+    finally:
+        service.close()
+
+    assert Path(again["markdown"]).exists()
+    assert changed["markdown"] != again["markdown"]
+    assert service.stats["rendered"] == 3
+
+
+@pytest.mark.asyncio
+async def test_formats_render_concurrently(tmp_path, monkeypatch):
+    def slow(model, path):
+        time.sleep(0.2)
+        Path(path).write_text(model.title)
+        return path
+
+    monkeypatch.setattr(
+        rendering_service,
+        "RENDERERS",
+        {"word": (slow, "docx"), "pdf": (slow, "pdf"), "markdown": (slow, "md")},
+    )
+    service = _service(tmp_path, max_workers=3)
+    try:
+        started = time.perf_counter()
+        results = await service.render_all("remedies", {"title": "REMEDIES"}, METADATA)
+        elapsed = time.perf_counter() - started
+    finally:
+        service.close()
+
+    assert all(Path(path).exists() for path in results.values())
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_failed_format_is_reported_without_failing_others(tmp_path, monkeypatch):
+    def broken(model, path):
+        raise RuntimeError("renderer crashed")
+
+    renderers = dict(rendering_service.RENDERERS, pdf=(broken, "pdf"))
+    monkeypatch.setattr(rendering_service, "RENDERERS", renderers)
+    service = _service(tmp_path)
+    try:
+        results = await service.render_all("claims_of_action", CLAIMS, METADATA)
+    finally:
+        service.close()
+
+    assert results["pdf"] == "Error: renderer crashed"
+    assert Path(results["markdown"]).exists()
+    assert service.stats["failures"] == 1
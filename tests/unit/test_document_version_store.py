@@ -0,0 +1,85 @@
+import random
+
+from lawyerfactory.phases.phaseC01_editing.document_export_system import DocumentExportSystem
+from lawyerfactory.phases.phaseC01_editing.version_store import ContentStore, chunk_offsets
+
+WORDS = "the plaintiff defendant alleges that on or about vehicle contract breach damages".split()
+
+
+def _document(words=20000, seed=7):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _chunk_ends(manifest):
+    ends, offset = [], 0
+    for _, length in manifest.chunks:
+        offset += length
+        ends.append(offset)
+    return ends
+
+
+def test_incremental_chunking_matches_full_rechunk(tmp_path):
+    rng = random.Random(3)
+    store = ContentStore(tmp_path)
+    data = _document().encode()
+    manifest = store.write(data)
+
+    for _ in range(50):
+        i = rng.randrange(len(data))
+        edit = rng.choice(
+            [
+                data[:i] + b" new clause " + data[i:],
+                data[:i] + data[i + rng.randrange(1, 300) :],
+                data + b" appended",
+                b"prefix " + data,
+            ]
+        )
+        new_manifest = store.write(edit, (data, manifest))
+        assert _chunk_ends(new_manifest) == chunk_offsets(edit)
+        assert store.read(new_manifest) == edit
+        data, manifest = edit, new_manifest
+
+
+def test_small_edit_writes_only_nearby_chunks(tmp_path):
+    store = ContentStore(tmp_path)
+    data = _document().encode()
+    manifest = store.write(data)
+    written = store.stats.blobs_written
+    rechunked = store.stats.bytes_rechunked
+
+    middle = len(data) // 2
+    edited = data[:middle] + b" amended " + data[middle:]
+    store.write(edited, (data, manifest))
+
+    assert store.stats.blobs_written - written <= 5
+    assert store.stats.bytes_rechunked - rechunked < len(data) // 10
+
+
+def test_versions_survive_restart_via_journal(tmp_path):
+    text = _document(5000)
+    system = DocumentExportSystem(str(tmp_path / "export"))
+    v1 = system.create_document_version("sof-1", text, "alice", "initial")
+    edited = text.replace("breach", "material breach", 1)
+    v2 = system.create_document_version("sof-1", edited, "bob", "tighten breach")
+
+    reopened = DocumentExportSystem(str(tmp_path / "export"))
+    history = reopened.get_document_history("sof-1")
+    assert history["version_count"] == 2 and history["total_authors"] == 2
+    assert reopened._load_document_version("sof-1", v1.version_id) == text
+    assert reopened._load_document_version("sof-1", v2.version_id) == edited
+    assert reopened._get_version_info("sof-1", v2.version_id).parent_version == v1.version_id
+
+    # The second version is journaled as a small splice of the first
+    journal = (tmp_path / "export" / "registry_journal.jsonl").read_text().splitlines()
+    assert len(journal) == 2 and "manifest_delta" in journal[1]
+    assert len(journal[1]) < len(journal[0])
+
+
+def test_legacy_text_versions_still_load(tmp_path):
+    system = DocumentExportSystem(str(tmp_path / "export"))
+    legacy = tmp_path / "export" / "versions" / "old-doc"
+    legacy.mkdir(parents=True)
+    (legacy / "ver_1.txt").write_text("legacy content", encoding="utf-8")
+
+    assert system._load_document_version("old-doc", "ver_1") == "legacy content"
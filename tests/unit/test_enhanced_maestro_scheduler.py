@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from lawyerfactory.compose.maestro.enhanced_maestro import (
+    EnhancedMaestro,
+    TaskScheduler,
+    WorkflowState,
+)
+from lawyerfactory.compose.maestro.workflow_models import (
+    PhaseStatus,
+    TaskPriority,
+    WorkflowPhase,
+    WorkflowTask,
+)
+
+
+def _task(task_id, agent="ResearchBot", priority=TaskPriority.NORMAL, depends_on=()):
+    return WorkflowTask(
+        id=task_id,
+        phase=WorkflowPhase.RESEARCH,
+        agent_type=agent,
+        description=task_id,
+        priority=priority,
+        depends_on=list(depends_on),
+    )
+
+
+def test_ready_tasks_follow_priority_dependencies_and_agent_limits():
+    scheduler = TaskScheduler(agent_limits={"WriterBot": 1})
+    scheduler.add_task(_task("draft", agent="WriterBot", depends_on=["research"]))
+    scheduler.add_task(_task("research", priority=TaskPriority.LOW))
+    scheduler.add_task(_task("caption", agent="WriterBot", priority=TaskPriority.HIGH))
+    scheduler.add_task(_task("summary", agent="WriterBot", priority=TaskPriority.CRITICAL))
+
+    first = scheduler.get_ready_tasks(max_count=5)
+    assert [t.id for t in first] == ["summary", "research"]  # one WriterBot slot
+
+    for task in first:
+        scheduler.complete_task(task)
+    second = scheduler.get_ready_tasks(max_count=5)
+    assert [t.id for t in second] == ["caption"]
+
+    scheduler.complete_task(second[0])
+    assert [t.id for t in scheduler.get_ready_tasks()] == ["draft"]
+
+
+def test_failed_dependency_keeps_dependents_blocked_and_orphans_are_released():
+    scheduler = TaskScheduler()
+    scheduler.add_task(_task("a"))
+    scheduler.add_task(_task("b", depends_on=["a"]))
+    scheduler.add_task(_task("c", depends_on=["never-scheduled"]))
+
+    (a,) = scheduler.get_ready_tasks()
+    scheduler.complete_task(a, succeeded=False)
+
+    assert [t.id for t in scheduler.get_ready_tasks()] == ["c"]
+    assert [t.id for t in scheduler.task_queue] == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_batch_tasks_run_concurrently(tmp_path):
+    maestro = EnhancedMaestro(storage_path=str(tmp_path / "wf"))
+    state = WorkflowState(session_id="s1", case_name="Case")
+    in_flight = 0
+    peak = 0
+
+    async def slow_task(task, workflow_state):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return {"task_id": task.id}
+
+    maestro._execute_task = slow_task
+    tasks = [_task(f"t{i}", agent=f"Bot{i}") for i in range(3)]
+    for task in tasks:
+        maestro.scheduler.add_task(task)
+
+    await maestro._execute_tasks_batch(maestro.scheduler.get_ready_tasks(), state)
+
+    assert peak == 3
+    assert sorted(state.completed_tasks) == ["t0", "t1", "t2"]
+    assert all(t.status == PhaseStatus.COMPLETED for t in tasks)
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from lawyerfactory.compose.maestro.events import EventBus
+
+
+@pytest.mark.asyncio
+async def test_emit_does_not_wait_for_slow_handlers():
+    bus = EventBus()
+    release = asyncio.Event()
+    seen = []
+
+    async def slow(event):
+        await release.wait()
+        seen.append(event["data"]["n"])
+
+    bus.subscribe("task_completed", slow)
+    for n in range(3):
+        await asyncio.wait_for(bus.emit("task_completed", {"n": n}), timeout=0.5)
+
+    assert seen == []
+    release.set()
+    await bus.drain()
+    assert seen == [0, 1, 2]  # per-subscriber order is kept
+
+    metrics = bus.get_metrics()["subscribers"]["task_completed"][0]
+    assert metrics["handled"] == 3
+    assert metrics["max_queue_depth"] >= 1
+    assert metrics["queue_depth"] == 0
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_overflow_policies():
+    bus = EventBus()
+    release = asyncio.Event()
+    received = {"oldest": [], "newest": []}
+
+    def handler(name):
+        async def handle(event):
+            await release.wait()
+            received[name].append(event["data"]["n"])
+
+        return handle
+
+    bus.subscribe("e", handler("oldest"), max_queue_size=2, overflow_policy="drop_oldest")
+    bus.subscribe("e", handler("newest"), max_queue_size=2, overflow_policy="drop_newest")
+
+    await bus.emit("e", {"n": 0})
+    await asyncio.sleep(0)  # workers pick up event 0 and block on it
+    for n in range(1, 5):
+        await bus.emit("e", {"n": n})
+
+    release.set()
+    await bus.drain()
+    assert received["oldest"] == [0, 3, 4]
+    assert received["newest"] == [0, 1, 2]
+    assert [m["dropped"] for m in bus.get_metrics()["subscribers"]["e"]] == [2, 2]
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure():
+    bus = EventBus(max_queue_size=1, overflow_policy="block")
+    release = asyncio.Event()
+
+    async def handle(event):
+        await release.wait()
+
+    bus.subscribe("e", handle)
+    await bus.emit("e", {})
+    await asyncio.sleep(0)
+    await bus.emit("e", {})  # fills the queue
+
+    blocked = asyncio.ensure_future(bus.emit("e", {}))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await asyncio.wait_for(blocked, timeout=0.5)
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_history_ring_buffer_keeps_type_index_in_step():
+    bus = EventBus(max_history_size=4)
+    for n in range(6):
+        await bus.emit("a" if n % 2 else "b", {"n": n})
+
+    assert [e["data"]["n"] for e in bus.get_event_history()] == [2, 3, 4, 5]
+    assert [e["data"]["n"] for e in bus.get_event_history("a")] == [3, 5]
+    assert [e["data"]["n"] for e in bus.get_event_history("b", limit=1)] == [4]
+    assert bus.get_event_history("missing") == []
+
+    bus.clear_history()
+    assert bus.get_event_history() == []
+
+
+@pytest.mark.asyncio
+async def test_close_stops_workers_and_next_emit_restarts_them():
+    bus = EventBus()
+    seen = []
+    bus.subscribe("e", seen.append)
+
+    await bus.emit("e", {"n": 1})
+    await bus.close()
+    assert seen and all(s.worker is None for s in bus._subscriptions["e"])
+
+    await bus.emit("e", {"n": 2})
+    await bus.close()
+    assert [e["data"]["n"] for e in seen] == [1, 2]
+
+
+def test_bus_is_usable_across_event_loops():
+    bus = EventBus(overflow_policy="block", max_queue_size=1)
+    seen = []
+
+    async def handle(event):
+        await asyncio.sleep(0)
+        seen.append(event["data"]["n"])
+
+    bus.subscribe("e", handle)
+
+    async def emit_all(start):
+        for n in range(start, start + 3):
+            await bus.emit("e", {"n": n})
+        await bus.drain()
+
+    asyncio.run(emit_all(0))
+    # The second loop gets its own queue and worker instead of the first loop's
+    asyncio.run(emit_all(3))
+    asyncio.run(bus.close())
+
+    assert seen == list(range(6))
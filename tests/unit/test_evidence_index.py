@@ -0,0 +1,108 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "apps/api"))
+
+from evidence_index import (
+    DEFAULT_PAGE_SIZE,
+    EvidenceIndex,
+    parse_page_args,
+    parse_relevance_score,
+)
+
+
+def _entry(evidence_id, **fields):
+    entry = {
+        "evidence_id": evidence_id,
+        "source_document": f"{evidence_id}.pdf",
+        "content": "",
+        "evidence_type": "document",
+        "evidence_source": "discovery",
+        "relevance_score": 0.5,
+    }
+    entry.update(fields)
+    return entry
+
+
+def test_filters_and_search_use_indexes():
+    index = EvidenceIndex(
+        [
+            _entry("e1", content="Defendant breached the lease agreement"),
+            _entry("e2", content="Negligent maintenance of stairwell", evidence_source="testimony"),
+            _entry("e3", content="Lease renewal notice", evidence_type="email"),
+        ]
+    )
+
+    page = index.query({"search": "lease"})
+    assert [e["evidence_id"] for e in page["evidence"]] == ["e1", "e3"]
+
+    page = index.query({"search": "neglig"})
+    assert [e["evidence_id"] for e in page["evidence"]] == ["e2"]
+
+    page = index.query({"search": "the lease", "evidence_type": "document"})
+    assert [e["evidence_id"] for e in page["evidence"]] == ["e1"]
+
+    page = index.query({"evidence_source": "testimony"})
+    assert page["total"] == 1
+
+
+def test_cursor_pagination_and_projection():
+    index = EvidenceIndex(_entry(f"e{i}") for i in range(5))
+    del index["e1"]
+
+    first = index.query(limit=2, fields=["source_document"])
+    assert [e["evidence_id"] for e in first["evidence"]] == ["e0", "e2"]
+    assert set(first["evidence"][0]) == {"evidence_id", "source_document"}
+    assert first["total"] == 4
+
+    second = index.query(limit=2, cursor=first["next_cursor"])
+    assert [e["evidence_id"] for e in second["evidence"]] == ["e3", "e4"]
+    assert second["next_cursor"] is None
+
+    with pytest.raises(ValueError):
+        index.query(cursor="not-a-cursor")
+
+
+def test_patch_and_delete_keep_indexes_and_stats_consistent():
+    index = EvidenceIndex([_entry("e1", content="original text"), _entry("e2")])
+
+    index.patch("e1", {"content": "amended text", "evidence_type": "email", "relevance_score": 1.0})
+    assert index.query({"search": "original"})["total"] == 0
+    assert index.query({"search": "amended"})["total"] == 1
+    assert index.query({"evidence_type": "email"})["total"] == 1
+
+    stats = index.stats()
+    assert stats["by_type"] == {"email": 1, "document": 1}
+    assert abs(stats["average_relevance_score"] - 0.75) < 1e-9
+
+    del index["e2"]
+    stats = index.stats()
+    assert stats["total_count"] == 1
+    assert stats["by_type"] == {"email": 1}
+
+    index.clear()
+    assert index.stats()["total_count"] == 0
+    assert index.query()["evidence"] == []
+
+
+def test_unpaged_query_returns_every_entry():
+    index = EvidenceIndex(_entry(f"e{i}") for i in range(DEFAULT_PAGE_SIZE + 5))
+
+    page = index.query()
+    assert page["count"] == page["total"] == DEFAULT_PAGE_SIZE + 5
+    assert page["next_cursor"] is None
+
+    assert parse_page_args({}) == (None, None, None)
+    assert parse_page_args({"cursor": "abc"})[0] == DEFAULT_PAGE_SIZE
+
+
+def test_relevance_score_is_validated():
+    assert parse_relevance_score("0.25") == 0.25
+    for bad in ("high", None, float("nan"), True):
+        with pytest.raises(ValueError):
+            parse_relevance_score(bad)
+
+    index = EvidenceIndex([_entry("e1", relevance_score="high")])
+    assert index.stats()["average_relevance_score"] == 0.0
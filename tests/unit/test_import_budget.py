@@ -0,0 +1,52 @@
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Generous enough for a cold CI runner; a regression to eager model loading
+# (sentence-transformers, spaCy, Qdrant round-trips) costs several seconds.
+IMPORT_BUDGET_MS = float(os.getenv("LF_IMPORT_BUDGET_MS", "3000"))
+
+HEAVY_MODULES = ("sentence_transformers", "torch", "spacy", "transformers")
+
+
+def _import_times(module, cwd):
+    env = dict(os.environ)
+    env["LF_DISABLE_EVENTLET"] = "1"
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(ROOT / "apps/api"), str(ROOT / "src"), env.get("PYTHONPATH", "")]
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total) / 1000.0
+    return cumulative
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["server", "lawyerfactory.phases.phaseA01_intake.ingestion.server"],
+)
+def test_server_import_stays_within_budget(module, tmp_path):
+    times = _import_times(module, tmp_path)
+
+    assert times[module] < IMPORT_BUDGET_MS, f"importing {module} took {times[module]:.0f}ms"
+    loaded = [name for name in HEAVY_MODULES if name in times]
+    assert not loaded, f"importing {module} eagerly loaded {loaded}"
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from lawyerfactory.compose.maestro.ingest_pipeline import IngestPipeline
+from lawyerfactory.kg.graph_api import EnhancedKnowledgeGraph
+
+
+def _case_folder(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"doc_{i}.txt"
+        path.write_text(
+            f"Plaintiff Jane Roe v. Defendant Acme Corp. Exhibit {i}: "
+            "the defendant breached the contract and caused damages."
+        )
+        paths.append(str(path))
+    return paths
+
+
+@pytest.mark.asyncio
+async def test_pipeline_ingests_into_knowledge_graph(tmp_path):
+    kg = EnhancedKnowledgeGraph(str(tmp_path / "kg.db"))
+    paths = _case_folder(tmp_path, 7) + [str(tmp_path / "missing.txt")]
+    pipeline = IngestPipeline(knowledge_graph=kg, use_processes=False, max_workers=2)
+    try:
+        report = await pipeline.run(paths, batch_size=3)
+    finally:
+        pipeline.close()
+        kg.close()
+
+    assert [doc.path for doc in report.documents] == paths
+    assert [doc.path for doc in report.failed] == paths[-1:]
+    assert report.failed[0].error.startswith("extract:")
+
+    stored = [doc for doc in report.documents if doc.entity_id]
+    assert len(stored) == 7
+    assert all(doc.classification["document_type"] for doc in stored)
+    assert all(doc.embedding == [] for doc in stored)  # no embedding service
+
+    summary = report.summary()
+    assert summary["documents"] == 8 and summary["failed"] == 1
+    assert list(summary["stages"]) == ["extract", "classify", "store"]
+    assert summary["stages"]["extract"] == {
+        **summary["stages"]["extract"],
+        "items": 8,
+        "batches": 3,
+        "errors": 1,
+    }
+    assert summary["stages"]["store"]["batches"] == 3
+
+
+@pytest.mark.asyncio
+async def test_stages_overlap_across_batches(tmp_path):
+    timeline = []
+
+    class SlowEmbedder:
+        async def generate_embeddings(self, texts):
+            timeline.append(("embed_start", len(texts)))
+            await asyncio.sleep(0.05)
+            timeline.append(("embed_end", len(texts)))
+            return [[1.0, 0.0]] * len(texts)
+
+    pipeline = IngestPipeline(
+        embedding_service=SlowEmbedder(), use_processes=False, max_workers=2
+    )
+    original_extract = pipeline._extract
+
+    async def tracing_extract(batch, stats):
+        timeline.append(("extract", len(batch)))
+        await original_extract(batch, stats)
+
+    pipeline._extract = tracing_extract
+    try:
+        report = await pipeline.run(_case_folder(tmp_path, 6), batch_size=2)
+    finally:
+        pipeline.close()
+
+    # Later batches are extracted before the first batch has finished embedding
+    first_embed_end = timeline.index(("embed_end", 2))
+    assert timeline[:first_embed_end].count(("extract", 2)) >= 2
+    assert all(doc.embedding == [1.0, 0.0] for doc in report.documents)
+
+
+@pytest.mark.asyncio
+async def test_embedding_failure_keeps_documents(tmp_path):
+    class BrokenEmbedder:
+        async def generate_embeddings(self, texts):
+            raise RuntimeError("quota exceeded")
+
+    pipeline = IngestPipeline(
+        embedding_service=BrokenEmbedder(), use_processes=False, max_workers=2
+    )
+    try:
+        report = await pipeline.run(_case_folder(tmp_path, 3), batch_size=2)
+    finally:
+        pipeline.close()
+
+    assert not report.failed
+    assert all(doc.embedding == [] for doc in report.documents)
+    assert report.stages["embed"].errors == 2
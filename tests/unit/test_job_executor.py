@@ -0,0 +1,94 @@
+from pathlib import Path
+import sys
+import threading
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "apps/api"))
+
+from job_executor import (
+    CANCELLED,
+    COMPLETED,
+    FAILED,
+    INTERRUPTED,
+    QUEUED,
+    JobExecutor,
+    JobStore,
+)
+
+
+def _wait_for(executor, job_id, statuses, timeout=5.0):
+    event = threading.Event()
+    deadline = threading.Timer(timeout, event.set)
+    deadline.start()
+    try:
+        while not event.is_set():
+            job = executor.get(job_id)
+            if job["status"] in statuses:
+                return job
+            event.wait(0.01)
+    finally:
+        deadline.cancel()
+    raise AssertionError(f"job {job_id} stuck in {executor.get(job_id)['status']}")
+
+
+def test_per_case_limit_queues_jobs_and_records_progress(tmp_path):
+    executor = JobExecutor(JobStore(str(tmp_path / "jobs.db")), max_workers=4, per_case_limit=1)
+    release = threading.Event()
+
+    def blocking_job(job, payload):
+        job.report(50, "halfway")
+        release.wait(5)
+        return {"value": payload["value"]}
+
+    first = executor.submit("case-1", "phaseB02_drafting", blocking_job, {"value": 1})
+    second = executor.submit("case-1", "phaseB02_drafting", blocking_job, {"value": 2})
+
+    _wait_for(executor, first, {"running"})
+    assert executor.get(second)["status"] == QUEUED
+
+    release.set()
+    assert _wait_for(executor, second, {COMPLETED})["result"] == {"value": 2}
+    assert executor.get(first)["progress"] == 100
+    executor.shutdown()
+
+
+def test_cancellation_is_cooperative(tmp_path):
+    executor = JobExecutor(JobStore(str(tmp_path / "jobs.db")), max_workers=2, per_case_limit=1)
+    started = threading.Event()
+    updates = []
+    executor.on_update = lambda job: updates.append(job["status"])
+
+    def long_job(job, payload):
+        started.set()
+        for step in range(500):
+            job.report(step // 5, "working")
+            threading.Event().wait(0.005)
+        return {}
+
+    running = executor.submit("case-1", "phaseC02_orchestration", long_job)
+    queued = executor.submit("case-1", "phaseC02_orchestration", long_job)
+    started.wait(5)
+
+    assert executor.cancel(queued)["status"] == CANCELLED
+    assert executor.cancel(running)["cancel_requested"] is True
+    assert _wait_for(executor, running, {CANCELLED, COMPLETED})["status"] == CANCELLED
+    assert "running" in updates
+    executor.shutdown()
+
+
+def test_failures_and_restart_state_are_persisted(tmp_path):
+    db_path = str(tmp_path / "jobs.db")
+    executor = JobExecutor(JobStore(db_path), max_workers=1)
+
+    def broken_job(job, payload):
+        raise RuntimeError("pipeline exploded")
+
+    failed = executor.submit("case-1", "phaseA02_research", broken_job)
+    assert _wait_for(executor, failed, {FAILED})["error"] == "pipeline exploded"
+    executor.shutdown()
+
+    store = JobStore(db_path)
+    store.create("orphan", "case-1", "phaseA03_outline", {})
+    restarted = JobExecutor(store, max_workers=1)
+    assert restarted.get("orphan")["status"] == INTERRUPTED
+    assert [job["job_id"] for job in restarted.list_jobs("case-1")] == [failed, "orphan"]
+    restarted.shutdown()
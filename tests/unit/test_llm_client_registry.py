@@ -0,0 +1,49 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "apps/api"))
+
+from llm_clients import LLMClientRegistry
+
+
+def _registry():
+    built = []
+
+    def factory(api_key, base_url):
+        client = object()
+        built.append((api_key, base_url, client))
+        return client
+
+    return LLMClientRegistry({"openai": factory, "anthropic": factory}), built
+
+
+def test_clients_are_reused_per_configuration():
+    registry, built = _registry()
+
+    first = registry.get_client("openai", None, "key-1")
+    assert registry.get_client("openai", None, "key-1") is first
+    assert registry.get_client("openai", "https://proxy.local/v1", "key-1") is not first
+    assert len(built) == 2
+    assert registry.stats["reused"] == 1
+
+
+def test_invalidate_forces_rebuild():
+    registry, built = _registry()
+    registry.get_client("openai", None, "key-1")
+    registry.get_client("anthropic", None, "key-2")
+
+    assert registry.invalidate("anthropic") == 1
+    assert len(registry) == 1
+    assert registry.invalidate() == 1
+
+    registry.get_client("openai", None, "key-1")
+    assert len(built) == 3
+
+
+def test_unknown_provider_raises():
+    registry, _ = _registry()
+    assert not registry.supports("groq")
+    with pytest.raises(ValueError):
+        registry.get_client("groq", None, "key")
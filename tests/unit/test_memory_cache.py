@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+
+from lawyerfactory.storage.vectors.memory_compression import (
+    CompressionLevel,
+    MCPMemoryManager,
+    MemoryCache,
+    MemoryEntry,
+    MemoryType,
+)
+
+CONTEXT = "The tenant reported the leak on March 3 and the landlord did nothing. " * 10
+
+
+def _entry(memory_id, content):
+    return MemoryEntry(
+        id=memory_id,
+        content=content,
+        memory_type=MemoryType.CASE_CONTEXT,
+        compression_level=CompressionLevel.LOW,
+        timestamp=datetime.now(),
+    )
+
+
+def test_cache_evicts_least_recently_used_by_bytes():
+    cache = MemoryCache(max_bytes=250, max_view_bytes=100)
+    for memory_id in ("a", "b"):
+        cache.put(_entry(memory_id, "x" * 100))
+    cache.get("a")
+    cache.put(_entry("c", "x" * 100))
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.bytes == 200
+    assert cache.stats["evictions"] == 1
+    assert not cache.put(_entry("huge", "x" * 300))
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_decompress_once_and_keep_payload():
+    manager = MCPMemoryManager()
+    calls = []
+
+    async def decompress(content, memory_type):
+        calls.append(content)
+        return content.upper()
+
+    manager._decompress_content = decompress
+    memory_id = await manager.store_memory(CONTEXT, MemoryType.CASE_CONTEXT, "s1")
+    stored = manager.memory_cache[memory_id].content
+
+    first = await manager.retrieve_memory(memory_id)
+    second = await manager.retrieve_memory(memory_id)
+    raw = await manager.retrieve_memory(memory_id, decompress=False)
+
+    assert first.content == second.content == stored.upper()
+    assert raw.content == stored
+    assert manager.memory_cache[memory_id].content == stored
+    assert len(calls) == 1
+    assert manager.memory_cache[memory_id].access_count == 3
+
+
+@pytest.mark.asyncio
+async def test_compression_runs_in_background_and_is_incremental():
+    created = []
+
+    async def create_entities(payload):
+        created.extend(entity["name"] for entity in payload["entities"])
+
+    manager = MCPMemoryManager({"create_entities": create_entities}, compression_batch_size=1)
+    manager.compression_strategies[MemoryType.CASE_CONTEXT]["max_entries"] = 3
+    memory_ids = [
+        await manager.store_memory(CONTEXT, MemoryType.CASE_CONTEXT, "s1") for _ in range(5)
+    ]
+    await manager.join_compression()
+
+    refs = manager.session_index["s1"]
+    compressed = [m for m in memory_ids if refs[m].compression_level is CompressionLevel.HIGH]
+    assert len(compressed) == 2
+    for memory_id in compressed:
+        assert len(manager.memory_cache[memory_id].content) < len(CONTEXT) * 0.3
+
+    writes = len(created)
+    stats = await manager.compress_session_context("s1")
+    assert stats["compressed_count"] == 0
+    assert len(created) == writes + 1  # only the compression summary
+    await manager.stop_background_compression()
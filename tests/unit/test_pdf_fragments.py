@@ -0,0 +1,153 @@
+import json
+from pathlib import Path
+import threading
+
+import pytest
+
+from apps.cli.one_click_case_builder import IntakeAnswers, _build_package_content
+from lawyerfactory.post_production import pdf_generator
+from lawyerfactory.post_production.pdf_generator import (
+    DocumentMetadata,
+    FormattingOptions,
+    LegalPDFGenerator,
+    fragment_key,
+)
+
+METADATA = DocumentMetadata(
+    title="COMPLAINT",
+    case_name="Smith v. Jones",
+    case_number="CV-1",
+    court="Superior Court",
+    attorney_name="A. Lawyer",
+)
+PAGES = [
+    ["INTRODUCTION", "Plaintiff brings this action."],
+    ["FIRST CAUSE OF ACTION", "Defendant was negligent.", "Plaintiff was harmed."],
+    ["PRAYER FOR RELIEF", "Plaintiff requests damages."],
+]
+CONTENT = "\f".join("\n\n".join(page) for page in PAGES)
+
+
+def _fake_render(blocks, formatting, path, number_pages=False):
+    Path(path).write_text(json.dumps(blocks))
+    # One page per two body paragraphs, at least one
+    return max(1, sum(kind == "body" for kind, _ in blocks) // 2 + 1)
+
+
+def _fake_merge(paths, formatting, output_path):
+    pages = sum(_fake_render(json.loads(Path(p).read_text()), formatting, p) for p in paths)
+    Path(output_path).write_text("merged")
+    return pages
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_generator, "render_fragment", _fake_render)
+    monkeypatch.setattr(pdf_generator, "merge_fragments", _fake_merge)
+    generator = LegalPDFGenerator(str(tmp_path), use_processes=False)
+    monkeypatch.setattr(pdf_generator, "REPORTLAB_AVAILABLE", True)
+    monkeypatch.setattr(pdf_generator, "PYPDF_AVAILABLE", True)
+    monkeypatch.setattr(pdf_generator, "PdfReader", None, raising=False)
+    yield generator
+    generator.close()
+
+
+def test_sections_split_at_page_breaks_with_caption_and_signature(generator):
+    sections = generator._plan_sections(CONTENT, METADATA, FormattingOptions())
+
+    assert len(sections) == 3
+    assert sections[0][0] == ("court", "SUPERIOR COURT")
+    assert ("heading", "INTRODUCTION") in sections[0]
+    assert sections[1][0] == ("heading", "FIRST CAUSE OF ACTION")
+    assert ("signature", "A. Lawyer") in sections[-1]
+
+
+def test_headings_without_page_breaks_stay_in_one_section(generator):
+    flowing = CONTENT.replace("\f", "\n\n")
+
+    sections = generator._plan_sections(flowing, METADATA, FormattingOptions())
+
+    assert len(sections) == 1
+    headings = [value for kind, value in sections[0] if kind == "heading"]
+    assert headings == ["INTRODUCTION", "FIRST CAUSE OF ACTION", "PRAYER FOR RELIEF"]
+
+
+def test_fragment_key_depends_on_content_and_formatting():
+    blocks = [("body", "text")]
+
+    assert fragment_key(blocks, FormattingOptions()) == fragment_key(
+        list(blocks), FormattingOptions()
+    )
+    assert fragment_key(blocks, FormattingOptions()) != fragment_key(
+        blocks, FormattingOptions(double_space_pleadings=False)
+    )
+    assert fragment_key(blocks, FormattingOptions()) != fragment_key(
+        [("body", "text!")], FormattingOptions()
+    )
+
+
+@pytest.mark.asyncio
+async def test_one_section_edit_rerenders_only_that_section(generator):
+    first = await generator.generate_pdf(CONTENT, METADATA, output_filename="v1.pdf")
+    edited = CONTENT.replace("Defendant was negligent.", "Defendant was reckless.")
+    second = await generator.generate_pdf(edited, METADATA, output_filename="v2.pdf")
+
+    assert first.success and second.success
+    assert (first.sections_rendered, first.sections_reused) == (3, 0)
+    assert (second.sections_rendered, second.sections_reused) == (1, 2)
+    assert first.page_count == second.page_count == 4
+    assert Path(second.file_path).exists()
+
+
+@pytest.mark.asyncio
+async def test_case_package_edit_rerenders_only_the_changed_section(generator, tmp_path):
+    answers = IntakeAnswers(
+        plaintiff="Jane Doe",
+        defendant="Acme Corp",
+        venue="Superior Court",
+        jurisdiction="California",
+        intake_statement="Acme breached our contract and failed to pay invoices.",
+        evidence_folder=str(tmp_path),
+    )
+    invoice, email = tmp_path / "invoice.pdf", tmp_path / "email.txt"
+    first_content = _build_package_content(answers, [invoice], "case_1")
+    second_content = _build_package_content(answers, [invoice, email], "case_1")
+
+    first = await generator.generate_pdf(first_content, METADATA, output_filename="v1.pdf")
+    second = await generator.generate_pdf(second_content, METADATA, output_filename="v2.pdf")
+
+    assert first.success and second.success
+    assert (first.sections_rendered, first.sections_reused) == (4, 0)
+    assert (second.sections_rendered, second.sections_reused) == (1, 3)
+
+
+@pytest.mark.asyncio
+async def test_evicted_fragments_are_removed_from_disk(generator):
+    generator.max_cached_fragments = 2
+    await generator.generate_pdf(CONTENT, METADATA, output_filename="v1.pdf")
+
+    fragments = list(Path(generator.fragment_directory).glob("*.pdf"))
+    assert len(fragments) == 2
+    assert len(generator._fragment_pages) == 2
+
+
+@pytest.mark.asyncio
+async def test_fragments_from_disk_are_counted_in_the_pool(generator, tmp_path, monkeypatch):
+    await generator.generate_pdf(CONTENT, METADATA, output_filename="v1.pdf")
+    counted_on = []
+
+    def count_pages(path):
+        counted_on.append(threading.current_thread().name)
+        return 1
+
+    monkeypatch.setattr(pdf_generator, "count_pages", count_pages)
+    monkeypatch.setattr(LegalPDFGenerator, "_setup_styles", lambda self: None)
+    fresh = LegalPDFGenerator(str(tmp_path), use_processes=False)
+    try:
+        result = await fresh.generate_pdf(CONTENT, METADATA, output_filename="v2.pdf")
+    finally:
+        fresh.close()
+
+    assert (result.sections_rendered, result.sections_reused) == (0, 3)
+    assert len(counted_on) == 3
+    assert all(name.startswith("pdf") for name in counted_on)
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from lawyerfactory.compose.maestro.prompt_chain_orchestrator import PromptChainOrchestrator
+from lawyerfactory.outline.generator import SectionType, SkeletalOutline, SkeletalSection
+
+
+def _outline():
+    facts = SkeletalSection(
+        section_id="facts",
+        section_type=SectionType.STATEMENT_OF_FACTS,
+        title="Statement of Facts",
+        fact_mapping={"timeline": ["f1", "f2"]},
+        evidence_mapping={"timeline": ["e1"]},
+    )
+    coa = SkeletalSection(
+        section_id="coa",
+        section_type=SectionType.CAUSE_OF_ACTION,
+        title="Breach of Contract",
+        roman_numeral="V",
+        priority_level=2,
+        fact_mapping={"breach": ["f2", "f3"]},
+        evidence_mapping={"breach": ["e1", "e2"]},
+        legal_authorities=["Cal. Civ. Code 3300"],
+    )
+    parties = SkeletalSection(
+        section_id="parties", section_type=SectionType.PARTIES, title="Parties"
+    )
+    return SkeletalOutline(outline_id="o1", case_id="c1", sections=[parties, facts, coa])
+
+
+class ScriptedLLM:
+    """Answers each section with numbered paragraphs, finishing in reverse order"""
+
+    def __init__(self, fail_on=None):
+        self.prompts = {}
+        self.fail_on = fail_on
+        self.cancelled = []
+
+    async def generate_content(self, prompt, max_tokens, temperature):
+        title = prompt.split("SECTION TO GENERATE: ")[1].splitlines()[0]
+        self.prompts[title] = prompt
+        if title == self.fail_on:
+            raise RuntimeError("llm down")
+        try:
+            await asyncio.sleep({"Parties": 0.03, "Statement of Facts": 0.02}.get(title, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled.append(title)
+            raise
+        return {"content": f"{title}\n\n1. First.\n\n2. Second."}
+
+
+@pytest.mark.asyncio
+async def test_assignments_and_numbering_do_not_depend_on_completion_order():
+    llm = ScriptedLLM()
+    result = await PromptChainOrchestrator(None, llm_service=llm).execute_prompt_chain(_outline())
+
+    assert result.success
+    coa_prompt = llm.prompts["Breach of Contract"]
+    assert "Facts for breach: ['f3']" in coa_prompt
+    assert "Evidence for breach: ['e2']" in coa_prompt
+    assert "Covered facts: ['f2']" in coa_prompt
+    assert "Facts for timeline: ['f1', 'f2']" in llm.prompts["Statement of Facts"]
+
+    context = result.generation_context
+    assert context.section_references == {
+        "parties": [1, 2],
+        "facts": [3, 4],
+        "coa": [5, 6],
+    }
+    assert "5. First." in result.generated_sections["coa"]
+    assert context.used_facts == ["f1", "f2", "f3"]
+
+
+@pytest.mark.asyncio
+async def test_section_failure_cancels_the_rest_of_the_chain():
+    llm = ScriptedLLM(fail_on="Breach of Contract")
+
+    result = await PromptChainOrchestrator(None, llm_service=llm).execute_prompt_chain(_outline())
+
+    assert not result.success
+    assert result.errors == ["llm down"]
+    assert sorted(llm.cancelled) == ["Parties", "Statement of Facts"]
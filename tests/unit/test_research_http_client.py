@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import pytest
+
+from lawyerfactory.compose.bots.research import CourtListenerClient
+from lawyerfactory.research.http_client import (
+    CircuitOpenError,
+    HttpError,
+    HttpResponse,
+    MockTransport,
+    ResearchHttpClient,
+)
+
+
+def _json(status=200, payload=None, **headers):
+    return HttpResponse(status, headers, json.dumps(payload or {}).encode())
+
+
+def _client(handler, **kwargs):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    transport = MockTransport(handler)
+    client = ResearchHttpClient(transport, sleep=fake_sleep, **kwargs)
+    return client, transport, sleeps
+
+
+@pytest.mark.asyncio
+async def test_retries_honour_retry_after():
+    responses = [_json(429, **{"retry-after": "7"}), _json(503), _json(200, {"ok": True})]
+    client, transport, sleeps = _client(lambda request: responses.pop(0), backoff_base=0.1)
+
+    assert await client.get_json("https://api.example.test/x") == {"ok": True}
+    assert len(transport.requests) == 3
+    assert sleeps[0] == 7
+    assert 0 <= sleeps[1] <= 0.2  # jittered exponential backoff
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_requests_only_retry_safe_statuses():
+    client, transport, _ = _client(lambda request: _json(500))
+
+    with pytest.raises(HttpError):
+        await client.post_json("https://api.example.test/search", {"q": "x"})
+    assert len(transport.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_and_half_opens():
+    now = [0.0]
+    client, transport, _ = _client(
+        lambda request: _json(502),
+        max_retries=0,
+        failure_threshold=2,
+        reset_timeout=10,
+        clock=lambda: now[0],
+    )
+
+    for _ in range(2):
+        with pytest.raises(HttpError):
+            await client.get_json("https://flaky.test/a")
+    with pytest.raises(CircuitOpenError):
+        await client.get_json("https://flaky.test/b")
+    assert len(transport.requests) == 2
+
+    now[0] = 11
+    transport.handler = lambda request: _json(200, {"ok": True})
+    assert await client.get_json("https://flaky.test/c") == {"ok": True}
+    assert client.breaker("flaky.test").state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_serves_cached_body_on_304():
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return HttpResponse(304, {})
+        return _json(200, {"n": 1}, etag='"v1"')
+
+    client, transport, _ = _client(handler)
+    first = await client.request("GET", "https://api.example.test/works", params={"q": "x"})
+    second = await client.request("GET", "https://api.example.test/works", params={"q": "x"})
+
+    assert second.json() == first.json() == {"n": 1}
+    assert second.from_cache and not first.from_cache
+    assert client.stats["not_modified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency_limit():
+    in_flight = {"a.test": 0, "b.test": 0}
+    peak = {"a.test": 0, "b.test": 0}
+
+    async def handler(request):
+        host = request.host
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return _json(200)
+
+    client, _, _ = _client(handler, per_host_limit=2)
+    await asyncio.gather(
+        *(client.get_json(f"https://{host}/{i}") for host in in_flight for i in range(5))
+    )
+    assert peak == {"a.test": 2, "b.test": 2}
+
+
+@pytest.mark.asyncio
+async def test_courtlistener_client_uses_injected_transport():
+    def handler(request):
+        assert request.headers["Authorization"] == "Token secret"
+        assert "q=negligence" in request.url
+        return _json(200, {"results": [{"case_name": "Smith v. Jones"}]})
+
+    client, _, _ = _client(handler)
+    courtlistener = CourtListenerClient("secret", http_client=client)
+
+    results = await courtlistener.search_opinions("negligence", limit=5)
+    assert results == [{"case_name": "Smith v. Jones"}]
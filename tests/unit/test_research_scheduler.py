@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from lawyerfactory.research.retrievers.scheduler import (
+    PriorityResearchScheduler,
+    TokenBucket,
+    WaitTimeHistogram,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills_continuously():
+    clock = FakeClock()
+    bucket = TokenBucket(rate_per_second=0.5, capacity=2, clock=clock)
+
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    clock.now += 1
+    assert not bucket.try_acquire()
+    clock.now += 1
+    assert bucket.try_acquire()
+
+    clock.now += 100
+    assert bucket.tokens == 2  # capped at capacity
+
+
+def test_histogram_buckets_are_cumulative():
+    hist = WaitTimeHistogram()
+    for seconds in (0.05, 0.3, 2.0, 1000.0):
+        hist.observe(seconds)
+
+    snapshot = hist.snapshot()
+    assert snapshot["count"] == 4
+    assert snapshot["buckets"]["le_0.1s"] == 1
+    assert snapshot["buckets"]["le_5s"] == 3
+    assert snapshot["buckets"]["le_600s"] == 3
+    assert snapshot["buckets"]["le_inf"] == 4
+    assert snapshot["max_seconds"] == 1000.0
+
+
+@pytest.mark.asyncio
+async def test_earliest_deadline_first_with_aging():
+    clock = FakeClock()
+    order = []
+
+    async def handle(item):
+        order.append(item)
+
+    scheduler = PriorityResearchScheduler(handle, workers=1, clock=clock)
+    await scheduler.submit("old-background", "old-background", deadline_seconds=600)
+    clock.now += 900  # the background request is now overdue
+    await scheduler.submit("low", "low", deadline_seconds=300)
+    await scheduler.submit("critical", "critical", deadline_seconds=0)
+
+    assert scheduler.status("low") == {"status": "queued", "priority": "default", "queue_position": 2}
+
+    scheduler.start()
+    await scheduler.join()
+    await scheduler.stop()
+
+    assert order == ["old-background", "critical", "low"]
+    assert scheduler.status("low")["status"] == "completed"
+    histograms = scheduler.wait_time_histograms()
+    assert histograms["default"]["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_workers_wake_immediately_and_record_failures():
+    started = asyncio.Event()
+
+    async def handle(item):
+        started.set()
+        if item == "bad":
+            raise RuntimeError("api down")
+
+    scheduler = PriorityResearchScheduler(handle, workers=2)
+    scheduler.start()
+    await scheduler.submit("r1", "bad", label="critical")
+    await asyncio.wait_for(started.wait(), timeout=0.5)
+    await scheduler.join()
+
+    assert scheduler.status("r1") == {
+        "status": "failed",
+        "priority": "critical",
+        "error": "api down",
+    }
+    assert scheduler.active == 0
+    await scheduler.stop()
+    assert not scheduler.running
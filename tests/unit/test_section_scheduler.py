@@ -0,0 +1,104 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from lawyerfactory.compose.maestro.section_scheduler import SectionScheduler
+
+
+def _section(section_id, deps=(), priority=1):
+    return SimpleNamespace(section_id=section_id, dependencies=list(deps), priority_level=priority)
+
+
+class FakeClock:
+    """Virtual clock advanced by the fake LLM calls"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_independent_sections_overlap_and_dependents_wait():
+    sections = [
+        _section("caption"),
+        _section("parties"),
+        _section("jurisdiction"),
+        _section("facts", deps=["parties"]),
+        _section("coa", deps=["facts", "jurisdiction"]),
+    ]
+    in_flight = []
+    peak = 0
+    seen_done = {}
+    done = set()
+
+    async def execute(section):
+        nonlocal peak
+        seen_done[section.section_id] = set(done)
+        in_flight.append(section.section_id)
+        peak = max(peak, len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(section.section_id)
+        done.add(section.section_id)
+        return section.section_id.upper()
+
+    result = await SectionScheduler().run(sections, execute)
+
+    assert result.results["coa"] == "COA"
+    assert peak == 3  # caption, parties and jurisdiction run together
+    assert {"parties"} <= seen_done["facts"]
+    assert {"facts", "jurisdiction"} <= seen_done["coa"]
+    assert result.completion_order[-1] == "coa"
+
+
+@pytest.mark.asyncio
+async def test_critical_path_uses_measured_durations():
+    clock = FakeClock()
+    cost = {"a": 1.0, "b": 5.0, "c": 2.0, "d": 1.0}
+    sections = [_section("a"), _section("b"), _section("c", deps=["a"]), _section("d", deps=["c"])]
+
+    async def execute(section):
+        start = clock.now
+        await asyncio.sleep(0)
+        clock.now = max(clock.now, start + cost[section.section_id])
+        return None
+
+    result = await SectionScheduler(clock=clock).run(sections, execute)
+
+    assert result.critical_path == ["b"]
+    assert abs(result.critical_path_seconds - 5.0) < 1e-9
+
+
+@pytest.mark.asyncio
+async def test_cycles_are_broken_by_priority_and_unknown_dependencies_ignored():
+    sections = [
+        _section("x", deps=["y"], priority=2),
+        _section("y", deps=["x"], priority=1),
+        _section("z", deps=["missing"]),
+    ]
+    order = []
+
+    async def execute(section):
+        order.append(section.section_id)
+
+    result = await SectionScheduler().run(sections, execute)
+
+    assert result.broken_cycles == ["y"]
+    assert order == ["z", "y", "x"]
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_remaining_sections():
+    started = []
+
+    async def execute(section):
+        started.append(section.section_id)
+        if section.section_id == "bad":
+            raise RuntimeError("llm down")
+        await asyncio.sleep(1)
+
+    with pytest.raises(RuntimeError):
+        await SectionScheduler().run([_section("bad"), _section("slow")], execute)
+    assert sorted(started) == ["bad", "slow"]
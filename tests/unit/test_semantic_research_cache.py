@@ -0,0 +1,70 @@
+from lawyerfactory.research.retrievers.semantic_cache import (
+    SemanticResearchCache,
+    canonical_element,
+    fingerprint_request,
+)
+
+FACTS = [
+    "Defendant ran a red light and collided with plaintiff's vehicle",
+    "Plaintiff suffered broken ribs and medical expenses",
+    "Defendant was texting while driving at the time of the collision",
+]
+
+
+def test_canonical_element_names():
+    assert canonical_element("Breach of Duty") == canonical_element("breach-duty")
+    assert canonical_element("Damages") == canonical_element("damage")
+
+
+def test_reordered_and_reworded_facts_hit_the_cache():
+    cache = SemanticResearchCache(threshold=0.8)
+    original = fingerprint_request("Negligence", "CA", ["Duty", "Breach"], FACTS)
+    cache.add("key-1", original)
+
+    reordered = fingerprint_request(
+        "negligence",
+        "ca",
+        ["breach", "duties"],
+        [FACTS[2], FACTS[0], FACTS[1].replace("suffered", "suffers")],
+    )
+    match = cache.lookup(reordered)
+    assert match is not None and match[0] == "key-1" and match[1] > 0.8
+
+    cache.record_hit("req-2", "key-1", match[1], saved_calls=9)
+    stats = cache.statistics()
+    assert stats["hits"] == 1 and stats["saved_upstream_calls"] == 9
+    assert stats["recent_hits"][0]["request_id"] == "req-2"
+
+
+def test_different_cause_or_facts_miss():
+    cache = SemanticResearchCache(threshold=0.8)
+    cache.add("key-1", fingerprint_request("Negligence", "CA", ["Duty"], FACTS))
+
+    assert cache.lookup(fingerprint_request("Fraud", "CA", ["Duty"], FACTS)) is None
+    assert cache.lookup(fingerprint_request("Negligence", "NY", ["Duty"], FACTS)) is None
+    unrelated = ["Landlord withheld the security deposit after tenant moved out"]
+    assert cache.lookup(fingerprint_request("Negligence", "CA", ["Duty"], unrelated)) is None
+
+
+def test_cached_result_must_cover_every_requested_element():
+    cache = SemanticResearchCache()
+    elements = ["Duty", "Breach", "Causation", "Damages", "Foreseeability"]
+    cache.add("key-1", fingerprint_request("Negligence", "CA", elements, FACTS))
+
+    # Identical facts, but three of the eight elements were never researched
+    wider = elements + ["Comparative Fault", "Assumption of Risk", "Res Ipsa Loquitur"]
+    assert cache.lookup(fingerprint_request("Negligence", "CA", wider, FACTS)) is None
+
+    narrower = fingerprint_request("Negligence", "CA", elements[:2], FACTS)
+    assert cache.lookup(narrower) == ("key-1", 1.0)
+
+
+def test_index_is_bounded_and_discard_removes_entries():
+    cache = SemanticResearchCache(max_entries=2)
+    for i in range(3):
+        cache.add(f"key-{i}", fingerprint_request("Negligence", "CA", [], [f"fact {i}"]))
+
+    assert len(cache) == 2
+    cache.discard("key-2")
+    assert len(cache) == 1
+    assert cache.lookup(fingerprint_request("Negligence", "CA", [], ["fact 2"])) is None
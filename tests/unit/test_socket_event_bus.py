@@ -0,0 +1,69 @@
+from lawyerfactory.phases.socket_events import BATCH_EVENT_NAME, ProgressEventBus
+
+
+class RecordingEmitter:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, event, data, to=None):
+        self.calls.append((event, data, to))
+
+
+def _started_bus(**kwargs):
+    emitter = RecordingEmitter()
+    bus = ProgressEventBus(emitter, sleep=lambda _: None, **kwargs)
+    # Mark as running without a flusher thread so the test controls flushing
+    bus._running = True
+    return bus, emitter
+
+
+def test_superseded_progress_is_dropped():
+    bus, emitter = _started_bus()
+    for progress in (10, 20, 30):
+        bus.publish("phase_progress_update", {"case_id": "c1", "progress": progress}, "A01")
+    bus.publish("phase_progress_update", {"case_id": "c1", "progress": 5}, "A02")
+
+    assert bus.flush() == 2
+    assert [(e, d["progress"]) for e, d, _ in emitter.calls] == [
+        ("phase_progress_update", 30),
+        ("phase_progress_update", 5),
+    ]
+    metrics = bus.get_metrics()
+    assert metrics["published"] == 4
+    assert metrics["coalesced"] == 2
+    assert metrics["emitted_events"] == 2
+
+
+def test_status_transitions_keep_original_old_status():
+    bus, emitter = _started_bus()
+    for old, new in (("queued", "processing"), ("processing", "complete")):
+        bus.publish(
+            "evidence_status_changed",
+            {"case_id": "c1", "old_status": old, "new_status": new},
+            "e1",
+        )
+    bus.flush()
+
+    (_, data, _), = emitter.calls
+    assert (data["old_status"], data["new_status"]) == ("queued", "complete")
+
+
+def test_batch_frames_are_sent_per_room():
+    bus, emitter = _started_bus(batch_frames=True)
+    bus.publish("evidence_uploaded", {"case_id": "c1", "evidence_id": "e1"}, "e1")
+    bus.publish("evidence_uploaded", {"case_id": "c1", "evidence_id": "e2"}, "e2")
+    bus.publish("evidence_uploaded", {"case_id": "c2", "evidence_id": "e3"}, "e3")
+    bus.flush()
+
+    assert [(event, to, len(data["events"])) for event, data, to in emitter.calls] == [
+        (BATCH_EVENT_NAME, "c1", 2),
+        (BATCH_EVENT_NAME, "c2", 1),
+    ]
+    assert bus.get_metrics()["frames"] == 2
+
+
+def test_publish_without_flusher_delivers_immediately():
+    emitter = RecordingEmitter()
+    bus = ProgressEventBus(emitter)
+    bus.publish("phase_progress_update", {"case_id": "c1", "progress": 50}, "A01")
+    assert len(emitter.calls) == 1
@@ -0,0 +1,154 @@
+import asyncio
+import json
+
+import pytest
+
+from lawyerfactory.storage.core.object_registry import ObjectRegistry
+from lawyerfactory.storage.core.unified_storage_api import EnhancedUnifiedStorageAPI
+
+PDF_BYTES = b"%PDF-1.4 production exhibit 12 " * 100
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.deleted = []
+
+    async def delete_document(self, doc_id):
+        self.deleted.append(doc_id)
+        return True
+
+
+@pytest.fixture
+def storage(tmp_path):
+    api = EnhancedUnifiedStorageAPI(storage_path=str(tmp_path / "storage"))
+    api.tier_writes = 0
+
+    async def fake_vector_store(content, metadata):
+        api.tier_writes += 1
+        await asyncio.sleep(0.01)
+        return {"success": True, "vector_ids": [f"vec-{metadata.object_id}"]}
+
+    api.vector_store_manager = FakeVectorStore()
+    api._store_in_vector_store = fake_vector_store
+    yield api
+    api.object_registry.close()
+
+
+@pytest.mark.asyncio
+async def test_identical_uploads_share_one_stored_copy(storage):
+    first = await storage.store_evidence(PDF_BYTES, "exhibit_12.pdf")
+    second = await storage.store_evidence(PDF_BYTES, "exhibit_12_copy.pdf", source_phase="research")
+
+    assert first.success and second.success
+    assert first.object_id != second.object_id
+    assert not first.deduplicated and second.deduplicated
+    assert second.vector_ids == first.vector_ids
+    assert storage.tier_writes == 1
+
+    entry = storage.object_registry[second.object_id]
+    assert entry["metadata"]["original_filename"] == "exhibit_12_copy.pdf"
+    assert entry["source_phase"] == "research"
+    assert entry["ref_count"] == 2
+
+    stats = storage.get_storage_stats()
+    assert stats["objects"] == 2 and stats["contents"] == 1
+    assert stats["bytes_saved"] == len(PDF_BYTES)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_store_once(storage):
+    results = await asyncio.gather(
+        *(storage.store_evidence(PDF_BYTES, f"copy_{i}.pdf") for i in range(5))
+    )
+
+    assert storage.tier_writes == 1
+    assert sum(not r.deduplicated for r in results) == 1
+    assert len({r.object_id for r in results}) == 5
+
+
+@pytest.mark.asyncio
+async def test_release_keeps_content_until_last_reference(storage):
+    first = await storage.store_evidence(PDF_BYTES, "a.pdf")
+    second = await storage.store_evidence(PDF_BYTES, "b.pdf")
+
+    assert (await storage.release_evidence(first.object_id))["remaining_references"] == 1
+    assert first.object_id not in storage.object_registry
+    assert storage.object_registry.object_for_ref("vector", first.vector_ids[0]) == second.object_id
+
+    assert storage.vector_store_manager.deleted == []
+
+    released = await storage.release_evidence(second.object_id)
+    assert released["remaining_references"] == 0
+    assert released["deleted_tiers"]["vector"]["success"]
+    assert storage.vector_store_manager.deleted == first.vector_ids
+    assert storage.object_registry.get_content(first.content_hash) is None
+
+    third = await storage.store_evidence(PDF_BYTES, "c.pdf")
+    assert not third.deduplicated
+    assert storage.tier_writes == 2
+
+
+@pytest.mark.asyncio
+async def test_duplicate_upload_retries_failed_tiers(storage):
+    evidence_calls = []
+
+    async def flaky_evidence_table(content, metadata):
+        evidence_calls.append(metadata.object_id)
+        if len(evidence_calls) == 1:
+            return {"error": "evidence table locked"}
+        return {"success": True, "evidence_id": "ev-retry"}
+
+    storage.evidence_table = object()
+    storage._store_in_evidence_table = flaky_evidence_table
+
+    first = await storage.store_evidence(PDF_BYTES, "a.pdf")
+    second = await storage.store_evidence(PDF_BYTES, "b.pdf")
+    third = await storage.store_evidence(PDF_BYTES, "c.pdf")
+
+    assert first.evidence_id is None
+    assert second.deduplicated and second.evidence_id == "ev-retry"
+    assert third.evidence_id == "ev-retry"
+    assert len(evidence_calls) == 2 and storage.tier_writes == 1
+    assert storage.object_registry.object_for_ref("evidence", "ev-retry") == first.object_id
+
+
+@pytest.mark.asyncio
+async def test_tier_refs_resolve_every_object_within_the_callers_scope(storage):
+    first = await storage.store_evidence(PDF_BYTES, "a.pdf", {"case_id": "case-1"})
+    second = await storage.store_evidence(
+        PDF_BYTES, "b.pdf", {"case_id": "case-2", "tags": ["Lease"]}, source_phase="research"
+    )
+    vector_id = first.vector_ids[0]
+    registry = storage.object_registry
+
+    assert registry.objects_for_ref("vector", vector_id) == [first.object_id, second.object_id]
+    assert registry.object_for_ref("vector", vector_id, case_id="case-2") == second.object_id
+    assert registry.objects_for_ref("vector", vector_id, source_phase="intake") == [
+        first.object_id
+    ]
+    assert registry.objects_for_ref("vector", vector_id, tags=["lease"]) == [second.object_id]
+    assert registry.object_for_ref("vector", vector_id, case_id="case-3") is None
+
+
+def test_legacy_json_registry_is_imported(tmp_path):
+    legacy = tmp_path / "object_registry.json"
+    legacy.write_text(
+        json.dumps(
+            {
+                "obj-1": {
+                    "metadata": {"object_id": "obj-1", "file_size": 10},
+                    "storage_results": {"evidence": {"evidence_id": "ev-1"}},
+                    "created_at": "2024-01-01T00:00:00",
+                    "source_phase": "intake",
+                }
+            }
+        )
+    )
+
+    registry = ObjectRegistry(tmp_path / "object_registry.db", legacy_json_path=legacy)
+    try:
+        assert "obj-1" in registry
+        assert registry["obj-1"]["storage_results"]["evidence"]["evidence_id"] == "ev-1"
+        assert registry.object_for_ref("evidence", "ev-1") == "obj-1"
+    finally:
+        registry.close()
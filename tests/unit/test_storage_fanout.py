@@ -0,0 +1,135 @@
+import asyncio
+import time
+
+import pytest
+
+from lawyerfactory.storage.core.unified_storage_api import EnhancedUnifiedStorageAPI
+
+
+def _hit(object_id, tier):
+    return {"object_id": object_id, "metadata": {}, "search_tier": tier}
+
+
+@pytest.fixture
+def storage(tmp_path):
+    api = EnhancedUnifiedStorageAPI(storage_path=str(tmp_path / "storage"))
+    api.vector_store_manager = object()
+    api.cloud_storage_manager = object()
+    api.evidence_table = object()
+    yield api
+    api.object_registry.close()
+
+
+def _slow(delay, result):
+    async def tier(*args):
+        await asyncio.sleep(delay)
+        return result
+
+    return tier
+
+
+@pytest.mark.asyncio
+async def test_tier_writes_run_concurrently(storage):
+    storage._store_in_vector_store = _slow(0.2, {"success": True, "vector_ids": ["v1"]})
+    storage._store_in_cloud_storage = _slow(0.2, {"success": True, "storage_id": "s1"})
+    storage._store_in_evidence_table = _slow(0.2, {"success": True, "evidence_id": "e1"})
+
+    started = time.perf_counter()
+    result = await storage.store_evidence(b"lease agreement", "lease.txt")
+    elapsed = time.perf_counter() - started
+
+    assert result.success
+    assert result.vector_ids == ["v1"] and result.evidence_id == "e1"
+    assert set(result.tier_latencies) == {"vector", "cloud", "evidence"}
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_slow_tier_times_out_without_failing_upload(storage):
+    storage.tier_timeouts["cloud"] = 0.05
+    storage._store_in_vector_store = _slow(0, {"success": True, "vector_ids": ["v1"]})
+    storage._store_in_cloud_storage = _slow(5, {"success": True})
+    storage._store_in_evidence_table = _slow(0, {"success": True, "evidence_id": "e1"})
+
+    result = await storage.store_evidence(b"late delivery notice", "notice.txt")
+
+    assert result.success
+    stored = storage.object_registry[result.object_id]["storage_results"]
+    assert "timed out" in stored["cloud"]["error"]
+    assert result.tier_latencies["cloud"] < 1
+
+
+@pytest.mark.asyncio
+async def test_search_all_fuses_tiers_by_reciprocal_rank(storage):
+    storage._search_vector_store = _slow(
+        0.1, [_hit("obj-a", "vector"), _hit("obj-b", "vector")]
+    )
+    storage._search_evidence_table = _slow(
+        0.1, [_hit("obj-b", "evidence"), _hit("obj-c", "evidence")]
+    )
+
+    results = await storage.search_evidence("breach", search_tier="all")
+
+    assert [r["object_id"] for r in results] == ["obj-b", "obj-a", "obj-c"]
+    assert results[0]["search_tiers"] == ["vector", "evidence"]
+    assert results[0]["fusion_score"] > results[1]["fusion_score"]
+    assert set(results.tier_latencies) == {"vector", "evidence"}
+
+
+@pytest.mark.asyncio
+async def test_search_survives_a_timed_out_tier(storage):
+    storage.tier_timeouts["vector"] = 0.05
+    storage._search_vector_store = _slow(5, [_hit("obj-a", "vector")])
+    storage._search_evidence_table = _slow(0, [_hit("obj-c", "evidence")])
+
+    results = await storage.search_evidence("breach", search_tier="all")
+
+    assert [r["object_id"] for r in results] == ["obj-c"]
+
+
+@pytest.mark.asyncio
+async def test_repeated_hits_within_a_tier_count_once(storage):
+    storage._search_vector_store = _slow(
+        0, [_hit("obj-a", "vector"), _hit("obj-a", "vector"), _hit("obj-b", "vector")]
+    )
+    storage._search_evidence_table = _slow(0, [_hit("obj-b", "evidence")])
+
+    fused = await storage.search_evidence("breach", search_tier="all")
+    single = await storage.search_evidence("breach", search_tier="vector")
+
+    assert [r["object_id"] for r in fused] == ["obj-b", "obj-a"]
+    assert fused[1]["search_tiers"] == ["vector"]
+    assert fused[1]["fusion_score"] == round(1.0 / 61, 6)
+    assert [r["object_id"] for r in single] == ["obj-a", "obj-b"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_report_their_own_latencies(storage):
+    storage._search_vector_store = _slow(0.1, [_hit("obj-a", "vector")])
+    storage._search_evidence_table = _slow(0, [_hit("obj-c", "evidence")])
+
+    fused, single = await asyncio.gather(
+        storage.search_evidence("breach", search_tier="all"),
+        storage.search_evidence("breach", search_tier="evidence"),
+    )
+
+    assert set(fused.tier_latencies) == {"vector", "evidence"}
+    assert set(single.tier_latencies) == {"evidence"}
+
+
+class _BlockingEvidenceTable:
+    def search_evidence(self, query):
+        time.sleep(0.2)
+        return []
+
+
+@pytest.mark.asyncio
+async def test_evidence_table_search_does_not_block_the_loop(storage):
+    storage.evidence_table = _BlockingEvidenceTable()
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(storage.search_evidence("breach", search_tier="evidence") for _ in range(3))
+    )
+
+    assert time.perf_counter() - started < 0.5
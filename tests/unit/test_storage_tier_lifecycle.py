@@ -0,0 +1,205 @@
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+import time
+
+import pytest
+
+from lawyerfactory.storage.cloud.cloud_storage_integration import CloudStorageManager
+from lawyerfactory.storage.cloud.tier_lifecycle import (
+    GIB,
+    LocalBlobStore,
+    StorageTier,
+    TierLifecycleEngine,
+)
+
+TEXT = "The defendant breached the lease agreement. " * 200
+
+
+def _policies(hot_limit_bytes=GIB):
+    return {
+        StorageTier.HOT: {
+            "max_size_gb": hot_limit_bytes / GIB,
+            "demote_after_idle_days": 7,
+            "demote_below_score": 1.0,
+        },
+        StorageTier.WARM: {
+            "max_size_gb": 1,
+            "demote_after_idle_days": 30,
+            "demote_below_score": 1.0,
+        },
+        StorageTier.COLD: {"max_size_gb": 1, "demote_after_idle_days": None},
+    }
+
+
+def _engine(tmp_path, **kwargs):
+    hot_dir = tmp_path / "hot"
+    hot_dir.mkdir(exist_ok=True)
+    return TierLifecycleEngine(
+        _policies(**kwargs),
+        hot_dir,
+        LocalBlobStore(str(tmp_path / "blobs")),
+        tmp_path / "blobs" / "storage_mappings.json",
+    )
+
+
+def _store(engine, doc_id, text=TEXT, access_count=0):
+    path = engine.hot_dir / f"{doc_id}.txt"
+    path.write_text(text, encoding="utf-8")
+    now = datetime.now().isoformat()
+    engine.register(
+        doc_id,
+        {
+            "storage_id": f"evidence_{doc_id}",
+            "local_path": str(path),
+            "storage_tier": "hot",
+            "created_at": now,
+            "last_accessed": now,
+            "access_count": access_count,
+        },
+    )
+    return path
+
+
+@pytest.mark.asyncio
+async def test_idle_evidence_is_compressed_into_warm_and_persisted(tmp_path):
+    engine = _engine(tmp_path)
+    path = _store(engine, "doc1")
+
+    report = await engine.run_once(now=datetime.now() + timedelta(days=10))
+
+    mapping = engine.mappings["doc1"]
+    assert report["moves"] == [{"doc_id": "doc1", "from": "hot", "to": "warm", "reason": "idle"}]
+    assert not path.exists()
+    assert mapping["blob_key"] == "warm/evidence_doc1"
+    assert mapping["size_bytes"] < mapping["content_bytes"] == len(TEXT)
+    assert _engine(tmp_path).mappings["doc1"]["storage_tier"] == "warm"
+
+
+@pytest.mark.asyncio
+async def test_long_idle_evidence_goes_straight_to_cold(tmp_path):
+    engine = _engine(tmp_path)
+    _store(engine, "doc1")
+
+    await engine.run_once(now=datetime.now() + timedelta(days=10))
+    await engine.run_once(now=datetime.now() + timedelta(days=45))
+
+    assert engine.mappings["doc1"]["storage_tier"] == "cold"
+    assert engine.mappings["doc1"]["codec"] == "lzma"
+    assert not engine.blob_store.exists("warm/evidence_doc1")
+
+
+@pytest.mark.asyncio
+async def test_frequently_accessed_evidence_stays_hot(tmp_path):
+    engine = _engine(tmp_path)
+    _store(engine, "busy", access_count=50)
+
+    report = await engine.run_once(now=datetime.now() + timedelta(days=10))
+
+    assert report["planned"] == 0
+    assert engine.mappings["busy"]["storage_tier"] == "hot"
+
+
+@pytest.mark.asyncio
+async def test_access_promotes_back_to_hot(tmp_path):
+    engine = _engine(tmp_path)
+    _store(engine, "doc1")
+    await engine.move("doc1", StorageTier.COLD)
+
+    content = await engine.read("doc1")
+
+    mapping = engine.mappings["doc1"]
+    assert content == TEXT
+    assert mapping["storage_tier"] == "hot"
+    assert mapping["access_count"] == 1
+    assert Path(mapping["local_path"]).read_text(encoding="utf-8") == TEXT
+    assert not engine.blob_store.exists("cold/evidence_doc1")
+    assert engine.stats["promoted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hot_size_limit_demotes_lowest_scoring_first(tmp_path):
+    engine = _engine(tmp_path, hot_limit_bytes=2 * len(TEXT))
+    _store(engine, "rare", access_count=1)
+    _store(engine, "popular", access_count=20)
+    _store(engine, "unused", access_count=0)
+
+    report = await engine.run_once()
+
+    assert [m["doc_id"] for m in report["moves"]] == ["unused"]
+    assert report["moves"][0]["reason"] == "size"
+    assert report["tier_usage"]["hot"] <= 2 * len(TEXT)
+    assert engine.mappings["popular"]["storage_tier"] == "hot"
+
+
+def test_blob_keys_cannot_escape_the_store(tmp_path):
+    store = LocalBlobStore(str(tmp_path / "blobs"))
+
+    with pytest.raises(ValueError):
+        store.put("../outside", b"data")
+
+
+@pytest.mark.asyncio
+async def test_documents_without_a_local_copy_are_never_moved(tmp_path):
+    engine = _engine(tmp_path, hot_limit_bytes=1)
+    old = (datetime.now() - timedelta(days=90)).isoformat()
+    engine.register(
+        "vector-only",
+        {
+            "storage_id": "evidence_vector-only",
+            "local_path": None,
+            "storage_tier": "hot",
+            "created_at": old,
+            "last_accessed": old,
+            "access_count": 0,
+        },
+    )
+
+    report = await engine.run_once()
+
+    assert report["planned"] == 0
+    assert engine.mappings["vector-only"]["size_bytes"] == 0
+    assert engine.stats["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unregister_deletes_the_local_copy_and_blob(tmp_path):
+    engine = _engine(tmp_path)
+    hot_path = _store(engine, "hot-doc")
+    _store(engine, "warm-doc")
+    await engine.move("warm-doc", StorageTier.WARM)
+
+    assert await engine.unregister("hot-doc")
+    assert await engine.unregister("warm-doc")
+    assert not await engine.unregister("warm-doc")
+
+    assert not hot_path.exists()
+    assert not engine.blob_store.exists("warm/evidence_warm-doc")
+    assert _engine(tmp_path).mappings == {}
+
+
+def test_engine_is_usable_across_event_loops(tmp_path):
+    engine = _engine(tmp_path)
+    _store(engine, "doc1")
+
+    async def read_twice():
+        # Concurrent reads make the second one wait on the lock
+        return await asyncio.gather(engine.read("doc1"), engine.read("doc1"))
+
+    assert asyncio.run(read_twice()) == [TEXT, TEXT]
+    assert asyncio.run(read_twice()) == [TEXT, TEXT]
+
+
+def test_manager_runs_lifecycle_passes_until_stopped(tmp_path):
+    manager = CloudStorageManager(
+        object(), local_temp_dir=str(tmp_path / "tmp"), blob_dir=str(tmp_path / "blobs")
+    )
+
+    manager.start_lifecycle(interval_hours=1)
+    deadline = time.monotonic() + 5
+    while manager.lifecycle.stats["passes"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    asyncio.run(manager.stop_lifecycle())
+
+    assert manager.lifecycle.stats["passes"] == 1
+    assert manager.lifecycle._task is None